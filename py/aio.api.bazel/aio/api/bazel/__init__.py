@@ -5,6 +5,7 @@ from .abstract import (
     ABazelCommand,
     ABazelEnv,
     ABazelProcessProtocol,
+    ABazelProtoWorkerProcessor,
     ABazelQuery,
     ABazelRun,
     ABazelWorker,
@@ -22,9 +23,18 @@ from .interface import (
     IBazelProcessProtocol,
     IBazelWorker,
     IBazelWorkerProcessor)
-from .worker import BazelWorker, BazelWorkerProcessor
+from .worker import (
+    BazelProtoWorkerProcessor,
+    BazelWorker,
+    BazelWorkerProcessor)
 from .worker_cmd import worker_cmd
-from . import abstract, bazel, exceptions, interface, worker
+from . import (
+    abstract,
+    bazel,
+    exceptions,
+    interface,
+    worker,
+    worker_protocol)
 
 
 __all__ = (
@@ -32,6 +42,7 @@ __all__ = (
     "ABazelCommand",
     "ABazelEnv",
     "ABazelProcessProtocol",
+    "ABazelProtoWorkerProcessor",
     "ABazelQuery",
     "ABazelRun",
     "ABazelWorker",
@@ -41,6 +52,7 @@ __all__ = (
     "Bazel",
     "BazelEnv",
     "BazelError",
+    "BazelProtoWorkerProcessor",
     "BazelQuery",
     "BazelQueryError",
     "BazelRun",
@@ -53,4 +65,5 @@ __all__ = (
     "IBazelWorkerProcessor",
     "interface",
     "worker",
-    "worker_cmd")
+    "worker_cmd",
+    "worker_protocol")
@@ -5,6 +5,7 @@ from .query import ABazelQuery
 from .run import ABazelRun
 from .worker import (
     ABazelProcessProtocol,
+    ABazelProtoWorkerProcessor,
     ABazelWorker,
     ABazelWorkerProcessor)
 
@@ -14,6 +15,7 @@ __all__ = (
     "ABazelCommand",
     "ABazelEnv",
     "ABazelProcessProtocol",
+    "ABazelProtoWorkerProcessor",
     "ABazelQuery",
     "ABazelRun",
     "ABazelWorker",
@@ -9,6 +9,8 @@ from functools import partial
 
 import abstracts
 
+from aio.core import event
+
 from aio.api.bazel import exceptions
 
 
@@ -44,7 +46,8 @@ class ABazelCommand(ABazel):
 
     @property
     def executor(self) -> concurrent.futures.Executor:
-        return concurrent.futures.ThreadPoolExecutor()
+        """Shared thread pool for running Bazel commands."""
+        return event.executors.get("thread")
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -54,8 +57,7 @@ class ABazelCommand(ABazel):
             self,
             *args,
             **kwargs) -> subprocess.CompletedProcess:
-        with self.executor as pool:
-            return await self._run_in_executor(pool, *args, **kwargs)
+        return await self._run_in_executor(self.executor, *args, **kwargs)
 
     async def _run_in_executor(
             self,
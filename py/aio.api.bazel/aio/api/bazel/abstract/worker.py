@@ -1,12 +1,14 @@
 
 import argparse
+import asyncio
 import json
+import traceback
 from functools import cached_property
 
 import abstracts
 
-from aio.api.bazel import interface
-from aio.core import pipe, utils
+from aio.api.bazel import interface, worker_protocol
+from aio.core import event, pipe, utils
 from aio.run import runner
 
 
@@ -31,34 +33,92 @@ class ABazelWorkerProcessor(
         pipe.StdinStdoutProcessor,
         metaclass=abstracts.Abstraction):
 
-    async def process(self, recv: argparse.Namespace) -> str:
-        with utils.captured_warnings() as captured:
-            captured.result = await super().process(recv)
-        return str(captured)
+    async def process(self, recv: dict) -> dict:
+        with utils.captured_task_warnings() as captured:
+            captured.result = await super().process(await self._load(recv))
+        return dict(
+            output=str(captured),
+            request_id=recv.get("requestId", 0))
 
-    async def recv(self) -> argparse.Namespace:
-        return await self._load(await super().recv())
+    def handle_error(self, recv: dict, error: Exception) -> dict:
+        super().handle_error(recv, error)
+        return dict(
+            exit_code=1,
+            output="".join(traceback.format_exception(error)),
+            request_id=recv.get("requestId", 0))
 
-    async def send(self, msg: str | None) -> None:
-        await super().send(self._dump(msg or ""))
+    async def recv(self) -> dict:
+        recv = await super().recv()
+        return (
+            self._decode(recv)
+            if recv
+            else {})
 
-    def _dump(self, msg: str) -> str:
-        # TODO: add error handling
-        return json.dumps(dict(exit_code=0, output=msg))
+    async def send(self, msg: dict | None) -> None:
+        await super().send(
+            self._dump(msg)
+            if msg
+            else "")
 
-    async def _load(self, recv) -> argparse.Namespace:
-        return (await self.protocol).parser.parse_args(
-            json.loads(recv)["arguments"])
+    def _decode(self, recv: str) -> dict:
+        return json.loads(recv)
+
+    def _dump(self, response: dict) -> str:
+        return json.dumps({"exit_code": 0, **response})
+
+    async def _load(self, recv: dict) -> argparse.Namespace:
+        return (await self.protocol).parser.parse_args(recv["arguments"])
+
+
+@abstracts.implementer(interface.IBazelWorkerProcessor)
+class ABazelProtoWorkerProcessor(
+        ABazelWorkerProcessor,
+        metaclass=abstracts.Abstraction):
+    """Worker processor using length-delimited protobuf messages."""
+
+    @property
+    def decode_inputs(self) -> bool:
+        """Decode the `inputs` of incoming `WorkRequest`s."""
+        return False
+
+    async def read(self, reader: asyncio.StreamReader) -> bytes:
+        try:
+            return await reader.readexactly(
+                await worker_protocol.read_varint(reader))
+        except asyncio.IncompleteReadError:
+            return b""
+
+    def write(self, writer: asyncio.StreamWriter, outgoing: bytes) -> None:
+        writer.write(outgoing)
+
+    def _decode(self, recv: bytes) -> dict:  # type:ignore[override]
+        return worker_protocol.decode_work_request(
+            recv,
+            inputs=self.decode_inputs)
+
+    def _dump(self, response: dict) -> bytes:  # type:ignore[override]
+        return worker_protocol.encode_work_response(
+            {"exit_code": 0, **response})
 
 
 @abstracts.implementer(interface.IBazelWorker)
 class ABazelWorker(runner.Runner, metaclass=abstracts.Abstraction):
     _use_uvloop = False
 
+    @property
+    def concurrency(self) -> int:
+        """Number of (multiplexed) requests to process concurrently."""
+        return self.args.concurrency or event.jobs.limit
+
     @property
     def persistent(self) -> bool:
         return self.args.persistent_worker
 
+    @property
+    def worker_protocol(self) -> str:
+        """Wire format used to talk to Bazel, `json` or `proto`."""
+        return self.args.worker_protocol
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def processor_class(self) -> type[interface.IBazelWorkerProcessor]:
@@ -77,6 +137,19 @@ class ABazelWorker(runner.Runner, metaclass=abstracts.Abstraction):
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument("protocol")
         parser.add_argument("--persistent_worker", action="store_true")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help=(
+                "Maximum number of multiplexed requests to process "
+                "concurrently, defaults to the number of cpus"))
+        parser.add_argument(
+            "--worker_protocol",
+            choices=["json", "proto"],
+            default="json",
+            help=(
+                "Wire format used to talk to Bazel, this should match the "
+                "`requires-worker-protocol` of the action"))
         super().add_arguments(parser)
 
     async def protocol(
@@ -87,7 +160,9 @@ class ABazelWorker(runner.Runner, metaclass=abstracts.Abstraction):
 
     async def run(self) -> None:
         if self.persistent:
-            await self.processor_class(self.protocol)()
+            await self.processor_class(
+                self.protocol,
+                concurrency=self.concurrency)()
         else:
             raise NotImplementedError(
                 "one-shot worker mode is not implemented")
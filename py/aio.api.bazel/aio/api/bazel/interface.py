@@ -43,7 +43,8 @@ class IBazelWorkerProcessor(
                 Awaitable[IBazelProcessProtocol]],
             stdin: TextIO = sys.stdin,
             stdout: TextIO = sys.stdout,
-            log: Callable[[str], None] | None = None) -> None:
+            log: Callable[[str], None] | None = None,
+            concurrency: int = 1) -> None:
         raise NotImplementedError
 
     @abstracts.interfacemethod
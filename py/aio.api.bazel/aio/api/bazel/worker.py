@@ -9,9 +9,17 @@ class BazelWorkerProcessor(abstract.ABazelWorkerProcessor):
     pass
 
 
+@abstracts.implementer(interface.IBazelWorkerProcessor)
+class BazelProtoWorkerProcessor(abstract.ABazelProtoWorkerProcessor):
+    pass
+
+
 @abstracts.implementer(interface.IBazelWorker)
 class BazelWorker(abstract.ABazelWorker):
 
     @property
     def processor_class(self):
-        return BazelWorkerProcessor
+        return (
+            BazelProtoWorkerProcessor
+            if self.worker_protocol == "proto"
+            else BazelWorkerProcessor)
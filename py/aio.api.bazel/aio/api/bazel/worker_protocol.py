@@ -0,0 +1,186 @@
+"""Protobuf wire format for Bazel's `worker_protocol.proto`.
+
+Only the `WorkRequest` and `WorkResponse` messages are needed by the
+worker, so these are encoded/decoded directly rather than requiring
+generated protobuf code.
+
+Decoded requests use the same (camelCase) keys as the JSON worker
+protocol, so they can be handled in the same way.
+"""
+
+import asyncio
+from typing import Any
+from collections.abc import Iterator
+
+
+VARINT = 0
+I64 = 1
+LEN = 2
+I32 = 5
+
+# WorkRequest field numbers
+REQUEST_ARGUMENTS = 1
+REQUEST_INPUTS = 2
+REQUEST_ID = 3
+REQUEST_CANCEL = 4
+REQUEST_VERBOSITY = 5
+REQUEST_SANDBOX_DIR = 6
+
+# Input field numbers
+INPUT_PATH = 1
+INPUT_DIGEST = 2
+
+# WorkResponse field numbers
+RESPONSE_EXIT_CODE = 1
+RESPONSE_OUTPUT = 2
+RESPONSE_REQUEST_ID = 3
+RESPONSE_WAS_CANCELLED = 4
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0:
+        # Negative int32s are sign-extended to 64 bits.
+        value += 1 << 64
+    encoded = bytearray()
+    while value > 0x7f:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_varint(data: bytes, pos: int = 0) -> tuple[int, int]:
+    byte = data[pos]
+    if byte < 0x80:
+        # Fast path for single byte varints (field keys, most lengths).
+        return byte, pos + 1
+    result = byte & 0x7f
+    shift = 7
+    pos += 1
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def decode_int32(value: int) -> int:
+    value &= 0xffffffff
+    return (
+        value - (1 << 32)
+        if value & 0x80000000
+        else value)
+
+
+async def read_varint(reader: asyncio.StreamReader) -> int:
+    """Read a varint from a stream.
+
+    Raises `asyncio.IncompleteReadError` if the stream ends.
+    """
+    result = shift = 0
+    while True:
+        byte = (await reader.readexactly(1))[0]
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result
+        shift += 7
+
+
+def iter_fields(data: bytes) -> Iterator[tuple[int, int, Any]]:
+    """Iterate `(field number, wire type, value)` for a message."""
+    pos = 0
+    end = len(data)
+    value: Any
+    while pos < end:
+        key, pos = decode_varint(data, pos)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == VARINT:
+            value, pos = decode_varint(data, pos)
+        elif wire_type == LEN:
+            size, pos = decode_varint(data, pos)
+            value, pos = data[pos:pos + size], pos + size
+        elif wire_type == I64:
+            value, pos = data[pos:pos + 8], pos + 8
+        elif wire_type == I32:
+            value, pos = data[pos:pos + 4], pos + 4
+        else:
+            raise ValueError(f"Unsupported wire type: {wire_type}")
+        yield field, wire_type, value
+
+
+def decode_input(data: bytes) -> dict:
+    decoded: dict = dict(path="", digest=b"")
+    for field, wire_type, value in iter_fields(data):
+        if field == INPUT_PATH:
+            decoded["path"] = value.decode()
+        elif field == INPUT_DIGEST:
+            decoded["digest"] = value
+    return decoded
+
+
+def decode_work_request(data: bytes, inputs: bool = True) -> dict:
+    """Decode a (non-delimited) `WorkRequest`.
+
+    Decoding the `inputs` dominates the cost of decoding most requests,
+    so this can be skipped if they are not needed.
+    """
+    arguments: list[str] = []
+    request: dict = dict(arguments=arguments)
+    if inputs:
+        request["inputs"] = []
+    pos = 0
+    end = len(data)
+    # This is inlined rather than using `iter_fields` as skipping
+    # unwanted fields without slicing them is significantly faster.
+    while pos < end:
+        key, pos = decode_varint(data, pos)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == LEN:
+            size, pos = decode_varint(data, pos)
+            start, pos = pos, pos + size
+            if field == REQUEST_ARGUMENTS:
+                arguments.append(data[start:pos].decode())
+            elif field == REQUEST_INPUTS and inputs:
+                request["inputs"].append(decode_input(data[start:pos]))
+            elif field == REQUEST_SANDBOX_DIR:
+                request["sandboxDir"] = data[start:pos].decode()
+        elif wire_type == VARINT:
+            value, pos = decode_varint(data, pos)
+            if field == REQUEST_ID:
+                request["requestId"] = decode_int32(value)
+            elif field == REQUEST_CANCEL:
+                request["cancel"] = bool(value)
+            elif field == REQUEST_VERBOSITY:
+                request["verbosity"] = decode_int32(value)
+        elif wire_type == I64:
+            pos += 8
+        elif wire_type == I32:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type: {wire_type}")
+    return request
+
+
+def encode_work_response(response: dict) -> bytes:
+    """Encode a length-delimited `WorkResponse`.
+
+    As with proto3, fields with default values are omitted.
+    """
+    encoded = bytearray()
+    if response.get("exit_code"):
+        encoded += encode_varint(RESPONSE_EXIT_CODE << 3 | VARINT)
+        encoded += encode_varint(response["exit_code"])
+    if response.get("output"):
+        output = response["output"].encode()
+        encoded += encode_varint(RESPONSE_OUTPUT << 3 | LEN)
+        encoded += encode_varint(len(output))
+        encoded += output
+    if response.get("request_id"):
+        encoded += encode_varint(RESPONSE_REQUEST_ID << 3 | VARINT)
+        encoded += encode_varint(response["request_id"])
+    if response.get("was_cancelled"):
+        encoded += encode_varint(RESPONSE_WAS_CANCELLED << 3 | VARINT)
+        encoded += encode_varint(1)
+    return encode_varint(len(encoded)) + bytes(encoded)
@@ -0,0 +1,98 @@
+"""Per-request overhead of the JSON and protobuf worker wire formats.
+
+Each iteration reads a framed `WorkRequest` from a stream, decodes it,
+and encodes the `WorkResponse`, as the worker processors do.
+
+Run with:
+
+    python benchmarks/bench_worker_protocol.py [--requests N]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import time
+
+from aio.api import bazel
+from aio.api.bazel import worker_protocol
+
+
+def _request(request_id: int, args: int, inputs: int) -> dict:
+    return dict(
+        arguments=[f"--arg{i}=value{i}" for i in range(args)],
+        inputs=[
+            dict(path=f"path/to/some/input/file{i}.txt",
+                 digest=bytes(range(32)))
+            for i in range(inputs)],
+        requestId=request_id)
+
+
+def _json_frame(request: dict) -> bytes:
+    request = dict(
+        request,
+        inputs=[
+            dict(path=i["path"],
+                 digest=base64.b64encode(i["digest"]).decode())
+            for i in request["inputs"]])
+    return json.dumps(request).encode() + b"\n"
+
+
+def _field(number: int, wire_type: int, value) -> bytes:
+    key = worker_protocol.encode_varint(number << 3 | wire_type)
+    if wire_type == worker_protocol.VARINT:
+        return key + worker_protocol.encode_varint(value)
+    return key + worker_protocol.encode_varint(len(value)) + value
+
+
+def _proto_frame(request: dict) -> bytes:
+    encoded = b"".join(
+        _field(1, worker_protocol.LEN, arg.encode())
+        for arg in request["arguments"])
+    for i in request["inputs"]:
+        encoded += _field(
+            2, worker_protocol.LEN,
+            _field(1, worker_protocol.LEN, i["path"].encode())
+            + _field(2, worker_protocol.LEN, i["digest"]))
+    encoded += _field(3, worker_protocol.VARINT, request["requestId"])
+    return worker_protocol.encode_varint(len(encoded)) + encoded
+
+
+async def _bench(processor, frames: list[bytes]) -> float:
+    reader = asyncio.StreamReader()
+    for frame in frames:
+        reader.feed_data(frame)
+    reader.feed_eof()
+    start = time.perf_counter()
+    for _ in frames:
+        request = processor._decode(await processor.read(reader))
+        processor._dump(
+            dict(output="Some output from the action",
+                 request_id=request.get("requestId", 0)))
+    return (time.perf_counter() - start) / len(frames)
+
+
+async def main(requests: int) -> None:
+    print(f"{'args':>6} {'inputs':>6} {'json (us)':>10} {'proto (us)':>10}")
+    for args, inputs in [(2, 0), (10, 10), (50, 500)]:
+        payloads = [
+            _request(i + 1, args, inputs)
+            for i in range(requests)]
+        timings = []
+        for processor, frame in [
+                (bazel.BazelWorkerProcessor("PROTOCOL"), _json_frame),
+                (bazel.BazelProtoWorkerProcessor("PROTOCOL"),
+                 _proto_frame)]:
+            timings.append(
+                await _bench(
+                    processor,
+                    [frame(payload) for payload in payloads]))
+        print(
+            f"{args:>6} {inputs:>6} "
+            f"{timings[0] * 1e6:>10.1f} {timings[1] * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -113,17 +113,17 @@ def test_base_bazel_command_constructor(bazel_path):
 def test_base_bazel_command_executor(patches):
     command = DummyBazelCommand("PATH")
     patched = patches(
-        "concurrent.futures",
+        "event",
         prefix="aio.api.bazel.abstract.base")
 
-    with patched as (m_futures, ):
+    with patched as (m_event, ):
         assert (
             command.executor
-            == m_futures.ThreadPoolExecutor.return_value)
+            == m_event.executors.get.return_value)
 
     assert (
-        m_futures.ThreadPoolExecutor.call_args
-        == [(), {}])
+        m_event.executors.get.call_args
+        == [("thread", ), {}])
     assert "executor" not in command.__dict__
 
 
@@ -163,7 +163,7 @@ async def test_base_bazel_command_subproc_run(patches, args, kwargs):
 
     assert (
         m_run.call_args
-        == [(m_exec.return_value.__enter__.return_value, ) + tuple(args),
+        == [(m_exec.return_value, ) + tuple(args),
             kwargs])
 
 
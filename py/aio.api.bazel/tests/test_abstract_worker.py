@@ -1,4 +1,7 @@
-
+import argparse
+import asyncio
+import json
+import warnings
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -6,6 +9,7 @@ import pytest
 import abstracts
 
 from aio.api import bazel
+from aio.api.bazel import worker_protocol
 from aio.core import pipe
 from aio.run import runner
 
@@ -72,23 +76,28 @@ def test_bazelworkerprocessor_constructor():
     assert isinstance(processor, pipe.IStdinStdoutProcessor)
 
 
-async def test_bazelworkerprocessor_process(patches):
+@pytest.mark.parametrize("request_id", [None, 0, 23])
+async def test_bazelworkerprocessor_process(patches, request_id):
     processor = bazel.ABazelWorkerProcessor("PROTOCOL")
     patched = patches(
         "str",
         "utils",
         "pipe.StdinStdoutProcessor.process",
+        "ABazelWorkerProcessor._load",
         prefix="aio.api.bazel.abstract.worker")
     captured = MagicMock()
-    recv = MagicMock()
+    recv = dict(arguments=["ARG"])
+    if request_id is not None:
+        recv["requestId"] = request_id
 
-    with patched as (m_str, m_utils, m_super):
-        (m_utils.captured_warnings
+    with patched as (m_str, m_utils, m_super, m_load):
+        (m_utils.captured_task_warnings
                 .return_value.__enter__
                 .return_value) = captured
         assert (
             await processor.process(recv)
-            == m_str.return_value)
+            == dict(output=m_str.return_value,
+                    request_id=request_id or 0))
 
     assert (
         captured.result
@@ -97,31 +106,87 @@ async def test_bazelworkerprocessor_process(patches):
         m_str.call_args
         == [(captured, ), {}])
     assert (
-        m_utils.captured_warnings.call_args
+        m_utils.captured_task_warnings.call_args
         == [(), {}])
     assert (
         m_super.call_args
+        == [(m_load.return_value, ), {}])
+    assert (
+        m_load.call_args
         == [(recv, ), {}])
 
 
-async def test_bazelworkerprocessor_recv(patches):
+@pytest.mark.parametrize("request_id", [None, 23])
+def test_bazelworkerprocessor_handle_error(patches, request_id):
+    processor = bazel.ABazelWorkerProcessor("PROTOCOL")
+    patched = patches(
+        "traceback",
+        "pipe.StdinStdoutProcessor.handle_error",
+        prefix="aio.api.bazel.abstract.worker")
+    recv = (
+        dict(requestId=request_id)
+        if request_id
+        else {})
+    error = Exception("BOOM")
+
+    with patched as (m_traceback, m_super):
+        m_traceback.format_exception.return_value = ["TB1", "TB2"]
+        assert (
+            processor.handle_error(recv, error)
+            == dict(
+                exit_code=1,
+                output="TB1TB2",
+                request_id=request_id or 0))
+
+    assert (
+        m_super.call_args
+        == [(recv, error), {}])
+    assert (
+        m_traceback.format_exception.call_args
+        == [(error, ), {}])
+
+
+@pytest.mark.parametrize("recv", ["", "RECV"])
+async def test_bazelworkerprocessor_recv(patches, recv):
     processor = bazel.ABazelWorkerProcessor("PROTOCOL")
     patched = patches(
         "pipe.StdinStdoutProcessor.recv",
-        "ABazelWorkerProcessor._load",
+        "ABazelWorkerProcessor._decode",
         prefix="aio.api.bazel.abstract.worker")
 
-    with patched as (m_recv, m_load):
+    with patched as (m_recv, m_decode):
+        m_recv.return_value = recv
         assert (
             await processor.recv()
-            == m_load.return_value)
+            == (m_decode.return_value
+                if recv
+                else {}))
 
+    if not recv:
+        assert not m_decode.called
+        return
     assert (
-        m_load.call_args
-        == [(m_recv.return_value, ), {}])
+        m_decode.call_args
+        == [(recv, ), {}])
 
 
-@pytest.mark.parametrize("msg", [None, MagicMock()])
+def test_bazelworkerprocessor__decode(patches):
+    processor = bazel.ABazelWorkerProcessor("PROTOCOL")
+    patched = patches(
+        "json",
+        prefix="aio.api.bazel.abstract.worker")
+
+    with patched as (m_json, ):
+        assert (
+            processor._decode("RECV")
+            == m_json.loads.return_value)
+
+    assert (
+        m_json.loads.call_args
+        == [("RECV", ), {}])
+
+
+@pytest.mark.parametrize("msg", [None, "", MagicMock()])
 async def test_bazelworkerprocessor_send(patches, msg):
     processor = bazel.ABazelWorkerProcessor("PROTOCOL")
     patched = patches(
@@ -132,45 +197,51 @@ async def test_bazelworkerprocessor_send(patches, msg):
     with patched as (m_send, m_dump):
         assert not await processor.send(msg)
 
+    if not msg:
+        assert not m_dump.called
+        assert (
+            m_send.call_args
+            == [("", ), {}])
+        return
     assert (
         m_send.call_args
         == [(m_dump.return_value, ), {}])
     assert (
         m_dump.call_args
-        == [(msg or "", ), {}])
+        == [(msg, ), {}])
 
 
-def test_bazelworkerprocessor__dump(patches):
+@pytest.mark.parametrize("exit_code", [None, 0, 1])
+def test_bazelworkerprocessor__dump(patches, exit_code):
     processor = bazel.ABazelWorkerProcessor("PROTOCOL")
+    response = dict(output="OUTPUT", request_id=23)
+    if exit_code is not None:
+        response["exit_code"] = exit_code
     patched = patches(
-        "dict",
         "json",
         prefix="aio.api.bazel.abstract.worker")
-    msg = MagicMock()
 
-    with patched as (m_dict, m_json):
+    with patched as (m_json, ):
         assert (
-            processor._dump(msg)
+            processor._dump(response)
             == m_json.dumps.return_value)
 
     assert (
         m_json.dumps.call_args
-        == [(m_dict.return_value, ), {}])
-    assert (
-        m_dict.call_args
-        == [(), dict(exit_code=0, output=msg)])
+        == [(dict(exit_code=exit_code or 0,
+                  output="OUTPUT",
+                  request_id=23), ), {}])
 
 
 async def test_bazelworkerprocessor__load(patches):
     processor = bazel.ABazelWorkerProcessor("PROTOCOL")
     patched = patches(
-        "json",
         ("ABazelWorkerProcessor.protocol",
          dict(new_callable=PropertyMock)),
         prefix="aio.api.bazel.abstract.worker")
-    recv = MagicMock()
+    recv = dict(arguments=["ARG1", "ARG2"])
 
-    with patched as (m_json, m_proto):
+    with patched as (m_proto, ):
         proto = AsyncMock(return_value=MagicMock())
         m_proto.side_effect = proto
         assert (
@@ -179,13 +250,218 @@ async def test_bazelworkerprocessor__load(patches):
 
     assert (
         proto.return_value.parser.parse_args.call_args
-        == [(m_json.loads.return_value.__getitem__.return_value, ), {}])
+        == [(["ARG1", "ARG2"], ), {}])
+
+
+async def test_bazelworkerprocessor_multiplexed():
+    release = asyncio.Event()
+
+    class Protocol:
+
+        async def __call__(self, args):
+            if args.in_ == "SLOW":
+                await release.wait()
+            else:
+                release.set()
+            warnings.warn(f"WARNED {args.in_}")
+            return f"DONE {args.in_}"
+
+        @property
+        def parser(self):
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--in", dest="in_")
+            return parser
+
+    async def protocol(processor):
+        return Protocol()
+
+    processor = bazel.ABazelWorkerProcessor(protocol, concurrency=2)
+    requests = [
+        json.dumps(dict(arguments=["--in", "SLOW"], requestId=1)),
+        json.dumps(dict(arguments=["--in", "FAST"], requestId=2)),
+        ""]
+    for request in requests:
+        processor.in_q.put_nowait(request)
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        await processor.processor
+    sent = [
+        processor.out_q.get_nowait()
+        for i in range(processor.out_q.qsize())]
+
     assert (
-        m_json.loads.call_args
-        == [(recv, ), {}])
+        [json.loads(msg) for msg in sent[:-1]]
+        == [dict(exit_code=0, output="WARNED FAST\nDONE FAST",
+                 request_id=2),
+            dict(exit_code=0, output="WARNED SLOW\nDONE SLOW",
+                 request_id=1)])
+    assert sent[-1] == ""
+
+
+async def test_bazelworkerprocessor_multiplexed_error():
+
+    class Protocol:
+
+        async def __call__(self, args):
+            if args.in_ == "BOOM":
+                raise Exception("BOOM")
+            return f"DONE {args.in_}"
+
+        @property
+        def parser(self):
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--in", dest="in_")
+            return parser
+
+    async def protocol(processor):
+        return Protocol()
+
+    processor = bazel.ABazelWorkerProcessor(protocol, concurrency=2)
+    requests = [
+        json.dumps(dict(arguments=["--in", "BOOM"], requestId=1)),
+        json.dumps(dict(arguments=["--in", "OK"], requestId=2)),
+        ""]
+    for request in requests:
+        processor.in_q.put_nowait(request)
+    await processor.processor
+    sent = [
+        json.loads(msg)
+        for msg
+        in [processor.out_q.get_nowait()
+            for i in range(processor.out_q.qsize())][:-1]]
+
+    assert len(sent) == 2
+    errored = sent[0]
+    assert errored["exit_code"] == 1
+    assert errored["request_id"] == 1
+    assert errored["output"].startswith("Traceback")
+    assert errored["output"].endswith("Exception: BOOM\n")
+    assert (
+        sent[1]
+        == dict(exit_code=0, output="DONE OK", request_id=2))
+
+
+def test_bazelprotoworkerprocessor_constructor():
+    processor = bazel.ABazelProtoWorkerProcessor("PROTOCOL")
+    assert isinstance(processor, bazel.ABazelWorkerProcessor)
+
+
+async def test_bazelprotoworkerprocessor_read():
+    processor = bazel.ABazelProtoWorkerProcessor("PROTOCOL")
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"\x03ABC\x02DE\x05FG")
+    reader.feed_eof()
+    assert await processor.read(reader) == b"ABC"
+    assert await processor.read(reader) == b"DE"
+    assert await processor.read(reader) == b""
+    assert await processor.read(reader) == b""
+
+
+def test_bazelprotoworkerprocessor_write():
+    processor = bazel.ABazelProtoWorkerProcessor("PROTOCOL")
+    writer = MagicMock()
+    assert not processor.write(writer, b"OUTGOING")
     assert (
-        m_json.loads.return_value.__getitem__.call_args
-        == [("arguments", ), {}])
+        writer.write.call_args
+        == [(b"OUTGOING", ), {}])
+
+
+def test_bazelprotoworkerprocessor_decode_inputs():
+    processor = bazel.ABazelProtoWorkerProcessor("PROTOCOL")
+    assert processor.decode_inputs is False
+    assert "decode_inputs" not in processor.__dict__
+
+
+def test_bazelprotoworkerprocessor__decode(patches):
+    processor = bazel.ABazelProtoWorkerProcessor("PROTOCOL")
+    patched = patches(
+        "worker_protocol",
+        ("ABazelProtoWorkerProcessor.decode_inputs",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.bazel.abstract.worker")
+
+    with patched as (m_protocol, m_inputs):
+        assert (
+            processor._decode(b"RECV")
+            == m_protocol.decode_work_request.return_value)
+
+    assert (
+        m_protocol.decode_work_request.call_args
+        == [(b"RECV", ), dict(inputs=m_inputs.return_value)])
+
+
+@pytest.mark.parametrize("exit_code", [None, 0, 1])
+def test_bazelprotoworkerprocessor__dump(patches, exit_code):
+    processor = bazel.ABazelProtoWorkerProcessor("PROTOCOL")
+    response = dict(output="OUTPUT", request_id=23)
+    if exit_code is not None:
+        response["exit_code"] = exit_code
+    patched = patches(
+        "worker_protocol",
+        prefix="aio.api.bazel.abstract.worker")
+
+    with patched as (m_protocol, ):
+        assert (
+            processor._dump(response)
+            == m_protocol.encode_work_response.return_value)
+
+    assert (
+        m_protocol.encode_work_response.call_args
+        == [(dict(exit_code=exit_code or 0,
+                  output="OUTPUT",
+                  request_id=23), ), {}])
+
+
+async def test_bazelprotoworkerprocessor_roundtrip():
+
+    class Protocol:
+
+        async def __call__(self, args):
+            return f"DONE {args.in_}"
+
+        @property
+        def parser(self):
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--in", dest="in_")
+            return parser
+
+    async def protocol(processor):
+        return Protocol()
+
+    processor = bazel.ABazelProtoWorkerProcessor(protocol, concurrency=2)
+    reader = asyncio.StreamReader()
+    for request_id in [1, 2]:
+        request = (
+            b"\x0a\x04--in"
+            + b"\x0a\x03IN" + str(request_id).encode()
+            + b"\x18" + worker_protocol.encode_varint(request_id))
+        reader.feed_data(
+            worker_protocol.encode_varint(len(request)) + request)
+    reader.feed_eof()
+    writer = MagicMock()
+    setattr(
+        processor,
+        bazel.ABazelProtoWorkerProcessor.connection.cache_name,
+        dict(connection=(reader, writer)))
+    await asyncio.gather(
+        processor.listener,
+        processor.processor,
+        processor.sender)
+
+    written = b"".join(
+        call[0][0]
+        for call
+        in writer.write.call_args_list)
+    responses = []
+    pos = 0
+    while pos < len(written):
+        size, pos = worker_protocol.decode_varint(written, pos)
+        responses.append(written[pos:pos + size])
+        pos += size
+    assert (
+        sorted(responses)
+        == [b"\x12\x08DONE IN1\x18\x01",
+            b"\x12\x08DONE IN2\x18\x02"])
 
 
 def test_bazelworker_constructor():
@@ -200,6 +476,39 @@ def test_bazelworker_constructor():
         worker.processor_class
 
 
+@pytest.mark.parametrize("concurrency", [None, 0, 3])
+def test_bazelworker_concurrency(patches, concurrency):
+    worker = DummyBazelWorker()
+    patched = patches(
+        "event",
+        ("ABazelWorker.args",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.bazel.abstract.worker")
+
+    with patched as (m_event, m_args):
+        m_args.return_value.concurrency = concurrency
+        assert (
+            worker.concurrency
+            == (concurrency or m_event.jobs.limit))
+
+    assert "concurrency" not in worker.__dict__
+
+
+def test_bazelworker_worker_protocol(patches):
+    worker = DummyBazelWorker()
+    patched = patches(
+        ("ABazelWorker.args",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.bazel.abstract.worker")
+
+    with patched as (m_args, ):
+        assert (
+            worker.worker_protocol
+            == m_args.return_value.worker_protocol)
+
+    assert "worker_protocol" not in worker.__dict__
+
+
 def test_bazelworker_persistent(patches):
     worker = DummyBazelWorker()
     patched = patches(
@@ -274,7 +583,18 @@ def test_bazelworker_add_arguments(patches):
     assert (
         parser.add_argument.call_args_list
         == [[("protocol", ), {}],
-            [("--persistent_worker", ), dict(action="store_true")]])
+            [("--persistent_worker", ), dict(action="store_true")],
+            [("--concurrency", ),
+             dict(type=int,
+                  help=("Maximum number of multiplexed requests to "
+                        "process concurrently, defaults to the number "
+                        "of cpus"))],
+            [("--worker_protocol", ),
+             dict(choices=["json", "proto"],
+                  default="json",
+                  help=("Wire format used to talk to Bazel, this "
+                        "should match the `requires-worker-protocol` "
+                        "of the action"))]])
     assert (
         m_super.call_args
         == [(parser, ), {}])
@@ -304,6 +624,8 @@ async def test_bazelworker_protocol(patches):
 async def test_bazelworker_run(patches, persistent):
     worker = DummyBazelWorker()
     patched = patches(
+        ("ABazelWorker.concurrency",
+         dict(new_callable=PropertyMock)),
         ("ABazelWorker.persistent",
          dict(new_callable=PropertyMock)),
         ("ABazelWorker.processor_class",
@@ -311,7 +633,7 @@ async def test_bazelworker_run(patches, persistent):
         "ABazelWorker.protocol",
         prefix="aio.api.bazel.abstract.worker")
 
-    with patched as (m_persistent, m_class, m_protocol):
+    with patched as (m_concurrency, m_persistent, m_class, m_protocol):
         m_persistent.return_value = persistent
         m_class.return_value.return_value.side_effect = AsyncMock()
         if not persistent:
@@ -325,7 +647,8 @@ async def test_bazelworker_run(patches, persistent):
         return
     assert (
         m_class.return_value.call_args
-        == [(m_protocol, ), {}])
+        == [(m_protocol, ),
+            dict(concurrency=m_concurrency.return_value)])
     assert (
         m_class.return_value.return_value.call_args
         == [(), {}])
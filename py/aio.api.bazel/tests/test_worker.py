@@ -1,3 +1,6 @@
+from unittest.mock import PropertyMock
+
+import pytest
 
 from aio.api import bazel
 
@@ -7,7 +10,25 @@ def test_bazelworkerprocessor_constructor():
     assert isinstance(processor, bazel.IBazelWorkerProcessor)
 
 
-def test_bazelworker_constructor():
+def test_bazelprotoworkerprocessor_constructor():
+    processor = bazel.BazelProtoWorkerProcessor("PROTOCOL")
+    assert isinstance(processor, bazel.IBazelWorkerProcessor)
+    assert isinstance(processor, bazel.ABazelWorkerProcessor)
+
+
+@pytest.mark.parametrize("protocol", ["json", "proto"])
+def test_bazelworker_constructor(patches, protocol):
     worker = bazel.BazelWorker()
     assert isinstance(worker, bazel.IBazelWorker)
-    assert worker.processor_class == bazel.BazelWorkerProcessor
+    patched = patches(
+        ("BazelWorker.worker_protocol",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.bazel.worker")
+
+    with patched as (m_protocol, ):
+        m_protocol.return_value = protocol
+        assert (
+            worker.processor_class
+            == (bazel.BazelProtoWorkerProcessor
+                if protocol == "proto"
+                else bazel.BazelWorkerProcessor))
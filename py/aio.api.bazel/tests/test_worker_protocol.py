@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from aio.api.bazel import worker_protocol
+
+
+@pytest.mark.parametrize(
+    "value, encoded",
+    [(0, b"\x00"),
+     (1, b"\x01"),
+     (127, b"\x7f"),
+     (128, b"\x80\x01"),
+     (300, b"\xac\x02"),
+     (2 ** 31 - 1, b"\xff\xff\xff\xff\x07"),
+     (-1, b"\xff" * 9 + b"\x01")])
+async def test_worker_protocol_varint(value, encoded):
+    assert worker_protocol.encode_varint(value) == encoded
+    decoded, pos = worker_protocol.decode_varint(b"X" + encoded, 1)
+    assert worker_protocol.decode_int32(decoded) == value
+    assert pos == len(encoded) + 1
+    reader = asyncio.StreamReader()
+    reader.feed_data(encoded)
+    reader.feed_eof()
+    assert (
+        worker_protocol.decode_int32(
+            await worker_protocol.read_varint(reader))
+        == value)
+    with pytest.raises(asyncio.IncompleteReadError):
+        await worker_protocol.read_varint(reader)
+
+
+def _field(number, wire_type, value):
+    key = worker_protocol.encode_varint(number << 3 | wire_type)
+    if wire_type == worker_protocol.LEN:
+        return key + worker_protocol.encode_varint(len(value)) + value
+    if wire_type == worker_protocol.VARINT:
+        return key + worker_protocol.encode_varint(value)
+    return key + value
+
+
+def test_worker_protocol_decode_work_request():
+    digest = b"\x00\x01\x02"
+    input_msg = (
+        _field(1, worker_protocol.LEN, b"path/to/file")
+        + _field(2, worker_protocol.LEN, digest))
+    data = (
+        _field(1, worker_protocol.LEN, b"--in")
+        + _field(1, worker_protocol.LEN, "fïle".encode())
+        + _field(2, worker_protocol.LEN, input_msg)
+        + _field(3, worker_protocol.VARINT, 23)
+        + _field(4, worker_protocol.VARINT, 1)
+        + _field(5, worker_protocol.VARINT, 10)
+        + _field(6, worker_protocol.LEN, b"sandbox")
+        # unknown fields are skipped
+        + _field(99, worker_protocol.I32, b"abcd")
+        + _field(98, worker_protocol.I64, b"abcdefgh")
+        + _field(97, worker_protocol.LEN, b"unknown"))
+    assert (
+        worker_protocol.decode_work_request(data)
+        == dict(
+            arguments=["--in", "fïle"],
+            inputs=[dict(path="path/to/file", digest=digest)],
+            requestId=23,
+            cancel=True,
+            verbosity=10,
+            sandboxDir="sandbox"))
+    assert (
+        worker_protocol.decode_work_request(data, inputs=False)
+        == dict(
+            arguments=["--in", "fïle"],
+            requestId=23,
+            cancel=True,
+            verbosity=10,
+            sandboxDir="sandbox"))
+    assert (
+        worker_protocol.decode_work_request(b"")
+        == dict(arguments=[], inputs=[]))
+
+
+def test_worker_protocol_decode_input():
+    assert (
+        worker_protocol.decode_input(
+            _field(1, worker_protocol.LEN, b"PATH")
+            + _field(3, worker_protocol.VARINT, 7))
+        == dict(path="PATH", digest=b""))
+
+
+@pytest.mark.parametrize(
+    "decode",
+    [worker_protocol.decode_work_request,
+     worker_protocol.decode_input])
+def test_worker_protocol_decode_bad_wire_type(decode):
+    with pytest.raises(ValueError) as e:
+        decode(worker_protocol.encode_varint(1 << 3 | 3))
+    assert e.value.args[0] == "Unsupported wire type: 3"
+
+
+@pytest.mark.parametrize(
+    "response, encoded",
+    [(dict(), b""),
+     (dict(exit_code=0, output="", request_id=0), b""),
+     (dict(exit_code=1), b"\x08\x01"),
+     (dict(exit_code=-1), b"\x08" + b"\xff" * 9 + b"\x01"),
+     (dict(output="ø"), b"\x12\x02" + "ø".encode()),
+     (dict(request_id=300), b"\x18\xac\x02"),
+     (dict(was_cancelled=True), b"\x20\x01"),
+     (dict(exit_code=2, output="OUT", request_id=7),
+      b"\x08\x02\x12\x03OUT\x18\x07")])
+def test_worker_protocol_encode_work_response(response, encoded):
+    assert (
+        worker_protocol.encode_work_response(response)
+        == worker_protocol.encode_varint(len(encoded)) + encoded)
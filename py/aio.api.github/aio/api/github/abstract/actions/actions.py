@@ -1,11 +1,18 @@
 
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 import abstracts
 
-from gidgethub.apps import get_installation_access_token
-
 from aio.api.github import interface
+from aio.core import utils
+
+if TYPE_CHECKING:
+    from gidgethub import apps as gidgethub_apps
+else:
+    # `gidgethub.apps` pulls in `jwt`/`cryptography`, and is only needed
+    # to dispatch workflows.
+    gidgethub_apps = utils.lazy_import("gidgethub.apps")
 
 
 @abstracts.implementer(interface.IGithubActions)
@@ -58,7 +65,8 @@ class AGithubWorkflows(metaclass=abstracts.Abstraction):
             installation_id: str,
             key: str,
             data: dict | None = None) -> None:
-        access_token_response = await get_installation_access_token(
+        get_token = gidgethub_apps.get_installation_access_token
+        access_token_response = await get_token(
             self.github.api,
             installation_id=installation_id,
             app_id=app_id,
@@ -1,17 +1,21 @@
 
+from __future__ import annotations
+
 import abc
 from functools import cached_property
-from typing import Any
-
-import aiohttp
-
-import gidgethub
-import gidgethub.abc
-import gidgethub.aiohttp
+from typing import TYPE_CHECKING, Any
 
 import abstracts
 
 from aio.api.github import interface
+from aio.core import utils
+
+if TYPE_CHECKING:
+    import aiohttp
+    import gidgethub.aiohttp as gidgethub_aiohttp
+else:
+    # `gidgethub.aiohttp` imports `aiohttp`, which is slow to import.
+    gidgethub_aiohttp = utils.lazy_import("gidgethub.aiohttp")
 
 
 @abstracts.implementer(interface.IGithubAPI)
@@ -42,7 +46,7 @@ class AGithubAPI(metaclass=abstracts.Abstraction):
         raise NotImplementedError
 
     @cached_property
-    def api(self) -> gidgethub.aiohttp.GitHubAPI:
+    def api(self) -> gidgethub_aiohttp.GitHubAPI:
         """Gidgethub API."""
         return self.api_class(
             self.session,
@@ -51,9 +55,9 @@ class AGithubAPI(metaclass=abstracts.Abstraction):
 
     @property
     @abc.abstractmethod
-    def api_class(self) -> type[gidgethub.aiohttp.GitHubAPI]:
+    def api_class(self) -> type[gidgethub_aiohttp.GitHubAPI]:
         """API class."""
-        return gidgethub.aiohttp.GitHubAPI
+        return gidgethub_aiohttp.GitHubAPI
 
     @property
     @abstracts.interfacemethod
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 import pathlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 import aiofiles
-import aiohttp
 
 from .base import AsyncStream
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 class Writer(AsyncStream):
     """This wraps an async file object and provides a `stream_bytes` method to
@@ -1,5 +1,7 @@
 
-import gidgethub.aiohttp
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import abstracts
 
@@ -18,6 +20,9 @@ from .abstract import (
     AGithubWorkflows)
 from . import interface
 
+if TYPE_CHECKING:
+    import gidgethub.aiohttp
+
 
 @abstracts.implementer(interface.IGithubActions)
 class GithubActions(AGithubActions):
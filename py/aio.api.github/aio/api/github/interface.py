@@ -3,15 +3,16 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from datetime import datetime
-from typing import Any, Pattern
-
-from packaging import version as _version
-
-import gidgethub.abc
+from typing import TYPE_CHECKING, Any, Pattern
 
 import abstracts
 
-import aiohttp
+if TYPE_CHECKING:
+    # These are only used for type annotations, and are relatively
+    # expensive to import.
+    import aiohttp
+    import gidgethub.abc
+    from packaging import version as _version
 
 
 class IGithubCommit(metaclass=abstracts.Interface):
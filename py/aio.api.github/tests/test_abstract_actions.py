@@ -76,7 +76,7 @@ def test_abstract_workflows_repo(patches):
 async def test_abstract_workflows_dispatch(patches):
     workflows = github.AGithubWorkflows("ACTIONS")
     patched = patches(
-        "get_installation_access_token",
+        "gidgethub_apps",
         ("AGithubWorkflows.github",
          dict(new_callable=PropertyMock)),
         ("AGithubWorkflows.repo",
@@ -88,7 +88,9 @@ async def test_abstract_workflows_dispatch(patches):
     key = MagicMock()
     data = MagicMock()
 
-    with patched as (m_token, m_gh, m_repo):
+    with patched as (m_apps, m_gh, m_repo):
+        m_token = AsyncMock()
+        m_apps.get_installation_access_token = m_token
         m_repo.return_value.post.side_effect = AsyncMock()
         assert not await workflows.dispatch(
             workflow, app_id, install_id, key, data)
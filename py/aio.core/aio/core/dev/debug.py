@@ -178,9 +178,23 @@ class ANullLogging(ADebugLogging):
         pass
 
 
+def _undecorated(fun: Callable) -> Callable:
+    return fun
+
+
 def logging(*args, **kwargs):
+    """Debug log calls to the decorated function.
+
+    Logging is enabled by setting `AIODEBUG`, or `AIOTRACEDEBUG` to also
+    log the call args and return values.
+
+    This is resolved when the function is decorated - if debug logging is
+    disabled the original function is returned, and has no overhead.
+    """
     if os.environ.get("AIOTRACEDEBUG"):
         return ATraceLogging(*args, **kwargs)
     if os.environ.get("AIODEBUG"):
         return ADebugLogging(*args, **kwargs)
-    return ANullLogging(*args, **kwargs)
+    if args and callable(args[0]):
+        return args[0]
+    return _undecorated
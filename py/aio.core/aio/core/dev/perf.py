@@ -1,9 +1,50 @@
 
 import functools
+import os
+import random
 import time
+from collections.abc import Callable
 
 
-def timing(fun):
+TIMING_ENV = "AIOTIMING"
+
+
+def timing_rate() -> float:
+    """Proportion of calls to time, read from `AIOTIMING`.
+
+    Every call is timed by default. A number is used as the sample rate
+    (eg `0.01` times ~1% of calls), so `0` disables timing. Any other
+    value times every call.
+    """
+    value = os.environ.get(TIMING_ENV, "")
+    if not value:
+        return 1
+    try:
+        return min(max(float(value), 0), 1)
+    except ValueError:
+        return 1
+
+
+def timing(
+        fun: Callable | None = None,
+        *,
+        sample: float | None = None) -> Callable:
+    """Print the time taken by calls to the decorated function.
+
+    This is resolved when the function is decorated - if timing is
+    disabled (`AIOTIMING=0`) the original function is returned, and has
+    no overhead.
+
+    Unless disabled, `sample` sets the proportion of calls that are
+    timed, and overrides the rate set in `AIOTIMING`.
+    """
+    if fun is None:
+        return functools.partial(timing, sample=sample)
+    rate = timing_rate()
+    if rate and sample is not None:
+        rate = min(max(sample, 0), 1)
+    if not rate:
+        return fun
 
     @functools.wraps(fun)
     def wrapper(*args, **kwargs):
@@ -15,4 +56,13 @@ def timing(fun):
             repr(fun.__name__), round(run_time, 3)))
         return value
 
-    return wrapper
+    if rate >= 1:
+        return wrapper
+
+    @functools.wraps(fun)
+    def sampled(*args, **kwargs):
+        if random.random() < rate:
+            return wrapper(*args, **kwargs)
+        return fun(*args, **kwargs)
+
+    return sampled
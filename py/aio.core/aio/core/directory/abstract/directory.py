@@ -11,6 +11,7 @@ from re import Pattern
 import abstracts
 
 from aio.core import event, subprocess as _subprocess
+from aio.core.dev import debug
 from aio.core.functional import async_property, async_set, AwaitableGenerator
 
 
@@ -47,14 +48,10 @@ class ADirectoryFileFinder(
         self.exclude_matcher = exclude_matcher
 
     def handle(self, response: subprocess.CompletedProcess) -> set[str]:
-        return set(
-            path
-            for path
-            in self.parse_response(response)
-            if self.include_path(
-                path,
-                self.path_matcher,
-                self.exclude_matcher))
+        paths: set[str] = set()
+        for line in response.stdout.split("\n"):
+            self._add_path(paths, line)
+        return paths
 
     def handle_error(
             self,
@@ -62,10 +59,35 @@ class ADirectoryFileFinder(
         # TODO: Handle errors in directory classes
         return super().handle_error(response)
 
-    def parse_response(
-            self,
-            response: subprocess.CompletedProcess) -> Iterable[str]:
-        return response.stdout.split("\n")
+    def parse_line(self, line: str) -> str | None:
+        return line
+
+    @debug.logging(
+        log="self.log",
+        show_cpu=True)
+    def run(self, *args, **kwargs) -> set[str] | dict[str, list[str]]:
+        """Run the finder, streaming its output.
+
+        Lines are parsed as they arrive, so that only the matching paths,
+        rather than all of the output, are held in memory.
+        """
+        paths: set[str] = set()
+        response = self.stream_response(
+            *args,
+            parser=partial(self._add_path, paths),
+            **kwargs)
+        return (
+            self.handle_error(response)
+            if self.has_failed(response)
+            else paths)
+
+    def _add_path(self, paths: set[str], line: str) -> None:
+        path = self.parse_line(line)
+        if path and self.include_path(
+                path,
+                self.path_matcher,
+                self.exclude_matcher):
+            paths.add(path)
 
 
 # TODO: rename `match_all_files` -> `match_untracked`
@@ -92,16 +114,11 @@ class AGitDirectoryFileFinder(
     def matcher(self):
         return re.compile(GIT_LS_FILES_EOL_RE)
 
-    def parse_response(
-            self,
-            response: subprocess.CompletedProcess) -> Iterable[str]:
-        if not self.match_all_files:
-            return super().parse_response(response)
-        files = []
-        for line in super().parse_response(response):
-            if filename := self._get_file(line):
-                files.append(filename)
-        return files
+    def parse_line(self, line: str) -> str | None:
+        return (
+            self._get_file(line)
+            if self.match_all_files
+            else line)
 
     def _get_file(self, line: str) -> str | None:
         eol, name = self._parse_line(line)
@@ -1,5 +1,8 @@
 """aio.core.event."""
 
+from .budget import available_cpus, JobsBudget, jobs
+from .registry import Executors, executors
+from .profiling import ExecutorProfiler, profiler
 from .loader import ALoader, ILoader, Loader
 from .reactive import AReactive, IReactive
 from .executive import AExecutive, IExecutive
@@ -9,7 +12,14 @@ __all__ = (
     "AExecutive",
     "ALoader",
     "AReactive",
+    "available_cpus",
+    "ExecutorProfiler",
+    "Executors",
+    "executors",
     "Loader",
     "IExecutive",
     "ILoader",
-    "IReactive")
+    "IReactive",
+    "jobs",
+    "JobsBudget",
+    "profiler")
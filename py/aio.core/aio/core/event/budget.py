@@ -0,0 +1,109 @@
+
+import math
+import os
+import pathlib
+from functools import cached_property
+
+
+CGROUP_ROOT = pathlib.Path("/sys/fs/cgroup")
+
+
+def cgroup_cpu_quota(root: pathlib.Path = CGROUP_ROOT) -> float | None:
+    """CPU quota of the cgroup, as a (fractional) number of CPUs.
+
+    Returns `None` if there is no quota, or it cannot be read.
+
+    Both cgroup v2 (`cpu.max`) and v1 (`cpu.cfs_quota_us`) are checked.
+    """
+    try:
+        quota, period = root.joinpath("cpu.max").read_text().split()[:2]
+    except (OSError, ValueError):
+        for cpu_dir in ("cpu", "cpu,cpuacct"):
+            try:
+                quota = root.joinpath(
+                    cpu_dir, "cpu.cfs_quota_us").read_text().strip()
+                period = root.joinpath(
+                    cpu_dir, "cpu.cfs_period_us").read_text().strip()
+            except OSError:
+                continue
+            break
+        else:
+            return None
+    if quota in ("max", "-1"):
+        return None
+    try:
+        cpus = int(quota) / int(period)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return cpus if cpus > 0 else None
+
+
+def available_cpus() -> int:
+    """Number of CPUs that this process can use.
+
+    This is the number of CPUs in this process' affinity mask, reduced by
+    any cgroup CPU quota (eg a container CPU limit).
+    """
+    sched_getaffinity = getattr(os, "sched_getaffinity", None)
+    cpus = (
+        len(sched_getaffinity(0))
+        if sched_getaffinity
+        else os.cpu_count()) or 1
+    quota = cgroup_cpu_quota()
+    if quota:
+        cpus = min(cpus, math.ceil(quota))
+    return max(cpus, 1)
+
+
+class JobsBudget:
+    """Process-wide budget of parallel jobs.
+
+    By default the budget is the number of CPUs actually available to the
+    process (see `available_cpus`) rather than the number of CPUs on the
+    machine. This can be overridden with `configure`, eg from a `--jobs`
+    cli arg.
+
+    Executors and batching in `aio.core` are sized from the budget, so
+    that concurrently running work shares it rather than each part
+    sizing itself to the whole machine.
+
+    ```python
+
+    from aio.core import event
+
+    event.jobs.configure(4)
+    assert event.jobs.limit == 4
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._jobs: int | None = None
+
+    @cached_property
+    def available(self) -> int:
+        """Number of CPUs available to this process."""
+        return available_cpus()
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of parallel jobs."""
+        return self._jobs or self.available
+
+    @property
+    def thread_limit(self) -> int:
+        """Maximum number of threads for (mostly io-bound) thread pools and
+        coroutine concurrency.
+
+        As with the `ThreadPoolExecutor` default, this allows for 4
+        threads more than the job limit, to a max of 32.
+        """
+        return min(32, self.limit + 4)
+
+    def configure(self, jobs: int | None) -> None:
+        """Set the job limit, `None` restores the default."""
+        if jobs is not None and jobs < 1:
+            raise ValueError(f"Jobs must be a positive number: {jobs}")
+        self._jobs = jobs
+
+
+jobs = JobsBudget()
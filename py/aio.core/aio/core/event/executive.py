@@ -1,11 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 from functools import partial
+from multiprocessing import shared_memory
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 import abstracts
 
 from aio.core import event, functional, tasks
 from aio.core.dev import debug
+from aio.core.event.profiling import ExecutorProfiler, profiler
+
+
+# Buffers at least this large are passed to process pools through
+# shared memory rather than being pickled.
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
+
+class SharedArg:
+    """Picklable handle to a buffer held in shared memory."""
+
+    def __init__(self, name: str, size: int, as_bytes: bool) -> None:
+        self.name = name
+        self.size = size
+        self.as_bytes = as_bytes
+
+    @contextmanager
+    def attached(self) -> Iterator[bytes | memoryview]:
+        """Attach to the shared memory, and yield the buffer.
+
+        `bytes` are still copied out of shared memory once, in the worker,
+        as the executable expects `bytes`. This avoids pickling them, but
+        not copying them. `memoryview`s are yielded without copying, so
+        executables that accept the buffer protocol, eg for hashing, can
+        be passed a `memoryview` to avoid the copy.
+        """
+        shm = shared_memory.SharedMemory(name=self.name)
+        view = shm.buf[:self.size]  # type:ignore
+        try:
+            yield (
+                view.tobytes()
+                if self.as_bytes
+                else view)
+        finally:
+            view.release()
+            try:
+                shm.close()
+            except BufferError:
+                # The executable has kept a reference to the buffer,
+                # the mapping is released with it.
+                pass
+
+
+def shared_call(
+        executable: Callable,
+        args: tuple,
+        kwargs: dict) -> Any:
+    """Call an executable, resolving any `SharedArg`s."""
+    with ExitStack() as stack:
+
+        def resolve(arg):
+            return (
+                stack.enter_context(arg.attached())
+                if isinstance(arg, SharedArg)
+                else arg)
+
+        return executable(
+            *(resolve(arg) for arg in args),
+            **{k: resolve(v) for k, v in kwargs.items()})
 
 
 # TODO: split `IReactive.pool` to here
@@ -45,11 +107,18 @@ class AExecutive(metaclass=abstracts.Abstraction):
             executable: Callable,
             *args,
             **kwargs) -> Any:
-        if kwargs:
-            executable = partial(executable, **kwargs)
-        return await self.loop.run_in_executor(
-            self.pool,
+        if self.shares_memory and self._shares_args(args, kwargs):
+            with self.shared_args(args, kwargs) as (args, kwargs):
+                return await self._run_in_executor(
+                    executable,
+                    partial(shared_call, executable),
+                    args,
+                    kwargs)
+        return await self._run_in_executor(
             executable,
+            (partial(executable, **kwargs)
+             if kwargs
+             else executable),
             *args)
 
     def execute_in_batches(
@@ -72,6 +141,74 @@ class AExecutive(metaclass=abstracts.Abstraction):
                  max_batch_size=max_batch_size)),
             limit=concurrency)
 
+    @property
+    def profiler(self) -> ExecutorProfiler:
+        """Profiler for calls submitted to the pool."""
+        return profiler
+
+    @property
+    def shared_memory_threshold(self) -> int | None:
+        """Minimum size of buffers passed through shared memory.
+
+        Set to `None` to always pickle arguments.
+        """
+        return SHARED_MEMORY_THRESHOLD
+
+    @property
+    def shares_memory(self) -> bool:
+        """Pass large buffers to the pool through shared memory."""
+        return bool(
+            self.shared_memory_threshold
+            and isinstance(self.pool, ProcessPoolExecutor))
+
+    @contextmanager
+    def shared_args(
+            self,
+            args: tuple,
+            kwargs: dict) -> Iterator[tuple[tuple, dict]]:
+        """Move large buffer arguments into shared memory.
+
+        Yields the arguments with large buffers replaced by
+        `SharedArg` handles. The shared memory is released on exit.
+
+        `memoryview`s that are too small to share are copied to `bytes`,
+        as they cannot be pickled.
+        """
+        shared: list[shared_memory.SharedMemory] = []
+
+        def share(arg):
+            if not self._should_share(arg):
+                return (
+                    arg.tobytes()
+                    if isinstance(arg, memoryview)
+                    else arg)
+            size = memoryview(arg).nbytes
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            shared.append(shm)
+            shm.buf[:size] = memoryview(arg).cast("B")
+            return SharedArg(shm.name, size, isinstance(arg, bytes))
+
+        try:
+            yield (
+                tuple(share(arg) for arg in args),
+                {k: share(v) for k, v in kwargs.items()})
+        finally:
+            for shm in shared:
+                shm.close()
+                shm.unlink()
+
+    def _shares_args(self, args: tuple, kwargs: dict) -> bool:
+        return any(
+            isinstance(arg, memoryview) or self._should_share(arg)
+            for arg
+            in (*args, *kwargs.values()))
+
+    def _should_share(self, arg: Any) -> bool:
+        return bool(
+            isinstance(arg, (bytes, memoryview))
+            and self.shared_memory_threshold
+            and memoryview(arg).nbytes >= self.shared_memory_threshold)
+
     def _debug_execute(self, start, result, time_taken, result_info):
         (instance, (executable, *args), kwargs), start_time = start
         pool_name = (
@@ -79,11 +216,31 @@ class AExecutive(metaclass=abstracts.Abstraction):
             if self.pool.__class__.__name__ == "ProcessPoolExecutor"
             else "\N{nonforking}")
         pool_info = f"{pool_name}:{hex(id(self.pool))}"
+        return (
+            f"{pool_info} {result_info}: "
+            f"{self._executable_name(executable)}")
+
+    def _executable_name(self, executable: Callable) -> str:
         if type(executable) is partial:
             executable = executable.func
         name = getattr(
             executable, "__qualname__",
             executable.__class__.__qualname__)
-        return (
-            f"{pool_info} {result_info}: "
-            f"{executable.__module__}.{name}")
+        return f"{executable.__module__}.{name}"
+
+    async def _run_in_executor(
+            self,
+            executable: Callable,
+            call: Callable,
+            *args) -> Any:
+        if self.profiler.enabled:
+            return await self.profiler.run_in_executor(
+                self.loop,
+                self.pool,
+                self._executable_name(executable),
+                call,
+                *args)
+        return await self.loop.run_in_executor(
+            self.pool,
+            call,
+            *args)
@@ -0,0 +1,132 @@
+"""Opt-in profiling of calls submitted to executors."""
+
+import asyncio
+import os
+import pickle
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any
+from collections.abc import Callable
+
+
+PROFILE_ENV = "AIOEXECUTORPROFILE"
+REPORT_HEADER = (
+    "calls", "wait(s)", "max wait", "run(s)", "max run",
+    "args(B)", "result(B)", "workers")
+
+
+def profiled_call(
+        executable: Callable,
+        submitted: float,
+        pickles: bool,
+        *args) -> tuple[Any, dict]:
+    """Call an executable, returning the result and timing stats."""
+    started = time.time()
+    result = executable(*args)
+    finished = time.time()
+    return (
+        result,
+        dict(pid=os.getpid(),
+             queue_wait=max(started - submitted, 0),
+             run_time=finished - started,
+             result_size=(
+                 len(pickle.dumps(result))
+                 if pickles
+                 else 0)))
+
+
+class ExecutorProfiler:
+    """Records how calls submitted to executors spend their time.
+
+    For each call the queue wait, run time, pickled argument and result
+    sizes, and the worker PID are recorded, and aggregated per
+    function.
+
+    Profiling is enabled by setting `AIOEXECUTORPROFILE` in the
+    environment, or by calling `enable`.
+    """
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        self._enabled = enabled
+        self.calls: defaultdict[str, list[dict]] = defaultdict(list)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self._enabled
+            if self._enabled is not None
+            else os.environ.get(PROFILE_ENV))
+
+    @property
+    def summary(self) -> dict[str, dict]:
+        """Call stats aggregated per function."""
+        summary = {}
+        for name, calls in self.calls.items():
+            waits = [call["queue_wait"] for call in calls]
+            runs = [call["run_time"] for call in calls]
+            summary[name] = dict(
+                calls=len(calls),
+                queue_wait=sum(waits),
+                max_queue_wait=max(waits),
+                run_time=sum(runs),
+                max_run_time=max(runs),
+                arg_size=sum(call["arg_size"] for call in calls),
+                result_size=sum(call["result_size"] for call in calls),
+                workers=len(set(call["pid"] for call in calls)))
+        return summary
+
+    def enable(self, enabled: bool = True) -> None:
+        self._enabled = enabled
+
+    def record(self, name: str, **stats) -> None:
+        self.calls[name].append(stats)
+
+    def report(self) -> str:
+        """Tabulated summary, ordered by total time spent."""
+        summary = sorted(
+            self.summary.items(),
+            key=lambda item: (
+                item[1]["queue_wait"] + item[1]["run_time"]),
+            reverse=True)
+        lines = ["\t".join(("function", *REPORT_HEADER))]
+        for name, stats in summary:
+            lines.append(
+                "\t".join((
+                    name,
+                    str(stats["calls"]),
+                    f"{stats['queue_wait']:.3f}",
+                    f"{stats['max_queue_wait']:.3f}",
+                    f"{stats['run_time']:.3f}",
+                    f"{stats['max_run_time']:.3f}",
+                    str(stats["arg_size"]),
+                    str(stats["result_size"]),
+                    str(stats["workers"]))))
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+    async def run_in_executor(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            pool: Executor,
+            name: str,
+            executable: Callable,
+            *args) -> Any:
+        """Run an executable in the pool, recording its stats."""
+        pickles = isinstance(pool, ProcessPoolExecutor)
+        arg_size = (
+            len(pickle.dumps((executable, args)))
+            if pickles
+            else 0)
+        result, stats = await loop.run_in_executor(
+            pool,
+            partial(profiled_call, executable, time.time(), pickles),
+            *args)
+        self.record(name, arg_size=arg_size, **stats)
+        return result
+
+
+profiler = ExecutorProfiler()
@@ -2,9 +2,12 @@
 import asyncio
 from concurrent import futures
 from functools import cached_property
+from collections.abc import Callable
 
 import abstracts
 
+from aio.core.event.registry import executors
+
 
 class IReactive(metaclass=abstracts.Interface):
     """Object that has a `loop`."""
@@ -47,4 +50,33 @@ class AReactive(IReactive, metaclass=abstracts.Abstraction):
 
     @cached_property
     def pool(self) -> futures.Executor:
-        return self._pool or futures.ProcessPoolExecutor()
+        """Processor pool.
+
+        Returns the injected pool if one was passed; otherwise returns the
+        shared executor named by `pool_name` from the process-wide
+        registry.
+        """
+        return self._pool or executors.get(
+            self.pool_name,
+            initializers=self.pool_initializers)
+
+    @property
+    def pool_initializers(self) -> tuple[tuple[Callable, tuple], ...]:
+        """Initializers, with their args, to run once in each worker process
+        of the shared pool.
+
+        Initializers are added to the shared pool, and run in each worker
+        before it next runs a call if they have not already run in it.
+
+        These can be used to preload modules or build objects that can
+        then be reused across calls submitted to the pool.
+
+        Initializers must be picklable, eg module functions or
+        classmethods.
+        """
+        return ()
+
+    @property
+    def pool_name(self) -> str:
+        """Name of the shared executor to use if no pool was injected."""
+        return "process"
@@ -0,0 +1,229 @@
+import os
+import threading
+from concurrent import futures
+from typing import Any
+from collections.abc import Callable
+
+from .budget import jobs
+
+
+Initializers = tuple[tuple[Callable, tuple], ...]
+
+# Initializers that have run in this (worker) process.
+_initialized: set[tuple[Callable, tuple]] = set()
+
+
+def initialize_worker(initializers: Initializers) -> None:
+    """Run initializers in a newly started pool worker."""
+    for initializer in initializers:
+        _initialize(initializer)
+
+
+def initialized_call(
+        initializers: Initializers,
+        fn: Callable,
+        *args,
+        **kwargs) -> Any:
+    """Run any initializers that have not yet run in this worker, and then
+    call `fn`."""
+    for initializer in initializers:
+        if initializer not in _initialized:
+            _initialize(initializer)
+    return fn(*args, **kwargs)
+
+
+def _initialize(initializer: tuple[Callable, tuple]) -> None:
+    fn, args = initializer
+    fn(*args)
+    _initialized.add(initializer)
+
+
+class ProcessPoolExecutor(futures.ProcessPoolExecutor):
+    """Process pool that can be given more worker initializers once it has
+    been created.
+
+    Initializers that are added later are run lazily, in each worker,
+    before it next runs a call.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.initializers: Initializers = (
+            kwargs["initargs"][0]
+            if kwargs.get("initializer") is initialize_worker
+            else ())
+        self.added_initializers: Initializers = ()
+
+    def add_initializers(self, initializers: Initializers) -> None:
+        """Add initializers to run in each worker."""
+        self.added_initializers += tuple(
+            initializer
+            for initializer
+            in dict.fromkeys(initializers)
+            if initializer not in self.initializers
+            and initializer not in self.added_initializers)
+
+    def submit(self, fn, /, *args, **kwargs):
+        if self.added_initializers:
+            return super().submit(
+                initialized_call,
+                self.added_initializers,
+                fn,
+                *args,
+                **kwargs)
+        return super().submit(fn, *args, **kwargs)
+
+
+EXECUTOR_KINDS: dict[str, type[futures.Executor]] = dict(
+    process=ProcessPoolExecutor,
+    thread=futures.ThreadPoolExecutor)
+
+
+class Executors:
+    """Process-wide registry of named executors.
+
+    Executors are created lazily on first use and shared by all callers
+    requesting the same name, so that objects which each need a pool do
+    not spawn competing pools.
+
+    Worker initializers requested for a process pool that already exists
+    are added to it, and run in each worker before it next runs a call.
+
+    The default names are `process` and `thread`, other names can be used
+    by specifying the `kind` of executor.
+
+    Worker sizes can be set per name with `configure`, before the executor
+    is first used. Otherwise, they are sized from the process-wide jobs
+    budget (`event.jobs`).
+
+    ```python
+
+    from aio.core import event
+
+    event.executors.configure(process=4)
+    pool = event.executors.get("process")
+    ...
+    event.executors.shutdown()
+    ```
+
+    Process pool workers kill any subprocesses they are running if they
+    are terminated, so that `cancel` also stops running tools.
+
+    The registry is reset in forked child processes, which should not use
+    executors created by their parent.
+    """
+
+    def __init__(self) -> None:
+        self._executors: dict[str, futures.Executor] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.sizes: dict[str, int | None] = {}
+
+    @property
+    def executors(self) -> dict[str, futures.Executor]:
+        """Created executors, keyed by name."""
+        if self._pid != os.getpid():
+            self._executors = {}
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+        return self._executors
+
+    def cancel(self) -> None:
+        """Cancel pending work, stop all created executors, and kill any
+        tracked subprocesses.
+
+        Process pool workers are terminated. Work already running in a
+        thread can not be interrupted, but any subprocess it is waiting on
+        is killed.
+        """
+        from aio.core.subprocess import tracking
+
+        executors = self.executors
+        with self._lock:
+            while executors:
+                executor = executors.popitem()[1]
+                if hasattr(executor, "terminate_workers"):
+                    executor.terminate_workers()
+                    continue
+                processes = getattr(executor, "_processes", None) or {}
+                executor.shutdown(wait=False, cancel_futures=True)
+                for process in list(processes.values()):
+                    process.terminate()
+        tracking.processes.kill()
+
+    def configure(self, **sizes: int | None) -> None:
+        """Set the number of workers for named executors."""
+        self.sizes.update(sizes)
+
+    def create(
+            self,
+            kind: str,
+            max_workers: int | None = None,
+            initializers: Initializers = ()) -> futures.Executor:
+        """Create a new executor of the given `kind`."""
+        # Imported here as the subprocess module depends on this one.
+        from aio.core.subprocess import tracking
+
+        if kind not in EXECUTOR_KINDS:
+            raise TypeError(f"Unknown executor kind: {kind}")
+        if kind == "process":
+            initializers = (
+                (tracking.kill_on_terminate, ()),
+                *initializers)
+        if max_workers is None:
+            max_workers = (
+                jobs.thread_limit
+                if kind == "thread"
+                else jobs.limit)
+        kwargs: dict = dict(max_workers=max_workers)
+        if initializers:
+            kwargs.update(
+                initializer=initialize_worker,
+                initargs=(initializers, ))
+        return EXECUTOR_KINDS[kind](**kwargs)
+
+    def get(
+            self,
+            name: str = "process",
+            kind: str | None = None,
+            initializers: Initializers = ()) -> futures.Executor:
+        """Get, or create, the named executor.
+
+        If the executor exists, any `initializers` are added to it. Only
+        process pools can be given initializers once created.
+        """
+        executors = self.executors
+        with self._lock:
+            if name not in executors:
+                executors[name] = self.create(
+                    kind or name,
+                    self.sizes.get(name),
+                    initializers)
+            elif initializers:
+                self._add_initializers(name, initializers)
+            return executors[name]
+
+    def _add_initializers(
+            self,
+            name: str,
+            initializers: Initializers) -> None:
+        executor = self.executors[name]
+        if not isinstance(executor, ProcessPoolExecutor):
+            raise TypeError(
+                f"Initializers can not be added to executor: {name}")
+        executor.add_initializers(initializers)
+
+    def shutdown(
+            self,
+            wait: bool = True,
+            cancel_futures: bool = False) -> None:
+        """Shutdown and forget all created executors."""
+        executors = self.executors
+        with self._lock:
+            while executors:
+                executors.popitem()[1].shutdown(
+                    wait=wait,
+                    cancel_futures=cancel_futures)
+
+
+executors = Executors()
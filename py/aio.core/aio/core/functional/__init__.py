@@ -11,6 +11,7 @@ from .decorators import async_property
 from .generator import AwaitableGenerator
 from .process import async_map
 from .utils import (
+    balanced_batches,
     batches,
     batch_jobs,
     maybe_awaitable,
@@ -27,6 +28,7 @@ __all__ = (
     "async_map",
     "async_set",
     "AwaitableGenerator",
+    "balanced_batches",
     "batches",
     "batch_jobs",
     "CollectionQuery",
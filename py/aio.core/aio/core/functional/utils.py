@@ -1,11 +1,12 @@
 import asyncio
 import contextlib
 import gzip
+import heapq
 import inspect
-import os
 import textwrap
-from typing import Any
-from collections.abc import Awaitable, Callable, Iterable, Iterator, Sized
+from typing import Any, TypeVar
+from collections.abc import (
+    Awaitable, Callable, Hashable, Iterable, Iterator, Mapping, Sized)
 
 from trycast import isassignable  # type:ignore
 
@@ -15,9 +16,13 @@ try:
 except ImportError:
     import json  # type:ignore
 
+from aio.core.event.budget import jobs as _jobs
 from aio.core.functional import exceptions
 
 
+K = TypeVar("K", bound=Hashable)
+
+
 def maybe_awaitable(result: Any) -> Awaitable:
     """Make anything awaitable.
 
@@ -107,6 +112,40 @@ def batches(items: Iterable, batch_size: int) -> Iterator[list]:
         yield batch
 
 
+def balanced_batches(
+        costs: Mapping[K, float],
+        batch_count: int) -> list[list[K]]:
+    """Split items into at most `batch_count` batches, with a similar total
+    cost in each.
+
+    `costs` maps each item to an estimate of the cost of processing it, eg
+    the size of a file.
+
+    Items are assigned, most costly first, to the batch with the lowest
+    total cost (or fewest items, for equal costs). Batches are returned with
+    the most costly first, so that they are started first when submitted to
+    a pool in order.
+    """
+    batch_count = max(1, min(batch_count, len(costs)))
+    loads = [(0., 0, i) for i in range(0, batch_count)]
+    batched: list[list[K]] = [[] for _ in range(0, batch_count)]
+    totals = [0.] * batch_count
+    ordered = sorted(costs.items(), key=lambda item: item[1], reverse=True)
+    for item, cost in ordered:
+        load, size, i = heapq.heappop(loads)
+        batched[i].append(item)
+        totals[i] = load + cost
+        heapq.heappush(loads, (totals[i], size + 1, i))
+    return [
+        batched[i]
+        for i
+        in sorted(
+            range(0, batch_count),
+            key=lambda i: totals[i],
+            reverse=True)
+        if batched[i]]
+
+
 def batch_jobs(
         jobs: Sized,
         max_batch_size: int | None = None,
@@ -118,7 +157,7 @@ def batch_jobs(
     if bad_jobs_type:
         raise exceptions.BatchedJobsError(
             f"Wrong type for `batch_jobs` ({type(jobs)}: {jobs}")
-    proc_count = os.cpu_count() or 1
+    proc_count = _jobs.limit
     batch_count = round(len(jobs) / proc_count)
     if max_batch_size:
         batch_count = min(batch_count, max_batch_size)
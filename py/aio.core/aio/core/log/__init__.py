@@ -1,9 +1,11 @@
 
 from .logging import (
+    BatchingHandler,
     QueueHandler,
     QueueLogger)
 
 
 __all__ = (
+    "BatchingHandler",
     "QueueHandler",
     "QueueLogger")
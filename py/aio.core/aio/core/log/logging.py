@@ -2,10 +2,14 @@ import asyncio
 import atexit
 import logging
 import logging.handlers
+import threading
 from functools import cached_property
 from queue import SimpleQueue
 
 
+BATCH_INTERVAL = 0.1
+
+
 class QueueHandler(logging.handlers.QueueHandler):
 
     def emit(self, record: logging.LogRecord) -> None:
@@ -17,6 +21,96 @@ class QueueHandler(logging.handlers.QueueHandler):
             self.handleError(record)
 
 
+class BatchingHandler(logging.Handler):
+    """Coalesces records for a target handler, and flushes them in
+    batches.
+
+    Records are flushed when `capacity` records are buffered, after
+    `interval` seconds, or immediately for records at or above
+    `flush_level`.
+
+    Batches for `StreamHandler` targets are written to the stream with a
+    single write and flush.
+
+    The handler's level is that of the target, so that any later change to
+    the target's level applies.
+    """
+
+    def __init__(
+            self,
+            target: logging.Handler,
+            capacity: int,
+            interval: float = BATCH_INTERVAL,
+            flush_level: int = logging.ERROR) -> None:
+        self.target = target
+        super().__init__(target.level)
+        self.capacity = capacity
+        self.interval = interval
+        self.flush_level = flush_level
+        self.buffer: list[logging.LogRecord] = []
+        self._timer: threading.Timer | None = None
+
+    @property
+    def level(self) -> int:
+        return self.target.level
+
+    @level.setter
+    def level(self, level: int) -> None:
+        self.target.setLevel(level)
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.buffer.append(record)
+        if (len(self.buffer) >= self.capacity
+                or record.levelno >= self.flush_level):
+            self.flush()
+        elif not self._timer:
+            self._timer = threading.Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            try:
+                self._timer.start()
+            except RuntimeError:
+                # Threads cannot be started during interpreter shutdown,
+                # eg when the listener is stopped `atexit`.
+                self.flush()
+
+    def flush(self) -> None:
+        with self.lock:  # type:ignore
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            records, self.buffer = self.buffer, []
+            if records:
+                self.write(records)
+
+    def write(self, records: list[logging.LogRecord]) -> None:
+        if not isinstance(self.target, logging.StreamHandler):
+            for record in records:
+                self.target.handle(record)
+            return
+        lines = []
+        for record in records:
+            if not self.target.filter(record):
+                continue
+            try:
+                lines.append(
+                    f"{self.target.format(record)}"
+                    f"{self.target.terminator}")
+            except Exception:
+                self.target.handleError(record)
+        if not lines:
+            return
+        with self.target.lock:  # type:ignore
+            try:
+                self.target.stream.write("".join(lines))
+                self.target.flush()
+            except Exception:
+                self.target.handleError(records[-1])
+
+
 class QueueLogger:
     """Wraps a `logging.Logger` with a listening queue.
 
@@ -25,16 +119,24 @@ class QueueLogger:
 
     If you set `stop_on_exit` to `False`, you must `stop` the listener
     yourself to ensure the logging queue is cleared.
+
+    Setting `batch_capacity` wraps the logger's handlers with
+    `BatchingHandler`s, so that high volumes of records are written in
+    batches.
     """
 
     def __init__(
             self,
             logger: logging.Logger,
             stop_on_exit: bool = True,
-            respect_handler_level: bool = True) -> None:
+            respect_handler_level: bool = True,
+            batch_capacity: int = 0,
+            batch_interval: float = BATCH_INTERVAL) -> None:
         self._logger = logger
         self.respect_handler_level = respect_handler_level
         self.stop_on_exit = stop_on_exit
+        self.batch_capacity = batch_capacity
+        self.batch_interval = batch_interval
 
     @cached_property
     def handler(self) -> QueueHandler:
@@ -70,9 +172,22 @@ class QueueLogger:
     def listener(self) -> logging.handlers.QueueListener:
         return self.listener_class(
             self.queue,
-            *self.handlers,
+            *self.listener_handlers,
             respect_handler_level=self.respect_handler_level)
 
+    @cached_property
+    def listener_handlers(self) -> list[logging.Handler]:
+        """Handlers called by the listener, batched if required."""
+        if not self.batch_capacity:
+            return self.handlers
+        return [
+            BatchingHandler(
+                handler,
+                self.batch_capacity,
+                interval=self.batch_interval)
+            for handler
+            in self.handlers]
+
     @cached_property
     def logger(self) -> logging.Logger:
         """Wrapped `Logger` with `handler` added."""
@@ -82,5 +197,11 @@ class QueueLogger:
     def start(self) -> logging.Logger:
         self.listener.start()
         if self.stop_on_exit:
-            atexit.register(self.listener.stop)
+            atexit.register(self.stop)
         return self.logger
+
+    def stop(self) -> None:
+        """Stop the listener, and flush any batched records."""
+        self.listener.stop()
+        for handler in self.listener_handlers:
+            handler.flush()
@@ -1,6 +1,7 @@
 import argparse
 import asyncio
 import sys
+import traceback
 from functools import cached_property
 from typing import Any, TextIO
 from collections.abc import Awaitable, Callable
@@ -43,11 +44,13 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
                 Awaitable[interface.IProcessProtocol]],
             stdin: TextIO = sys.stdin,
             stdout: TextIO = sys.stdout,
-            log: Callable[[str], None] | None = None) -> None:
+            log: Callable[[str], None] | None = None,
+            concurrency: int = 1) -> None:
         self._protocol = protocol
         self.stdin = stdin
         self.stdout = stdout
         self._log = log
+        self.concurrency = concurrency
 
     async def __call__(self) -> None:
         await self.start()
@@ -76,15 +79,18 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
             reader = await self.reader
         self.log(f"START LISTENING {reader}")
         while True:
-            line = await reader.readline()
-            if not line:
+            message = await self.read(reader)
+            if not message:
                 break
-            if not line.strip():
-                continue
-            await self.in_q.put(line.decode())
+            await self.in_q.put(message)
         self.log("STOP LISTENING")
         await self.in_q.put("")
 
+    @cached_property
+    def limit(self) -> asyncio.Semaphore:
+        """Limits the number of requests processed concurrently."""
+        return asyncio.Semaphore(self.concurrency)
+
     @cached_property
     def loop(self) -> asyncio.AbstractEventLoop:
         return asyncio.get_event_loop()
@@ -98,12 +104,17 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
         async with self.connecting:
             protocol = await self.protocol
         self.log(f"START PROCESSING {protocol}")
+        handling: set[asyncio.Task] = set()
         while True:
             recv = await self.recv()
             if not recv:
                 break
-            await self.send(await self.process(recv))
-            self.complete()
+            await self.limit.acquire()
+            task = asyncio.create_task(self.handle(recv))
+            handling.add(task)
+            task.add_done_callback(handling.discard)
+        if handling:
+            await asyncio.gather(*handling)
         self.log("STOP PROCESSING")
         await self.send("")
 
@@ -125,7 +136,7 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
             if not outgoing:
                 break
             self.out_q.task_done()
-            writer.write(outgoing.encode())
+            self.write(writer, outgoing)
         self.log("STOP SENDING")
 
     @cached_property
@@ -161,6 +172,31 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
     def complete(self) -> None:
         self.in_q.task_done()
 
+    async def handle(self, recv: Any) -> None:
+        """Process a request and send the response.
+
+        Responses are sent as soon as they are ready, which may be out
+        of order if the processor is concurrent.
+        """
+        try:
+            await self.send(await self.process(recv))
+        except Exception as e:
+            if (response := self.handle_error(recv, e)) is not None:
+                await self.send(response)
+        finally:
+            self.complete()
+            self.limit.release()
+
+    def handle_error(self, recv: Any, error: Exception) -> Any:
+        """Log a request that failed to process, and return the response.
+
+        Returning `None` sends no response.
+        """
+        self.log(
+            f"ERROR: {recv}\n"
+            f"{''.join(traceback.format_exception(error))}")
+        return None
+
     def log(self, message: str) -> None:
         if self._log:
             self._log(f"{message}\n")
@@ -170,6 +206,17 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
         self.log(f"PROCESS: {protocol} {data}")
         return await protocol(data)
 
+    async def read(self, reader: asyncio.StreamReader) -> Any:
+        """Read the next message, or an empty message at the end of the
+        stream.
+
+        By default messages are non-empty lines.
+        """
+        while line := await reader.readline():
+            if line.strip():
+                return line.decode()
+        return ""
+
     async def recv(self) -> Any:
         recv = await self.in_q.get()
         self.log(f"RECV: {recv}")
@@ -179,6 +226,10 @@ class AStdinStdoutProcessor(metaclass=abstracts.Abstraction):
         self.log(f"SEND: {msg}")
         await self.out_q.put(msg)
 
+    def write(self, writer: asyncio.StreamWriter, outgoing: Any) -> None:
+        """Write an outgoing message."""
+        writer.write(outgoing.encode())
+
     async def start(self) -> None:
         self.log("PROCESSOR START")
         await asyncio.gather(
@@ -16,7 +16,13 @@ class IProcessor(metaclass=abstracts.Interface):
 class IStdinStdoutProcessor(IProcessor, metaclass=abstracts.Interface):
 
     @abstracts.interfacemethod
-    def __init__(self, processor, stdin=None, stdout=None, log=None):
+    def __init__(
+            self,
+            processor,
+            stdin=None,
+            stdout=None,
+            log=None,
+            concurrency=1):
         raise NotImplementedError
 
 
@@ -1,14 +1,19 @@
 """aio.core.subprocess."""
 
-from .async_subprocess import AsyncSubprocess, run, parallel
+from .async_subprocess import AsyncSubprocess, parallel, run, stream
 from .handler import ASubprocessHandler, ISubprocessHandler
-from . import exceptions
+from .tracking import processes, RunningProcesses
+from . import exceptions, tracking
 
 
 __all__ = (
     "exceptions",
     "run",
     "parallel",
+    "processes",
+    "tracking",
     "ASubprocessHandler",
     "AsyncSubprocess",
-    "ISubprocessHandler")
+    "ISubprocessHandler",
+    "RunningProcesses",
+    "stream")
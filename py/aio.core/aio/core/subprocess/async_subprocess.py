@@ -3,10 +3,15 @@ import subprocess
 from concurrent.futures import (
     Executor, ProcessPoolExecutor, ThreadPoolExecutor)
 from functools import partial
-from collections.abc import AsyncGenerator, Iterable
+from typing import Any
+from collections.abc import AsyncGenerator, Callable, Iterable
 
 
 from aio.core import functional
+from aio.core.subprocess import tracking
+
+
+STREAM_CHUNK_SIZE = 65536
 
 
 class AsyncSubprocess:
@@ -16,6 +21,9 @@ class AsyncSubprocess:
             cls,
             commands: Iterable[Iterable[str]],
             fork: bool = True,
+            executor: Executor | None = None,
+            limit: int | None = None,
+            parser: Callable[[Iterable[str], str], Any] | None = None,
             **kwargs) -> AsyncGenerator[
                 subprocess.CompletedProcess,
                 Iterable[Iterable[str]]]:
@@ -23,6 +31,18 @@ class AsyncSubprocess:
 
         Yields `subprocess.CompletedProcess` results as they are completed.
 
+        If an `executor` is provided it is used to run the commands, and
+        is left running on completion, so a long-lived pool can be shared
+        between calls. Otherwise an executor is created for the call.
+
+        If `limit` is set, no more than `limit` commands are in flight at
+        any time, and `commands` are only consumed as slots become free.
+
+        If a `parser` is provided, it is called with the command and each
+        line of its stdout as it arrives, and the yielded results have
+        empty `stdout` (see `stream`). Streamed commands are read by the
+        event loop, so no executor is created for them.
+
         Example usage:
 
         ```
@@ -39,6 +59,15 @@ class AsyncSubprocess:
         asyncio.run(run_system_commands(["whoami"] for i in range(0, 5)))
         ```
         """
+        if executor or parser:
+            async for result in cls.run_parallel(
+                    commands,
+                    executor,
+                    limit=limit,
+                    parser=parser,
+                    **kwargs):
+                yield result
+            return
         # Using a `ProcessPoolExecutor` or `ThreadPoolExecutor` here is
         # somewhat arbitrary as subproc will spawn a new process regardless.
         # Either way - using a custom executor of either type gives
@@ -47,18 +76,14 @@ class AsyncSubprocess:
         # speedup over a large number of tasks, despite any additional overhead
         # of creating the executor. Without `max_workers` set
         # `ProcessPoolExecutor` defaults to the number of cpus on the machine.
-        executor = (
+        pool_class = (
             ProcessPoolExecutor
             if fork
             else ThreadPoolExecutor)
-        with executor() as pool:
-            futures = asyncio.as_completed(
-                tuple(
-                    asyncio.create_task(
-                        cls.run(command, executor=pool, **kwargs))
-                    for command in commands))
-            for result in futures:
-                yield await result
+        with pool_class() as pool:
+            async for result in cls.run_parallel(
+                    commands, pool, limit=limit, **kwargs):
+                yield result
 
     @classmethod
     async def run(
@@ -93,10 +118,147 @@ class AsyncSubprocess:
         that loop's default (`ThreadPool`) executor.
 
         You can provide the loop and/or the executor to change this behaviour.
+
+        If the call is cancelled the process is killed, unless it is running
+        in a process pool. Processes running in a pool are killed if the
+        pool is cancelled (see `event.executors.cancel`).
         """
         loop = loop or asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            executor, partial(subprocess.run, *args, **kwargs))
+        started: list[subprocess.Popen] = []
+        try:
+            return await loop.run_in_executor(
+                executor,
+                partial(
+                    tracking.run,
+                    *args,
+                    on_start=started.append,
+                    **kwargs))
+        except asyncio.CancelledError:
+            for proc in started:
+                proc.kill()
+            raise
+
+    @classmethod
+    async def run_parallel(
+            cls,
+            commands: Iterable[Iterable[str]],
+            executor: Executor | None,
+            limit: int | None = None,
+            parser: Callable[[Iterable[str], str], Any] | None = None,
+            **kwargs) -> AsyncGenerator[
+                subprocess.CompletedProcess,
+                None]:
+        """Run commands in the provided `executor`, with at most `limit`
+        in flight, yielding results as they complete.
+
+        If a `parser` is provided, the commands are streamed, and it is
+        called with the command and each line of its stdout as it arrives.
+
+        If the consumer stops iterating, any commands still in flight are
+        cancelled, and waited for.
+        """
+        remaining = iter(commands)
+        pending: set[asyncio.Task] = set()
+        try:
+            while True:
+                for command in remaining:
+                    pending.add(
+                        asyncio.create_task(
+                            cls.stream(
+                                command,
+                                partial(parser, command),
+                                **kwargs)
+                            if parser
+                            else cls.run(
+                                command,
+                                executor=executor,
+                                **kwargs)))
+                    if limit and len(pending) >= limit:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    @classmethod
+    async def stream(
+            cls,
+            command: Iterable[str],
+            parser: Callable[[str], Any],
+            encoding: str = "utf-8",
+            **kwargs) -> subprocess.CompletedProcess:
+        """Run a command, calling `parser` with each line of its stdout as
+        it arrives.
+
+        Only a line of stdout at a time is held in memory. The returned
+        `subprocess.CompletedProcess` has empty `stdout`, and the decoded
+        `stderr`.
+
+        The process is tracked while it runs, and is killed if the call
+        is cancelled, or the `parser` raises.
+
+        Example usage:
+
+        ```
+        import asyncio
+
+        from aio.core.subprocess import stream
+
+        async def run_system_command():
+            result = await stream(["ls", "-l"], print)
+            print(result.returncode)
+
+        asyncio.run(run_system_command())
+        ```
+        """
+        kwargs.pop("capture_output", None)
+        args = tuple(command)
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **kwargs)
+        with tracking.processes.tracking(proc):  # type:ignore
+            try:
+                stderr, __ = await asyncio.gather(
+                    proc.stderr.read(),  # type:ignore
+                    cls._parse_lines(
+                        proc.stdout,  # type:ignore
+                        parser,
+                        encoding))
+                returncode = await proc.wait()
+            except BaseException:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+        return subprocess.CompletedProcess(
+            args,
+            returncode,
+            "",
+            stderr.decode(encoding))
+
+    @classmethod
+    async def _parse_lines(
+            cls,
+            stdout: asyncio.StreamReader,
+            parser: Callable[[str], Any],
+            encoding: str) -> None:
+        buffered = b""
+        while chunk := await stdout.read(STREAM_CHUNK_SIZE):
+            *lines, buffered = (buffered + chunk).split(b"\n")
+            for line in lines:
+                parser(line.decode(encoding))
+        if buffered:
+            parser(buffered.decode(encoding))
 
 
 def parallel(*args, **kwargs) -> "functional.AwaitableGenerator":
@@ -113,9 +275,11 @@ def parallel(*args, **kwargs) -> "functional.AwaitableGenerator":
 
 
 run = AsyncSubprocess.run
+stream = AsyncSubprocess.stream
 
 
 __all__ = (
     "AsyncSubprocess",
     "parallel",
-    "run")
+    "run",
+    "stream")
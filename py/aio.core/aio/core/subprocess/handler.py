@@ -2,14 +2,20 @@ import abc
 import logging
 import os
 import subprocess
+import tempfile
 from functools import cached_property
-from typing import Any
-from collections.abc import Mapping, Sequence
+from typing import IO, Any
+from collections.abc import Callable, Iterator, Mapping, Sequence
 
 import abstracts
 
 from aio.core import directory
 from aio.core.dev import debug
+from aio.core.subprocess.tracking import processes
+
+
+STREAM_CHUNK_SIZE = 65536
+STREAM_RECORD_SEPARATOR = "\n"
 
 
 class ISubprocessHandler(
@@ -47,10 +53,20 @@ class ISubprocessHandler(
         """Handle a response."""
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    def handle_record(self, record: str) -> None:
+        """Handle a record of streamed output."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def has_failed(self, response: subprocess.CompletedProcess) -> bool:
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    def iter_records(self, stream: IO[bytes]) -> Iterator[str]:
+        """Iterate separated records from a stream as they arrive."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def run(self,
             *args: str,
@@ -58,6 +74,16 @@ class ISubprocessHandler(
         """Run the subprocess, returning handled results."""
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    def run_stream(
+            self,
+            *args: str,
+            parser: Callable[[str], Any] | None = None,
+            **kwargs) -> Any:
+        """Run the subprocess, feeding stdout records to a parser as they
+        arrive, and returning handled results."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def run_subprocess(
             self,
@@ -110,6 +136,11 @@ class ASubprocessHandler(
             if self._args
             else ())
 
+    @property
+    def chunk_size(self) -> int:
+        """Maximum number of bytes to read from a stream at once."""
+        return STREAM_CHUNK_SIZE
+
     @property
     def encoding(self) -> str:
         return self._encoding
@@ -126,6 +157,12 @@ class ASubprocessHandler(
         """Logger to use - derived from implementer name."""
         return logging.getLogger(str(self))
 
+    @property
+    def record_separator(self) -> str:
+        """Separator between records of streamed stdout, eg `\\0` for
+        commands called with `-z`."""
+        return STREAM_RECORD_SEPARATOR
+
     @abc.abstractmethod
     def handle(
             self,
@@ -146,6 +183,10 @@ class ASubprocessHandler(
                 response.stdout,
                 response.stderr])
 
+    def handle_record(self, record: str) -> None:
+        """Override to consume stdout records when streaming."""
+        pass
+
     def handle_response(
             self,
             response: subprocess.CompletedProcess) -> Any:
@@ -157,6 +198,16 @@ class ASubprocessHandler(
     def has_failed(self, response: subprocess.CompletedProcess) -> bool:
         return bool(response.returncode)
 
+    def iter_records(self, stream: IO[bytes]) -> Iterator[str]:
+        buffered = b""
+        separator = self.record_separator.encode(self.encoding)
+        while chunk := stream.read1(self.chunk_size):  # type:ignore
+            *records, buffered = (buffered + chunk).split(separator)
+            for record in records:
+                yield record.decode(self.encoding)
+        if buffered:
+            yield buffered.decode(self.encoding)
+
     @debug.logging(
         log="self.log",
         show_cpu=True)
@@ -167,11 +218,72 @@ class ASubprocessHandler(
                 *self.subprocess_args(*args, **kwargs),
                 **self.subprocess_kwargs(*args, **kwargs)))
 
+    @debug.logging(
+        log="self.log",
+        show_cpu=True)
+    def run_stream(
+            self,
+            *args,
+            parser: Callable[[str], Any] | None = None,
+            **kwargs) -> Any:
+        """Run the subprocess, feeding each record of stdout to `parser`
+        (default `handle_record`) as it arrives.
+
+        Only a record at a time is held in memory. The response passed to
+        the handlers has empty `stdout`.
+        """
+        return self.handle_response(
+            self.stream_response(*args, parser=parser, **kwargs))
+
     def run_subprocess(
             self,
             *args,
             **kwargs) -> subprocess.CompletedProcess:
-        return subprocess.run(*args, **kwargs)
+        return processes.run(*args, **kwargs)
+
+    def stream_kwargs(self, *args, **kwargs) -> Mapping:
+        """Subprocess kwargs for streaming - output is captured as bytes
+        from a pipe."""
+        return {
+            k: v
+            for k, v
+            in self.subprocess_kwargs(*args, **kwargs).items()
+            if k not in ["capture_output", "encoding", "text"]}
+
+    def stream_response(
+            self,
+            *args,
+            parser: Callable[[str], Any] | None = None,
+            **kwargs) -> subprocess.CompletedProcess:
+        """Run the subprocess, feeding each record of stdout to `parser`
+        (default `handle_record`) as it arrives, and return the unhandled
+        response, with empty `stdout`."""
+        parser = parser or self.handle_record
+        command = self.subprocess_args(*args, **kwargs)
+        with tempfile.TemporaryFile() as stderr:
+            with self.stream_subprocess(
+                    *command,
+                    stderr=stderr,
+                    **self.stream_kwargs(*args, **kwargs)) as proc, \
+                    processes.tracking(proc):
+                for record in self.iter_records(
+                        proc.stdout):  # type:ignore
+                    parser(record)
+            stderr.seek(0)
+            return subprocess.CompletedProcess(
+                command[0],
+                proc.returncode,
+                "",
+                stderr.read().decode(self.encoding))
+
+    def stream_subprocess(
+            self,
+            *args,
+            **kwargs) -> subprocess.Popen[bytes]:
+        return subprocess.Popen(  # type:ignore
+            *args,
+            stdout=subprocess.PIPE,
+            **kwargs)
 
     def subprocess_args(self, *args, **kwargs) -> tuple[Sequence[str], ...]:
         return ((*self.args, *args), )
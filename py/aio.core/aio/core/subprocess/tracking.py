@@ -0,0 +1,135 @@
+import os
+import signal
+import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+class RunningProcesses:
+    """Process-wide registry of running subprocesses, so that they can be
+    killed if the work they are doing is cancelled.
+
+    Subprocesses are tracked while they run, if started with `run`, or
+    wrapped with `tracking`.
+
+    ```python
+
+    from aio.core.subprocess import processes
+
+    result = processes.run(["whoami"], capture_output=True)
+    ...
+    processes.kill()
+    ```
+
+    The registry is reset in forked child processes, which should not kill
+    subprocesses started by their parent.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._running: set[subprocess.Popen] = set()
+
+    @property
+    def running(self) -> set[subprocess.Popen]:
+        """Currently running subprocesses."""
+        if self._pid != os.getpid():
+            self._lock = threading.RLock()
+            self._pid = os.getpid()
+            self._running = set()
+        return self._running
+
+    def kill(self) -> int:
+        """Kill all running subprocesses, returning the number killed."""
+        running = self.running
+        with self._lock:
+            procs = list(running)
+            running.clear()
+        for proc in procs:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+        return len(procs)
+
+    def run(
+            self,
+            *args,
+            input: Any = None,
+            capture_output: bool = False,
+            timeout: float | None = None,
+            check: bool = False,
+            on_start: Callable[[subprocess.Popen], None] | None = None,
+            **kwargs) -> subprocess.CompletedProcess:
+        """Run a subprocess, as with `subprocess.run`, tracking it while it
+        runs.
+
+        `on_start` is called with the subprocess once it has started.
+        """
+        if input is not None:
+            kwargs["stdin"] = subprocess.PIPE
+        if capture_output:
+            kwargs.update(
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE)
+        with subprocess.Popen(*args, **kwargs) as proc:
+            with self.tracking(proc):
+                if on_start:
+                    on_start(proc)
+                try:
+                    stdout, stderr = proc.communicate(input, timeout=timeout)
+                except BaseException:
+                    proc.kill()
+                    raise
+        if check and proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode,
+                proc.args,
+                output=stdout,
+                stderr=stderr)
+        return subprocess.CompletedProcess(
+            proc.args,
+            proc.returncode,
+            stdout,
+            stderr)
+
+    @contextmanager
+    def tracking(
+            self,
+            proc: subprocess.Popen) -> Iterator[subprocess.Popen]:
+        """Track a subprocess while in the context."""
+        running = self.running
+        with self._lock:
+            running.add(proc)
+        try:
+            yield proc
+        finally:
+            with self._lock:
+                running.discard(proc)
+
+
+processes = RunningProcesses()
+
+
+def run(*args, **kwargs) -> subprocess.CompletedProcess:
+    """Run a subprocess, tracked by the process-wide registry.
+
+    Unlike `processes.run`, this can be submitted to a process pool.
+    """
+    return processes.run(*args, **kwargs)
+
+
+def kill_on_terminate() -> None:
+    """Kill running subprocesses, and exit, when the process is terminated.
+
+    This is used to initialize process pool workers, so that terminating
+    a worker also stops any tool it is running.
+    """
+    signal.signal(signal.SIGTERM, _terminate)
+
+
+def _terminate(signum: int, frame: Any) -> None:
+    processes.kill()
+    os._exit(128 + signum)
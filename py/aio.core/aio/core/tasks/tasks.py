@@ -1,6 +1,5 @@
 import asyncio
 import inspect
-import os
 import types
 from functools import cached_property
 from typing import (
@@ -9,6 +8,7 @@ from collections.abc import (
     AsyncIterable, AsyncIterator, Awaitable,
     Callable, Iterable, Iterator)
 
+from aio.core.event.budget import jobs as _jobs
 from aio.core.functional import async_property, AwaitableGenerator
 
 from .exceptions import (
@@ -163,11 +163,11 @@ class Concurrent:
 
     @property
     def default_limit(self) -> int:
-        """Default is to use cpu+4 to a max of 32 coroutines."""
+        """Default is to use the jobs budget + 4 to a max of 32 coroutines."""
         # This reflects the default for asyncio's `ThreadPoolExecutor`, this is
         # a fairly arbitrary number to use, but it seems like a reasonable
         # default.
-        return min(32, (os.cpu_count() or 0) + 4)
+        return _jobs.thread_limit
 
     @cached_property
     def limit(self) -> int:
@@ -341,18 +341,27 @@ class Concurrent:
         await self.exit_on_completion()
 
     async def output(self) -> AsyncIterator:
-        """Asynchronously yield results as they become available."""
-        while True:
-            # Wait for some output
-            if (result := await self.out.get()) is _sentinel:
-                # All done!
-                await self.close()
-                break
-            elif error := self.raisable(result):
-                # Raise an error and bail!
+        """Asynchronously yield results as they become available.
+
+        If the consumer is cancelled, or stops iterating, running tasks are
+        cancelled and pending coroutines are closed.
+        """
+        try:
+            while True:
+                # Wait for some output
+                if (result := await self.out.get()) is _sentinel:
+                    # All done!
+                    await self.close()
+                    break
+                elif error := self.raisable(result):
+                    # Raise an error and bail!
+                    await self.cancel()
+                    raise error
+                yield result
+        except (asyncio.CancelledError, GeneratorExit):
+            if not self.closed:
                 await self.cancel()
-                raise error
-            yield result
+            raise
 
     def raisable(self, result: Any) -> Exception | None:
         """Check a result type and whether it should raise and return mangled
@@ -8,8 +8,9 @@ from .data import (
     is_tarlike,
     to_yaml)
 from .resolve import dottedname
-from .context import Captured, captured_warnings
+from .context import Captured, captured_task_warnings, captured_warnings
 from .exceptions import ExtractError
+from .lazy import lazy_import
 
 
 dottedname_resolve = dottedname
@@ -17,6 +18,7 @@ dottedname_resolve = dottedname
 
 __all__ = (
     "Captured",
+    "captured_task_warnings",
     "captured_warnings",
     "dottedname",
     "dottedname_resolve",
@@ -27,4 +29,5 @@ __all__ = (
     "from_yaml",
     "is_sha",
     "is_tarlike",
+    "lazy_import",
     "to_yaml")
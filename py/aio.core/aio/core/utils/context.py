@@ -1,7 +1,13 @@
 import contextlib
+import contextvars
 import warnings as _warnings
 from typing import Any
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+
+
+_task_warnings: contextvars.ContextVar[
+    list[_warnings.WarningMessage] | None] = contextvars.ContextVar(
+        "_task_warnings", default=None)
 
 
 class Captured:
@@ -25,3 +31,63 @@ def captured_warnings() -> Iterator[Captured]:
     with _warnings.catch_warnings(record=True) as w:
         yield captured
     captured.warnings = w
+
+
+class TaskWarningRouter:
+    """Routes warnings to the log of the task that is capturing them.
+
+    `warnings.catch_warnings` swaps module-wide state, so it can not be
+    used from concurrent tasks. Instead, a single `showwarning` hook is
+    installed while any task is capturing.
+    """
+
+    def __init__(self) -> None:
+        self.users = 0
+        self.catcher: _warnings.catch_warnings | None = None
+        self.showwarning: Callable | None = None
+
+    def __enter__(self) -> None:
+        if not self.users:
+            self.catcher = _warnings.catch_warnings()
+            self.catcher.__enter__()
+            self.showwarning = _warnings.showwarning
+            _warnings.showwarning = self.route
+        self.users += 1
+
+    def __exit__(self, *args) -> None:
+        self.users -= 1
+        if not self.users and self.catcher:
+            self.catcher.__exit__(*args)
+            self.catcher = None
+            self.showwarning = None
+
+    def route(self, message, category, filename, lineno, file=None,
+              line=None) -> None:
+        log = _task_warnings.get()
+        if log is not None:
+            log.append(
+                _warnings.WarningMessage(
+                    message, category, filename, lineno, file, line))
+        elif self.showwarning:
+            self.showwarning(
+                message, category, filename, lineno, file, line)
+
+
+_router = TaskWarningRouter()
+
+
+@contextlib.contextmanager
+def captured_task_warnings() -> Iterator[Captured]:
+    """Capture warnings raised by the current task.
+
+    Unlike `captured_warnings` this is safe to use from concurrent tasks.
+    """
+    captured = Captured()
+    log: list[_warnings.WarningMessage] = []
+    token = _task_warnings.set(log)
+    try:
+        with _router:
+            yield captured
+    finally:
+        _task_warnings.reset(token)
+    captured.warnings = log
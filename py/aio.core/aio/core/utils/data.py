@@ -1,11 +1,15 @@
 import json
 import pathlib
 import tarfile
-from typing import Any
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
 from aio.core import functional, utils
+from aio.core.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import yaml
+else:
+    yaml = lazy_import("yaml")
 
 
 # See here for a list of known tar file extensions:
@@ -0,0 +1,41 @@
+
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Import the module `name`, deferring its execution until one of its
+    attributes is first accessed.
+
+    If the module has already been imported it is returned as is.
+
+    This is intended for heavy modules that are only needed by some
+    code paths, so that importing a package (eg to run a cli) does not
+    pay for them up front. For type checking, the module should be
+    imported normally under `typing.TYPE_CHECKING`, eg:
+
+        if TYPE_CHECKING:
+            import aiohttp
+        else:
+            aiohttp = utils.lazy_import("aiohttp")
+
+    Code that uses it at module level (including in non-postponed
+    annotations) will trigger the import.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        # As with a normal import, make the submodule available as an
+        # attribute of its (already imported) parent.
+        setattr(sys.modules[parent], child, module)
+    return module
@@ -0,0 +1,71 @@
+"""Per-call overhead of the `aio.core.dev` debug/timing decorators.
+
+With debug logging disabled (the default) and timing disabled
+(`AIOTIMING=0`), decorated functions should be indistinguishable from
+undecorated ones.
+
+Run with:
+
+    python benchmarks/bench_dev.py [--calls N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import timeit
+
+
+def _fun(a, b=None):
+    return a
+
+
+def _bench(fun, calls: int) -> float:
+    return min(
+        timeit.repeat(
+            lambda: fun(1, b=2),
+            number=calls,
+            repeat=5)) / calls
+
+
+def main(calls: int) -> None:
+    # Import here so that the env is read when the decorators are applied.
+    from aio.core.dev import debug, perf
+
+    class Thing:
+
+        def method(self, a, b=None):
+            return a
+
+        @debug.logging(log=__name__)
+        def logged(self, a, b=None):
+            return a
+
+    thing = Thing()
+    os.environ["AIOTIMING"] = "0"
+    timed = perf.timing(_fun)
+    assert timed is _fun, "Disabled timing should not wrap"
+    assert (
+        Thing.logged.__class__ is type(_fun)
+        or os.environ.get("AIODEBUG")
+        or os.environ.get("AIOTRACEDEBUG")), "Disabled logging should not wrap"
+
+    results = dict(
+        plain=_bench(_fun, calls),
+        timing=_bench(timed, calls),
+        method=_bench(thing.method, calls),
+        logging=_bench(thing.logged, calls))
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Measure the enabled overhead for comparison.
+        os.environ["AIOTIMING"] = "1"
+        results["timing (enabled)"] = _bench(perf.timing(_fun), calls)
+        os.environ["AIOTIMING"] = "0.01"
+        results["timing (1% sampled)"] = _bench(perf.timing(_fun), calls)
+    for name, taken in results.items():
+        print(f"{name:>20} {taken * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100000)
+    main(parser.parse_args().calls)
@@ -1,4 +1,5 @@
 
+import asyncio
 import sys
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
@@ -53,8 +54,11 @@ async def test_processprotocol_dunder_call(patches):
 @pytest.mark.parametrize("log", [None, "", (), "LOG"])
 @pytest.mark.parametrize("stdin", [True, False])
 @pytest.mark.parametrize("stdout", [True, False])
-def test_stdinstdoutprocessor_constructor(log, stdin, stdout):
+@pytest.mark.parametrize("concurrency", [None, 1, 5])
+def test_stdinstdoutprocessor_constructor(log, stdin, stdout, concurrency):
     kwargs = {}
+    if concurrency is not None:
+        kwargs["concurrency"] = concurrency
     if log is not None:
         kwargs["log"] = log
     if stdin:
@@ -66,6 +70,7 @@ def test_stdinstdoutprocessor_constructor(log, stdin, stdout):
     assert processor._protocol == "PROTOCOL"
     assert processor.stdin == kwargs.get("stdin", sys.stdin)
     assert processor.stdout == kwargs.get("stdout", sys.stdout)
+    assert processor.concurrency == kwargs.get("concurrency", 1)
 
 
 async def test_stdinstdoutprocessor_dunder_call(patches):
@@ -204,6 +209,21 @@ async def test_stdinstdoutprocessor_listener(iters, patches):
                 == [(), {}])
 
 
+def test_stdinstdoutprocessor_limit(patches):
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL", concurrency=7)
+    patched = patches(
+        "asyncio",
+        prefix="aio.core.pipe.abstract.pipe")
+
+    with patched as (m_asyncio, ):
+        assert processor.limit == m_asyncio.Semaphore.return_value
+
+    assert (
+        m_asyncio.Semaphore.call_args
+        == [(7, ), {}])
+    assert "limit" in processor.__dict__
+
+
 def test_stdinstdoutprocessor_loop(patches):
     processor = pipe.AStdinStdoutProcessor("PROTOCOL")
     patched = patches(
@@ -298,6 +318,71 @@ async def test_stdinstdoutprocessor_processor(iters, patches):
              if i < 17]))
 
 
+async def test_stdinstdoutprocessor_processor_concurrent():
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL", concurrency=2)
+    requests = ["SLOW", "FAST", "OTHER", ""]
+    release = asyncio.Event()
+    running = []
+    sent = []
+
+    async def recv():
+        return requests.pop(0)
+
+    async def process(recv):
+        running.append(recv)
+        if recv == "SLOW":
+            await release.wait()
+        else:
+            release.set()
+        assert len([r for r in running if r]) <= 2
+        running[running.index(recv)] = None
+        return f"DONE {recv}"
+
+    async def send(msg):
+        sent.append(msg)
+
+    processor.complete = MagicMock()
+    processor.recv = recv
+    processor.process = process
+    processor.send = send
+    processor._protocol = AsyncMock()
+    await processor.processor
+
+    assert sent == ["DONE FAST", "DONE SLOW", "DONE OTHER", ""]
+    assert processor.complete.call_count == 3
+    assert processor.limit._value == 2
+
+
+async def test_stdinstdoutprocessor_processor_error():
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL", concurrency=2)
+    requests = ["BOOM", "OK", ""]
+    sent = []
+
+    async def recv():
+        return requests.pop(0)
+
+    async def process(recv):
+        if recv == "BOOM":
+            raise Exception("BOOM")
+        return f"DONE {recv}"
+
+    async def send(msg):
+        sent.append(msg)
+
+    processor.complete = MagicMock()
+    processor.handle_error = MagicMock(
+        side_effect=lambda recv, e: f"FAILED {recv} {e}")
+    processor.recv = recv
+    processor.process = process
+    processor.send = send
+    processor._protocol = AsyncMock()
+    await processor.processor
+
+    assert sent == ["FAILED BOOM BOOM", "DONE OK", ""]
+    assert processor.complete.call_count == 2
+    assert processor.limit._value == 2
+
+
 async def test_stdinstdoutprocessor_protocol():
     protocol = AsyncMock()
     processor = pipe.AStdinStdoutProcessor(protocol)
@@ -517,6 +602,72 @@ def test_stdinstdoutprocessor_complete(patches):
         == [(), {}])
 
 
+@pytest.mark.parametrize("raises", [True, False])
+@pytest.mark.parametrize("response", [None, "", "RESPONSE"])
+async def test_stdinstdoutprocessor_handle(patches, raises, response):
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL")
+    patched = patches(
+        ("AStdinStdoutProcessor.limit",
+         dict(new_callable=PropertyMock)),
+        "AStdinStdoutProcessor.complete",
+        "AStdinStdoutProcessor.handle_error",
+        "AStdinStdoutProcessor.process",
+        "AStdinStdoutProcessor.send",
+        prefix="aio.core.pipe.abstract.pipe")
+    error = Exception("BOOM")
+
+    with patched as (m_limit, m_complete, m_error, m_process, m_send):
+        m_error.return_value = response
+        if raises:
+            m_process.side_effect = error
+        assert not await processor.handle("RECV")
+
+    assert (
+        m_process.call_args
+        == [("RECV", ), {}])
+    if not raises:
+        assert not m_error.called
+        assert (
+            m_send.call_args
+            == [(m_process.return_value, ), {}])
+    else:
+        assert (
+            m_error.call_args
+            == [("RECV", error), {}])
+        if response is None:
+            assert not m_send.called
+        else:
+            assert (
+                m_send.call_args
+                == [(response, ), {}])
+    assert (
+        m_complete.call_args
+        == [(), {}])
+    assert (
+        m_limit.return_value.release.call_args
+        == [(), {}])
+
+
+def test_stdinstdoutprocessor_handle_error(patches):
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL")
+    patched = patches(
+        "traceback",
+        "AStdinStdoutProcessor.log",
+        prefix="aio.core.pipe.abstract.pipe")
+    error = Exception("BOOM")
+
+    with patched as (m_traceback, m_log):
+        m_traceback.format_exception.return_value = ["TB1", "TB2"]
+        assert not processor.handle_error("RECV", error)
+
+    assert (
+        m_traceback.format_exception.call_args
+        == [(error, ), {}])
+    assert (
+        m_log.call_args
+        == [("ERROR: RECV\nTB1TB2", ), {}])
+
+
 @pytest.mark.parametrize("log", [None, MagicMock()])
 def test_stdinstdoutprocessor_log(log):
     processor = pipe.AStdinStdoutProcessor("PROCESSOR", "ARGS", log=log)
@@ -553,6 +704,17 @@ async def test_stdinstdoutprocessor_process(patches):
         == [(data, ), {}])
 
 
+async def test_stdinstdoutprocessor_read():
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL")
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"\n  \nFIRST\nSECOND\n\n")
+    reader.feed_eof()
+    assert await processor.read(reader) == "FIRST\n"
+    assert await processor.read(reader) == "SECOND\n"
+    assert await processor.read(reader) == ""
+    assert await processor.read(reader) == ""
+
+
 async def test_stdinstdoutprocessor_recv(patches):
     processor = pipe.AStdinStdoutProcessor("PROTOCOL")
     patched = patches(
@@ -598,6 +760,16 @@ async def test_stdinstdoutprocessor_send(patches):
         == [(msg, ), {}])
 
 
+def test_stdinstdoutprocessor_write():
+    processor = pipe.AStdinStdoutProcessor("PROTOCOL")
+    writer = MagicMock()
+    outgoing = MagicMock()
+    assert not processor.write(writer, outgoing)
+    assert (
+        writer.write.call_args
+        == [(outgoing.encode.return_value, ), {}])
+
+
 async def test_stdinstdoutprocessor_start(patches):
     processor = pipe.AStdinStdoutProcessor("PROTOCOL")
     patched = patches(
@@ -1,4 +1,7 @@
 
+import asyncio
+import sys
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -6,45 +9,182 @@ import pytest
 import aio.core.subprocess
 
 
-async def test_subprocess_parallel(patches):
+@pytest.mark.parametrize("fork", [None, True, False])
+@pytest.mark.parametrize("executor", [None, "EXECUTOR"])
+@pytest.mark.parametrize("limit", [None, 0, 3])
+@pytest.mark.parametrize("parser", [None, "PARSER"])
+async def test_subprocess_parallel(patches, fork, executor, limit, parser):
     patched = patches(
-        "asyncio",
         "ProcessPoolExecutor",
-        ("AsyncSubprocess.run", dict(new_callable=MagicMock)),
+        "ThreadPoolExecutor",
+        ("AsyncSubprocess.run_parallel", dict(new_callable=MagicMock)),
         prefix="aio.core.subprocess.async_subprocess")
     procs = [f"PROC{i}" for i in range(0, 3)]
     kwargs = {f"KEY{i}": f"VALUE{i}" for i in range(0, 3)}
+    args = {}
+    if fork is not None:
+        args["fork"] = fork
+    if executor is not None:
+        args["executor"] = executor
+    if limit is not None:
+        args["limit"] = limit
+    if parser is not None:
+        args["parser"] = parser
+    returned = [f"RESULT{i}" for i in range(0, 5)]
 
-    async def async_result(result):
-        return result
-
-    with patched as (m_asyncio, m_future, m_run):
-        returned = [f"RESULT{i}" for i in range(0, 5)]
-        m_asyncio.as_completed.return_value = [
-            async_result(result) for result in returned]
+    async def run_parallel(*la, **kwa):
+        for result in returned:
+            yield result
 
+    with patched as (m_proc, m_thread, m_run):
+        m_run.side_effect = run_parallel
         results = []
         iterator = aio.core.subprocess.AsyncSubprocess.parallel(
-            procs, **kwargs)
+            procs, **args, **kwargs)
         async for result in iterator:
             results.append(result)
 
     assert results == returned
+    if executor or parser:
+        assert not m_proc.called
+        assert not m_thread.called
+        pool = executor
+    else:
+        m_pool = (
+            m_thread
+            if fork is False
+            else m_proc)
+        m_other = (
+            m_proc
+            if fork is False
+            else m_thread)
+        assert (
+            m_pool.call_args
+            == [(), {}])
+        assert not m_other.called
+        pool = m_pool.return_value.__enter__.return_value
+    if executor or parser:
+        kwargs["parser"] = parser
     assert (
-        m_future.call_args
-        == [(), {}])
+        m_run.call_args
+        == [(procs, pool), dict(limit=limit, **kwargs)])
+
+
+@pytest.mark.parametrize("limit", [None, 0, 1, 2, 5, 10])
+@pytest.mark.parametrize("parser", [None, MagicMock()])
+async def test_subprocess_run_parallel(patches, limit, parser):
+    patched = patches(
+        ("AsyncSubprocess.run", dict(new_callable=MagicMock)),
+        ("AsyncSubprocess.stream", dict(new_callable=MagicMock)),
+        prefix="aio.core.subprocess.async_subprocess")
+    procs = [f"PROC{i}" for i in range(0, 7)]
+    kwargs = {f"KEY{i}": f"VALUE{i}" for i in range(0, 3)}
+    consumed = []
+    in_flight = []
+    running = set()
+
+    def commands():
+        for proc in procs:
+            consumed.append(proc)
+            yield proc
+
+    async def run(command, *la, **kwa):
+        running.add(command)
+        in_flight.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(command)
+        return f"RESULT:{command}"
+
+    with patched as (m_run, m_stream):
+        m_run.side_effect = run
+        m_stream.side_effect = run
+        results = []
+        iterator = aio.core.subprocess.AsyncSubprocess.run_parallel(
+            commands(), "EXECUTOR", limit=limit, parser=parser, **kwargs)
+        async for result in iterator:
+            results.append(result)
+            assert (
+                len(consumed)
+                <= (limit or len(procs)) + len(results))
+
+    assert (
+        sorted(results)
+        == [f"RESULT:{proc}" for proc in procs])
     assert (
-        m_asyncio.as_completed.call_args
-        == [(tuple(
-            m_asyncio.create_task.return_value
-            for i in range(0, len(procs))), ), {}])
-    kwargs["executor"] = m_future.return_value.__enter__.return_value
+        max(in_flight)
+        <= (limit or len(procs)))
+    if not parser:
+        assert not m_stream.called
+        assert (
+            m_run.call_args_list
+            == [[(proc, ), dict(executor="EXECUTOR", **kwargs)]
+                for proc in procs])
+        return
+    assert not m_run.called
+    for proc, (args, kwa) in zip(procs, m_stream.call_args_list):
+        assert args[0] == proc
+        assert type(args[1]) is partial
+        assert args[1].func == parser
+        assert args[1].args == (proc, )
+        assert kwa == kwargs
+
+
+async def test_subprocess_run_parallel_cancel(patches):
+    patched = patches(
+        ("AsyncSubprocess.run", dict(new_callable=MagicMock)),
+        prefix="aio.core.subprocess.async_subprocess")
+    procs = [f"PROC{i}" for i in range(0, 5)]
+    cancelled = []
+
+    async def run(command, **kwa):
+        if command == "PROC0":
+            return command
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(command)
+            raise
+
+    with patched as (m_run, ):
+        m_run.side_effect = run
+        iterator = aio.core.subprocess.AsyncSubprocess.run_parallel(
+            procs, "EXECUTOR", limit=3)
+        async for result in iterator:
+            assert result == "PROC0"
+            break
+        await iterator.aclose()
+
+    assert sorted(cancelled) == ["PROC1", "PROC2"]
+
+
+async def test_subprocess_run_parallel_streamed():
+    lines = []
+    commands = [
+        [sys.executable, "-c", f"print('a{i}'); print('b{i}')"]
+        for i in range(0, 3)]
+    results = [
+        result
+        async for result
+        in aio.core.subprocess.AsyncSubprocess.run_parallel(
+            commands,
+            None,
+            limit=2,
+            parser=lambda command, line: lines.append(
+                (commands.index(command), line)))]
+
     assert (
-        m_run.call_args_list
-        == [[(proc,), kwargs] for proc in procs])
+        [(r.returncode, r.stdout, r.stderr) for r in results]
+        == [(0, "", "")] * 3)
     assert (
-        m_asyncio.create_task.call_args_list
-        == [[(m_run.return_value,), {}] for proc in procs])
+        sorted(lines)
+        == sorted(
+            (i, f"{x}{i}")
+            for i in range(0, 3)
+            for x in ["a", "b"]))
+    for i in range(0, 3):
+        assert (
+            [line for j, line in lines if j == i]
+            == [f"a{i}", f"b{i}"])
 
 
 @pytest.mark.parametrize("loop", [True, False])
@@ -53,7 +193,7 @@ async def test_subprocess_run(patches, loop, executor):
     patched = patches(
         "asyncio",
         "partial",
-        "subprocess",
+        "tracking",
         prefix="aio.core.subprocess.async_subprocess")
     args = [f"ARG{i}" for i in range(0, 3)]
     kwargs = {f"KEY{i}": f"VALUE{i}" for i in range(0, 3)}
@@ -64,7 +204,7 @@ async def test_subprocess_run(patches, loop, executor):
     if executor:
         kwargs["executor"] = executor
 
-    with patched as (m_asyncio, m_partial, m_subproc):
+    with patched as (m_asyncio, m_partial, m_tracking):
         m_asyncio.get_running_loop.return_value = AsyncMock()
         if loop:
             m_loop = kwargs["loop"]
@@ -81,14 +221,117 @@ async def test_subprocess_run(patches, loop, executor):
     kwargs.pop("executor", None)
     kwargs.pop("loop", None)
 
+    on_start = m_partial.call_args[1].pop("on_start")
     assert (
         m_partial.call_args
-        == [(m_subproc.run, ) + tuple(args), kwargs])
+        == [(m_tracking.run, ) + tuple(args), kwargs])
+    assert on_start.__name__ == "append"
+    assert on_start.__self__ == []
     assert (
         m_loop.run_in_executor.call_args
         == [(executor, m_partial.return_value), {}])
 
 
+async def test_subprocess_stream():
+    lines = []
+    script = (
+        "import sys\n"
+        "sys.stdout.write('a\\n\\nb\\nc')\n"
+        "sys.stderr.write('oops')\n"
+        "sys.exit(3)\n")
+
+    result = await aio.core.subprocess.stream(
+        [sys.executable, "-c", script],
+        lines.append,
+        capture_output=True)
+
+    assert lines == ["a", "", "b", "c"]
+    assert result.args == (sys.executable, "-c", script)
+    assert result.returncode == 3
+    assert result.stdout == ""
+    assert result.stderr == "oops"
+
+
+@pytest.mark.parametrize("cancel", [True, False])
+async def test_subprocess_stream_killed(patches, cancel):
+    started = asyncio.Event()
+    script = (
+        "import time\n"
+        "print('started', flush=True)\n"
+        "time.sleep(30)\n")
+    patched = patches(
+        "tracking.processes.tracking",
+        prefix="aio.core.subprocess.async_subprocess")
+
+    def parser(line):
+        started.set()
+        if not cancel:
+            raise ValueError(line)
+
+    with patched as (m_tracking, ):
+        task = asyncio.create_task(
+            aio.core.subprocess.stream(
+                [sys.executable, "-c", script],
+                parser))
+        await asyncio.wait_for(started.wait(), 10)
+        if cancel:
+            task.cancel()
+        with pytest.raises(
+                asyncio.CancelledError
+                if cancel
+                else ValueError):
+            await task
+
+    proc = m_tracking.call_args[0][0]
+    assert proc.returncode is not None
+    assert proc.returncode < 0
+    assert m_tracking.return_value.__exit__.called
+
+
+@pytest.mark.parametrize("trailing", [True, False])
+async def test_subprocess__parse_lines(patches, trailing):
+    stdout = asyncio.StreamReader()
+    lines = []
+    patched = patches(
+        ("STREAM_CHUNK_SIZE", dict(new=3)),
+        prefix="aio.core.subprocess.async_subprocess")
+    stdout.feed_data(
+        "ab\nc\n\nd\u00e9f\nghi".encode()
+        + (b"\n"
+           if trailing
+           else b""))
+    stdout.feed_eof()
+
+    with patched:
+        assert not await (
+            aio.core.subprocess.AsyncSubprocess._parse_lines(
+                stdout, lines.append, "utf-8"))
+
+    assert lines == ["ab", "c", "", "d\u00e9f", "ghi"]
+
+
+@pytest.mark.parametrize("started", [True, False])
+async def test_subprocess_run_cancelled(patches, started):
+    patched = patches(
+        "tracking",
+        prefix="aio.core.subprocess.async_subprocess")
+    loop = MagicMock()
+    proc = MagicMock()
+
+    async def run_in_executor(executor, call):
+        if started:
+            call.keywords["on_start"](proc)
+        raise asyncio.CancelledError()
+
+    loop.run_in_executor.side_effect = run_in_executor
+
+    with patched:
+        with pytest.raises(asyncio.CancelledError):
+            await aio.core.subprocess.run("ARG", loop=loop)
+
+    assert proc.kill.called == started
+
+
 @pytest.mark.parametrize(
     "args", [[], [f"A{i}" for i in range(0, 3)]])
 @pytest.mark.parametrize(
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from aio.core import dev
+from aio.core.dev import debug, perf
 
 
 @pytest.mark.parametrize(
@@ -16,6 +17,7 @@ def test_dev_timing(patches, args, kwargs):
     patched = patches(
         "time",
         "print",
+        "timing_rate",
         prefix="aio.core.dev.perf")
 
     wrapped_fun = MagicMock()
@@ -24,7 +26,8 @@ def test_dev_timing(patches, args, kwargs):
         wrapped_fun(*args, **kwargs)
         return "FUN ALL ROUND"
 
-    with patched as (m_time, m_print):
+    with patched as (m_time, m_print, m_rate):
+        m_rate.return_value = 1
         assert (
             dev.timing(some_fun)(*args, **kwargs)
             == "FUN ALL ROUND")
@@ -39,3 +42,124 @@ def test_dev_timing(patches, args, kwargs):
     assert (
         m_print.call_args
         == [(f"Finished 'some_fun' in {time_taken} secs", ), {}])
+
+
+@pytest.mark.parametrize(
+    "env",
+    [None, "", "0", "0.0", "-1", "0.25", "1", "2", "yes"])
+def test_dev_timing_rate(patches, env):
+    patched = patches(
+        "os",
+        prefix="aio.core.dev.perf")
+    expected = dict(
+        [("0", 0), ("0.0", 0), ("-1", 0), ("0.25", 0.25)])
+
+    with patched as (m_os, ):
+        m_os.environ.get.return_value = env or ""
+        assert perf.timing_rate() == expected.get(env, 1)
+
+    assert (
+        m_os.environ.get.call_args
+        == [(perf.TIMING_ENV, ""), {}])
+
+
+@pytest.mark.parametrize("rate", [0, 0.5, 1])
+@pytest.mark.parametrize("sample", [None, 0, 0.5, 1])
+def test_dev_timing_resolved(patches, rate, sample):
+    patched = patches(
+        "timing_rate",
+        prefix="aio.core.dev.perf")
+
+    def some_fun():
+        pass
+
+    with patched as (m_rate, ):
+        m_rate.return_value = rate
+        timed = (
+            dev.timing(some_fun)
+            if sample is None
+            else dev.timing(sample=sample)(some_fun))
+
+    effective = (
+        sample
+        if rate and sample is not None
+        else rate)
+    if not effective:
+        assert timed is some_fun
+        return
+    assert timed is not some_fun
+    assert timed.__wrapped__ is some_fun
+    assert timed.__name__ == "some_fun"
+
+
+@pytest.mark.parametrize("sampled", [True, False])
+def test_dev_timing_sampled(patches, sampled):
+    patched = patches(
+        "random",
+        "time",
+        "print",
+        "timing_rate",
+        prefix="aio.core.dev.perf")
+    wrapped_fun = MagicMock()
+
+    def some_fun(*args, **kwargs):
+        return wrapped_fun(*args, **kwargs)
+
+    with patched as (m_random, m_time, m_print, m_rate):
+        m_rate.return_value = 0.25
+        m_random.random.return_value = 0.2 if sampled else 0.3
+        assert (
+            dev.timing(some_fun)("ARG", kw="KW")
+            == wrapped_fun.return_value)
+
+    assert (
+        wrapped_fun.call_args
+        == [("ARG", ), dict(kw="KW")])
+    assert (
+        m_random.random.call_args
+        == [(), {}])
+    assert m_print.called == sampled
+    assert m_time.perf_counter.called == sampled
+
+
+@pytest.mark.parametrize("env", [None, "AIODEBUG", "AIOTRACEDEBUG"])
+@pytest.mark.parametrize("bare", [True, False])
+def test_dev_debug_logging(patches, env, bare):
+    patched = patches(
+        "os",
+        "ADebugLogging",
+        "ATraceLogging",
+        prefix="aio.core.dev.debug")
+
+    def some_fun():
+        pass
+
+    with patched as (m_os, m_debug, m_trace):
+        m_os.environ.get.side_effect = lambda k: k == env
+        decorated = (
+            debug.logging(some_fun)
+            if bare
+            else debug.logging(log="LOG")(some_fun))
+
+    if env == "AIOTRACEDEBUG":
+        expected = m_trace
+    elif env == "AIODEBUG":
+        expected = m_debug
+    else:
+        assert decorated is some_fun
+        assert not m_debug.called
+        assert not m_trace.called
+        return
+    if bare:
+        assert decorated == expected.return_value
+        assert (
+            expected.call_args
+            == [(some_fun, ), {}])
+        return
+    assert decorated == expected.return_value.return_value
+    assert (
+        expected.call_args
+        == [(), dict(log="LOG")])
+    assert (
+        expected.return_value.call_args
+        == [(some_fun, ), {}])
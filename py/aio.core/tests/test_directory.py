@@ -1,5 +1,5 @@
 
-import types
+import re
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -957,46 +957,32 @@ def test_finder_constructor(patches, path_matcher, exclude_matcher):
     assert finder.exclude_matcher == exclude_matcher
 
 
-@pytest.mark.parametrize("n", range(1, 5))
-def test_finder_handle(patches, n):
-    path_matcher = MagicMock()
-    exclude_matcher = MagicMock()
-    finder = DummyDirectoryFileFinder(
-        "PATH",
-        path_matcher=path_matcher,
-        exclude_matcher=exclude_matcher)
+def test_finder_handle(patches):
+    finder = DummyDirectoryFileFinder("PATH")
     patched = patches(
-        "set",
-        "_subprocess.ASubprocessHandler.handle_error",
-        "ADirectoryFileFinder.include_path",
-        "ADirectoryFileFinder.parse_response",
+        "ADirectoryFileFinder._add_path",
         prefix="aio.core.directory.abstract.directory")
     response = MagicMock()
-    paths = [f"PATH{i}" for i in range(0, 7)]
+    response.stdout = "LINE0\nLINE1\n\nLINE3"
 
-    def include(path, *args):
-        return int(path[-1]) % n
-
-    with patched as (m_set, m_super, m_include, m_parse):
-        m_parse.return_value = paths
-        m_include.side_effect = include
-        assert (
-            finder.handle(response)
-            == m_set.return_value)
-        path_iter = m_set.call_args[0][0]
-        assert isinstance(path_iter, types.GeneratorType)
-        result = list(path_iter)
+    with patched as (m_add, ):
+        result = finder.handle(response)
 
+    assert result == set()
     assert (
-        result
-        == [p for i, p in enumerate(paths) if i % n])
-    assert (
-        m_parse.call_args
-        == [(response, ), {}])
-    assert (
-        m_include.call_args_list
-        == [[(p, path_matcher, exclude_matcher), {}]
-            for p in paths])
+        m_add.call_args_list
+        == [[(result, line), {}]
+            for line
+            in ["LINE0", "LINE1", "", "LINE3"]])
+
+
+def test_finder_handle_paths():
+    finder = DummyDirectoryFileFinder(
+        "PATH",
+        exclude_matcher=re.compile(r".*B$"))
+    response = MagicMock()
+    response.stdout = "A\nB\n\nC\n"
+    assert finder.handle(response) == {"A", "C"}
 
 
 def test_finder_handle_error(patches):
@@ -1016,15 +1002,94 @@ def test_finder_handle_error(patches):
         == [(response, ), {}])
 
 
-def test_finder_parse_response():
+def test_finder_parse_line():
     finder = DummyDirectoryFileFinder("PATH")
-    response = MagicMock()
+    assert finder.parse_line("LINE") == "LINE"
+
+
+@pytest.mark.parametrize("failed", [True, False])
+def test_finder_run(patches, failed):
+    finder = DummyDirectoryFileFinder("PATH")
+    patched = patches(
+        "partial",
+        "ADirectoryFileFinder.handle_error",
+        "ADirectoryFileFinder.has_failed",
+        "ADirectoryFileFinder.stream_response",
+        "ADirectoryFileFinder._add_path",
+        prefix="aio.core.directory.abstract.directory")
+
+    with patched as (m_partial, m_error, m_failed, m_stream, m_add):
+        m_failed.return_value = failed
+        result = finder.run("ARG1", "ARG2", foo="bar")
+
+    paths = m_partial.call_args[0][1]
     assert (
-        finder.parse_response(response)
-        == response.stdout.split.return_value)
+        m_partial.call_args
+        == [(m_add, paths), {}])
+    assert (
+        m_stream.call_args
+        == [("ARG1", "ARG2"),
+            dict(parser=m_partial.return_value, foo="bar")])
+    assert (
+        m_failed.call_args
+        == [(m_stream.return_value, ), {}])
+    if failed:
+        assert result == m_error.return_value
+        assert (
+            m_error.call_args
+            == [(m_stream.return_value, ), {}])
+        return
+    assert not m_error.called
+    assert result is paths
+    assert result == set()
+
+
+def test_finder_run_integration(tmp_path):
+    for name in ["a", "b", "c"]:
+        tmp_path.joinpath(f"{name}.txt").write_text(f"{name}\n")
+    finder = DummyDirectoryFileFinder(
+        tmp_path,
+        exclude_matcher=re.compile(r".*b\.txt$"))
+    assert (
+        finder("grep", "-rl", "", ".")
+        == {"./a.txt", "./c.txt"})
+    assert (
+        finder("grep", "-rl", "MISSING", ".")
+        == dict(ERROR=[1, "", ""]))
+
+
+@pytest.mark.parametrize("path", [None, "", "PATH"])
+@pytest.mark.parametrize("include", [True, False])
+def test_finder__add_path(patches, path, include):
+    finder = DummyDirectoryFileFinder(
+        "PATH",
+        path_matcher="PATH_MATCHER",
+        exclude_matcher="EXCLUDE_MATCHER")
+    patched = patches(
+        "ADirectoryFileFinder.include_path",
+        "ADirectoryFileFinder.parse_line",
+        prefix="aio.core.directory.abstract.directory")
+    paths = {"OTHER"}
+
+    with patched as (m_include, m_parse):
+        m_parse.return_value = path
+        m_include.return_value = include
+        assert not finder._add_path(paths, "LINE")
+
     assert (
-        response.stdout.split.call_args
-        == [("\n", ), {}])
+        m_parse.call_args
+        == [("LINE", ), {}])
+    assert (
+        paths
+        == ({"OTHER", path}
+            if path and include
+            else {"OTHER"}))
+    if not path:
+        assert not m_include.called
+        return
+    assert (
+        m_include.call_args
+        == [(path, "PATH_MATCHER", "EXCLUDE_MATCHER"), {}])
 
 
 @abstracts.implementer(directory.AGitDirectoryFileFinder)
@@ -1080,35 +1145,23 @@ def test_git_finder_matcher(patches):
 
 
 @pytest.mark.parametrize("all_files", [True, False])
-def test_git_finder_parse_response(patches, all_files):
+def test_git_finder_parse_line(patches, all_files):
     finder = DummyGitDirectoryFileFinder("PATH", match_all_files=all_files)
     patched = patches(
-        "ADirectoryFileFinder.parse_response",
         "AGitDirectoryFileFinder._get_file",
         prefix="aio.core.directory.abstract.directory")
-    response = MagicMock()
-    files = [f"F{i}" for i in range(0, 10)]
-    filtered = [f"F{i}" for i in range(0, 10) if i % 2]
-
-    def get(line):
-        if int(line[1:]) % 2:
-            return line
 
-    with patched as (m_super, m_get):
-        m_get.side_effect = get
-        m_super.return_value = files
+    with patched as (m_get, ):
         assert (
-            finder.parse_response(response)
-            == (filtered
+            finder.parse_line("LINE")
+            == (m_get.return_value
                 if all_files
-                else files))
+                else "LINE"))
 
-    assert m_super.call_args == [(response, ), {}]
     if all_files:
         assert (
-            m_get.call_args_list
-            == [[(f, ), {}]
-                for f in files])
+            m_get.call_args
+            == [("LINE", ), {}])
     else:
         assert not m_get.called
 
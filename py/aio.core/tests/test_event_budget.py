@@ -0,0 +1,149 @@
+
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from aio.core import event
+from aio.core.event import budget
+
+
+@pytest.mark.parametrize(
+    "files",
+    [{},
+     {"cpu.max": "max 100000\n"},
+     {"cpu.max": "150000 100000\n"},
+     {"cpu.max": "200000 100000\n"},
+     {"cpu.max": "0 100000\n"},
+     {"cpu.max": "garbage\n"},
+     {"cpu.max": "50000 0\n"},
+     {"cpu/cpu.cfs_quota_us": "-1\n",
+      "cpu/cpu.cfs_period_us": "100000\n"},
+     {"cpu/cpu.cfs_quota_us": "300000\n",
+      "cpu/cpu.cfs_period_us": "100000\n"},
+     {"cpu,cpuacct/cpu.cfs_quota_us": "50000\n",
+      "cpu,cpuacct/cpu.cfs_period_us": "100000\n"},
+     {"cpu/cpu.cfs_quota_us": "300000\n"}])
+def test_budget_cgroup_cpu_quota(tmp_path, files):
+    for name, content in files.items():
+        path = tmp_path.joinpath(name)
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(content)
+    quota = None
+    if (v2 := files.get("cpu.max", "").split()) and len(v2) == 2:
+        quota, period = v2
+    elif "cpu/cpu.cfs_period_us" in files:
+        quota = files["cpu/cpu.cfs_quota_us"].strip()
+        period = files["cpu/cpu.cfs_period_us"].strip()
+    elif "cpu,cpuacct/cpu.cfs_period_us" in files:
+        quota = files["cpu,cpuacct/cpu.cfs_quota_us"].strip()
+        period = files["cpu,cpuacct/cpu.cfs_period_us"].strip()
+    expected = (
+        int(quota) / int(period)
+        if (quota not in (None, "max", "-1")
+            and int(period)
+            and int(quota) > 0)
+        else None)
+    assert budget.cgroup_cpu_quota(tmp_path) == expected
+
+
+@pytest.mark.parametrize("affinity", [True, False])
+@pytest.mark.parametrize("cpus", [None, 0, 1, 8])
+@pytest.mark.parametrize("quota", [None, 0.5, 1.5, 4, 16])
+def test_budget_available_cpus(patches, affinity, cpus, quota):
+    patched = patches(
+        "os",
+        "cgroup_cpu_quota",
+        prefix="aio.core.event.budget")
+
+    with patched as (m_os, m_quota):
+        if affinity:
+            affinity_mask = m_os.sched_getaffinity.return_value
+            affinity_mask.__len__.return_value = cpus or 0
+        else:
+            del m_os.sched_getaffinity
+        m_os.cpu_count.return_value = cpus
+        m_quota.return_value = quota
+        result = budget.available_cpus()
+
+    expected = cpus or 1
+    if quota:
+        expected = min(expected, -(-quota // 1))
+    assert result == max(expected, 1)
+    if affinity:
+        assert (
+            m_os.sched_getaffinity.call_args
+            == [(0, ), {}])
+        assert not m_os.cpu_count.called
+    else:
+        assert (
+            m_os.cpu_count.call_args
+            == [(), {}])
+
+
+def test_budget_constructor():
+    jobs = budget.JobsBudget()
+    assert jobs._jobs is None
+    assert isinstance(event.jobs, event.JobsBudget)
+    assert event.jobs is budget.jobs
+
+
+def test_budget_available(patches):
+    jobs = budget.JobsBudget()
+    patched = patches(
+        "available_cpus",
+        prefix="aio.core.event.budget")
+
+    with patched as (m_cpus, ):
+        assert jobs.available == m_cpus.return_value
+
+    assert "available" in jobs.__dict__
+
+
+@pytest.mark.parametrize("configured", [None, 3])
+def test_budget_limit(patches, configured):
+    jobs = budget.JobsBudget()
+    jobs._jobs = configured
+    patched = patches(
+        ("JobsBudget.available",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.budget")
+
+    with patched as (m_available, ):
+        assert (
+            jobs.limit
+            == (configured
+                or m_available.return_value))
+
+    assert "limit" not in jobs.__dict__
+
+
+@pytest.mark.parametrize("limit", [1, 4, 28, 29, 64])
+def test_budget_thread_limit(patches, limit):
+    jobs = budget.JobsBudget()
+    patched = patches(
+        ("JobsBudget.limit",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.budget")
+
+    with patched as (m_limit, ):
+        m_limit.return_value = limit
+        assert jobs.thread_limit == min(32, limit + 4)
+
+    assert "thread_limit" not in jobs.__dict__
+
+
+@pytest.mark.parametrize("configure", [None, -1, 0, 1, 7])
+def test_budget_configure(configure):
+    jobs = budget.JobsBudget()
+    jobs._jobs = MagicMock()
+
+    if configure is not None and configure < 1:
+        with pytest.raises(ValueError) as e:
+            jobs.configure(configure)
+        assert (
+            e.value.args[0]
+            == f"Jobs must be a positive number: {configure}")
+        return
+
+    assert not jobs.configure(configure)
+    assert jobs._jobs == configure
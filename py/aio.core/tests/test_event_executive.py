@@ -1,7 +1,8 @@
-
+import inspect
 import types
 from functools import partial
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -9,6 +10,11 @@ import pytest
 import abstracts
 
 from aio.core import event
+from aio.core.event import executive as _executive
+
+
+def _describe_arg(data, other=None):
+    return type(data).__name__, bytes(data[:4]), len(data), other
 
 
 @abstracts.implementer(event.IExecutive)
@@ -36,6 +42,10 @@ class DummyExecutive(event.AExecutive):
     pass
 
 
+class DummySharingExecutive(DummyExecutive):
+    shared_memory_threshold = 1024
+
+
 async def test_event_executive_iface_constructor():
 
     with pytest.raises(TypeError):
@@ -58,21 +68,35 @@ def test_event_executive_constructor():
     "args", [[], [f"ARG{i}" for i in range(0, 5)]])
 @pytest.mark.parametrize(
     "kwargs", [{}, {f"K{i}": f"V{i}" for i in range(0, 5)}])
-async def test_event_executive_execute(patches, args, kwargs):
+@pytest.mark.parametrize(
+    "shares", [(False, False), (False, True), (True, False)])
+async def test_event_executive_execute(patches, args, kwargs, shares):
     executive = DummyExecutive()
     executable = MagicMock()
+    shares_memory, shares_args = shares
     patched = patches(
         ("AExecutive.loop",
          dict(new_callable=PropertyMock)),
         ("AExecutive.pool",
          dict(new_callable=PropertyMock)),
+        ("AExecutive.profiler",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.shares_memory",
+         dict(new_callable=PropertyMock)),
+        "AExecutive._shares_args",
+        "AExecutive.shared_args",
         prefix="aio.core.event.executive")
 
-    with patched as (m_loop, m_pool):
+    with patched as patchy:
+        (m_loop, m_pool, m_profiler,
+         m_shares, m_shares_args, m_args) = patchy
+        m_profiler.return_value.enabled = False
+        m_shares.return_value = shares_memory
+        m_shares_args.return_value = shares_args
         execute = AsyncMock()
         m_loop.return_value.run_in_executor = execute
         assert (
-            await DummyExecutive.execute.__wrapped__(
+            await inspect.unwrap(DummyExecutive.execute)(
                 executive, executable, *args, **kwargs)
             == m_loop.return_value.run_in_executor.return_value)
 
@@ -81,6 +105,13 @@ async def test_event_executive_execute(patches, args, kwargs):
     assert called_kwargs == {}
     assert called_args[0] == m_pool.return_value
     assert called_args[2:] == tuple(args)
+    assert not m_args.called
+    if shares_memory:
+        assert (
+            m_shares_args.call_args
+            == [(tuple(args), kwargs), {}])
+    else:
+        assert not m_shares_args.called
 
     if kwargs:
         assert type(called_args[1]) is partial
@@ -90,6 +121,76 @@ async def test_event_executive_execute(patches, args, kwargs):
         assert called_args[1] == executable
 
 
+async def test_event_executive_execute_shared(patches):
+    executive = DummyExecutive()
+    executable = MagicMock()
+    patched = patches(
+        "partial",
+        "shared_call",
+        ("AExecutive.loop",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.pool",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.profiler",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.shares_memory",
+         dict(new_callable=PropertyMock)),
+        "AExecutive._shares_args",
+        "AExecutive.shared_args",
+        prefix="aio.core.event.executive")
+
+    with patched as patchy:
+        (m_partial, m_call, m_loop, m_pool,
+         m_profiler, m_shares, m_shares_args, m_args) = patchy
+        m_profiler.return_value.enabled = False
+        m_shares.return_value = True
+        m_shares_args.return_value = True
+        m_args.return_value.__enter__.return_value = ("ARGS", "KWARGS")
+        m_loop.return_value.run_in_executor = AsyncMock()
+        assert (
+            await inspect.unwrap(DummyExecutive.execute)(
+                executive, executable, "ARG1", "ARG2", foo="bar")
+            == m_loop.return_value.run_in_executor.return_value)
+
+    assert (
+        m_shares_args.call_args
+        == [(("ARG1", "ARG2"), dict(foo="bar")), {}])
+    assert (
+        m_args.call_args
+        == [(("ARG1", "ARG2"), dict(foo="bar")), {}])
+    assert (
+        m_partial.call_args
+        == [(m_call, executable), {}])
+    assert (
+        m_loop.return_value.run_in_executor.call_args
+        == [(m_pool.return_value,
+             m_partial.return_value,
+             "ARGS",
+             "KWARGS"), {}])
+    assert m_args.return_value.__exit__.called
+
+
+async def test_event_executive_execute_shared_process_pool():
+    executive = DummySharingExecutive()
+    data = b"DATA" * 1024
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        executive._pool = pool
+        assert (
+            await executive.execute(
+                _describe_arg, data, other=b"SMALL")
+            == ("bytes", b"DATA", len(data), b"SMALL"))
+        assert (
+            await executive.execute(
+                _describe_arg, memoryview(data), other="OTHER")
+            == ("memoryview", b"DATA", len(data), "OTHER"))
+        # Memoryviews too small to share are still passed.
+        assert (
+            await executive.execute(
+                _describe_arg, memoryview(b"SMALL"), other="OTHER")
+            == ("bytes", b"SMAL", 5, "OTHER"))
+
+
 async def test_event_executive_execute_forwards_kwargs():
     executive = DummyExecutive()
     calls = []
@@ -164,3 +265,222 @@ async def test_event_executive_execute_in_batches(
         == [[("EXECUTABLE", *batch), kwargs]
             for batch
             in batches])
+
+
+def test_event_executive_profiler():
+    executive = DummyExecutive()
+    assert executive.profiler is event.profiler
+    assert "profiler" not in executive.__dict__
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_event_executive__run_in_executor(patches, enabled):
+    executive = DummyExecutive()
+    patched = patches(
+        ("AExecutive.loop",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.pool",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.profiler",
+         dict(new_callable=PropertyMock)),
+        "AExecutive._executable_name",
+        prefix="aio.core.event.executive")
+
+    with patched as (m_loop, m_pool, m_profiler, m_name):
+        m_profiler.return_value.enabled = enabled
+        m_profiler.return_value.run_in_executor = AsyncMock()
+        m_loop.return_value.run_in_executor = AsyncMock()
+        assert (
+            await executive._run_in_executor(
+                "EXECUTABLE", "CALL", "ARG1", "ARG2")
+            == (m_profiler.return_value.run_in_executor.return_value
+                if enabled
+                else m_loop.return_value.run_in_executor.return_value))
+
+    if enabled:
+        assert not m_loop.return_value.run_in_executor.called
+        assert (
+            m_profiler.return_value.run_in_executor.call_args
+            == [(m_loop.return_value,
+                 m_pool.return_value,
+                 m_name.return_value,
+                 "CALL", "ARG1", "ARG2"), {}])
+        assert (
+            m_name.call_args
+            == [("EXECUTABLE", ), {}])
+        return
+    assert not m_profiler.return_value.run_in_executor.called
+    assert not m_name.called
+    assert (
+        m_loop.return_value.run_in_executor.call_args
+        == [(m_pool.return_value, "CALL", "ARG1", "ARG2"), {}])
+
+
+@pytest.mark.parametrize("partialed", [True, False])
+def test_event_executive__executable_name(partialed):
+    executive = DummyExecutive()
+    executable = (
+        partial(_describe_arg, b"DATA")
+        if partialed
+        else _describe_arg)
+    assert (
+        executive._executable_name(executable)
+        == f"{__name__}._describe_arg")
+    assert (
+        executive._executable_name(MagicMock())
+        == "unittest.mock.MagicMock")
+
+
+@pytest.mark.parametrize("threshold", [None, 0, 23])
+@pytest.mark.parametrize("process", [True, False])
+def test_event_executive_shares_memory(patches, threshold, process):
+    executive = DummyExecutive()
+    patched = patches(
+        ("AExecutive.pool",
+         dict(new_callable=PropertyMock)),
+        ("AExecutive.shared_memory_threshold",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.executive")
+
+    with patched as (m_pool, m_threshold):
+        m_threshold.return_value = threshold
+        m_pool.return_value = (
+            MagicMock(spec=ProcessPoolExecutor)
+            if process
+            else MagicMock())
+        assert (
+            executive.shares_memory
+            == bool(threshold and process))
+
+
+def test_event_executive_shared_memory_threshold():
+    executive = DummyExecutive()
+    assert (
+        executive.shared_memory_threshold
+        == _executive.SHARED_MEMORY_THRESHOLD)
+    assert "shared_memory_threshold" not in executive.__dict__
+
+
+def test_event_executive_shared_args(patches):
+    executive = DummyExecutive()
+    big = b"X" * 10
+    view = memoryview(bytearray(b"Y" * 10))
+    patched = patches(
+        "AExecutive._should_share",
+        prefix="aio.core.event.executive")
+
+    with patched as (m_share, ):
+        m_share.side_effect = lambda arg: len(arg) == 10
+        with executive.shared_args(
+                (big, b"SMALL", "OTHER", memoryview(b"VIEW")),
+                dict(view=view, small=b"SMALL")) as (args, kwargs):
+            shared = [args[0], kwargs["view"]]
+            assert args[1:] == (b"SMALL", "OTHER", b"VIEW")
+            assert type(args[3]) is bytes
+            assert kwargs["small"] == b"SMALL"
+            for arg, expected, as_bytes in zip(
+                    shared, [big, bytes(view)], [True, False]):
+                assert isinstance(arg, _executive.SharedArg)
+                assert arg.size == 10
+                assert arg.as_bytes == as_bytes
+                with arg.attached() as attached:
+                    assert bytes(attached) == expected
+                    assert (
+                        isinstance(attached, bytes)
+                        == as_bytes)
+
+    for arg in shared:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=arg.name)
+
+
+@pytest.mark.parametrize(
+    "args", [[], [f"ARG{i}" for i in range(0, 5)]])
+@pytest.mark.parametrize(
+    "kwargs", [{}, {f"K{i}": f"V{i}" for i in range(0, 5)}])
+@pytest.mark.parametrize("shared", [None, "ARG3", "V2"])
+def test_event_executive__shares_args(patches, args, kwargs, shared):
+    executive = DummyExecutive()
+    patched = patches(
+        "AExecutive._should_share",
+        prefix="aio.core.event.executive")
+
+    with patched as (m_share, ):
+        m_share.side_effect = lambda arg: arg == shared
+        assert (
+            executive._shares_args(tuple(args), kwargs)
+            == bool(shared in [*args, *kwargs.values()]))
+        # Memoryviews are always handled, as they cannot be pickled.
+        assert executive._shares_args(
+            (*args, memoryview(b"VIEW")),
+            kwargs)
+        m_share.reset_mock()
+        executive._shares_args(tuple(args), kwargs)
+
+    checked = [*args, *kwargs.values()]
+    if shared in checked:
+        checked = checked[:checked.index(shared) + 1]
+    assert (
+        m_share.call_args_list
+        == [[(arg, ), {}] for arg in checked])
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [b"X" * 5, b"X" * 10, bytearray(b"X" * 10),
+     memoryview(b"X" * 5), memoryview(b"X" * 10), "X" * 10])
+@pytest.mark.parametrize("threshold", [None, 0, 10])
+def test_event_executive__should_share(patches, arg, threshold):
+    executive = DummyExecutive()
+    patched = patches(
+        ("AExecutive.shared_memory_threshold",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.executive")
+
+    with patched as (m_threshold, ):
+        m_threshold.return_value = threshold
+        assert (
+            executive._should_share(arg)
+            == bool(
+                isinstance(arg, (bytes, memoryview))
+                and threshold
+                and len(arg) >= threshold))
+
+
+def test_event_executive_shared_arg():
+    shm = shared_memory.SharedMemory(create=True, size=16)
+    try:
+        shm.buf[:16] = b"A" * 16
+        arg = _executive.SharedArg(shm.name, 8, False)
+        assert arg.name == shm.name
+        assert arg.size == 8
+        assert not arg.as_bytes
+        with arg.attached() as view:
+            assert isinstance(view, memoryview)
+            assert view.tobytes() == b"A" * 8
+        with pytest.raises(ValueError):
+            view.tobytes()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_event_executive_shared_call(patches):
+    executable = MagicMock()
+    shared = MagicMock(spec=_executive.SharedArg)
+    other = MagicMock(spec=_executive.SharedArg)
+
+    assert (
+        _executive.shared_call(
+            executable,
+            ("ARG", shared),
+            dict(foo="bar", other=other))
+        == executable.return_value)
+    assert (
+        executable.call_args
+        == [("ARG",
+             shared.attached.return_value.__enter__.return_value),
+            dict(foo="bar",
+                 other=other.attached.return_value.__enter__.return_value)])
+    for arg in [shared, other]:
+        assert arg.attached.return_value.__exit__.called
@@ -0,0 +1,255 @@
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+
+from aio.core import event
+from aio.core.event import profiling as _profiling
+
+
+def _double(x):
+    return x * 2
+
+
+@pytest.mark.parametrize("pickles", [True, False])
+def test_event_profiling_profiled_call(patches, pickles):
+    executable = MagicMock()
+    patched = patches(
+        "os",
+        "pickle",
+        "time",
+        prefix="aio.core.event.profiling")
+
+    with patched as (m_os, m_pickle, m_time):
+        m_time.time.side_effect = [23, 30]
+        m_pickle.dumps.return_value = "X" * 7
+        assert (
+            _profiling.profiled_call(
+                executable, 20, pickles, "ARG1", "ARG2")
+            == (executable.return_value,
+                dict(pid=m_os.getpid.return_value,
+                     queue_wait=3,
+                     run_time=7,
+                     result_size=(
+                         7
+                         if pickles
+                         else 0))))
+
+    assert (
+        executable.call_args
+        == [("ARG1", "ARG2"), {}])
+    if pickles:
+        assert (
+            m_pickle.dumps.call_args
+            == [(executable.return_value, ), {}])
+    else:
+        assert not m_pickle.dumps.called
+
+
+def test_event_profiling_profiled_call_clock_skew(patches):
+    patched = patches(
+        "time",
+        prefix="aio.core.event.profiling")
+
+    with patched as (m_time, ):
+        m_time.time.side_effect = [10, 12]
+        assert (
+            _profiling.profiled_call(
+                _double, 11, False, 2)[1]["queue_wait"]
+            == 0)
+
+
+@pytest.mark.parametrize("enabled", [None, True, False])
+def test_event_profiling_constructor(enabled):
+    profiler = (
+        _profiling.ExecutorProfiler(enabled=enabled)
+        if enabled is not None
+        else _profiling.ExecutorProfiler())
+    assert profiler._enabled == enabled
+    assert profiler.calls == {}
+    assert isinstance(event.profiler, _profiling.ExecutorProfiler)
+
+
+@pytest.mark.parametrize("enabled", [None, True, False])
+@pytest.mark.parametrize("env", [None, "", "1"])
+def test_event_profiling_enabled(patches, enabled, env):
+    profiler = _profiling.ExecutorProfiler(enabled=enabled)
+    patched = patches(
+        "os",
+        prefix="aio.core.event.profiling")
+
+    with patched as (m_os, ):
+        m_os.environ.get.return_value = env
+        assert (
+            profiler.enabled
+            == (enabled
+                if enabled is not None
+                else bool(env)))
+
+    if enabled is None:
+        assert (
+            m_os.environ.get.call_args
+            == [(_profiling.PROFILE_ENV, ), {}])
+    else:
+        assert not m_os.environ.get.called
+
+
+def test_event_profiling_enable():
+    profiler = _profiling.ExecutorProfiler()
+    assert not profiler.enable()
+    assert profiler._enabled is True
+    assert profiler.enabled
+    assert not profiler.enable(False)
+    assert profiler._enabled is False
+    assert not profiler.enabled
+
+
+def test_event_profiling_record():
+    profiler = _profiling.ExecutorProfiler()
+    assert not profiler.record("NAME", foo="bar")
+    assert not profiler.record("NAME", foo="baz")
+    assert not profiler.record("OTHER", foo="bar")
+    assert (
+        profiler.calls
+        == dict(NAME=[dict(foo="bar"), dict(foo="baz")],
+                OTHER=[dict(foo="bar")]))
+    assert not profiler.reset()
+    assert profiler.calls == {}
+
+
+def test_event_profiling_summary():
+    profiler = _profiling.ExecutorProfiler()
+    assert profiler.summary == {}
+    profiler.record(
+        "NAME", pid=1, queue_wait=1, run_time=5,
+        arg_size=10, result_size=20)
+    profiler.record(
+        "NAME", pid=2, queue_wait=3, run_time=2,
+        arg_size=10, result_size=20)
+    profiler.record(
+        "NAME", pid=1, queue_wait=0, run_time=1,
+        arg_size=10, result_size=20)
+    profiler.record(
+        "OTHER", pid=1, queue_wait=0.5, run_time=0.5,
+        arg_size=3, result_size=4)
+    assert (
+        profiler.summary
+        == dict(
+            NAME=dict(
+                calls=3,
+                queue_wait=4,
+                max_queue_wait=3,
+                run_time=8,
+                max_run_time=5,
+                arg_size=30,
+                result_size=60,
+                workers=2),
+            OTHER=dict(
+                calls=1,
+                queue_wait=0.5,
+                max_queue_wait=0.5,
+                run_time=0.5,
+                max_run_time=0.5,
+                arg_size=3,
+                result_size=4,
+                workers=1)))
+    assert "summary" not in profiler.__dict__
+
+
+def test_event_profiling_report(patches):
+    profiler = _profiling.ExecutorProfiler()
+    patched = patches(
+        ("ExecutorProfiler.summary",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.profiling")
+    stats = dict(
+        calls=3,
+        max_queue_wait=2,
+        max_run_time=3,
+        arg_size=30,
+        result_size=60,
+        workers=2)
+
+    with patched as (m_summary, ):
+        m_summary.return_value = dict(
+            FAST=dict(queue_wait=0.5, run_time=1, **stats),
+            SLOW=dict(queue_wait=1, run_time=2.25, **stats))
+        assert (
+            profiler.report().split("\n")
+            == ["\t".join(("function", *_profiling.REPORT_HEADER)),
+                "SLOW\t3\t1.000\t2.000\t2.250\t3.000\t30\t60\t2",
+                "FAST\t3\t0.500\t2.000\t1.000\t3.000\t30\t60\t2"])
+
+
+@pytest.mark.parametrize("process", [True, False])
+async def test_event_profiling_run_in_executor(patches, process):
+    profiler = _profiling.ExecutorProfiler()
+    loop = MagicMock()
+    loop.run_in_executor = AsyncMock(
+        return_value=("RESULT", dict(foo="bar")))
+    pool = (
+        MagicMock(spec=ProcessPoolExecutor)
+        if process
+        else MagicMock())
+    patched = patches(
+        "partial",
+        "pickle",
+        "time",
+        "ExecutorProfiler.record",
+        prefix="aio.core.event.profiling")
+
+    with patched as (m_partial, m_pickle, m_time, m_record):
+        m_pickle.dumps.return_value = "X" * 5
+        assert (
+            await profiler.run_in_executor(
+                loop, pool, "NAME", "EXECUTABLE", "ARG1", "ARG2")
+            == "RESULT")
+
+    assert (
+        loop.run_in_executor.call_args
+        == [(pool, m_partial.return_value, "ARG1", "ARG2"), {}])
+    assert (
+        m_partial.call_args
+        == [(_profiling.profiled_call,
+             "EXECUTABLE",
+             m_time.time.return_value,
+             process), {}])
+    assert (
+        m_record.call_args
+        == [("NAME", ),
+            dict(arg_size=5 if process else 0, foo="bar")])
+    if process:
+        assert (
+            m_pickle.dumps.call_args
+            == [(("EXECUTABLE", ("ARG1", "ARG2")), ), {}])
+    else:
+        assert not m_pickle.dumps.called
+
+
+@pytest.mark.parametrize(
+    "pool_class", [ProcessPoolExecutor, ThreadPoolExecutor])
+async def test_event_profiling_run_in_executor_pools(pool_class):
+    profiler = _profiling.ExecutorProfiler(enabled=True)
+
+    class DummyExecutive(event.AExecutive):
+
+        @property
+        def profiler(self):
+            return profiler
+
+    executive = DummyExecutive()
+    with pool_class(max_workers=1) as pool:
+        executive._pool = pool
+        assert await executive.execute(_double, 3) == 6
+        assert await executive.execute(_double, "x") == "xx"
+
+    summary = profiler.summary[f"{__name__}._double"]
+    assert summary["calls"] == 2
+    assert summary["workers"] == 1
+    if pool_class is ProcessPoolExecutor:
+        assert summary["arg_size"] > 0
+        assert summary["result_size"] > 0
+    else:
+        assert summary["arg_size"] == 0
+        assert summary["result_size"] == 0
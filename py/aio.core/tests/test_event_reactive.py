@@ -1,4 +1,6 @@
 
+from unittest.mock import PropertyMock
+
 import pytest
 
 import abstracts
@@ -102,18 +104,43 @@ def test_event_reactive_loop_creates(patches):
     assert "loop" in reactive.__dict__
 
 
-def test_event_reactive_pool(patches):
+@pytest.mark.parametrize("injected", [True, False])
+def test_event_reactive_pool(patches, injected):
     reactive = DummyReactive()
+    if injected:
+        reactive._pool = "INJECTED_POOL"
     patched = patches(
-        "futures",
+        "executors",
+        ("AReactive.pool_initializers",
+         dict(new_callable=PropertyMock)),
+        ("AReactive.pool_name",
+         dict(new_callable=PropertyMock)),
         prefix="aio.core.event.reactive")
 
-    with patched as (m_futures, ):
+    with patched as (m_executors, m_inits, m_name):
         assert (
             reactive.pool
-            == m_futures.ProcessPoolExecutor.return_value)
+            == ("INJECTED_POOL"
+                if injected
+                else m_executors.get.return_value))
 
-    assert (
-        m_futures.ProcessPoolExecutor.call_args
-        == [(), {}])
     assert "pool" in reactive.__dict__
+    if injected:
+        assert not m_executors.get.called
+        return
+    assert (
+        m_executors.get.call_args
+        == [(m_name.return_value, ),
+            dict(initializers=m_inits.return_value)])
+
+
+def test_event_reactive_pool_initializers():
+    reactive = DummyReactive()
+    assert reactive.pool_initializers == ()
+    assert "pool_initializers" not in reactive.__dict__
+
+
+def test_event_reactive_pool_name():
+    reactive = DummyReactive()
+    assert reactive.pool_name == "process"
+    assert "pool_name" not in reactive.__dict__
@@ -0,0 +1,464 @@
+
+import os
+import sys
+from concurrent import futures
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from aio.core import event
+from aio.core.event import registry as _registry
+from aio.core.event.registry import initialize_worker
+from aio.core.subprocess import tracking
+
+
+_FLAGS: list = []
+
+
+def _flag(value):
+    _FLAGS.append(value)
+
+
+def _flags():
+    return os.getpid(), list(_FLAGS)
+
+
+def test_executors_constructor(patches):
+    patched = patches(
+        "os",
+        "threading",
+        prefix="aio.core.event.registry")
+
+    with patched as (m_os, m_threading):
+        registry = event.Executors()
+
+    assert registry._executors == {}
+    assert registry._lock == m_threading.Lock.return_value
+    assert registry._pid == m_os.getpid.return_value
+    assert registry.sizes == {}
+
+
+def test_executors_singleton():
+    assert isinstance(event.executors, event.Executors)
+
+
+@pytest.mark.parametrize("forked", [True, False])
+def test_executors_executors(patches, forked):
+    registry = event.Executors()
+    registry._executors = dict(EXECUTORS=True)
+    lock = registry._lock
+    pid = registry._pid
+    patched = patches(
+        "os",
+        "threading",
+        prefix="aio.core.event.registry")
+
+    with patched as (m_os, m_threading):
+        m_os.getpid.return_value = (
+            pid + 1
+            if forked
+            else pid)
+        assert (
+            registry.executors
+            == ({}
+                if forked
+                else dict(EXECUTORS=True)))
+        assert registry.executors is registry._executors
+
+    if not forked:
+        assert registry._lock is lock
+        assert registry._pid == pid
+        return
+    assert registry._lock == m_threading.Lock.return_value
+    assert registry._pid == pid + 1
+
+
+def test_executors_configure():
+    registry = event.Executors()
+    registry.sizes["OTHER"] = 7
+    assert not registry.configure(process=3, thread=None)
+    assert (
+        registry.sizes
+        == dict(OTHER=7, process=3, thread=None))
+
+
+@pytest.mark.parametrize("kind", ["process", "thread", "other"])
+@pytest.mark.parametrize("max_workers", [None, 0, 5])
+@pytest.mark.parametrize("initializers", [(), ("INIT0", "INIT1")])
+def test_executors_create(patches, kind, max_workers, initializers):
+    registry = event.Executors()
+    kinds = dict(process=MagicMock(), thread=MagicMock())
+    patched = patches(
+        "EXECUTOR_KINDS",
+        "jobs",
+        prefix="aio.core.event.registry")
+
+    with patched as (m_kinds, m_jobs):
+        m_kinds.__contains__.side_effect = kinds.__contains__
+        m_kinds.__getitem__.side_effect = kinds.__getitem__
+        if kind == "other":
+            with pytest.raises(TypeError) as e:
+                registry.create(kind, max_workers, initializers)
+            assert e.value.args[0] == "Unknown executor kind: other"
+            return
+        assert (
+            registry.create(kind, max_workers, initializers)
+            == kinds[kind].return_value)
+
+    expected = dict(
+        max_workers=(
+            max_workers
+            if max_workers is not None
+            else (m_jobs.thread_limit
+                  if kind == "thread"
+                  else m_jobs.limit)))
+    if kind == "process":
+        initializers = (
+            (tracking.kill_on_terminate, ()),
+            *initializers)
+    if initializers:
+        expected.update(
+            initializer=initialize_worker,
+            initargs=(initializers, ))
+    assert (
+        kinds[kind].call_args
+        == [(), expected])
+
+
+@pytest.mark.parametrize("name", [None, "process", "thread", "NAME"])
+@pytest.mark.parametrize("kind", [None, "KIND"])
+@pytest.mark.parametrize("initializers", [None, ("INIT0", "INIT1")])
+@pytest.mark.parametrize("exists", [True, False])
+def test_executors_get(patches, name, kind, initializers, exists):
+    registry = event.Executors()
+    registry.sizes["thread"] = 23
+    kwargs = {}
+    if kind:
+        kwargs["kind"] = kind
+    if initializers:
+        kwargs["initializers"] = initializers
+    _name = name or "process"
+    created = dict(OTHER="EXECUTOR")
+    if exists:
+        created[_name] = "EXISTING"
+    patched = patches(
+        "Executors.create",
+        "Executors._add_initializers",
+        ("Executors.executors",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.registry")
+    args = (
+        (name, )
+        if name
+        else ())
+
+    with patched as (m_create, m_add, m_executors):
+        m_executors.return_value = created
+        assert (
+            registry.get(*args, **kwargs)
+            == ("EXISTING"
+                if exists
+                else m_create.return_value))
+
+    if exists:
+        assert not m_create.called
+        assert (
+            m_add.call_args
+            == ([(_name, initializers), {}]
+                if initializers
+                else None))
+        return
+    assert not m_add.called
+    assert created[_name] == m_create.return_value
+    assert (
+        m_create.call_args
+        == [(kind or _name,
+             registry.sizes.get(_name),
+             initializers or ()), {}])
+
+
+def test_executors_get_shared():
+    registry = event.Executors()
+    try:
+        thread = registry.get("thread")
+        assert isinstance(thread, futures.ThreadPoolExecutor)
+        assert registry.get("thread") is thread
+        assert registry.get("other", kind="thread") is not thread
+        initialized = registry.get(
+            "initialized",
+            kind="thread",
+            initializers=((os.getpid, ()), ))
+        assert initialized is not thread
+        assert initialized.submit(os.getpid).result() == os.getpid()
+        with pytest.raises(TypeError) as e:
+            registry.get("thread", initializers=((os.getpid, ()), ))
+        assert (
+            e.value.args[0]
+            == "Initializers can not be added to executor: thread")
+    finally:
+        registry.shutdown()
+    assert registry.executors == {}
+
+
+def test_executors_get_shared_process_pool():
+    registry = event.Executors()
+    registry.configure(process=1)
+    try:
+        pool = registry.get("process", initializers=((_flag, ("A", )), ))
+        assert isinstance(pool, futures.ProcessPoolExecutor)
+        pid, flags = pool.submit(_flags).result(timeout=10)
+        assert pid != os.getpid()
+        assert flags == ["A"]
+        assert (
+            registry.get(
+                "process",
+                initializers=((_flag, ("A", )), (_flag, ("B", ))))
+            is pool)
+        assert registry.get("process") is pool
+        assert (
+            pool.submit(_flags).result(timeout=10)
+            == (pid, ["A", "B"]))
+        assert (
+            pool.submit(_flags).result(timeout=10)
+            == (pid, ["A", "B"]))
+    finally:
+        registry.shutdown()
+    assert _FLAGS == []
+
+
+@pytest.mark.parametrize("process", [True, False])
+def test_executors__add_initializers(patches, process):
+    registry = event.Executors()
+    executor = (
+        MagicMock(spec=_registry.ProcessPoolExecutor)
+        if process
+        else MagicMock())
+    patched = patches(
+        ("Executors.executors",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.registry")
+
+    with patched as (m_executors, ):
+        m_executors.return_value = dict(NAME=executor)
+        if not process:
+            with pytest.raises(TypeError) as e:
+                registry._add_initializers("NAME", "INITIALIZERS")
+            assert (
+                e.value.args[0]
+                == "Initializers can not be added to executor: NAME")
+            return
+        assert not registry._add_initializers("NAME", "INITIALIZERS")
+
+    assert (
+        executor.add_initializers.call_args
+        == [("INITIALIZERS", ), {}])
+
+
+@pytest.mark.parametrize("terminate_workers", [True, False])
+@pytest.mark.parametrize("processes", [None, {}, dict(P0="P0", P1="P1")])
+def test_executors_cancel(patches, terminate_workers, processes):
+    registry = event.Executors()
+    created = {f"K{i}": MagicMock() for i in range(0, 3)}
+    pools = list(created.values())
+    procs = {}
+    for i, pool in enumerate(pools):
+        if not terminate_workers:
+            del pool.terminate_workers
+        pool._processes = (
+            {k: MagicMock() for k in processes}
+            if processes is not None
+            else None)
+        procs[i] = pool._processes
+    patched = patches(
+        "subprocess.tracking.processes",
+        ("event.registry.Executors.executors",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core")
+
+    with patched as (m_processes, m_executors):
+        m_executors.return_value = created
+        assert not registry.cancel()
+
+    assert created == {}
+    assert (
+        m_processes.kill.call_args
+        == [(), {}])
+    for i, pool in enumerate(pools):
+        if terminate_workers:
+            assert (
+                pool.terminate_workers.call_args
+                == [(), {}])
+            assert not pool.shutdown.called
+            continue
+        assert (
+            pool.shutdown.call_args
+            == [(), dict(wait=False, cancel_futures=True)])
+        for proc in (procs[i] or {}).values():
+            assert (
+                proc.terminate.call_args
+                == [(), {}])
+
+
+def test_executors_cancel_process_pool():
+    registry = event.Executors()
+    registry.configure(process=2)
+    pool = registry.get("process")
+    future = pool.submit(
+        tracking.run,
+        [sys.executable, "-c", "import time; time.sleep(30)"])
+    assert pool.submit(os.getpid).result(timeout=10) != os.getpid()
+    registry.cancel()
+    assert registry.executors == {}
+
+    with pytest.raises(
+            (futures.CancelledError,
+             futures.process.BrokenProcessPool)):
+        future.result(timeout=10)
+
+
+@pytest.mark.parametrize("wait", [None, True, False])
+@pytest.mark.parametrize("cancel", [None, True, False])
+def test_executors_shutdown(patches, wait, cancel):
+    registry = event.Executors()
+    created = {f"K{i}": MagicMock() for i in range(0, 3)}
+    pools = list(created.values())
+    kwargs = {}
+    if wait is not None:
+        kwargs["wait"] = wait
+    if cancel is not None:
+        kwargs["cancel_futures"] = cancel
+    patched = patches(
+        ("Executors.executors",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.event.registry")
+
+    with patched as (m_executors, ):
+        m_executors.return_value = created
+        assert not registry.shutdown(**kwargs)
+
+    assert created == {}
+    for pool in pools:
+        assert (
+            pool.shutdown.call_args
+            == [(),
+                dict(wait=(wait if wait is not None else True),
+                     cancel_futures=bool(cancel))])
+
+
+def test_executors_initialize_worker(patches):
+    initializers = [MagicMock() for i in range(0, 3)]
+    patched = patches(
+        "_initialize",
+        prefix="aio.core.event.registry")
+
+    with patched as (m_init, ):
+        assert not initialize_worker(
+            tuple(
+                (initializer, (f"ARG{i}", i))
+                for i, initializer
+                in enumerate(initializers)))
+
+    assert (
+        m_init.call_args_list
+        == [[((initializer, (f"ARG{i}", i)), ), {}]
+            for i, initializer
+            in enumerate(initializers)])
+
+
+def test_executors_initialized_call(patches):
+    fn = MagicMock()
+    patched = patches(
+        "_initialize",
+        ("_initialized",
+         dict(new=set(["INIT1"]))),
+        prefix="aio.core.event.registry")
+
+    with patched as (m_init, _m_initialized):
+        assert (
+            _registry.initialized_call(
+                ("INIT0", "INIT1", "INIT2"),
+                fn,
+                "ARG",
+                foo="bar")
+            == fn.return_value)
+
+    assert (
+        m_init.call_args_list
+        == [[("INIT0", ), {}], [("INIT2", ), {}]])
+    assert (
+        fn.call_args
+        == [("ARG", ), dict(foo="bar")])
+
+
+def test_executors__initialize(patches):
+    initializer = MagicMock()
+    patched = patches(
+        ("_initialized",
+         dict(new=set())),
+        prefix="aio.core.event.registry")
+
+    with patched:
+        assert not _registry._initialize((initializer, ("ARG", 23)))
+        assert _registry._initialized == {(initializer, ("ARG", 23))}
+
+    assert (
+        initializer.call_args
+        == [("ARG", 23), {}])
+
+
+@pytest.mark.parametrize("initialize", [True, False])
+def test_executors_process_pool_constructor(initialize):
+    kwargs = (
+        dict(initializer=initialize_worker,
+             initargs=(("INIT0", "INIT1"), ))
+        if initialize
+        else dict(initializer=_flag, initargs=("A", )))
+    pool = _registry.ProcessPoolExecutor(max_workers=2, **kwargs)
+    try:
+        assert isinstance(pool, futures.ProcessPoolExecutor)
+        assert pool._max_workers == 2
+        assert (
+            pool.initializers
+            == (("INIT0", "INIT1")
+                if initialize
+                else ()))
+        assert pool.added_initializers == ()
+    finally:
+        pool.shutdown()
+
+
+def test_executors_process_pool_add_initializers():
+    pool = _registry.ProcessPoolExecutor(
+        initializer=initialize_worker,
+        initargs=(("INIT0", "INIT1"), ))
+    try:
+        pool.add_initializers(("INIT1", "INIT2", "INIT2"))
+        assert pool.added_initializers == ("INIT2", )
+        pool.add_initializers(("INIT0", "INIT2", "INIT3"))
+        assert pool.added_initializers == ("INIT2", "INIT3")
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.parametrize("added", [(), ("INIT0", "INIT1")])
+def test_executors_process_pool_submit(patches, added):
+    pool = _registry.ProcessPoolExecutor()
+    pool.added_initializers = added
+    patched = patches(
+        "futures.ProcessPoolExecutor.submit",
+        prefix="aio.core.event.registry")
+
+    try:
+        with patched as (m_submit, ):
+            assert (
+                pool.submit("FN", "ARG", foo="bar")
+                == m_submit.return_value)
+    finally:
+        pool.shutdown()
+
+    assert (
+        m_submit.call_args
+        == ([(_registry.initialized_call, added, "FN", "ARG"),
+             dict(foo="bar")]
+            if added
+            else [("FN", "ARG"), dict(foo="bar")]))
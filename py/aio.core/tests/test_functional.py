@@ -992,6 +992,42 @@ def test_batches(iters, item_count, batch_size):
     assert results == items
 
 
+@pytest.mark.parametrize(
+    "costs",
+    [{},
+     dict(A=1),
+     dict(A=8, B=7, C=6, D=5, E=4),
+     dict(A=0, B=0, C=0),
+     {f"F{i}": i % 7 for i in range(0, 50)}])
+@pytest.mark.parametrize("batch_count", [0, 1, 2, 3, 100])
+def test_balanced_batches(costs, batch_count):
+    batches = functional.balanced_batches(costs, batch_count)
+    assert (
+        sorted(item for batch in batches for item in batch)
+        == sorted(costs))
+    assert all(batches)
+    assert len(batches) <= max(1, batch_count)
+    if costs:
+        assert len(batches) == min(max(1, batch_count), len(costs))
+    totals = [sum(costs[item] for item in batch) for batch in batches]
+    assert totals == sorted(totals, reverse=True)
+    for batch in batches:
+        # The lightest batch would have taken any item from a heavier batch
+        # that left it lighter than the lightest batch.
+        assert (
+            sum(costs[item] for item in batch) - min(
+                costs[item] for item in batch)
+            <= totals[-1])
+
+
+def test_balanced_batches_lpt():
+    assert (
+        functional.balanced_batches(
+            dict(A=8, B=7, C=6, D=5, E=4),
+            2)
+        == [["A", "D", "E"], ["B", "C"]])
+
+
 @pytest.mark.parametrize("is_str_or_bytes", [True, False])
 @pytest.mark.parametrize("is_iterable", [True, False])
 @pytest.mark.parametrize("max_batch_size", [None, 0, 23])
@@ -1003,7 +1039,7 @@ def test_batch_jobs(
         "isinstance",
         "max",
         "min",
-        "os",
+        "_jobs",
         "round",
         "type",
         "batches",
@@ -1022,7 +1058,7 @@ def test_batch_jobs(
         return is_str_or_bytes
 
     with patched as patchy:
-        (m_len, m_isinst, m_max, m_min, m_os, m_round, m_type,
+        (m_len, m_isinst, m_max, m_min, m_jobs, m_round, m_type,
          m_batches, m_typed) = patchy
         m_isinst.side_effect = isinst
         if not is_iterable or is_str_or_bytes:
@@ -1037,7 +1073,6 @@ def test_batch_jobs(
         m_isinst.call_args_list[0]
         == [(jobs, Iterable), {}])
     if not is_iterable or is_str_or_bytes:
-        assert not m_os.proc_count.called
         assert not m_round.called
         assert not m_len.called
         assert not m_min.called
@@ -1059,9 +1094,6 @@ def test_batch_jobs(
     if is_str_or_bytes:
         return
     assert not m_type.called
-    assert (
-        m_os.cpu_count.call_args
-        == [(), {}])
     assert (
         m_len.call_args
         == [(jobs, ), {}])
@@ -1071,7 +1103,7 @@ def test_batch_jobs(
             {}])
     assert (
         m_len.return_value.__truediv__.call_args
-        == [(m_os.cpu_count.return_value, ), {}])
+        == [(m_jobs.limit, ), {}])
     batch_count = m_round.return_value
     if max_batch_size:
         assert (
@@ -1,6 +1,8 @@
 
 import asyncio
+import io
 import logging
+import logging.handlers
 from queue import SimpleQueue
 from unittest.mock import MagicMock, PropertyMock
 
@@ -11,8 +13,15 @@ from aio.core import log
 
 @pytest.mark.parametrize("respect", [None, True, False])
 @pytest.mark.parametrize("stop_on_exit", [None, True, False])
-def test_queue_logger_constructor(respect, stop_on_exit):
+@pytest.mark.parametrize("batch_capacity", [None, 0, 23])
+@pytest.mark.parametrize("batch_interval", [None, 0.5])
+def test_queue_logger_constructor(
+        respect, stop_on_exit, batch_capacity, batch_interval):
     kwargs = {}
+    if batch_capacity is not None:
+        kwargs["batch_capacity"] = batch_capacity
+    if batch_interval is not None:
+        kwargs["batch_interval"] = batch_interval
     if respect is not None:
         kwargs["respect_handler_level"] = respect
     if stop_on_exit is not None:
@@ -26,6 +35,12 @@ def test_queue_logger_constructor(respect, stop_on_exit):
     assert (
         logger.stop_on_exit
         == (stop_on_exit if stop_on_exit is not None else True))
+    assert logger.batch_capacity == (batch_capacity or 0)
+    assert (
+        logger.batch_interval
+        == (batch_interval
+            if batch_interval is not None
+            else log.logging.BATCH_INTERVAL))
     assert logger.handler_class == log.QueueHandler
     assert "handler_class" not in logger.__dict__
     assert logger.queue_class == SimpleQueue
@@ -109,7 +124,7 @@ def test_queue_logger_listener(iters, patches, respect):
         kwargs["respect_handler_level"] = respect
     logger = log.QueueLogger("LOGGER", **kwargs)
     patched = patches(
-        ("QueueLogger.handlers",
+        ("QueueLogger.listener_handlers",
          dict(new_callable=PropertyMock)),
         ("QueueLogger.listener_class",
          dict(new_callable=PropertyMock)),
@@ -133,6 +148,38 @@ def test_queue_logger_listener(iters, patches, respect):
     assert "listener" in logger.__dict__
 
 
+@pytest.mark.parametrize("batch_capacity", [0, 23])
+def test_queue_logger_listener_handlers(iters, patches, batch_capacity):
+    logger = log.QueueLogger(
+        "LOGGER",
+        batch_capacity=batch_capacity,
+        batch_interval=0.5)
+    patched = patches(
+        "BatchingHandler",
+        ("QueueLogger.handlers",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.log.logging")
+    handlers = iters()
+
+    with patched as (m_batching, m_handlers):
+        m_handlers.return_value = handlers
+        assert (
+            logger.listener_handlers
+            == (handlers
+                if not batch_capacity
+                else [m_batching.return_value] * len(handlers)))
+
+    assert "listener_handlers" in logger.__dict__
+    if not batch_capacity:
+        assert not m_batching.called
+        return
+    assert (
+        m_batching.call_args_list
+        == [[(h, 23), dict(interval=0.5)]
+            for h
+            in handlers])
+
+
 def test_queue_logger_logger(patches):
     wrapped_logger = MagicMock()
     logger = log.QueueLogger(wrapped_logger)
@@ -172,7 +219,245 @@ def test_queue_logger_start(patches, stop_on_exit):
     else:
         assert (
             m_atexit.register.call_args
-            == [(m_listener.return_value.stop, ), {}])
+            == [(logger.stop, ), {}])
+
+
+def test_queue_logger_stop(iters, patches):
+    logger = log.QueueLogger("LOGGER")
+    patched = patches(
+        ("QueueLogger.listener",
+         dict(new_callable=PropertyMock)),
+        ("QueueLogger.listener_handlers",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.log.logging")
+    handlers = iters(cb=lambda i: MagicMock())
+
+    with patched as (m_listener, m_handlers):
+        m_handlers.return_value = handlers
+        assert not logger.stop()
+
+    assert (
+        m_listener.return_value.stop.call_args
+        == [(), {}])
+    for handler in handlers:
+        assert (
+            handler.flush.call_args
+            == [(), {}])
+
+
+def _record(msg, level=logging.INFO):
+    return logging.LogRecord(
+        "NAME", level, "PATH", 23, msg, None, None)
+
+
+def test_batching_handler_constructor():
+    target = logging.StreamHandler()
+    target.setLevel(logging.WARNING)
+    handler = log.BatchingHandler(target, 23)
+    assert isinstance(handler, logging.Handler)
+    assert handler.target == target
+    assert handler.level == logging.WARNING
+    assert handler.capacity == 23
+    assert handler.interval == log.logging.BATCH_INTERVAL
+    assert handler.flush_level == logging.ERROR
+    assert handler.buffer == []
+    assert handler._timer is None
+
+
+def test_batching_handler_level():
+    target = logging.StreamHandler()
+    target.setLevel(logging.WARNING)
+    handler = log.BatchingHandler(target, 23)
+    target.setLevel(logging.INFO)
+    assert handler.level == logging.INFO
+    handler.setLevel(logging.DEBUG)
+    assert target.level == logging.DEBUG
+
+
+def test_batching_handler_level_change_applies():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    handler = log.BatchingHandler(target, 23)
+    queue: SimpleQueue = SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        queue,
+        handler,
+        respect_handler_level=True)
+    # Stopping the listener waits for the queued records to be handled.
+    for message, level, target_level in (
+            ("HIDDEN", logging.INFO, logging.WARNING),
+            ("SHOWN", logging.INFO, logging.INFO),
+            ("HIDDEN AGAIN", logging.WARNING, logging.ERROR)):
+        target.setLevel(target_level)
+        listener.start()
+        queue.put(_record(message, level))
+        listener.stop()
+    handler.flush()
+    assert stream.getvalue() == "SHOWN\n"
+
+
+@pytest.mark.parametrize("buffered", [0, 1, 5])
+@pytest.mark.parametrize("level", [logging.INFO, logging.ERROR])
+@pytest.mark.parametrize("timer", [True, False])
+def test_batching_handler_emit(patches, buffered, level, timer):
+    handler = log.BatchingHandler(MagicMock(level=0), 3)
+    handler.buffer = ["RECORD"] * buffered
+    if timer:
+        handler._timer = "TIMER"
+    patched = patches(
+        "threading",
+        "BatchingHandler.flush",
+        prefix="aio.core.log.logging")
+    record = _record("MSG", level)
+
+    with patched as (m_threading, m_flush):
+        assert not handler.emit(record)
+
+    assert handler.buffer[-1] == record
+    flushes = (
+        len(handler.buffer) >= 3
+        or level >= logging.ERROR)
+    if flushes:
+        assert m_flush.called
+        assert not m_threading.Timer.called
+        return
+    assert not m_flush.called
+    if timer:
+        assert not m_threading.Timer.called
+        return
+    assert handler._timer == m_threading.Timer.return_value
+    assert (
+        m_threading.Timer.call_args
+        == [(handler.interval, m_flush), {}])
+    assert handler._timer.daemon is True
+    assert (
+        handler._timer.start.call_args
+        == [(), {}])
+
+
+def test_batching_handler_emit_shutdown(patches):
+    handler = log.BatchingHandler(MagicMock(level=0), 3)
+    patched = patches(
+        "threading",
+        "BatchingHandler.flush",
+        prefix="aio.core.log.logging")
+    record = _record("MSG", logging.INFO)
+
+    with patched as (m_threading, m_flush):
+        m_threading.Timer.return_value.start.side_effect = RuntimeError(
+            "can't create new thread at interpreter shutdown")
+        assert not handler.emit(record)
+
+    assert handler.buffer == [record]
+    assert (
+        m_flush.call_args
+        == [(), {}])
+
+
+@pytest.mark.parametrize("records", [True, False])
+@pytest.mark.parametrize("timer", [True, False])
+def test_batching_handler_flush(patches, records, timer):
+    handler = log.BatchingHandler(MagicMock(level=0), 3)
+    buffer = ["R1", "R2"] if records else []
+    handler.buffer = buffer
+    m_timer = MagicMock()
+    if timer:
+        handler._timer = m_timer
+    patched = patches(
+        "BatchingHandler.write",
+        prefix="aio.core.log.logging")
+
+    with patched as (m_write, ):
+        assert not handler.flush()
+
+    assert handler.buffer == []
+    assert handler._timer is None
+    if timer:
+        assert m_timer.cancel.called
+    if records:
+        assert (
+            m_write.call_args
+            == [(buffer, ), {}])
+    else:
+        assert not m_write.called
+
+
+def test_batching_handler_close(patches):
+    handler = log.BatchingHandler(MagicMock(level=0), 3)
+    patched = patches(
+        "logging.Handler.close",
+        "BatchingHandler.flush",
+        prefix="aio.core.log.logging")
+
+    with patched as (m_close, m_flush):
+        assert not handler.close()
+
+    assert m_flush.called
+    assert m_close.called
+
+
+def test_batching_handler_write_handler():
+    target = MagicMock(level=0)
+    handler = log.BatchingHandler(target, 3)
+    assert not handler.write(["R1", "R2"])
+    assert (
+        target.handle.call_args_list
+        == [[("R1", ), {}], [("R2", ), {}]])
+
+
+def test_batching_handler_write_stream():
+    stream = MagicMock()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    target.addFilter(lambda record: record.msg != "FILTERED")
+    handler = log.BatchingHandler(target, 3)
+    bad = _record("BAD %s")
+    bad.args = (1, 2)
+    target.handleError = MagicMock()
+
+    assert not handler.write(
+        [_record("ONE"),
+         _record("FILTERED"),
+         bad,
+         _record("TWO", logging.WARNING)])
+
+    assert (
+        stream.write.call_args_list
+        == [[("INFO ONE\nWARNING TWO\n", ), {}]])
+    assert stream.flush.call_count == 1
+    assert (
+        target.handleError.call_args
+        == [(bad, ), {}])
+    assert not handler.write([_record("FILTERED")])
+    assert stream.write.call_count == 1
+
+
+def test_batching_handler_write_stream_fails():
+    stream = MagicMock()
+    stream.write.side_effect = OSError
+    target = logging.StreamHandler(stream)
+    target.handleError = MagicMock()
+    handler = log.BatchingHandler(target, 3)
+    records = [_record("ONE"), _record("TWO")]
+    assert not handler.write(records)
+    assert (
+        target.handleError.call_args
+        == [(records[-1], ), {}])
+
+
+def test_batching_handler_interval():
+    stream = MagicMock()
+    target = logging.StreamHandler(stream)
+    handler = log.BatchingHandler(target, 100, interval=0.01)
+    handler.handle(_record("ONE"))
+    handler.handle(_record("TWO"))
+    assert not stream.write.called
+    handler._timer.join()
+    assert (
+        stream.write.call_args_list
+        == [[("ONE\nTWO\n", ), {}]])
+    handler.handle(_record("THREE", logging.ERROR))
+    assert stream.write.call_count == 2
 
 
 def test_queue_handler_constructor():
@@ -1,10 +1,14 @@
 
+import io
+import sys
+import tracemalloc
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
 import abstracts
 
+import aio.core.subprocess.handler
 from aio.core import subprocess
 
 
@@ -40,12 +44,22 @@ class DummySubprocessHandlerInterface:
     def handle_response(self, response):
         return subprocess.ISubprocessHandler.handle_response(self, response)
 
+    def handle_record(self, record):
+        return subprocess.ISubprocessHandler.handle_record(self, record)
+
     def has_failed(self, response):
         return subprocess.ISubprocessHandler.has_failed(self, response)
 
+    def iter_records(self, stream):
+        return subprocess.ISubprocessHandler.iter_records(self, stream)
+
     def run(self, *args, **kwargs):
         return subprocess.ISubprocessHandler.run(self, *args, **kwargs)
 
+    def run_stream(self, *args, **kwargs):
+        return subprocess.ISubprocessHandler.run_stream(
+            self, *args, **kwargs)
+
     def run_subprocess(self, *args, **kwargs):
         return subprocess.ISubprocessHandler.run_subprocess(
             self, *args, **kwargs)
@@ -68,12 +82,13 @@ def test_subprocess_handler_interface():
         with pytest.raises(NotImplementedError):
             getattr(iface, iface_prop)
     response_methods = [
-        "handle", "handle_error", "handle_response", "has_failed"]
+        "handle", "handle_error", "handle_record", "handle_response",
+        "has_failed", "iter_records"]
     for response_method in response_methods:
         with pytest.raises(NotImplementedError):
             getattr(iface, response_method)("RESPONSE")
     subproc_methods = [
-        "run", "run_subprocess"]
+        "run", "run_stream", "run_subprocess"]
     for subproc_method in subproc_methods:
         with pytest.raises(NotImplementedError):
             getattr(iface, subproc_method)("SUBPROC", "ARG", KW="VALUE")
@@ -142,6 +157,14 @@ def test_subprocess_handler_dunder_call(iters, patches):
         == [tuple(args), {}])
 
 
+def test_subprocess_handler_chunk_size():
+    handler = DummySubprocessHandler("PATH")
+    assert (
+        handler.chunk_size
+        == aio.core.subprocess.handler.STREAM_CHUNK_SIZE)
+    assert "chunk_size" not in handler.__dict__
+
+
 def test_subprocess_handler_dunder_str():
     handler = DummySubprocessHandler("PATH")
     assert (
@@ -252,6 +275,11 @@ def test_subprocess_handler_handle_response(patches, has_failed):
         == [(response, ), {}])
 
 
+def test_subprocess_handler_handle_record():
+    handler = DummySubprocessHandler("PATH")
+    assert not handler.handle_record("RECORD")
+
+
 def test_subprocess_handler_has_failed(patches):
     handler = DummySubprocessHandler("PATH")
     patched = patches(
@@ -269,6 +297,47 @@ def test_subprocess_handler_has_failed(patches):
         == [(response.returncode, ), {}])
 
 
+@pytest.mark.parametrize(
+    "output",
+    [b"",
+     b"a",
+     b"a\n",
+     b"a\nbb\nccc",
+     b"a\nbb\nccc\n\n",
+     "\u00e9\n\u00e9\u00e9\n".encode("utf-8")])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+@pytest.mark.parametrize("separator", ["\n", "\0"])
+def test_subprocess_handler_iter_records(
+        patches, output, chunk_size, separator):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        ("ASubprocessHandler.chunk_size",
+         dict(new_callable=PropertyMock)),
+        ("ASubprocessHandler.record_separator",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.core.subprocess.handler")
+    output = output.replace(b"\n", separator.encode())
+    stream = io.BufferedReader(io.BytesIO(output))
+    expected = output.decode("utf-8").split(separator)
+    if not expected[-1]:
+        expected = expected[:-1]
+
+    with patched as (m_chunk, m_sep):
+        m_chunk.return_value = chunk_size
+        m_sep.return_value = separator
+        assert (
+            list(handler.iter_records(stream))
+            == expected)
+
+
+def test_subprocess_handler_record_separator():
+    handler = DummySubprocessHandler("PATH")
+    assert (
+        handler.record_separator
+        == aio.core.subprocess.handler.STREAM_RECORD_SEPARATOR)
+    assert "record_separator" not in handler.__dict__
+
+
 def test_subprocess_handler_run(iters, patches):
     handler = DummySubprocessHandler("PATH")
     patched = patches(
@@ -301,24 +370,200 @@ def test_subprocess_handler_run(iters, patches):
         == [tuple(args), kwargs])
 
 
-def test_subprocess_handler_run_subprocess(iters, patches):
+@pytest.mark.parametrize("parser", [None, "PARSER"])
+def test_subprocess_handler_run_stream(iters, patches, parser):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        "ASubprocessHandler.handle_response",
+        "ASubprocessHandler.stream_response",
+        prefix="aio.core.subprocess.handler")
+    args = iters()
+    kwargs = iters(dict)
+    if parser:
+        kwargs["parser"] = parser
+
+    with patched as (m_handle, m_stream):
+        assert (
+            handler.run_stream(*args, **kwargs)
+            == m_handle.return_value)
+
+    kwargs["parser"] = parser
+    assert (
+        m_stream.call_args
+        == [tuple(args), kwargs])
+    assert (
+        m_handle.call_args
+        == [(m_stream.return_value, ), {}])
+
+
+def test_subprocess_handler_run_stream_integration(tmp_path):
+    handler = DummySubprocessHandler(tmp_path)
+    records = []
+
+    response = handler.run_stream(
+        "sh", "-c", "printf 'a\\nb\\nc'; printf 'oops' >&2; exit 3",
+        parser=records.append)
+
+    assert records == ["a", "b", "c"]
+    assert (
+        response
+        == dict(ERROR=[3, "", "oops"]))
+
+
+def test_subprocess_handler_run_stream_bounded_memory(tmp_path):
+    handler = DummySubprocessHandler(tmp_path)
+    counted = dict(records=0, size=0)
+    # 40 * 512 * 1024 bytes (20MB) of output, in 1KB records.
+    script = (
+        "import sys\n"
+        "for _ in range(40):\n"
+        "    sys.stdout.write(('x' * 1023 + '\\n') * 512)\n")
+
+    def parser(record):
+        counted["records"] += 1
+        counted["size"] += len(record)
+
+    tracemalloc.start()
+    try:
+        response = handler.run_stream(
+            sys.executable, "-c", script,
+            parser=parser)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert response == dict(RESPONSE=[0, "", ""])
+    assert counted == dict(records=40 * 512, size=40 * 512 * 1023)
+    assert peak < 2 * 1024 * 1024
+
+
+@pytest.mark.parametrize("parser", [True, False])
+def test_subprocess_handler_stream_response(iters, patches, parser):
     handler = DummySubprocessHandler("PATH")
     patched = patches(
         "subprocess",
+        "tempfile",
+        "ASubprocessHandler.handle_record",
+        "ASubprocessHandler.iter_records",
+        "ASubprocessHandler.stream_kwargs",
+        "ASubprocessHandler.stream_subprocess",
+        "ASubprocessHandler.subprocess_args",
+        prefix="aio.core.subprocess.handler")
+    args = iters()
+    kwargs = iters(dict)
+    records = iters(cb=lambda i: f"RECORD{i}")
+    m_parser = MagicMock()
+    if parser:
+        kwargs["parser"] = m_parser
+
+    with patched as patchy:
+        (m_subproc, m_temp, m_record,
+         m_iter, m_kwargs, m_stream, m_args) = patchy
+        m_args.return_value = ["COMMAND"]
+        m_kwargs.return_value = dict(K="V")
+        m_iter.return_value = iter(records)
+        m_stderr = m_temp.TemporaryFile.return_value.__enter__.return_value
+        m_proc = m_stream.return_value.__enter__.return_value
+        assert (
+            handler.stream_response(*args, **kwargs)
+            == m_subproc.CompletedProcess.return_value)
+
+    kwargs.pop("parser", None)
+    m_parse = (
+        m_parser
+        if parser
+        else m_record)
+    assert (
+        m_parse.call_args_list
+        == [[(record, ), {}] for record in records])
+    if parser:
+        assert not m_record.called
+    assert (
+        m_args.call_args
+        == [tuple(args), kwargs])
+    assert (
+        m_kwargs.call_args
+        == [tuple(args), kwargs])
+    assert (
+        m_stream.call_args
+        == [("COMMAND", ), dict(stderr=m_stderr, K="V")])
+    assert (
+        m_iter.call_args
+        == [(m_proc.stdout, ), {}])
+    assert (
+        m_stderr.seek.call_args
+        == [(0, ), {}])
+    assert (
+        m_stderr.read.return_value.decode.call_args
+        == [("utf-8", ), {}])
+    assert (
+        m_subproc.CompletedProcess.call_args
+        == [("COMMAND",
+             m_proc.returncode,
+             "",
+             m_stderr.read.return_value.decode.return_value), {}])
+
+
+def test_subprocess_handler_run_subprocess(iters, patches):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        "processes",
         prefix="aio.core.subprocess.handler")
     args = iters()
     kwargs = iters(dict)
 
-    with patched as (m_subproc, ):
+    with patched as (m_processes, ):
         assert (
             handler.run_subprocess(*args, **kwargs)
-            == m_subproc.run.return_value)
+            == m_processes.run.return_value)
+
+    assert (
+        m_processes.run.call_args
+        == [tuple(args), kwargs])
+
+
+def test_subprocess_handler_stream_kwargs(iters, patches):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        "ASubprocessHandler.subprocess_kwargs",
+        prefix="aio.core.subprocess.handler")
+    args = iters()
+    kwargs = iters(dict)
+
+    with patched as (m_kwargs, ):
+        m_kwargs.return_value = dict(
+            cwd="CWD",
+            capture_output=True,
+            encoding="ENCODING",
+            text=True,
+            other="OTHER")
+        assert (
+            handler.stream_kwargs(*args, **kwargs)
+            == dict(cwd="CWD", other="OTHER"))
 
     assert (
-        m_subproc.run.call_args
+        m_kwargs.call_args
         == [tuple(args), kwargs])
 
 
+def test_subprocess_handler_stream_subprocess(iters, patches):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        "subprocess",
+        prefix="aio.core.subprocess.handler")
+    args = iters()
+    kwargs = iters(dict)
+
+    with patched as (m_subproc, ):
+        assert (
+            handler.stream_subprocess(*args, **kwargs)
+            == m_subproc.Popen.return_value)
+
+    assert (
+        m_subproc.Popen.call_args
+        == [tuple(args), dict(stdout=m_subproc.PIPE, **kwargs)])
+
+
 def test_subprocess_handler_subprocess_args(iters, patches):
     handler = DummySubprocessHandler("PATH")
     patched = patches(
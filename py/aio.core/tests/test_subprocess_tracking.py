@@ -0,0 +1,189 @@
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from aio.core import subprocess as aio_subprocess
+from aio.core.subprocess import tracking
+
+
+def test_tracking_constructor():
+    processes = tracking.RunningProcesses()
+    assert processes.running == set()
+    assert isinstance(
+        aio_subprocess.processes,
+        aio_subprocess.RunningProcesses)
+    assert aio_subprocess.processes is tracking.processes
+
+
+def test_tracking_running_forked(patches):
+    processes = tracking.RunningProcesses()
+    processes.running.add("PROC")
+    lock = processes._lock
+    patched = patches(
+        "os",
+        prefix="aio.core.subprocess.tracking")
+
+    with patched as (m_os, ):
+        m_os.getpid.return_value = "CHILD PID"
+        assert processes.running == set()
+
+    assert processes._pid == "CHILD PID"
+    assert processes._lock is not lock
+
+
+def test_tracking_tracking():
+    processes = tracking.RunningProcesses()
+
+    with processes.tracking("PROC") as proc:
+        assert proc == "PROC"
+        assert processes.running == {"PROC"}
+
+    assert processes.running == set()
+
+    with pytest.raises(RuntimeError):
+        with processes.tracking("PROC"):
+            raise RuntimeError()
+
+    assert processes.running == set()
+
+
+def test_tracking_kill():
+    processes = tracking.RunningProcesses()
+    assert processes.kill() == 0
+
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"])
+    with processes.tracking(proc):
+        assert processes.kill() == 1
+        assert processes.running == set()
+        assert proc.wait(timeout=10) != 0
+    proc.kill()
+    assert processes.kill() == 0
+
+
+@pytest.mark.parametrize("check", [True, False])
+@pytest.mark.parametrize("capture_output", [True, False])
+def test_tracking_run(check, capture_output):
+    processes = tracking.RunningProcesses()
+    started = []
+
+    def on_start(proc):
+        assert processes.running == {proc}
+        started.append(proc)
+
+    command = [
+        sys.executable,
+        "-c",
+        ("import sys; "
+         "sys.stdout.write(sys.stdin.read().upper()); "
+         "sys.stderr.write('ERR'); "
+         "sys.exit(3)")]
+
+    def run():
+        return processes.run(
+            command,
+            input="in",
+            capture_output=capture_output,
+            check=check,
+            encoding="utf-8",
+            on_start=on_start)
+
+    if check:
+        with pytest.raises(subprocess.CalledProcessError) as e:
+            run()
+        assert e.value.returncode == 3
+        if capture_output:
+            assert e.value.output == "IN"
+            assert e.value.stderr == "ERR"
+    else:
+        result = run()
+        assert result.args == command
+        assert result.returncode == 3
+        assert (
+            (result.stdout, result.stderr)
+            == (("IN", "ERR")
+                if capture_output
+                else (None, None)))
+    assert len(started) == 1
+    assert processes.running == set()
+
+
+def test_tracking_run_killed():
+    processes = tracking.RunningProcesses()
+    started = threading.Event()
+    results = []
+
+    def run():
+        results.append(
+            processes.run(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                on_start=lambda proc: started.set()))
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert started.wait(timeout=10)
+    assert processes.kill() == 1
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert results[0].returncode != 0
+    assert processes.running == set()
+
+
+def test_tracking_run_timeout():
+    processes = tracking.RunningProcesses()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        processes.run(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            timeout=.1)
+
+    assert processes.running == set()
+
+
+def test_tracking_run_function(patches):
+    patched = patches(
+        "processes",
+        prefix="aio.core.subprocess.tracking")
+
+    with patched as (m_processes, ):
+        assert (
+            tracking.run("ARG", kwarg="KWARG")
+            == m_processes.run.return_value)
+
+    assert (
+        m_processes.run.call_args
+        == [("ARG", ), dict(kwarg="KWARG")])
+
+
+def test_tracking_kill_on_terminate(patches):
+    patched = patches(
+        "signal",
+        prefix="aio.core.subprocess.tracking")
+
+    with patched as (m_signal, ):
+        assert not tracking.kill_on_terminate()
+
+    assert (
+        m_signal.signal.call_args
+        == [(m_signal.SIGTERM, tracking._terminate), {}])
+
+
+def test_tracking__terminate(patches):
+    patched = patches(
+        "os",
+        "processes",
+        prefix="aio.core.subprocess.tracking")
+
+    with patched as (m_os, m_processes):
+        assert not tracking._terminate(15, "FRAME")
+
+    assert (
+        m_processes.kill.call_args
+        == [(), {}])
+    assert (
+        m_os._exit.call_args
+        == [(143, ), {}])
@@ -167,21 +167,15 @@ def test_aio_concurrent_running_queue(patches):
     assert "running_queue" in concurrent.__dict__
 
 
-@pytest.mark.parametrize("cpus", [None, "", 0, 4, 73])
-def test_aio_concurrent_default_limit(patches, cpus):
+def test_aio_concurrent_default_limit(patches):
     concurrent = aio.core.tasks.Concurrent(["CORO"])
     patched = patches(
-        "min",
-        "os",
+        "_jobs",
         prefix="aio.core.tasks.tasks")
 
-    with patched as (m_min, m_os):
-        m_os.cpu_count.return_value = cpus
-        assert concurrent.default_limit == m_min.return_value
+    with patched as (m_jobs, ):
+        assert concurrent.default_limit == m_jobs.thread_limit
 
-    assert (
-        m_min.call_args
-        == [(32, (cpus or 0) + 4), {}])
     assert "default_limit" not in concurrent.__dict__
 
 
@@ -627,6 +621,76 @@ async def test_aio_concurrent_on_task_complete(
         == [(), {}])
 
 
+@pytest.mark.parametrize("raises", [asyncio.CancelledError, GeneratorExit])
+@pytest.mark.parametrize("closed", [True, False])
+async def test_aio_concurrent_output_cancelled(patches, raises, closed):
+    concurrent = aio.core.tasks.Concurrent(["CORO"])
+    patched = patches(
+        ("Concurrent.cancel", dict(new_callable=AsyncMock)),
+        ("Concurrent.closed", dict(new_callable=PropertyMock)),
+        ("Concurrent.out", dict(new_callable=PropertyMock)),
+        prefix="aio.core.tasks.tasks")
+
+    with patched as (m_cancel, m_closed, m_out):
+        m_closed.return_value = closed
+        m_out.return_value.get = AsyncMock(side_effect=raises)
+        with pytest.raises(raises):
+            async for result in concurrent.output():
+                pass
+
+    if closed:
+        assert not m_cancel.called
+        return
+    assert (
+        m_cancel.call_args
+        == [(), {}])
+
+
+@pytest.mark.parametrize("stop", ["cancel", "break"])
+async def test_aio_concurrent_output_stop_integration(stop):
+    started = asyncio.Event()
+    sleeping = []
+    cancelled = []
+
+    async def slow(i):
+        # the first returns straight away, the rest wait until cancelled
+        try:
+            if i:
+                sleeping.append(i)
+                if len(sleeping) == 3:
+                    started.set()
+                await asyncio.sleep(10)
+            return i
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+
+    async def consume():
+        results = concurrent.output()
+        async for result in results:
+            if stop == "break":
+                await started.wait()
+                await results.aclose()
+                return
+
+    concurrent = aio.core.tasks.Concurrent(
+        (slow(i) for i in range(0, 5)),
+        limit=3)
+    concurrent.submit_task = asyncio.create_task(concurrent.submit())
+    consumer = asyncio.create_task(consume())
+    await started.wait()
+    if stop == "cancel":
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+    else:
+        await consumer
+
+    assert concurrent.closed
+    assert concurrent.submit_task.done()
+    assert sorted(cancelled) == [1, 2, 3]
+
+
 @pytest.mark.parametrize("result_count", range(0, 7))
 @pytest.mark.parametrize("error", [True, False])
 @pytest.mark.parametrize("should_error", [True, False])
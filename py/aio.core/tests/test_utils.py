@@ -1,10 +1,14 @@
 
+import asyncio
 import contextlib
+import sys
+import warnings
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
 from aio.core import utils
+from aio.core.utils import context
 
 
 def test_captured_constructor():
@@ -87,6 +91,48 @@ def test_captured__warnings(patches):
         == [(), dict(record=True)])
 
 
+async def test_captured_task_warnings():
+
+    async def warn(name, wait, release):
+        with utils.captured_task_warnings() as captured:
+            warnings.warn(f"{name} BEFORE")
+            release.set()
+            await wait.wait()
+            warnings.warn(f"{name} AFTER")
+            captured.result = name
+        return captured
+
+    first = asyncio.Event()
+    second = asyncio.Event()
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        captured = await asyncio.gather(
+            warn("A", second, first),
+            warn("B", first, second))
+        showwarning = warnings.showwarning
+
+    assert (
+        [str(c) for c in captured]
+        == ["A BEFORE\nA AFTER\nA", "B BEFORE\nB AFTER\nB"])
+    assert context._router.users == 0
+    assert context._router.catcher is None
+    assert showwarning is not context._router.route
+
+
+def test_captured_task_warnings_outside_task(patches):
+    router = context.TaskWarningRouter()
+    showwarning = MagicMock()
+
+    with router:
+        router.showwarning = showwarning
+        router.route("MESSAGE", UserWarning, "FILE", 23)
+
+    assert (
+        showwarning.call_args
+        == [("MESSAGE", UserWarning, "FILE", 23, None, None), {}])
+    assert router.showwarning is None
+
+
 @pytest.mark.parametrize(
     "tarballs",
     [(), tuple("TARB{i}" for i in range(0, 3))])
@@ -281,3 +327,42 @@ def test_ellipsize(text_length, max_length):
     assert (
         utils.ellipsize("X" * text_length, max_length)
         == expected)
+
+
+def test_lazy_import_imported(patches):
+    patched = patches(
+        "importlib",
+        prefix="aio.core.utils.lazy")
+
+    with patched as (m_importlib, ):
+        assert utils.lazy_import("asyncio") is asyncio
+
+    assert not m_importlib.util.find_spec.called
+
+
+def test_lazy_import_missing():
+    with pytest.raises(ModuleNotFoundError) as e:
+        utils.lazy_import("aio.core.does_not_exist")
+
+    assert e.value.name == "aio.core.does_not_exist"
+
+
+def test_lazy_import(monkeypatch, tmp_path):
+    package = tmp_path.joinpath("lazy_pkg")
+    package.mkdir()
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("mod.py").write_text(
+        "import lazy_pkg\n"
+        "lazy_pkg.loaded = True\n"
+        "VALUE = 23\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ["lazy_pkg", "lazy_pkg.mod"]:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = utils.lazy_import("lazy_pkg.mod")
+    parent = sys.modules["lazy_pkg"]
+    assert parent.mod is module
+    assert not hasattr(parent, "loaded")
+    assert module.VALUE == 23
+    assert parent.loaded is True
+    assert utils.lazy_import("lazy_pkg.mod") is module
@@ -1,19 +1,37 @@
 
-from . import abstract, decorators, interface
+from . import (
+    abstract, decorators, fingerprints, interface, merge, output, sharding)
 from .checker import (
     Checker,
     CheckerSummary,
     Problems)
 from .decorators import preload
+from .fingerprints import fingerprint
 from .interface import IProblems
+from .merge import CheckerResults, CheckerResultsMerger
+from .merge_cmd import merge_cmd
+from .output import CheckerOutput, JSONLOutput, SARIFOutput
+from .timings import CheckerTimings
 
 
 __all__ = (
     "abstract",
     "Checker",
+    "CheckerOutput",
+    "CheckerResults",
+    "CheckerResultsMerger",
     "CheckerSummary",
+    "CheckerTimings",
     "decorators",
+    "fingerprint",
+    "fingerprints",
     "interface",
     "IProblems",
+    "JSONLOutput",
+    "merge",
+    "merge_cmd",
+    "output",
     "preload",
-    "Problems")
+    "Problems",
+    "SARIFOutput",
+    "sharding")
@@ -1,12 +1,16 @@
 import argparse
 import asyncio
+import json
 import pathlib
 import time
 from collections.abc import Awaitable, Callable, Iterable, Sequence
 from functools import cached_property
 
+from aio.core import event
 from aio.run import runner
-from aio.run.checker import abstract
+from aio.run.checker import abstract, fingerprints, sharding
+from aio.run.checker.output import CheckerOutput, output_formats
+from aio.run.checker.timings import CheckerTimings
 
 
 _sentinel = object()
@@ -21,6 +25,7 @@ class Checker(runner.Runner):
 
     _active_check = ""
     checks: tuple[str, ...] = ()
+    sharded_checks: tuple[str, ...] = ()
     _preloader: asyncio.Task | None = None
 
     def __init__(self, *args) -> None:
@@ -34,10 +39,45 @@ class Checker(runner.Runner):
         """Currently active check."""
         return self._active_check
 
+    @cached_property
+    def cached_checks(self) -> set[str]:
+        """Checks skipped as their inputs are unchanged since they last
+        succeeded."""
+        return set()
+
+    @cached_property
+    def check_cache(self) -> dict[str, str]:
+        """Fingerprints of checks that succeeded on previous runs, loaded
+        from the check cache file."""
+        path = self.check_cache_path
+        if not path or not path.exists():
+            return {}
+        try:
+            cache = json.loads(path.read_text())
+        except ValueError:
+            cache = None
+        if not isinstance(cache, dict):
+            self.log.warning(f"Ignoring invalid check cache: {path}")
+            return {}
+        return cache
+
+    @property
+    def check_cache_path(self) -> pathlib.Path | None:
+        """Path to the check cache file, if caching is enabled."""
+        return (
+            pathlib.Path(self.args.check_cache)
+            if self.args.check_cache
+            else None)
+
     @cached_property
     def checks_to_run(self) -> Sequence[str]:
-        """Checks to run after being filtered according to CLI args."""
-        return self.get_checks()
+        """Checks to run after being filtered according to CLI args, and
+        the shard, if set."""
+        checks = self.get_checks()
+        return (
+            sharding.shard_checks(checks, self.shard, self.sharded_checks)
+            if self.shard
+            else checks)
 
     @property
     def diff(self) -> bool:
@@ -59,6 +99,11 @@ class Checker(runner.Runner):
     def exiting(self) -> bool:
         return "exiting" in self.errors
 
+    @property
+    def fail_fast(self) -> bool:
+        """Stop running checks after the first check fails."""
+        return self.args.fail_fast
+
     @property
     def fail_on_warn(self) -> bool:
         """Return failure when warnings are generated."""
@@ -69,6 +114,11 @@ class Checker(runner.Runner):
         """Dictionary of errors per check."""
         return dict((k, (len(v))) for k, v in self.errors.items())
 
+    @cached_property
+    def fingerprints(self) -> dict[str, str]:
+        """Fingerprints of the inputs of checks in this run."""
+        return {}
+
     @property
     def fix(self) -> bool:
         """Flag to determine whether the checker should attempt to fix found
@@ -82,6 +132,11 @@ class Checker(runner.Runner):
             self.failed
             or (self.warned and self.fail_on_warn))
 
+    @property
+    def log_successes(self) -> bool:
+        """Log each success, rather than only a count per check."""
+        return self.args.log_success == "each"
+
     @cached_property
     def path(self) -> pathlib.Path:
         """The "path" - usually Envoy src dir.
@@ -106,6 +161,24 @@ class Checker(runner.Runner):
         """List of paths to apply checks to."""
         return self.args.paths or [self.path]
 
+    @cached_property
+    def results_output(self) -> CheckerOutput | None:
+        """Streaming output of check results, if enabled."""
+        if not self.args.results_file:
+            return None
+        return output_formats[self.args.results_format](
+            pathlib.Path(self.args.results_file),
+            type(self).__name__)
+
+    @property
+    def shard(self) -> sharding.Shard | None:
+        """The shard of checks to run, if set.
+
+        Checks named in `sharded_checks` partition their own work, and run
+        in every shard, other checks are assigned whole to a shard.
+        """
+        return self.args.shard
+
     @property
     def show_summary(self) -> bool:
         """Show a summary at the end or not."""
@@ -124,7 +197,8 @@ class Checker(runner.Runner):
             warnings=self.warning_count,
             failed=self.failed,
             warned=self.warned,
-            succeeded=self.succeeded)
+            succeeded=self.succeeded,
+            cached=sorted(self.cached_checks))
 
     @property
     def succeeded(self) -> dict:
@@ -146,6 +220,11 @@ class Checker(runner.Runner):
         """Checker's summary class."""
         return CheckerSummary
 
+    @cached_property
+    def timings(self) -> CheckerTimings:
+        """Timings of preload tasks and checks."""
+        return CheckerTimings()
+
     @property
     def warned(self) -> dict:
         """Dictionary of warned checks grouped by check type."""
@@ -190,6 +269,59 @@ class Checker(runner.Runner):
             type=int,
             default=5,
             help="Number of warnings to show in the summary, -1 shows all")
+        parser.add_argument(
+            "--timings",
+            action="store_true",
+            default=False,
+            help=(
+                "Show the timings of preload tasks and checks, and the "
+                "critical path through them"))
+        parser.add_argument(
+            "--timings-json",
+            metavar="FILE",
+            default=None,
+            help=(
+                "Write the timings of preload tasks and checks, and the "
+                "critical path through them, as JSON to this file. Timings "
+                "from a previous run in this file are used to prioritize "
+                "preload tasks"))
+        parser.add_argument(
+            "--results-file",
+            metavar="FILE",
+            default=None,
+            help=(
+                "Stream errors and warnings, the outcome of each check, and "
+                "a final summary to this file while checks run"))
+        parser.add_argument(
+            "--results-format",
+            choices=list(output_formats),
+            default="jsonl",
+            help="Format of the results file, JSON lines or SARIF")
+        parser.add_argument(
+            "--log-success",
+            choices=["each", "summary"],
+            default="each",
+            help=(
+                "Log each success, or only a count of successes for each "
+                "check. Errors and warnings are always logged"))
+        parser.add_argument(
+            "--fail-fast",
+            action="store_true",
+            default=False,
+            help=(
+                "Stop after the first check fails, cancelling any remaining "
+                "checks, preload tasks and running tools"))
+        parser.add_argument(
+            "--shard",
+            metavar="I/N",
+            type=sharding.shard_arg,
+            default=None,
+            help=(
+                "Run the `I`th of `N` shards of the checks, eg to split a run "
+                "across CI machines. Files are partitioned between shards "
+                "for checks that support it, other checks are assigned whole "
+                "to a shard. Results can be combined with "
+                "`aio.run.checker.merge`"))
         parser.add_argument(
             "--check",
             "-c",
@@ -198,6 +330,14 @@ class Checker(runner.Runner):
             help=(
                 "Specify which checks to run, can be specified for multiple "
                 "checks"))
+        parser.add_argument(
+            "--check-cache",
+            metavar="FILE",
+            default=None,
+            help=(
+                "Skip checks with inputs that are unchanged since they last "
+                "succeeded, storing the fingerprints of their inputs in this "
+                "file. Only checks that provide a fingerprint are cached"))
         for check in self.checks:
             parser.add_argument(
                 f"--config-{check}",
@@ -217,17 +357,26 @@ class Checker(runner.Runner):
                 "Paths to check. At least one path must be specified, or the "
                 "`path` argument should be provided"))
 
+    async def cleanup(self) -> None:
+        """Close the results output, and clean up the runner."""
+        if self.results_output:
+            self.results_output.close(self.status)
+        await super().cleanup()
+
     def error(
             self,
             name: str,
             errors: Iterable[str] | None,
             log: bool = True,
-            log_type: str = "error") -> int:
-        """Record (and log) errors for a check type."""
+            log_type: str = "error",
+            path: str | None = None) -> int:
+        """Record (and log) errors for a check type, optionally for the
+        file at `path`."""
         if not errors:
             return 0
         self.errors[name] = self.errors.get(name, [])
         self.errors[name].extend(errors)
+        self._record_problems(name, "error", errors, path)
         if not log:
             return 1
         for message in errors:
@@ -238,6 +387,29 @@ class Checker(runner.Runner):
         super().exit()
         return self.error("exiting", ["Keyboard exit"], log_type="fatal")
 
+    async def fingerprint(self, check: str) -> str | None:
+        """Fingerprint of a check's inputs.
+
+        Checks opt in to caching by implementing a `fingerprint_<check>`
+        method, returning a hash of the check's inputs - eg its files,
+        config and tool versions - or `None` if it should not be cached.
+
+        Sharded checks only check their shard's part of their inputs, so
+        the shard is included.
+        """
+        provider = getattr(self, f"fingerprint_{check}", None)
+        if not provider or (fingerprint := await provider()) is None:
+            return None
+        sharded = (
+            (self.shard, )
+            if self.shard and check in self.sharded_checks
+            else ())
+        return fingerprints.fingerprint(
+            check,
+            getattr(self.args, f"config_{check}", ""),
+            fingerprint,
+            *sharded)
+
     def get_checks(self) -> Sequence[str]:
         """Get list of checks for this checker class filtered according to user
         args."""
@@ -274,12 +446,22 @@ class Checker(runner.Runner):
         self._active_check = check
         self.log.notice(f"[{check}] Running check...")
 
+    async def on_check_cached(self, check: str) -> None:
+        """Callback hook called for checks skipped as their inputs are
+        unchanged since they last succeeded."""
+        self.cached_checks.add(check)
+        self.log.notice(
+            f"[{check}] Check skipped, inputs unchanged since last "
+            "successful run (cached)")
+
     async def on_check_run(self, check: str) -> None:
         """Callback hook called after each check run."""
         self._active_check = ""
         if self.exiting:
             return
-        elif check in self.errors:
+        self._update_check_cache(check)
+        self._record_check(check)
+        if check in self.errors:
             self.log.error(f"[{check}] Check failed")
         elif check in self.warnings:
             self.log.warning(f"[{check}] Check has warnings")
@@ -290,16 +472,36 @@ class Checker(runner.Runner):
                 f"[{check}] Checks ({len(self.success[check])}) "
                 "completed successfully")
 
+    async def on_checks_cancelled(self, check: str) -> None:
+        """Callback hook called when a check fails and `--fail-fast` is set.
+
+        Preloading is cancelled, and all executors are stopped, killing any
+        tools that they are running.
+        """
+        self.log.error(
+            f"[{check}] Check failed, cancelling remaining checks "
+            "(--fail-fast)")
+        if remaining := self.remaining_checks:
+            self.log.notice(f"Checks not run: {', '.join(remaining)}")
+        if self._preloader:
+            self._preloader.cancel()
+        event.executors.cancel()
+        if self._preloader:
+            await asyncio.gather(self._preloader, return_exceptions=True)
+
     async def on_checks_begin(self) -> None:
         """Callback hook called before all checks."""
         # set up preload tasks
         self._preloader = asyncio.create_task(self.preload())
+        self._preloader.add_done_callback(self._on_preloader_done)
         self._notify_checks()
         self._notify_preload()
 
     async def on_checks_complete(self) -> int:
         """Callback hook called after all checks have run, and returning the
         final outcome of a checks_run."""
+        self.save_check_cache()
+        self.report_timings()
         if self.show_summary:
             self.summary.print_summary()
         return 1 if self.has_failed else 0
@@ -307,19 +509,73 @@ class Checker(runner.Runner):
     async def on_runner_error(self, e: BaseException) -> int:
         return await self.on_checks_complete()
 
+    def report_timings(self) -> None:
+        """Show, and/or write, the timings of preload tasks and checks."""
+        if self.args.timings:
+            self.log.info(self.timings.as_text())
+        if self.args.timings_json:
+            path = pathlib.Path(self.args.timings_json)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.timings.as_dict(), indent=2))
+
+    def save_check_cache(self) -> None:
+        """Write the fingerprints of succeeded checks to the check cache
+        file."""
+        if not self.check_cache_path or self.exiting:
+            return
+        self.check_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.check_cache_path.write_text(
+            json.dumps(self.check_cache, indent=2, sort_keys=True))
+
+    async def skip_cached_checks(self) -> None:
+        """Skip checks with inputs that are unchanged since they last
+        succeeded.
+
+        Cached checks are removed from the checks to run, so that any data
+        that only they need is not preloaded.
+        """
+        if not self.check_cache_path:
+            return
+        checks = [
+            check
+            for check
+            in self.checks_to_run
+            if hasattr(self, f"fingerprint_{check}")]
+        results = await asyncio.gather(
+            *(self.fingerprint(check) for check in checks))
+        for check, fingerprint in zip(checks, results):
+            if fingerprint is None:
+                continue
+            self.fingerprints[check] = fingerprint
+            if self.check_cache.get(check) == fingerprint:
+                await self.on_check_cached(check)
+        if self.cached_checks:
+            self.checks_to_run = [
+                check
+                for check
+                in self.checks_to_run
+                if check not in self.cached_checks]
+
     def succeed(self, name: str, success: list, log: bool = True) -> None:
         """Record (and log) success for a check type."""
         self.success[name] = self.success.get(name, [])
         self.success[name].extend(success)
-        if not log:
+        if not log or not self.log_successes:
             return
         for message in success:
             self.log.success(f"[{name}] \N{heavy check mark} {message}")
 
-    def warn(self, name: str, warnings: list, log: bool = True) -> None:
-        """Record (and log) warnings for a check type."""
+    def warn(
+            self,
+            name: str,
+            warnings: list,
+            log: bool = True,
+            path: str | None = None) -> None:
+        """Record (and log) warnings for a check type, optionally for the
+        file at `path`."""
         self.warnings[name] = self.warnings.get(name, [])
         self.warnings[name].extend(warnings)
+        self._record_problems(name, "warning", warnings, path)
         if not log:
             return
         for message in warnings:
@@ -349,18 +605,36 @@ class Checker(runner.Runner):
     def preload_checks_data(self) -> dict[str, dict]:
         return dict(getattr(self, "_preload_checks_data", ()))
 
+    @cached_property
+    def preload_order(self) -> list[str]:
+        """Preload tasks, in the order that they should be started.
+
+        Tasks are ordered by `preload_priority`, ties are kept in the
+        order that they were declared.
+        """
+        return sorted(
+            self.preload_checks_data,
+            key=self.preload_priority,
+            reverse=True)
+
     @cached_property
     def preload_pending_tasks(self) -> set[str]:
         """Currently pending preload tasks."""
         return set()
 
+    @cached_property
+    def preload_sem(self) -> asyncio.Semaphore:
+        """Lock to limit the number of preload tasks in flight."""
+        return asyncio.Semaphore(event.jobs.thread_limit)
+
     @cached_property
     def preload_tasks(self) -> tuple[Awaitable, ...]:
-        """Tuple of awaitables for preloading check data."""
+        """Tuple of awaitables for preloading check data, in order of
+        priority."""
         tasks = [
             self.preload_data(name)
             for name
-            in self.preload_checks_data]
+            in self.preload_order]
         return tuple(t for t in tasks if t)
 
     @cached_property
@@ -368,6 +642,25 @@ class Checker(runner.Runner):
         """Checks for which all preload tasks are complete."""
         return set()
 
+    @cached_property
+    def previous_timings(self) -> dict[tuple[str, str], float]:
+        """Durations of preload tasks and checks from a previous run, loaded
+        from the timings JSON file."""
+        if not self.args.timings_json:
+            return {}
+        path = pathlib.Path(self.args.timings_json)
+        if not path.exists():
+            return {}
+        try:
+            return {
+                (timing["kind"], timing["name"]): float(timing["duration"])
+                for timing
+                in json.loads(path.read_text())["timings"]
+                if timing.get("duration") is not None}
+        except (KeyError, TypeError, ValueError):
+            self.log.warning(f"Ignoring invalid timings: {path}")
+            return {}
+
     @property
     def remaining_checks(self) -> tuple[str, ...]:
         return tuple(
@@ -384,14 +677,17 @@ class Checker(runner.Runner):
 
     async def begin_checks(self) -> None:
         """Start the checks queue, and preloaders, and populate the queue with
-        any checks that don't require preloaded data."""
+        any checks that don't require preloaded data.
+
+        Preloaders run alongside the checks, and add checks to the queue as
+        the data they require is loaded.
+        """
+        await self.skip_cached_checks()
         await self.on_checks_begin()
         # Place all checks that are not blocked in the queue.
         for check in self.checks_to_run:
             if check not in self.preload_checks:
                 await self.check_queue.put(check)
-        if self._preloader:
-            await self._preloader
 
     async def on_preload(self, task: str) -> None:
         """Event fired after each preload task completes."""
@@ -399,6 +695,7 @@ class Checker(runner.Runner):
         for check in self.checks_to_run:
             if self._check_should_run(check):
                 self.log.debug(f"Check data preloaded: {check}")
+                self.timings.blocked(check, task)
                 self.preloaded_checks.add(check)
                 await self.check_queue.put(check)
         if self.removed_checks and not self.preload_pending_tasks:
@@ -438,6 +735,12 @@ class Checker(runner.Runner):
         """Async preload data for checks."""
         # TODO: factor out the preloading to a separate interface
         if self.preload_tasks:
+            order = ", ".join(
+                task
+                for task
+                in self.preload_order
+                if task in self.preload_pending_tasks)
+            self.log.debug(f"Preload order: {order}")
             await asyncio.gather(*self.preload_tasks)
 
     def preload_data(
@@ -450,24 +753,53 @@ class Checker(runner.Runner):
                 task,
                 self.preload_checks_data[task]["fun"](self))
 
+    def preload_priority(self, task: str) -> tuple[float, int]:
+        """Priority of a preload task, higher first.
+
+        Tasks are prioritized by the longest chain of work that they start,
+        ie their own duration and that of the longest check they block,
+        taken from `previous_timings`, and then by the number of checks
+        they block.
+        """
+        blocks = [
+            check
+            for check
+            in self.preload_checks_data[task].get("blocks", ())
+            if check in self.checks_to_run]
+        duration = self.previous_timings.get(("preload", task), 0)
+        longest_check = max(
+            (self.previous_timings.get(("check", check), 0)
+             for check
+             in blocks),
+            default=0)
+        return duration + longest_check, len(blocks)
+
     async def preloader(self, task: str, runner: Awaitable) -> None:
         """Wrap a preload task with the pending queue, and trigger `on_preload`
-        event on completion."""
-        start = time.time()
-        self.log.debug(f"Preloading {task}...")
-        proceed = False
-        try:
-            await runner
-        except self.preloader_catches(task) as e:
-            self.log.debug(f"Preload failed {task} in {time.time() - start}s")
-            await self.on_preload_task_failed(task, e)
-            proceed = True
-        else:
-            self.log.debug(f"Preloaded {task} in {time.time() - start}s")
-            proceed = True
-        finally:
-            if proceed:
-                await self.on_preload(task)
+        event on completion.
+
+        The number of tasks running at once is limited by `preload_sem`,
+        waiting tasks start in the order that they were scheduled.
+        """
+        async with self.preload_sem:
+            start = time.time()
+            self.log.debug(f"Preloading {task}...")
+            self.timings.start("preload", task)
+            proceed = False
+            try:
+                await runner
+            except self.preloader_catches(task) as e:
+                self.log.debug(
+                    f"Preload failed {task} in {time.time() - start}s")
+                await self.on_preload_task_failed(task, e)
+                proceed = True
+            else:
+                self.log.debug(f"Preloaded {task} in {time.time() - start}s")
+                proceed = True
+            finally:
+                self.timings.end("preload", task)
+                if proceed:
+                    await self.on_preload(task)
 
     def preloader_catches(self, task: str) -> tuple[type[BaseException], ...]:
         return tuple(self.preload_checks_data[task].get("catches", ()))
@@ -477,7 +809,11 @@ class Checker(runner.Runner):
         await self.begin_checks()
         try:
             await self._run_from_queue()
+            if self._preloader and not self._preloader.cancelled():
+                await self._preloader
         finally:
+            if self._preloader and not self._preloader.done():
+                self._preloader.cancel()
             result = (
                 1
                 if self.exiting
@@ -508,6 +844,42 @@ class Checker(runner.Runner):
         if preload:
             self.log.notice(f"Preloading: {preload}")
 
+    def _on_preloader_done(self, task: asyncio.Task) -> None:
+        # If preloading failed unexpectedly stop waiting for checks, the
+        # error is raised when the preloader is awaited.
+        if not task.cancelled() and task.exception():
+            self.check_queue.put_nowait(_sentinel)
+
+    def _record_check(self, check: str) -> None:
+        if not self.results_output:
+            return
+        status = (
+            "failed"
+            if check in self.errors
+            else ("warned"
+                  if check in self.warnings
+                  else ("passed"
+                        if check in self.success
+                        else "empty")))
+        self.results_output.check(
+            check,
+            status,
+            dict(
+                errors=len(self.errors.get(check, [])),
+                warnings=len(self.warnings.get(check, [])),
+                successes=len(self.success.get(check, []))))
+
+    def _record_problems(
+            self,
+            check: str,
+            level: str,
+            problems: Iterable[str],
+            path: str | None = None) -> None:
+        if not self.results_output:
+            return
+        for message in problems:
+            self.results_output.problem(check, level, message, path)
+
     async def _run_check(self, check: str) -> None:
         await self.on_check_begin(check)
         await getattr(self, f"check_{check}")()
@@ -519,9 +891,22 @@ class Checker(runner.Runner):
                 break
             if (check := await self.check_queue.get()) is _sentinel:
                 break
+            self.timings.start("check", check)
             await self._run_check(check)
+            self.timings.end("check", check)
             self.check_queue.task_done()
             self.completed_checks.add(check)
+            if self.fail_fast and check in self.errors:
+                await self.on_checks_cancelled(check)
+                break
+
+    def _update_check_cache(self, check: str) -> None:
+        if check not in self.fingerprints:
+            return
+        if check in self.errors or check in self.warnings:
+            self.check_cache.pop(check, None)
+        else:
+            self.check_cache[check] = self.fingerprints[check]
 
     def _task_should_preload(
             self,
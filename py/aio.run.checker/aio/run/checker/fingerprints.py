@@ -0,0 +1,43 @@
+"""Fingerprints of check inputs."""
+
+import hashlib
+import pathlib
+from collections.abc import Iterable
+
+
+def fingerprint(
+        *parts: object,
+        root: pathlib.Path | None = None,
+        paths: Iterable[str | pathlib.Path] = ()) -> str:
+    """Hash of `parts`, and of the names and contents of `paths`.
+
+    `parts` should include anything that affects the outcome of a check
+    other than its input files - eg config and tool versions.
+
+    Relative `paths` are resolved from `root`, and their order does not
+    affect the hash. Missing files are hashed as such, so that creating
+    them changes the fingerprint.
+
+    This reads every file and can be slow, so should not be called from
+    the event loop thread.
+    """
+    hashed = hashlib.sha256()
+    for part in parts:
+        _update(hashed, str(part).encode())
+    for path in sorted(set(str(p) for p in paths)):
+        _update(hashed, path.encode())
+        full_path = root.joinpath(path) if root else pathlib.Path(path)
+        try:
+            content = full_path.read_bytes()
+        except OSError:
+            hashed.update(b"-")
+        else:
+            hashed.update(b"+")
+            _update(hashed, content)
+    return hashed.hexdigest()
+
+
+def _update(hashed: "hashlib._Hash", data: bytes) -> None:
+    # Length prefix each item so that items cannot run into each other.
+    hashed.update(f"{len(data)}:".encode())
+    hashed.update(data)
@@ -0,0 +1,200 @@
+"""Merge the results of checker runs, eg from CI shards."""
+
+import argparse
+import json
+import pathlib
+from functools import cached_property
+
+from aio.run import runner
+from aio.run.checker.output import CheckerOutput, output_formats
+
+
+# Check statuses, from least to most severe.
+CHECK_STATUSES = ("empty", "passed", "warned", "failed")
+
+
+class CheckerResults:
+    """Results of checker runs, merged from their JSON lines results files
+    (`--results-file`).
+
+    Runs that did not complete, or results that can not be read, are
+    recorded as `incomplete`.
+    """
+
+    def __init__(self) -> None:
+        self.checks: dict[str, dict] = {}
+        self.problems: list[dict] = []
+        self.incomplete: list[str] = []
+        self.runs = 0
+        self._summary: dict = dict(
+            success=0,
+            errors=0,
+            warnings=0,
+            failed={},
+            warned={},
+            succeeded={},
+            cached=set())
+
+    @property
+    def summary(self) -> dict:
+        """Merged summary of all runs."""
+        return self._summary | dict(
+            cached=sorted(self._summary["cached"]),
+            runs=self.runs,
+            incomplete=self.incomplete)
+
+    def add(self, path: pathlib.Path) -> None:
+        """Add the results of a run from its results file."""
+        self.runs += 1
+        complete = False
+        try:
+            with path.open() as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    match record.pop("type", None):
+                        case "check":
+                            self.add_check(record)
+                        case "problem":
+                            self.problems.append(record)
+                        case "summary":
+                            self.add_summary(record)
+                            complete = True
+        except (OSError, ValueError):
+            complete = False
+        if not complete:
+            self.incomplete.append(str(path))
+
+    def add_check(self, record: dict) -> None:
+        """Add the outcome of a check, a check that runs in several shards
+        takes its most severe status."""
+        check = self.checks.setdefault(
+            record.pop("check"),
+            dict(status="empty", errors=0, warnings=0, successes=0))
+        check["status"] = max(
+            check["status"],
+            record.pop("status"),
+            key=CHECK_STATUSES.index)
+        for k, v in record.items():
+            check[k] = check.get(k, 0) + v
+
+    def add_summary(self, record: dict) -> None:
+        """Add the final summary of a run."""
+        for k in ["success", "errors", "warnings"]:
+            self._summary[k] += record.get(k, 0)
+        for k in ["failed", "warned", "succeeded"]:
+            for check, count in record.get(k, {}).items():
+                self._summary[k][check] = (
+                    self._summary[k].get(check, 0)
+                    + count)
+        self._summary["cached"].update(record.get("cached", ()))
+
+
+class CheckerResultsMerger(runner.Runner):
+    """Merges the results files of checker runs, eg from CI shards, into one
+    summary and exit code."""
+
+    @property
+    def fail_on_warn(self) -> bool:
+        """Return failure when warnings are generated."""
+        return self.args.warning == "error"
+
+    @property
+    def has_failed(self) -> bool:
+        """Shows whether any run failed, or did not complete."""
+        summary = self.results.summary
+        return bool(
+            summary["errors"]
+            or summary["incomplete"]
+            or (summary["warnings"]
+                and self.fail_on_warn))
+
+    @cached_property
+    def results(self) -> CheckerResults:
+        """Merged results."""
+        return CheckerResults()
+
+    @cached_property
+    def results_output(self) -> CheckerOutput | None:
+        """Output for the merged results, if set."""
+        if not self.args.results_file:
+            return None
+        return output_formats[self.args.results_format](
+            pathlib.Path(self.args.results_file),
+            self.name)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--warning",
+            "-w",
+            choices=["warn", "error"],
+            default="warn",
+            help="Handle warnings as warnings or errors")
+        parser.add_argument(
+            "--results-file",
+            metavar="FILE",
+            default=None,
+            help="Write the merged results to this file")
+        parser.add_argument(
+            "--results-format",
+            choices=list(output_formats),
+            default="jsonl",
+            help="Format of the merged results file, JSON lines or SARIF")
+        parser.add_argument(
+            "results",
+            nargs="+",
+            help="JSON lines results files of the checker runs to merge")
+
+    def log_results(self) -> None:
+        """Log problems and the outcome of each check."""
+        for problem in self.results.problems:
+            log = (
+                self.log.error
+                if problem["level"] == "error"
+                else self.log.warning)
+            log(f"[{problem['check']}] {problem['message']}")
+        for name, check in sorted(self.results.checks.items()):
+            match check["status"]:
+                case "failed":
+                    self.log.error(
+                        f"[{name}] Check failed ({check['errors']})")
+                case "warned":
+                    self.log.warning(
+                        f"[{name}] Check has warnings ({check['warnings']})")
+                case "passed":
+                    self.log.notice(
+                        f"[{name}] Checks ({check['successes']}) "
+                        "completed successfully")
+                case _:
+                    self.log.notice(f"[{name}] No checks ran")
+        for path in self.results.incomplete:
+            self.log.error(f"Incomplete results: {path}")
+
+    async def run(self) -> int:
+        for path in self.args.results:
+            self.results.add(pathlib.Path(path))
+        self.log_results()
+        self.write_results()
+        summary = self.results.summary
+        if self.has_failed:
+            self.log.error(f"{summary}")
+            return 1
+        self.log.success(f"{summary}")
+        return 0
+
+    def write_results(self) -> None:
+        """Write the merged results to the results file, if set."""
+        if not self.results_output:
+            return
+        for problem in self.results.problems:
+            self.results_output.problem(
+                problem["check"],
+                problem["level"],
+                problem["message"],
+                problem.get("path"))
+        for name, check in sorted(self.results.checks.items()):
+            counts = dict(check)
+            self.results_output.check(name, counts.pop("status"), counts)
+        self.results_output.close(self.results.summary)
@@ -0,0 +1,15 @@
+import sys
+
+from .merge import CheckerResultsMerger
+
+
+def main(*args: str) -> int:
+    return CheckerResultsMerger(*args)()
+
+
+def merge_cmd() -> None:
+    sys.exit(main(*sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    merge_cmd()
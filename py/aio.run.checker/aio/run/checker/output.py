@@ -0,0 +1,174 @@
+"""Streaming machine-readable output of checker results."""
+
+import json
+import pathlib
+import re
+from functools import cached_property
+from typing import IO
+from urllib.parse import quote
+
+
+SARIF_SCHEMA = (
+    "https://docs.oasis-open.org/sarif/sarif/v2.1.0/errata01/os/schemas/"
+    "sarif-schema-2.1.0.json")
+# Base of the artifact URIs of results, ie the root of the repository.
+SARIF_ROOT = "%SRCROOT%"
+
+
+class CheckerOutput:
+    """Writes checker results to a file while checks are running.
+
+    Each record is written, and flushed, as it is received, so that the
+    output can be consumed before the checks complete, and records are not
+    held in memory.
+    """
+
+    def __init__(self, path: pathlib.Path, name: str) -> None:
+        self.path = path
+        self.name = name
+        self.closed = False
+
+    @cached_property
+    def file(self) -> IO[str]:
+        """Output file, opened on first write."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = self.path.open("w")
+        self.start(file)
+        return file
+
+    def check(self, check: str, status: str, counts: dict[str, int]) -> None:
+        """Record the outcome of a check."""
+
+    def close(self, status: dict) -> None:
+        """Record the final status of the checks, and close the file."""
+        if self.closed:
+            return
+        self.end(status)
+        self.file.close()
+        self.closed = True
+
+    def end(self, status: dict) -> None:
+        """Write anything required to complete the output."""
+
+    def problem(
+            self,
+            check: str,
+            level: str,
+            message: str,
+            path: str | None = None) -> None:
+        """Record an error or warning from a check, and the path of the
+        file that it relates to, if any."""
+        raise NotImplementedError
+
+    def start(self, file: IO[str]) -> None:
+        """Write anything required to begin the output."""
+
+    def write(self, text: str) -> None:
+        self.file.write(text)
+        self.file.flush()
+
+
+class JSONLOutput(CheckerOutput):
+    """Writes a JSON record per line, for each problem, each completed check,
+    and a final summary."""
+
+    def check(self, check: str, status: str, counts: dict[str, int]) -> None:
+        self.record(
+            dict(
+                type="check",
+                check=check,
+                status=status,
+                **counts))
+
+    def end(self, status: dict) -> None:
+        self.record(dict(type="summary", **status))
+
+    def problem(
+            self,
+            check: str,
+            level: str,
+            message: str,
+            path: str | None = None) -> None:
+        self.record(
+            dict(
+                type="problem",
+                check=check,
+                level=level,
+                message=message,
+                **(dict(path=path) if path else {})))
+
+    def record(self, data: dict) -> None:
+        self.write(f"{json.dumps(data)}\n")
+
+
+class SARIFOutput(CheckerOutput):
+    """Writes a SARIF log, with a result for each problem and a rule for
+    each check that reported problems.
+
+    Results are streamed into the log as they are received, and the rest of
+    the log is completed when the output is closed. Until then the file is
+    not valid JSON.
+
+    Each result has a location, as required eg by GitHub code scanning.
+    This is the file the problem relates to, or the root of the repository
+    for problems that do not relate to a file.
+    """
+
+    def __init__(self, path: pathlib.Path, name: str) -> None:
+        super().__init__(path, name)
+        self.results = 0
+        self.rules: set[str] = set()
+
+    def end(self, status: dict) -> None:
+        tool = dict(
+            driver=dict(
+                name=self.name,
+                rules=[dict(id=rule) for rule in sorted(self.rules)]))
+        self.write(f"\n], \"tool\": {json.dumps(tool)}}}]}}\n")
+
+    def location(self, message: str, path: str | None = None) -> dict:
+        """SARIF location of a problem.
+
+        If the message starts with `<path>:<line>`, eg as flake8 errors do,
+        the line is included.
+        """
+        location: dict = dict(
+            artifactLocation=dict(
+                uri=quote(path) if path else ".",
+                uriBaseId=SARIF_ROOT))
+        line = (
+            re.match(rf"{re.escape(path)}:(\d+)", message)
+            if path
+            else None)
+        if line:
+            location["region"] = dict(startLine=int(line.group(1)))
+        return dict(physicalLocation=location)
+
+    def problem(
+            self,
+            check: str,
+            level: str,
+            message: str,
+            path: str | None = None) -> None:
+        result = dict(
+            ruleId=check,
+            level=level,
+            message=dict(text=message),
+            locations=[self.location(message, path)])
+        self.write(
+            f"{',' if self.results else ''}\n"
+            f"{json.dumps(result)}")
+        self.results += 1
+        self.rules.add(check)
+
+    def start(self, file: IO[str]) -> None:
+        file.write(
+            "{"
+            "\"version\": \"2.1.0\", "
+            f"\"$schema\": \"{SARIF_SCHEMA}\", "
+            "\"runs\": [{\"results\": [")
+
+
+output_formats: dict[str, type[CheckerOutput]] = dict(
+    jsonl=JSONLOutput,
+    sarif=SARIFOutput)
@@ -0,0 +1,63 @@
+"""Deterministic partitioning of checker work across shards, eg CI machines.
+
+A shard is given as `i/N`, the `i`th (from 1) of `N` shards. Every shard must
+be run with the same args for the partitioning to be complete.
+"""
+
+import argparse
+import hashlib
+from collections.abc import Iterable, Sequence
+
+
+Shard = tuple[int, int]
+
+
+def shard_arg(value: str) -> Shard:
+    """Parse a `--shard` arg, `i/N` where `i` is from 1 to `N`."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        index = count = 0
+    if not 0 < index <= count:
+        raise argparse.ArgumentTypeError(
+            f"must be `i/N`, where `i` is from 1 to `N`: {value}")
+    return index, count
+
+
+def shard_index(key: str, count: int) -> int:
+    """Index (from 1) of the shard that `key` is assigned to.
+
+    The key is hashed with a stable hash, rather than `hash`, so that it is
+    assigned to the same shard across processes and machines.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest) % count + 1
+
+
+def in_shard(key: str, shard: Shard) -> bool:
+    """Whether `key`, eg a file path, is assigned to the `shard`."""
+    index, count = shard
+    return shard_index(key, count) == index
+
+
+def shard_checks(
+        checks: Sequence[str],
+        shard: Shard,
+        sharded: Iterable[str] = ()) -> list[str]:
+    """Checks to run in the `shard`.
+
+    `sharded` checks partition their own work, and run in every shard. Other
+    checks are assigned whole, in turn, to each shard.
+    """
+    index, count = shard
+    sharded = set(sharded)
+    assigned = set(
+        [check
+         for check
+         in checks
+         if check not in sharded][index - 1::count])
+    return [
+        check
+        for check
+        in checks
+        if check in sharded or check in assigned]
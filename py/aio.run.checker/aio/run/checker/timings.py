@@ -0,0 +1,149 @@
+"""Timings of checker preload tasks and checks."""
+
+import time
+
+
+class CheckerTimings:
+    """Start and end times of a checker's preload tasks and checks, and the
+    preload task that each check was waiting on.
+
+    Times are reported in seconds from the start of the first recorded
+    task.
+
+    The critical path is the chain of tasks that determined when the
+    checks finished, working back from the last check to finish - each
+    check waited either for the preload task that unblocked it, or for
+    the check that ran before it.
+    """
+
+    def __init__(self) -> None:
+        self.blockers: dict[str, str] = {}
+        self.ended: dict[tuple[str, str], float] = {}
+        self.started: dict[tuple[str, str], float] = {}
+
+    @property
+    def critical_path(self) -> list[tuple[str, str]]:
+        """Critical path, as a list of `(kind, name)`."""
+        finished = self.finished
+        if not finished:
+            return []
+        checks = [key for key in finished if key[0] == "check"]
+        current = max(
+            checks or finished,
+            key=lambda key: finished[key][1])
+        path = [current]
+        while current[0] == "check":
+            started = finished[current][0]
+            blocker = ("preload", self.blockers.get(current[1], ""))
+            waited_for = [
+                key
+                for key, (_start, end)
+                in finished.items()
+                if (end <= started
+                    and (key[0] == "check" or key == blocker))]
+            if not waited_for:
+                break
+            current = max(
+                waited_for,
+                key=lambda key: finished[key][1])
+            path.append(current)
+        return path[::-1]
+
+    @property
+    def finished(self) -> dict[tuple[str, str], tuple[float, float]]:
+        """Start and end times of finished tasks."""
+        return {
+            key: (self.started[key], end)
+            for key, end
+            in self.ended.items()}
+
+    @property
+    def origin(self) -> float:
+        """Start time of the first task."""
+        return min(self.started.values(), default=0)
+
+    def as_dict(self) -> dict:
+        """Timings and critical path, as JSON-serializable data."""
+        timings = [
+            self.timing(kind, name)
+            for kind, name
+            in sorted(self.started, key=self.started.__getitem__)]
+        path = [
+            self.timing(kind, name)
+            for kind, name
+            in self.critical_path]
+        return dict(
+            total=max(
+                (timing["end"]
+                 for timing
+                 in timings
+                 if timing["end"] is not None),
+                default=0),
+            timings=timings,
+            critical_path=path)
+
+    def as_text(self) -> str:
+        """Timings table and critical path, as text."""
+        data = self.as_dict()
+        if not data["timings"]:
+            return "No timings recorded"
+        width = max(len(timing["name"]) for timing in data["timings"])
+        lines = [
+            "Timings (seconds from start):",
+            (f"  {'kind':<8} {'name':<{width}} {'start':>8} {'end':>8} "
+             f"{'duration':>8}  blocked by")]
+        for timing in data["timings"]:
+            lines.append(
+                f"  {timing['kind']:<8} {timing['name']:<{width}} "
+                f"{self._seconds(timing['start'])} "
+                f"{self._seconds(timing['end'])} "
+                f"{self._seconds(timing['duration'])}  "
+                f"{timing.get('blocked_by') or ''}".rstrip())
+        path = " -> ".join(
+            f"{timing['name']} ({timing['duration']:.3f}s)"
+            for timing
+            in data["critical_path"])
+        lines.append(
+            f"Critical path ({data['total']:.3f}s): {path or 'none'}")
+        return "\n".join(lines)
+
+    def blocked(self, check: str, task: str) -> None:
+        """Record the preload task that was blocking a check."""
+        self.blockers[check] = task
+
+    def end(self, kind: str, name: str) -> None:
+        """Record the end of a task."""
+        if (kind, name) in self.started:
+            self.ended[(kind, name)] = time.monotonic()
+
+    def start(self, kind: str, name: str) -> None:
+        """Record the start of a task, eg a `preload` or `check`."""
+        self.started[(kind, name)] = time.monotonic()
+        self.ended.pop((kind, name), None)
+
+    def timing(self, kind: str, name: str) -> dict:
+        """Timing of a task, relative to the `origin`."""
+        start = self.started[(kind, name)]
+        end = self.ended.get((kind, name))
+        origin = self.origin
+        timing: dict = dict(
+            kind=kind,
+            name=name,
+            start=round(start - origin, 3),
+            end=(
+                round(end - origin, 3)
+                if end is not None
+                else None),
+            duration=(
+                round(end - start, 3)
+                if end is not None
+                else None))
+        if kind == "check":
+            timing["blocked_by"] = self.blockers.get(name)
+        return timing
+
+    def _seconds(self, value: float | None) -> str:
+        return (
+            f"{value:>8.3f}"
+            if value is not None
+            else f"{'-':>8}")
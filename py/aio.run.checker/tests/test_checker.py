@@ -1,11 +1,10 @@
 
-import inspect
 from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 
 import pytest
 
 from aio.run.checker import (
-    abstract, Checker, CheckerSummary, Problems)
+    abstract, Checker, CheckerSummary, Problems, sharding)
 from aio.run.runner import Runner
 
 
@@ -65,18 +64,105 @@ def test_checker_constructor(patches):
     assert "removed_checks" in checker.__dict__
     assert checker.completed_checks == set()
     assert "completed_checks" in checker.__dict__
+    assert checker.cached_checks == set()
+    assert "cached_checks" in checker.__dict__
+    assert checker.fingerprints == {}
+    assert "fingerprints" in checker.__dict__
 
 
-def test_checker_checks_to_run(patches):
+@pytest.mark.parametrize("path", [None, "PATH"])
+@pytest.mark.parametrize("exists", [True, False])
+@pytest.mark.parametrize(
+    "content",
+    ['{"check1": "FP1"}', "[]", "not json"])
+def test_checker_check_cache(patches, path, exists, content):
     checker = Checker("path1", "path2", "path3")
     patched = patches(
+        "json",
+        ("Checker.check_cache_path",
+         dict(new_callable=PropertyMock)),
+        ("Checker.log",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    cache_path = MagicMock() if path else None
+    loaded = dict(check1="FP1") if content.startswith("{") else []
+
+    with patched as (m_json, m_path, m_log):
+        m_path.return_value = cache_path
+        if cache_path:
+            cache_path.exists.return_value = exists
+        if content == "not json":
+            m_json.loads.side_effect = ValueError("BAD")
+        else:
+            m_json.loads.return_value = loaded
+        result = checker.check_cache
+
+    assert "check_cache" in checker.__dict__
+    if not path or not exists:
+        assert result == {}
+        assert not m_json.loads.called
+        assert not m_log.called
+        return
+    assert (
+        m_json.loads.call_args
+        == [(cache_path.read_text.return_value, ), {}])
+    if content.startswith("{"):
+        assert result == loaded
+        assert not m_log.called
+        return
+    assert result == {}
+    assert (
+        m_log.return_value.warning.call_args
+        == [(f"Ignoring invalid check cache: {cache_path}", ), {}])
+
+
+@pytest.mark.parametrize("check_cache", [None, "", "PATH"])
+def test_checker_check_cache_path(patches, check_cache):
+    checker = DummyChecker()
+    patched = patches(
+        "pathlib",
+        prefix="aio.run.checker.checker")
+    checker.args.check_cache = check_cache
+
+    with patched as (m_plib, ):
+        result = checker.check_cache_path
+
+    assert "check_cache_path" not in checker.__dict__
+    if not check_cache:
+        assert result is None
+        assert not m_plib.Path.called
+        return
+    assert result == m_plib.Path.return_value
+    assert (
+        m_plib.Path.call_args
+        == [(check_cache, ), {}])
+
+
+@pytest.mark.parametrize("shard", [None, (1, 2)])
+def test_checker_checks_to_run(patches, shard):
+    checker = Checker("path1", "path2", "path3")
+    patched = patches(
+        "sharding",
         "Checker.get_checks",
+        ("Checker.shard",
+         dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
 
-    with patched as (m_checks, ):
-        assert checker.checks_to_run == m_checks.return_value
+    with patched as (m_sharding, m_checks, m_shard):
+        m_shard.return_value = shard
+        assert (
+            checker.checks_to_run
+            == (m_sharding.shard_checks.return_value
+                if shard
+                else m_checks.return_value))
 
     assert "checks_to_run" in checker.__dict__
+    if not shard:
+        assert not m_sharding.shard_checks.called
+        return
+    assert (
+        m_sharding.shard_checks.call_args
+        == [(m_checks.return_value, shard, checker.sharded_checks), {}])
 
 
 def test_checker_diff():
@@ -107,6 +193,29 @@ def test_checker_exiting(errors):
     assert "exiting" not in checker.__dict__
 
 
+def test_checker_shard(patches):
+    checker = Checker("path1", "path2", "path3")
+    assert checker.sharded_checks == ()
+    patched = patches(
+        ("Checker.args", dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_args, ):
+        assert checker.shard == m_args.return_value.shard
+    assert "shard" not in checker.__dict__
+
+
+def test_checker_fail_fast(patches):
+    checker = Checker("path1", "path2", "path3")
+    patched = patches(
+        ("Checker.args", dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_args, ):
+        assert checker.fail_fast == m_args.return_value.fail_fast
+    assert "fail_fast" not in checker.__dict__
+
+
 @pytest.mark.parametrize("warning", [True, False, "cabbage", "error"])
 def test_checker_fail_on_warn(patches, warning):
     checker = Checker("path1", "path2", "path3")
@@ -227,6 +336,52 @@ def test_checker_paths(patches, paths):
     assert "paths" not in checker.__dict__
 
 
+@pytest.mark.parametrize("results_file", [None, "", "PATH"])
+@pytest.mark.parametrize("results_format", ["jsonl", "sarif"])
+def test_checker_results_output(patches, results_file, results_format):
+    checker = DummyChecker()
+    patched = patches(
+        "pathlib",
+        "output_formats",
+        prefix="aio.run.checker.checker")
+    checker.args.results_file = results_file
+    checker.args.results_format = results_format
+
+    with patched as (m_plib, m_formats):
+        result = checker.results_output
+
+    assert "results_output" in checker.__dict__
+    if not results_file:
+        assert result is None
+        assert not m_formats.__getitem__.called
+        return
+    output_class = m_formats.__getitem__.return_value
+    assert result == output_class.return_value
+    assert (
+        m_formats.__getitem__.call_args
+        == [(results_format, ), {}])
+    assert (
+        output_class.call_args
+        == [(m_plib.Path.return_value, "DummyChecker"), {}])
+    assert (
+        m_plib.Path.call_args
+        == [(results_file, ), {}])
+
+
+@pytest.mark.parametrize("log_success", ["each", "summary"])
+def test_checker_log_successes(patches, log_success):
+    checker = Checker("path1", "path2", "path3")
+    patched = patches(
+        ("Checker.args", dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_args, ):
+        m_args.return_value.log_success = log_success
+        assert checker.log_successes == (log_success == "each")
+
+    assert "log_successes" not in checker.__dict__
+
+
 @pytest.mark.parametrize("summary", [True, False])
 @pytest.mark.parametrize("error_count", [0, 1])
 @pytest.mark.parametrize("warning_count", [0, 1])
@@ -266,11 +421,13 @@ def test_checker_status(patches):
         ("Checker.failed", dict(new_callable=PropertyMock)),
         ("Checker.warned", dict(new_callable=PropertyMock)),
         ("Checker.succeeded", dict(new_callable=PropertyMock)),
+        ("Checker.cached_checks", dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
 
     with patched as args:
         (m_success_count, m_error_count, m_warning_count,
-         m_failed, m_warned, m_succeeded) = args
+         m_failed, m_warned, m_succeeded, m_cached) = args
+        m_cached.return_value = {"C2", "C1"}
         assert (
             checker.status
             == dict(
@@ -279,7 +436,8 @@ def test_checker_status(patches):
                 warnings=m_warning_count.return_value,
                 failed=m_failed.return_value,
                 warned=m_warned.return_value,
-                succeeded=m_succeeded.return_value))
+                succeeded=m_succeeded.return_value,
+                cached=["C1", "C2"]))
     assert "status" not in checker.__dict__
 
 
@@ -317,6 +475,21 @@ def test_checker_summary():
     assert "summary" in checker.__dict__
 
 
+def test_checker_timings(patches):
+    checker = Checker("path1", "path2", "path3")
+    patched = patches(
+        "CheckerTimings",
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_timings, ):
+        assert checker.timings == m_timings.return_value
+
+    assert (
+        m_timings.call_args
+        == [(), {}])
+    assert "timings" in checker.__dict__
+
+
 def test_checker_warned():
     checker = Checker("path1", "path2", "path3")
     checker.warnings = dict(
@@ -381,12 +554,66 @@ def test_checker_add_arguments(patches):
               'default': 5,
               'help': (
                   "Number of warnings to show in the summary, -1 shows all")}],
+            [('--timings',),
+             {'action': 'store_true',
+              'default': False,
+              'help': (
+                  "Show the timings of preload tasks and checks, and the "
+                  "critical path through them")}],
+            [('--timings-json',),
+             {'metavar': 'FILE',
+              'default': None,
+              'help': (
+                  "Write the timings of preload tasks and checks, and the "
+                  "critical path through them, as JSON to this file. "
+                  "Timings from a previous run in this file are used to "
+                  "prioritize preload tasks")}],
+            [('--results-file',),
+             {'metavar': 'FILE',
+              'default': None,
+              'help': (
+                  "Stream errors and warnings, the outcome of each check, "
+                  "and a final summary to this file while checks run")}],
+            [('--results-format',),
+             {'choices': ['jsonl', 'sarif'],
+              'default': 'jsonl',
+              'help': "Format of the results file, JSON lines or SARIF"}],
+            [('--log-success',),
+             {'choices': ['each', 'summary'],
+              'default': 'each',
+              'help': (
+                  "Log each success, or only a count of successes for each "
+                  "check. Errors and warnings are always logged")}],
+            [('--fail-fast',),
+             {'action': 'store_true',
+              'default': False,
+              'help': (
+                  "Stop after the first check fails, cancelling any "
+                  "remaining checks, preload tasks and running tools")}],
+            [('--shard',),
+             {'metavar': 'I/N',
+              'type': sharding.shard_arg,
+              'default': None,
+              'help': (
+                  "Run the `I`th of `N` shards of the checks, eg to split a "
+                  "run across CI machines. Files are partitioned between "
+                  "shards for checks that support it, other checks are "
+                  "assigned whole to a shard. Results can be combined with "
+                  "`aio.run.checker.merge`")}],
             [('--check', '-c'),
              {'choices': ("check1", "check2"),
               'nargs': '*',
               'help': (
                   "Specify which checks to run, can be specified for multiple "
                   "checks")}],
+            [('--check-cache',),
+             {'metavar': 'FILE',
+              'default': None,
+              'help': (
+                  "Skip checks with inputs that are unchanged since they last "
+                  "succeeded, storing the fingerprints of their inputs in "
+                  "this file. Only checks that provide a fingerprint are "
+                  "cached")}],
             [('--config-check1',),
              {'default': '',
               'help': 'Custom configuration for the check1 check'}],
@@ -417,27 +644,41 @@ TEST_ERRORS: tuple = (
 @pytest.mark.parametrize("log_type", [None, "fatal"])
 @pytest.mark.parametrize("errors", TEST_ERRORS)
 @pytest.mark.parametrize("newerrors", [[], ["err1", "err2", "err3"]])
-def test_checker_error(log, log_type, errors, newerrors):
+@pytest.mark.parametrize("path", [None, "PATH"])
+def test_checker_error(log, log_type, errors, newerrors, path):
     checker = Checker("path1", "path2", "path3")
     log_mock = patch(
         "aio.run.checker.checker.Checker.log",
         new_callable=PropertyMock)
+    record_mock = patch(
+        "aio.run.checker.checker.Checker._record_problems")
     checker.errors = errors.copy()
     result = 1 if newerrors else 0
 
-    with log_mock as m_log:
+    kwargs = dict(path=path) if path else {}
+
+    with log_mock as m_log, record_mock as m_record:
         if log_type:
             assert (
-                checker.error("mycheck", newerrors, log, log_type=log_type)
+                checker.error(
+                    "mycheck",
+                    newerrors,
+                    log,
+                    log_type=log_type,
+                    **kwargs)
                 == result)
         else:
-            assert checker.error("mycheck", newerrors, log) == result
+            assert checker.error("mycheck", newerrors, log, **kwargs) == result
 
     if not newerrors:
         assert not m_log.called
+        assert not m_record.called
         assert "mycheck" not in checker.errors
         return
 
+    assert (
+        m_record.call_args
+        == [("mycheck", "error", newerrors, path), {}])
     assert checker.errors["mycheck"] == errors.get("mycheck", []) + newerrors
     for k, v in errors.items():
         if k != "mycheck":
@@ -452,6 +693,33 @@ def test_checker_error(log, log_type, errors, newerrors):
         assert not getattr(m_log.return_value, log_type or "error").called
 
 
+@pytest.mark.parametrize("output", [True, False])
+async def test_checker_cleanup(patches, output):
+    checker = Checker()
+    patched = patches(
+        "runner.Runner.cleanup",
+        ("Checker.results_output",
+         dict(new_callable=PropertyMock)),
+        ("Checker.status",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_super, m_output, m_status):
+        if not output:
+            m_output.return_value = None
+        assert not await checker.cleanup()
+
+    assert (
+        m_super.call_args
+        == [(), {}])
+    if not output:
+        assert not m_status.called
+        return
+    assert (
+        m_output.return_value.close.call_args
+        == [(m_status.return_value, ), {}])
+
+
 def test_checker_exit(patches):
     checker = Checker("path1", "path2", "path3")
     patched = patches(
@@ -470,6 +738,45 @@ def test_checker_exit(patches):
         == [('exiting', ['Keyboard exit']), {'log_type': 'fatal'}])
 
 
+@pytest.mark.parametrize("provider", [True, False])
+@pytest.mark.parametrize("fingerprint", [None, "", "FINGERPRINT"])
+@pytest.mark.parametrize("config", [True, False])
+@pytest.mark.parametrize("shard", [None, (2, 3)])
+@pytest.mark.parametrize("sharded", [True, False])
+async def test_checker_fingerprint(
+        patches, provider, fingerprint, config, shard, sharded):
+    checker = DummyChecker()
+    patched = patches(
+        "fingerprints",
+        ("Checker.shard",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    if provider:
+        checker.fingerprint_CHECK = AsyncMock(return_value=fingerprint)
+    if config:
+        checker.args.config_CHECK = "CONFIG"
+    else:
+        del checker.args.config_CHECK
+    if sharded:
+        checker.sharded_checks = ("OTHER", "CHECK")
+
+    with patched as (m_fingerprints, m_shard):
+        m_shard.return_value = shard
+        result = await checker.fingerprint("CHECK")
+
+    if not provider or fingerprint is None:
+        assert result is None
+        assert not m_fingerprints.fingerprint.called
+        return
+    assert result == m_fingerprints.fingerprint.return_value
+    assert (
+        m_fingerprints.fingerprint.call_args
+        == [("CHECK",
+             "CONFIG" if config else "",
+             fingerprint,
+             *((shard, ) if shard and sharded else ())), {}])
+
+
 @pytest.mark.parametrize(
     "checks",
     (None,
@@ -568,6 +875,22 @@ async def test_checker_on_check_begin(patches):
         == [('[CHECKNAME] Running check...',), {}])
 
 
+async def test_checker_on_check_cached(patches):
+    checker = Checker()
+    patched = patches(
+        ("Checker.log", dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_log, ):
+        assert not await checker.on_check_cached("CHECK")
+
+    assert checker.cached_checks == {"CHECK"}
+    assert (
+        m_log.return_value.notice.call_args
+        == [("[CHECK] Check skipped, inputs unchanged since last "
+             "successful run (cached)", ), {}])
+
+
 @pytest.mark.parametrize(
     "errors", [[], ["CHECK1", "CHECK2", "CHECK3"], ["CHECK2", "CHECK3"]])
 @pytest.mark.parametrize(
@@ -584,6 +907,8 @@ async def test_checker_on_check_run(
     patched = patches(
         ("Checker.exiting", dict(new_callable=PropertyMock)),
         ("Checker.log", dict(new_callable=PropertyMock)),
+        "Checker._record_check",
+        "Checker._update_check_cache",
         prefix="aio.run.checker.checker")
 
     check = "CHECK1"
@@ -592,7 +917,7 @@ async def test_checker_on_check_run(
     checker.success = success
     checker._active_check = check
 
-    with patched as (m_exit, m_log):
+    with patched as (m_exit, m_log, m_record, m_update):
         m_exit.return_value = exiting
         assert not await checker.on_check_run(check)
 
@@ -600,7 +925,15 @@ async def test_checker_on_check_run(
 
     if exiting:
         assert not m_log.called
+        assert not m_record.called
+        assert not m_update.called
         return
+    assert (
+        m_update.call_args
+        == [(check, ), {}])
+    assert (
+        m_record.call_args
+        == [(check, ), {}])
     if check in errors:
         assert (
             m_log.return_value.error.call_args
@@ -628,6 +961,50 @@ async def test_checker_on_check_run(
     assert not m_log.return_value.error.called
 
 
+@pytest.mark.parametrize("remaining", [(), ("C1", "C2")])
+@pytest.mark.parametrize("preloader", [True, False])
+async def test_checker_on_checks_cancelled(patches, remaining, preloader):
+    checker = Checker("path1", "path2", "path3")
+    patched = patches(
+        "asyncio",
+        "event",
+        ("Checker.log",
+         dict(new_callable=PropertyMock)),
+        ("Checker.remaining_checks",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    if preloader:
+        checker._preloader = MagicMock()
+
+    with patched as (m_asyncio, m_event, m_log, m_remaining):
+        m_asyncio.gather = AsyncMock()
+        m_remaining.return_value = remaining
+        assert not await checker.on_checks_cancelled("CHECK")
+
+    assert (
+        m_log.return_value.error.call_args
+        == [("[CHECK] Check failed, cancelling remaining checks "
+             "(--fail-fast)", ), {}])
+    if remaining:
+        assert (
+            m_log.return_value.notice.call_args
+            == [("Checks not run: C1, C2", ), {}])
+    else:
+        assert not m_log.return_value.notice.called
+    assert (
+        m_event.executors.cancel.call_args
+        == [(), {}])
+    if not preloader:
+        assert not m_asyncio.gather.called
+        return
+    assert (
+        checker._preloader.cancel.call_args
+        == [(), {}])
+    assert (
+        m_asyncio.gather.call_args
+        == [(checker._preloader, ), dict(return_exceptions=True)])
+
+
 async def test_checker_on_checks_begin(patches):
     checker = Checker("path1", "path2", "path3")
     patched = patches(
@@ -647,6 +1024,9 @@ async def test_checker_on_checks_begin(patches):
     assert (
         m_asyncio.create_task.call_args
         == [(m_preload.return_value, ), {}])
+    assert (
+        m_asyncio.create_task.return_value.add_done_callback.call_args
+        == [(checker._on_preloader_done, ), {}])
     assert (
         m_preload.call_args
         == [(), {}])
@@ -666,13 +1046,22 @@ async def test_checker_on_checks_complete(patches, failed, show_summary):
         ("Checker.has_failed", dict(new_callable=PropertyMock)),
         ("Checker.show_summary", dict(new_callable=PropertyMock)),
         ("Checker.summary", dict(new_callable=PropertyMock)),
+        "Checker.save_check_cache",
+        "Checker.report_timings",
         prefix="aio.run.checker.checker")
 
-    with patched as (m_failed, m_show_summary, m_summary):
+    with patched as (m_failed, m_show_summary, m_summary, m_save, m_report):
         m_failed.return_value = failed
         m_show_summary.return_value = show_summary
         assert await checker.on_checks_complete() is (1 if failed else 0)
 
+    assert (
+        m_save.call_args
+        == [(), {}])
+    assert (
+        m_report.call_args
+        == [(), {}])
+
     if show_summary:
         assert (
             m_summary.return_value.print_summary.call_args
@@ -708,16 +1097,26 @@ TEST_WARNS: tuple = (
 
 @pytest.mark.parametrize("log", [True, False])
 @pytest.mark.parametrize("warns", TEST_WARNS)
-def test_checker_warn(patches, log, warns):
+@pytest.mark.parametrize("path", [None, "PATH"])
+def test_checker_warn(patches, log, warns, path):
     checker = Checker("path1", "path2", "path3")
     log_mock = patch(
         "aio.run.checker.checker.Checker.log",
         new_callable=PropertyMock)
+    record_mock = patch(
+        "aio.run.checker.checker.Checker._record_problems")
     checker.warnings = warns.copy()
 
-    with log_mock as m_log:
-        checker.warn("mycheck", ["warn1", "warn2", "warn3"], log)
+    with log_mock as m_log, record_mock as m_record:
+        checker.warn(
+            "mycheck",
+            ["warn1", "warn2", "warn3"],
+            log,
+            **(dict(path=path) if path else {}))
 
+    assert (
+        m_record.call_args
+        == [("mycheck", "warning", ["warn1", "warn2", "warn3"], path), {}])
     assert (
         checker.warnings["mycheck"]
         == warns.get("mycheck", []) + ["warn1", "warn2", "warn3"])
@@ -732,6 +1131,148 @@ def test_checker_warn(patches, log, warns):
         assert not m_log.return_value.warn.called
 
 
+@pytest.mark.parametrize("timings", [True, False])
+@pytest.mark.parametrize("timings_json", [None, "PATH"])
+def test_checker_report_timings(patches, timings, timings_json):
+    checker = DummyChecker()
+    patched = patches(
+        "json",
+        "pathlib",
+        ("Checker.log",
+         dict(new_callable=PropertyMock)),
+        ("Checker.timings",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    checker.args.timings = timings
+    checker.args.timings_json = timings_json
+
+    with patched as (m_json, m_plib, m_log, m_timings):
+        assert not checker.report_timings()
+
+    if timings:
+        assert (
+            m_log.return_value.info.call_args
+            == [(m_timings.return_value.as_text.return_value, ), {}])
+    else:
+        assert not m_log.called
+    if not timings_json:
+        assert not m_plib.Path.called
+        assert not m_json.dumps.called
+        return
+    path = m_plib.Path.return_value
+    assert (
+        m_plib.Path.call_args
+        == [(timings_json, ), {}])
+    assert (
+        path.parent.mkdir.call_args
+        == [(), dict(parents=True, exist_ok=True)])
+    assert (
+        path.write_text.call_args
+        == [(m_json.dumps.return_value, ), {}])
+    assert (
+        m_json.dumps.call_args
+        == [(m_timings.return_value.as_dict.return_value, ),
+            dict(indent=2)])
+
+
+@pytest.mark.parametrize("path", [True, False])
+@pytest.mark.parametrize("exiting", [True, False])
+def test_checker_save_check_cache(patches, path, exiting):
+    checker = Checker()
+    patched = patches(
+        "json",
+        ("Checker.check_cache",
+         dict(new_callable=PropertyMock)),
+        ("Checker.check_cache_path",
+         dict(new_callable=PropertyMock)),
+        ("Checker.exiting",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    cache_path = MagicMock() if path else None
+
+    with patched as (m_json, m_cache, m_path, m_exiting):
+        m_path.return_value = cache_path
+        m_exiting.return_value = exiting
+        assert not checker.save_check_cache()
+
+    if not path or exiting:
+        assert not m_json.dumps.called
+        assert not m_cache.called
+        return
+    assert (
+        cache_path.parent.mkdir.call_args
+        == [(), dict(parents=True, exist_ok=True)])
+    assert (
+        cache_path.write_text.call_args
+        == [(m_json.dumps.return_value, ), {}])
+    assert (
+        m_json.dumps.call_args
+        == [(m_cache.return_value, ),
+            dict(indent=2, sort_keys=True)])
+
+
+@pytest.mark.parametrize("path", [True, False])
+@pytest.mark.parametrize(
+    "fingerprints",
+    [{},
+     dict(C1="FP1"),
+     dict(C1="FP1", C2=None, C3="FP3"),
+     dict(C1="FP1", C3="FP3")])
+@pytest.mark.parametrize(
+    "cache",
+    [{},
+     dict(C1="FP1"),
+     dict(C1="OTHER", C3="FP3"),
+     dict(C1="FP1", C3="FP3")])
+async def test_checker_skip_cached_checks(patches, path, fingerprints, cache):
+    checker = Checker()
+    patched = patches(
+        ("Checker.check_cache",
+         dict(new_callable=PropertyMock)),
+        ("Checker.check_cache_path",
+         dict(new_callable=PropertyMock)),
+        "Checker.fingerprint",
+        prefix="aio.run.checker.checker")
+    checks = ["C1", "C2", "C3", "C4"]
+    checker.checks_to_run = checks
+    for check in fingerprints:
+        setattr(checker, f"fingerprint_{check}", MagicMock())
+    cached = [
+        check
+        for check, fingerprint
+        in fingerprints.items()
+        if fingerprint and cache.get(check) == fingerprint]
+
+    async def on_check_cached(check):
+        checker.cached_checks.add(check)
+
+    checker.on_check_cached = AsyncMock(side_effect=on_check_cached)
+
+    with patched as (m_cache, m_path, m_fingerprint):
+        m_path.return_value = path
+        m_cache.return_value = cache
+        m_fingerprint.side_effect = lambda check: fingerprints[check]
+        assert not await checker.skip_cached_checks()
+
+    if not path:
+        assert not m_fingerprint.called
+        assert checker.checks_to_run == checks
+        assert checker.fingerprints == {}
+        return
+    assert (
+        m_fingerprint.call_args_list
+        == [[(check, ), {}] for check in fingerprints])
+    assert (
+        checker.fingerprints
+        == {k: v for k, v in fingerprints.items() if v is not None})
+    assert (
+        checker.on_check_cached.call_args_list
+        == [[(check, ), {}] for check in cached])
+    assert (
+        checker.checks_to_run
+        == [check for check in checks if check not in cached])
+
+
 TEST_SUCCESS: tuple = (
     {},
     dict(mysuccess=[]),
@@ -742,15 +1283,20 @@ TEST_SUCCESS: tuple = (
 
 
 @pytest.mark.parametrize("log", [True, False])
+@pytest.mark.parametrize("log_successes", [True, False])
 @pytest.mark.parametrize("success", TEST_SUCCESS)
-def test_checker_succeed(patches, log, success):
+def test_checker_succeed(patches, log, log_successes, success):
     checker = Checker("path1", "path2", "path3")
-    log_mock = patch(
-        "aio.run.checker.checker.Checker.log",
-        new_callable=PropertyMock)
+    patched = patches(
+        ("Checker.log",
+         dict(new_callable=PropertyMock)),
+        ("Checker.log_successes",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
     checker.success = success.copy()
 
-    with log_mock as m_log:
+    with patched as (m_log, m_successes):
+        m_successes.return_value = log_successes
         checker.succeed("mycheck", ["success1", "success2", "success3"], log)
 
     assert (
@@ -760,7 +1306,7 @@ def test_checker_succeed(patches, log, success):
     for k, v in success.items():
         if k != "mycheck":
             assert checker.success[k] == v
-    if log:
+    if log and log_successes:
         assert (
             m_log.return_value.success.call_args_list
             == [[(f'[mycheck] ✔ success{i}',), {}] for i in range(1, 4)])
@@ -1060,6 +1606,41 @@ def test_checker_preload_checks_data(patches):
     assert "preload_checks_data" in checker.__dict__
 
 
+def test_checker_preload_order(patches):
+    checker = Checker()
+    patched = patches(
+        "sorted",
+        ("Checker.preload_checks_data",
+         dict(new_callable=PropertyMock)),
+        "Checker.preload_priority",
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_sorted, m_data, m_priority):
+        assert checker.preload_order == m_sorted.return_value
+
+    assert (
+        m_sorted.call_args
+        == [(m_data.return_value, ),
+            dict(key=m_priority, reverse=True)])
+    assert "preload_order" in checker.__dict__
+
+
+def test_checker_preload_sem(patches):
+    checker = Checker()
+    patched = patches(
+        "asyncio",
+        "event",
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_aio, m_event):
+        assert checker.preload_sem == m_aio.Semaphore.return_value
+
+    assert (
+        m_aio.Semaphore.call_args
+        == [(m_event.jobs.thread_limit, ), {}])
+    assert "preload_sem" in checker.__dict__
+
+
 @pytest.mark.parametrize(
     "checks", [[], [f"C{i}" for i in range(0, 5)]])
 def test_checker_preload_tasks(patches, checks):
@@ -1067,20 +1648,16 @@ def test_checker_preload_tasks(patches, checks):
     patched = patches(
         ("Checker.preload_data",
          dict(new_callable=MagicMock)),
+        ("Checker.preload_order",
+         dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
-    checker.preload_checks_data = MagicMock()
-
-    def iter_checks():
-        for check in checks:
-            yield check
-
-    checker.preload_checks_data.__iter__.side_effect = iter_checks
 
     def preloader(name):
         if int(name[1:]) % 2:
             return name
 
-    with patched as (m_preload, ):
+    with patched as (m_preload, m_order):
+        m_order.return_value = checks
         m_preload.side_effect = preloader
         assert (
             checker.preload_tasks
@@ -1092,6 +1669,67 @@ def test_checker_preload_tasks(patches, checks):
     assert "preload_tasks" in checker.__dict__
 
 
+VALID_TIMINGS = (
+    '{"timings": [{"kind": "check", "name": "C1", "duration": 2.5}, '
+    '{"kind": "preload", "name": "P1", "duration": 1}, '
+    '{"kind": "check", "name": "C2", "duration": null}]}')
+
+
+@pytest.mark.parametrize("timings_json", [None, "", "PATH"])
+@pytest.mark.parametrize("exists", [True, False])
+@pytest.mark.parametrize(
+    "content",
+    [VALID_TIMINGS,
+     '{"timings": []}',
+     '{"timings": [{"kind": "check"}]}',
+     '{"timings": [{"kind": "check", "name": "C1", "duration": "X"}]}',
+     '{}',
+     '[]',
+     'NOT JSON'])
+def test_checker_previous_timings(patches, timings_json, exists, content):
+    checker = Checker()
+    patched = patches(
+        "pathlib",
+        ("Checker.log",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    checker.args = MagicMock()
+    checker.args.timings_json = timings_json
+
+    with patched as (m_plib, m_log):
+        path = m_plib.Path.return_value
+        path.exists.return_value = exists
+        path.read_text.return_value = content
+        result = checker.previous_timings
+
+    assert "previous_timings" in checker.__dict__
+    if not timings_json:
+        assert result == {}
+        assert not m_plib.Path.called
+        return
+    assert (
+        m_plib.Path.call_args
+        == [(timings_json, ), {}])
+    if not exists:
+        assert result == {}
+        assert not path.read_text.called
+        return
+    expected = {
+        '{"timings": []}': {},
+        '{"timings": [{"kind": "check"}]}': {}}
+    expected[VALID_TIMINGS] = {
+        ("check", "C1"): 2.5,
+        ("preload", "P1"): 1}
+    if content in expected:
+        assert result == expected[content]
+        assert not m_log.called
+        return
+    assert result == {}
+    assert (
+        m_log.return_value.warning.call_args
+        == [(f"Ignoring invalid timings: {path}", ), {}])
+
+
 @pytest.mark.parametrize(
     "checks",
     [[],
@@ -1154,20 +1792,22 @@ async def test_checker_begin_checks(patches, to_run, to_pre):
          dict(new_callable=PropertyMock)),
         ("Checker.preload_checks",
          dict(new_callable=PropertyMock)),
+        "Checker.skip_cached_checks",
         "Checker.on_checks_begin",
         prefix="aio.run.checker.checker")
     expected = [c for c in to_run if c not in to_pre]
-    checker._preloader = AsyncMock()()
+    checker._preloader = AsyncMock()
 
-    with patched as (m_q, m_run, m_checks, m_begin):
+    with patched as (m_q, m_run, m_checks, m_skip, m_begin):
         m_run.return_value = to_run
         m_checks.return_value = to_pre
         m_q.return_value.put = AsyncMock()
         assert not await checker.begin_checks()
 
+    assert not checker._preloader.called
     assert (
-        inspect.getcoroutinestate(checker._preloader)
-        == inspect.CORO_CLOSED)
+        m_skip.call_args
+        == [(), {}])
     assert (
         m_begin.call_args
         == [(), {}])
@@ -1207,6 +1847,8 @@ async def test_checker_on_preload(patches, checks, removed, pending):
          dict(new_callable=PropertyMock)),
         ("Checker.removed_checks",
          dict(new_callable=PropertyMock)),
+        ("Checker.timings",
+         dict(new_callable=PropertyMock)),
         "Checker._check_should_run",
         "Checker.on_preload_errors",
         prefix="aio.run.checker.checker")
@@ -1219,7 +1861,7 @@ async def test_checker_on_preload(patches, checks, removed, pending):
 
     with patched as patchy:
         (m_q, m_run, m_preload,
-         m_pending, m_removed, m_should, m_err) = patchy
+         m_pending, m_removed, m_timings, m_should, m_err) = patchy
         m_run.return_value = checks
         m_q.return_value.put = AsyncMock()
         m_should.side_effect = should_run
@@ -1233,6 +1875,11 @@ async def test_checker_on_preload(patches, checks, removed, pending):
     assert (
         m_preload.return_value.add.call_args_list
         == [[(check, ), {}] for check in checks if int(check[1:]) % 2])
+    assert (
+        m_timings.return_value.blocked.call_args_list
+        == [[(check, "TASK"), {}]
+            for check in checks
+            if int(check[1:]) % 2])
     assert (
         m_q.return_value.put.call_args_list
         == [[(check, ), {}] for check in checks if int(check[1:]) % 2])
@@ -1354,21 +2001,85 @@ async def test_checker_preload(patches, tasks):
     checker = Checker()
     patched = patches(
         "asyncio",
+        ("Checker.log",
+         dict(new_callable=PropertyMock)),
+        ("Checker.preload_order",
+         dict(new_callable=PropertyMock)),
+        ("Checker.preload_pending_tasks",
+         dict(new_callable=PropertyMock)),
         ("Checker.preload_tasks",
          dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
 
-    with patched as (m_aio, m_tasks):
+    with patched as (m_aio, m_log, m_order, m_pending, m_tasks):
         m_aio.gather = AsyncMock()
+        m_order.return_value = ["T0", "OTHER"] + list(reversed(tasks))
+        m_pending.return_value = set(tasks)
         m_tasks.return_value = tasks
         assert not await checker.preload()
 
     if not tasks:
         assert not m_aio.gather.called
+        assert not m_log.called
     else:
         assert (
             m_aio.gather.call_args
             == [tuple(tasks), {}])
+        order = [
+            task
+            for task
+            in m_order.return_value
+            if task in tasks]
+        assert (
+            m_log.return_value.debug.call_args
+            == [(f"Preload order: {', '.join(order)}", ), {}])
+
+
+@pytest.mark.parametrize(
+    "blocks",
+    [[],
+     ["C1"],
+     ["C1", "C2", "NOT_RUN"],
+     ["NOT_RUN"]])
+@pytest.mark.parametrize(
+    "previous",
+    [{},
+     {("preload", "TASK"): 3},
+     {("preload", "TASK"): 3,
+      ("check", "C1"): 5,
+      ("check", "C2"): 7,
+      ("check", "NOT_RUN"): 23},
+     {("check", "C1"): 5}])
+def test_checker_preload_priority(patches, blocks, previous):
+    checker = Checker()
+    patched = patches(
+        ("Checker.checks_to_run",
+         dict(new_callable=PropertyMock)),
+        ("Checker.preload_checks_data",
+         dict(new_callable=PropertyMock)),
+        ("Checker.previous_timings",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_checks, m_data, m_previous):
+        m_checks.return_value = ["C1", "C2", "C3"]
+        m_data.return_value = dict(TASK=dict(blocks=blocks))
+        m_previous.return_value = previous
+        result = checker.preload_priority("TASK")
+
+    expected_blocks = [
+        check
+        for check
+        in blocks
+        if check != "NOT_RUN"]
+    assert (
+        result
+        == (previous.get(("preload", "TASK"), 0)
+            + max((previous.get(("check", check), 0)
+                   for check
+                   in expected_blocks),
+                  default=0),
+            len(expected_blocks)))
 
 
 @pytest.mark.parametrize("should", [True, False])
@@ -1438,6 +2149,10 @@ async def test_checker_preloader(patches, catches, raises):
         "Checker.on_preload",
         "Checker.on_preload_task_failed",
         "Checker.preloader_catches",
+        ("Checker.preload_sem",
+         dict(new_callable=PropertyMock)),
+        ("Checker.timings",
+         dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
     error = (
         raises("AN ERROR OCCURRED")
@@ -1448,9 +2163,21 @@ async def test_checker_preloader(patches, catches, raises):
         time_called = False
         order = MagicMock()
 
+        async def __aenter__(self):
+            self.order("acquire")
+
+        async def __aexit__(self, *args):
+            self.order("release")
+
         def debug(self, message):
             self.order("debug", message)
 
+        def timing_start(self, kind, task):
+            self.order("timing_start", kind, task)
+
+        def timing_end(self, kind, task):
+            self.order("timing_end", kind, task)
+
         def failed(self, task, e):
             self.order("failed", task, e)
 
@@ -1476,8 +2203,13 @@ async def test_checker_preloader(patches, catches, raises):
         if raises
         else False)
 
-    with patched as (m_time, m_log, m_on_pre, m_failed, m_catches):
+    with patched as patchy:
+        (m_time, m_log, m_on_pre, m_failed,
+         m_catches, m_sem, m_timings) = patchy
+        m_sem.return_value = order_mock
         m_log.return_value.debug.side_effect = order_mock.debug
+        m_timings.return_value.start.side_effect = order_mock.timing_start
+        m_timings.return_value.end.side_effect = order_mock.timing_end
         m_time.time.side_effect = order_mock.time
         m_on_pre.side_effect = order_mock.on_pre
         m_failed.side_effect = order_mock.failed
@@ -1492,28 +2224,40 @@ async def test_checker_preloader(patches, catches, raises):
         if not will_catch:
             assert (
                 order_mock.order.call_args_list
-                == [[('time', ), {}],
+                == [[('acquire', ), {}],
+                    [('time', ), {}],
                     [('debug', 'Preloading NAME...'), {}],
-                    [('task',), {}]])
+                    [('timing_start', 'preload', 'NAME'), {}],
+                    [('task',), {}],
+                    [('timing_end', 'preload', 'NAME'), {}],
+                    [('release', ), {}]])
             return
         assert (
             order_mock.order.call_args_list
-            == [[('time',), {}],
+            == [[('acquire', ), {}],
+                [('time',), {}],
                 [('debug', 'Preloading NAME...'), {}],
+                [('timing_start', 'preload', 'NAME'), {}],
                 [('task',), {}],
                 [('time',), {}],
                 [('debug', 'Preload failed NAME in 16s'), {}],
                 [('failed', 'NAME', error), {}],
-                [('on_pre', "NAME"), {}]])
+                [('timing_end', 'preload', 'NAME'), {}],
+                [('on_pre', "NAME"), {}],
+                [('release', ), {}]])
         return
     assert (
         order_mock.order.call_args_list
-        == [[('time',), {}],
+        == [[('acquire', ), {}],
+            [('time',), {}],
             [('debug', 'Preloading NAME...'), {}],
+            [('timing_start', 'preload', 'NAME'), {}],
             [('task',), {}],
             [('time',), {}],
             [('debug', 'Preloaded NAME in 16s'), {}],
-            [('on_pre', "NAME"), {}]])
+            [('timing_end', 'preload', 'NAME'), {}],
+            [('on_pre', "NAME"), {}],
+            [('release', ), {}]])
 
 
 def test_checker_preloader_catches(patches):
@@ -1647,7 +2391,10 @@ def test_checker__notify_preload(patches, checks, preload_checks):
 
 @pytest.mark.parametrize("raises", [True, False])
 @pytest.mark.parametrize("exiting", [True, False])
-async def test_checker_run(patches, raises, exiting):
+@pytest.mark.parametrize(
+    "preloader",
+    [None, "done", "pending", "cancelled"])
+async def test_checker_run(patches, raises, exiting, preloader):
     checker = Checker()
     patched = patches(
         "Checker.begin_checks",
@@ -1656,6 +2403,23 @@ async def test_checker_run(patches, raises, exiting):
         ("Checker.exiting", dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
 
+    class Preloader:
+        awaited = False
+        cancel = MagicMock()
+
+        def __await__(self):
+            self.awaited = True
+            return iter(())
+
+        def cancelled(self):
+            return preloader == "cancelled"
+
+        def done(self):
+            return preloader in ["done", "cancelled"]
+
+    if preloader:
+        checker._preloader = Preloader()
+
     with patched as (m_start, m_run_q, m_complete, m_exit):
         m_exit.return_value = exiting
         if raises:
@@ -1674,6 +2438,13 @@ async def test_checker_run(patches, raises, exiting):
     assert (
         m_run_q.call_args
         == [(), {}])
+    if preloader:
+        assert (
+            checker._preloader.awaited
+            == (not raises and preloader != "cancelled"))
+        assert (
+            checker._preloader.cancel.called
+            == (preloader == "pending"))
 
     if exiting:
         assert not m_complete.called
@@ -1683,6 +2454,101 @@ async def test_checker_run(patches, raises, exiting):
             == [(), {}])
 
 
+@pytest.mark.parametrize("output", [True, False])
+@pytest.mark.parametrize(
+    "results",
+    [{},
+     dict(errors=dict(CHECK=["E1", "E2"]),
+          warnings=dict(CHECK=["W1"]),
+          success=dict(CHECK=["S1"])),
+     dict(warnings=dict(CHECK=["W1"]),
+          success=dict(CHECK=["S1", "S2"])),
+     dict(success=dict(CHECK=["S1"]),
+          errors=dict(OTHER=["E1"]))])
+def test_checker__record_check(patches, output, results):
+    checker = Checker()
+    patched = patches(
+        ("Checker.results_output",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    checker.errors = results.get("errors", {})
+    checker.warnings = results.get("warnings", {})
+    checker.success = results.get("success", {})
+
+    with patched as (m_output, ):
+        if not output:
+            m_output.return_value = None
+        assert not checker._record_check("CHECK")
+
+    if not output:
+        return
+    status = (
+        "failed"
+        if "CHECK" in checker.errors
+        else ("warned"
+              if "CHECK" in checker.warnings
+              else ("passed"
+                    if "CHECK" in checker.success
+                    else "empty")))
+    assert (
+        m_output.return_value.check.call_args
+        == [("CHECK",
+             status,
+             dict(errors=len(checker.errors.get("CHECK", [])),
+                  warnings=len(checker.warnings.get("CHECK", [])),
+                  successes=len(checker.success.get("CHECK", [])))),
+            {}])
+
+
+@pytest.mark.parametrize("output", [True, False])
+@pytest.mark.parametrize("path", [None, "PATH"])
+def test_checker__record_problems(patches, output, path):
+    checker = Checker()
+    patched = patches(
+        ("Checker.results_output",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_output, ):
+        if not output:
+            m_output.return_value = None
+        assert not checker._record_problems(
+            "CHECK", "LEVEL", ["P1", "P2"], *((path, ) if path else ()))
+
+    if not output:
+        return
+    assert (
+        m_output.return_value.problem.call_args_list
+        == [[("CHECK", "LEVEL", "P1", path), {}],
+            [("CHECK", "LEVEL", "P2", path), {}]])
+
+
+@pytest.mark.parametrize("cancelled", [True, False])
+@pytest.mark.parametrize("exception", [None, "ERROR"])
+def test_checker__on_preloader_done(patches, cancelled, exception):
+    checker = Checker()
+    patched = patches(
+        "_sentinel",
+        ("Checker.check_queue",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    task = MagicMock()
+    task.cancelled.return_value = cancelled
+    task.exception.return_value = exception
+
+    with patched as (m_sentinel, m_queue):
+        assert not checker._on_preloader_done(task)
+
+    if cancelled:
+        assert not task.exception.called
+    if cancelled or not exception:
+        assert not m_queue.called
+        return
+    assert (
+        m_queue.return_value.put_nowait.call_args
+        == [(m_sentinel, ), {}])
+
+
 async def test_checker__run_check(patches):
     checker = Checker()
     patched = patches(
@@ -1735,18 +2601,29 @@ async def test_checker__run_check(patches):
      ([f"C{i}" for i in range(0, 2)]
       + ["SENTINEL"]
       + [f"C{i}" for i in range(0, 2)])])
-async def test_checker__run_from_queue(patches, checks):
+@pytest.mark.parametrize("fail_fast", [True, False])
+@pytest.mark.parametrize("failing", [None, "C1"])
+async def test_checker__run_from_queue(patches, checks, fail_fast, failing):
     checker = Checker()
+    checker.errors = (
+        {failing: ["ERROR"]}
+        if failing
+        else {})
     patched = patches(
         "_sentinel",
         "Checker.log",
         "Checker._run_check",
+        "Checker.on_checks_cancelled",
+        ("Checker.fail_fast",
+         dict(new_callable=PropertyMock)),
         ("Checker.check_queue",
          dict(new_callable=PropertyMock)),
         ("Checker.completed_checks",
          dict(new_callable=PropertyMock)),
         ("Checker.remaining_checks",
          dict(new_callable=PropertyMock)),
+        ("Checker.timings",
+         dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
 
     class Getter:
@@ -1769,11 +2646,15 @@ async def test_checker__run_from_queue(patches, checks):
         expected = checks[:checks.index("SENTINEL")]
     else:
         expected = checks
+    cancelled = fail_fast and failing in expected
+    if cancelled:
+        expected = expected[:expected.index(failing) + 1]
 
     with patched as patchy:
-        (m_sentinel, m_log, m_run,
-         m_q, m_completed, m_remaining) = patchy
+        (m_sentinel, m_log, m_run, m_cancelled, m_fail_fast,
+         m_q, m_completed, m_remaining, m_timings) = patchy
 
+        m_fail_fast.return_value = fail_fast
         getter = Getter(m_sentinel)
         m_q.return_value.get = AsyncMock(side_effect=getter.get)
         m_remaining.side_effect = getter.remaining
@@ -1783,10 +2664,12 @@ async def test_checker__run_from_queue(patches, checks):
         assert not m_q.called
         assert not m_run.called
         assert not m_completed.called
+        assert not m_cancelled.called
         return
     get_calls = (
         len(expected) + 1
-        if "SENTINEL" in checks
+        if ("SENTINEL" in checks
+            and not cancelled)
         else len(expected))
     assert (
         m_q.return_value.get.call_args_list
@@ -1794,12 +2677,58 @@ async def test_checker__run_from_queue(patches, checks):
     assert (
         m_run.call_args_list
         == [[(check, ), {}] for check in expected])
+    assert (
+        m_timings.return_value.start.call_args_list
+        == [[("check", check), {}] for check in expected])
+    assert (
+        m_timings.return_value.end.call_args_list
+        == [[("check", check), {}] for check in expected])
     assert (
         m_q.return_value.task_done.call_args_list
         == [[(), {}] for check in expected])
     assert (
         m_completed.return_value.add.call_args_list
         == [[(check, ), {}] for check in expected])
+    if not cancelled:
+        assert not m_cancelled.called
+        return
+    assert (
+        m_cancelled.call_args
+        == [(failing, ), {}])
+
+
+@pytest.mark.parametrize("fingerprinted", [True, False])
+@pytest.mark.parametrize("errors", [True, False])
+@pytest.mark.parametrize("warnings", [True, False])
+@pytest.mark.parametrize("cached", [True, False])
+def test_checker__update_check_cache(
+        patches, fingerprinted, errors, warnings, cached):
+    checker = Checker()
+    patched = patches(
+        ("Checker.check_cache",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    cache = dict(OTHER="OTHER_FP")
+    if cached:
+        cache["CHECK"] = "OLD_FP"
+    if fingerprinted:
+        checker.fingerprints["CHECK"] = "FP"
+    if errors:
+        checker.errors["CHECK"] = ["ERROR"]
+    if warnings:
+        checker.warnings["CHECK"] = ["WARNING"]
+    expected = cache.copy()
+
+    with patched as (m_cache, ):
+        m_cache.return_value = cache
+        assert not checker._update_check_cache("CHECK")
+
+    if fingerprinted:
+        if errors or warnings:
+            expected.pop("CHECK", None)
+        else:
+            expected["CHECK"] = "FP"
+    assert cache == expected
 
 
 @pytest.mark.parametrize("pending", [True, False])
@@ -0,0 +1,73 @@
+
+from aio.run.checker import fingerprint, fingerprints
+
+
+def test_fingerprint_parts():
+    assert (
+        fingerprint("A", "B")
+        == fingerprint("A", "B"))
+    assert (
+        fingerprint("A", "B")
+        != fingerprint("B", "A"))
+    assert (
+        fingerprint("AB")
+        != fingerprint("A", "B"))
+    assert (
+        fingerprint(1, None)
+        == fingerprint("1", "None"))
+    assert fingerprints.fingerprint is fingerprint
+
+
+def test_fingerprint_paths(tmp_path):
+    tmp_path.joinpath("a.yaml").write_text("A")
+    tmp_path.joinpath("b.yaml").write_text("B")
+    initial = fingerprint(
+        "PART",
+        root=tmp_path,
+        paths=["a.yaml", "b.yaml"])
+
+    assert (
+        fingerprint(
+            "PART",
+            root=tmp_path,
+            paths=["b.yaml", "a.yaml", "a.yaml"])
+        == initial)
+    assert (
+        fingerprint(
+            "PART",
+            paths=[tmp_path.joinpath("a.yaml"), tmp_path.joinpath("b.yaml")])
+        != initial)
+    assert (
+        fingerprint(
+            "OTHER",
+            root=tmp_path,
+            paths=["a.yaml", "b.yaml"])
+        != initial)
+    assert (
+        fingerprint(
+            "PART",
+            root=tmp_path,
+            paths=["a.yaml"])
+        != initial)
+
+    tmp_path.joinpath("b.yaml").write_text("B2")
+    changed = fingerprint(
+        "PART",
+        root=tmp_path,
+        paths=["a.yaml", "b.yaml"])
+    assert changed != initial
+
+    tmp_path.joinpath("b.yaml").unlink()
+    missing = fingerprint(
+        "PART",
+        root=tmp_path,
+        paths=["a.yaml", "b.yaml"])
+    assert missing != changed
+
+    tmp_path.joinpath("b.yaml").write_text("")
+    assert (
+        fingerprint(
+            "PART",
+            root=tmp_path,
+            paths=["a.yaml", "b.yaml"])
+        != missing)
@@ -0,0 +1,542 @@
+
+import json
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from aio.run import runner
+from aio.run.checker import (
+    CheckerResults, CheckerResultsMerger, JSONLOutput, merge, merge_cmd,
+    output)
+from aio.run.checker.merge_cmd import main
+
+
+def _write_results(path, records):
+    path.write_text(
+        "".join(
+            f"{json.dumps(record)}\n"
+            for record
+            in records))
+    return path
+
+
+def test_merge_results_constructor():
+    results = CheckerResults()
+    assert results.checks == {}
+    assert results.problems == []
+    assert results.incomplete == []
+    assert results.runs == 0
+    assert (
+        results.summary
+        == dict(
+            success=0,
+            errors=0,
+            warnings=0,
+            failed={},
+            warned={},
+            succeeded={},
+            cached=[],
+            runs=0,
+            incomplete=[]))
+
+
+def test_merge_results_summary():
+    results = CheckerResults()
+    results.runs = 23
+    results.incomplete.append("PATH")
+    results._summary["cached"].update(["C2", "C1"])
+    results._summary["errors"] = 7
+    assert (
+        results.summary
+        == dict(
+            success=0,
+            errors=7,
+            warnings=0,
+            failed={},
+            warned={},
+            succeeded={},
+            cached=["C1", "C2"],
+            runs=23,
+            incomplete=["PATH"]))
+    assert "summary" not in results.__dict__
+
+
+@pytest.mark.parametrize("complete", [True, False])
+def test_merge_results_add(tmp_path, patches, complete):
+    results = CheckerResults()
+    records = [
+        dict(type="problem", check="C1", level="error", message="M1"),
+        dict(type="check", check="C1", status="failed", errors=1),
+        dict(type="OTHER", data="DATA"),
+        dict(notype="NOTYPE")]
+    if complete:
+        records.append(dict(type="summary", errors=1))
+    path = _write_results(tmp_path.joinpath("results.jsonl"), records)
+    path.write_text(f"{path.read_text()}\n  \n")
+    patched = patches(
+        "CheckerResults.add_check",
+        "CheckerResults.add_summary",
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_check, m_summary):
+        assert not results.add(path)
+
+    assert results.runs == 1
+    assert (
+        results.problems
+        == [dict(check="C1", level="error", message="M1")])
+    assert (
+        m_check.call_args_list
+        == [[(dict(check="C1", status="failed", errors=1), ), {}]])
+    if complete:
+        assert (
+            m_summary.call_args_list
+            == [[(dict(errors=1), ), {}]])
+        assert results.incomplete == []
+        return
+    assert not m_summary.called
+    assert results.incomplete == [str(path)]
+
+
+@pytest.mark.parametrize("error", ["missing", "invalid", "truncated"])
+def test_merge_results_add_errors(tmp_path, error):
+    results = CheckerResults()
+    path = tmp_path.joinpath("results.jsonl")
+    summary = json.dumps(dict(type="summary", errors=0))
+    if error == "invalid":
+        path.write_text(f"NOT JSON\n{summary}\n")
+    elif error == "truncated":
+        path.write_text(f"{summary}\n{summary[:-3]}")
+
+    assert not results.add(path)
+    assert results.runs == 1
+    assert results.incomplete == [str(path)]
+
+
+def test_merge_results_add_check():
+    results = CheckerResults()
+    statuses = ["passed", "empty", "failed", "warned", "passed"]
+    for i, status in enumerate(statuses):
+        results.add_check(
+            dict(check="C1", status=status, errors=i, successes=1))
+    results.add_check(dict(check="C2", status="empty", errors=0))
+    results.add_check(dict(check="C3", status="warned", warnings=2))
+    results.add_check(dict(check="C3", status="passed", successes=3))
+    assert (
+        results.checks
+        == dict(
+            C1=dict(status="failed", errors=10, warnings=0, successes=5),
+            C2=dict(status="empty", errors=0, warnings=0, successes=0),
+            C3=dict(status="warned", errors=0, warnings=2, successes=3)))
+
+
+def test_merge_results_add_summary():
+    results = CheckerResults()
+    results.add_summary(
+        dict(success=3,
+             errors=2,
+             warnings=0,
+             failed=dict(C1=2),
+             warned={},
+             succeeded=dict(C1=1, C2=2),
+             cached=["C3"]))
+    results.add_summary(
+        dict(success=1,
+             errors=1,
+             warnings=1,
+             failed=dict(C1=1),
+             warned=dict(C2=1),
+             succeeded=dict(C2=1),
+             cached=["C3", "C4"]))
+    results.add_summary({})
+    assert (
+        results.summary
+        == dict(
+            success=4,
+            errors=3,
+            warnings=1,
+            failed=dict(C1=3),
+            warned=dict(C2=1),
+            succeeded=dict(C1=1, C2=3),
+            cached=["C3", "C4"],
+            runs=0,
+            incomplete=[]))
+
+
+def test_merge_results_shards(tmp_path):
+    paths = []
+    for i, (status, counts) in enumerate(
+            [("passed", dict(errors=0, warnings=0, successes=2)),
+             ("failed", dict(errors=1, warnings=0, successes=1))]):
+        results_path = tmp_path.joinpath(f"shard{i}.jsonl")
+        results_output = JSONLOutput(results_path, "NAME")
+        if counts["errors"]:
+            results_output.problem("files", "error", "bad file")
+        results_output.check("files", status, counts)
+        results_output.check(f"whole{i}", "passed", dict(successes=1))
+        results_output.close(
+            dict(success=counts["successes"] + 1,
+                 errors=counts["errors"],
+                 warnings=0,
+                 failed=(
+                     dict(files=1)
+                     if counts["errors"]
+                     else {}),
+                 warned={},
+                 succeeded={
+                     "files": counts["successes"],
+                     f"whole{i}": 1},
+                 cached=[]))
+        paths.append(results_path)
+    results = CheckerResults()
+    for path in paths:
+        results.add(path)
+
+    assert (
+        results.checks
+        == dict(
+            files=dict(status="failed", errors=1, warnings=0, successes=3),
+            whole0=dict(status="passed", errors=0, warnings=0, successes=1),
+            whole1=dict(status="passed", errors=0, warnings=0, successes=1)))
+    assert (
+        results.problems
+        == [dict(check="files", level="error", message="bad file")])
+    assert (
+        results.summary
+        == dict(
+            success=5,
+            errors=1,
+            warnings=0,
+            failed=dict(files=1),
+            warned={},
+            succeeded=dict(files=3, whole0=1, whole1=1),
+            cached=[],
+            runs=2,
+            incomplete=[]))
+
+
+def test_merge_merger_constructor():
+    merger = CheckerResultsMerger("path1", "path2")
+    assert isinstance(merger, runner.Runner)
+    assert merge.CHECK_STATUSES == ("empty", "passed", "warned", "failed")
+
+
+@pytest.mark.parametrize("warning", ["warn", "error"])
+def test_merge_merger_fail_on_warn(patches, warning):
+    merger = CheckerResultsMerger()
+    patched = patches(
+        ("CheckerResultsMerger.args",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_args, ):
+        m_args.return_value.warning = warning
+        assert merger.fail_on_warn == (warning == "error")
+
+    assert "fail_on_warn" not in merger.__dict__
+
+
+@pytest.mark.parametrize("errors", [0, 1])
+@pytest.mark.parametrize("warnings", [0, 1])
+@pytest.mark.parametrize("incomplete", [[], ["PATH"]])
+@pytest.mark.parametrize("fail_on_warn", [True, False])
+def test_merge_merger_has_failed(
+        patches, errors, warnings, incomplete, fail_on_warn):
+    merger = CheckerResultsMerger()
+    patched = patches(
+        ("CheckerResultsMerger.fail_on_warn",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.results",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_warn, m_results):
+        m_warn.return_value = fail_on_warn
+        m_results.return_value.summary = dict(
+            errors=errors,
+            warnings=warnings,
+            incomplete=incomplete)
+        assert (
+            merger.has_failed
+            == bool(errors
+                    or incomplete
+                    or (warnings and fail_on_warn)))
+
+    assert "has_failed" not in merger.__dict__
+
+
+def test_merge_merger_results():
+    merger = CheckerResultsMerger()
+    assert isinstance(merger.results, CheckerResults)
+    assert "results" in merger.__dict__
+
+
+@pytest.mark.parametrize("results_file", [None, "", "PATH"])
+def test_merge_merger_results_output(patches, results_file):
+    merger = CheckerResultsMerger()
+    formats = dict(FORMAT=MagicMock())
+    patched = patches(
+        "pathlib",
+        "output_formats",
+        ("CheckerResultsMerger.args",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.name",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_plib, m_formats, m_args, m_name):
+        m_formats.__getitem__.side_effect = formats.__getitem__
+        m_args.return_value.results_file = results_file
+        m_args.return_value.results_format = "FORMAT"
+        assert (
+            merger.results_output
+            == (formats["FORMAT"].return_value
+                if results_file
+                else None))
+
+    assert "results_output" in merger.__dict__
+    if not results_file:
+        assert not formats["FORMAT"].called
+        return
+    assert (
+        formats["FORMAT"].call_args
+        == [(m_plib.Path.return_value, m_name.return_value), {}])
+    assert (
+        m_plib.Path.call_args
+        == [(results_file, ), {}])
+
+
+def test_merge_merger_add_arguments(patches):
+    merger = CheckerResultsMerger()
+    parser = MagicMock()
+    patched = patches(
+        "runner.Runner.add_arguments",
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_super, ):
+        assert not merger.add_arguments(parser)
+
+    assert (
+        m_super.call_args
+        == [(parser, ), {}])
+    assert (
+        parser.add_argument.call_args_list
+        == [[("--warning", "-w"),
+             dict(choices=["warn", "error"],
+                  default="warn",
+                  help="Handle warnings as warnings or errors")],
+            [("--results-file", ),
+             dict(metavar="FILE",
+                  default=None,
+                  help="Write the merged results to this file")],
+            [("--results-format", ),
+             dict(choices=["jsonl", "sarif"],
+                  default="jsonl",
+                  help=(
+                      "Format of the merged results file, JSON lines or "
+                      "SARIF"))],
+            [("results", ),
+             dict(nargs="+",
+                  help=(
+                      "JSON lines results files of the checker runs to "
+                      "merge"))]])
+
+
+def test_merge_merger_log_results(patches):
+    merger = CheckerResultsMerger()
+    patched = patches(
+        ("CheckerResultsMerger.log",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.results",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_log, m_results):
+        m_results.return_value.problems = [
+            dict(check="C1", level="error", message="E1"),
+            dict(check="C2", level="warning", message="W1")]
+        m_results.return_value.checks = dict(
+            C4=dict(status="empty"),
+            C1=dict(status="failed", errors=2),
+            C3=dict(status="passed", successes=3),
+            C2=dict(status="warned", warnings=1))
+        m_results.return_value.incomplete = ["PATH1", "PATH2"]
+        assert not merger.log_results()
+
+    assert (
+        m_log.return_value.error.call_args_list
+        == [[("[C1] E1", ), {}],
+            [("[C1] Check failed (2)", ), {}],
+            [("Incomplete results: PATH1", ), {}],
+            [("Incomplete results: PATH2", ), {}]])
+    assert (
+        m_log.return_value.warning.call_args_list
+        == [[("[C2] W1", ), {}],
+            [("[C2] Check has warnings (1)", ), {}]])
+    assert (
+        m_log.return_value.notice.call_args_list
+        == [[("[C3] Checks (3) completed successfully", ), {}],
+            [("[C4] No checks ran", ), {}]])
+
+
+@pytest.mark.parametrize("failed", [True, False])
+async def test_merge_merger_run(patches, failed):
+    merger = CheckerResultsMerger()
+    patched = patches(
+        "pathlib",
+        "CheckerResultsMerger.log_results",
+        "CheckerResultsMerger.write_results",
+        ("CheckerResultsMerger.args",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.has_failed",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.log",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.results",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.merge")
+
+    with patched as patchy:
+        (m_plib, m_log_results, m_write, m_args,
+         m_failed, m_log, m_results) = patchy
+        m_args.return_value.results = ["PATH1", "PATH2"]
+        m_failed.return_value = failed
+        assert await merger.run() == (1 if failed else 0)
+
+    summary = m_results.return_value.summary
+    assert (
+        m_plib.Path.call_args_list
+        == [[("PATH1", ), {}], [("PATH2", ), {}]])
+    assert (
+        m_results.return_value.add.call_args_list
+        == [[(m_plib.Path.return_value, ), {}]] * 2)
+    assert (
+        m_log_results.call_args
+        == [(), {}])
+    assert (
+        m_write.call_args
+        == [(), {}])
+    if failed:
+        assert (
+            m_log.return_value.error.call_args
+            == [(f"{summary}", ), {}])
+        assert not m_log.return_value.success.called
+        return
+    assert (
+        m_log.return_value.success.call_args
+        == [(f"{summary}", ), {}])
+    assert not m_log.return_value.error.called
+
+
+@pytest.mark.parametrize("results_output", [True, False])
+def test_merge_merger_write_results(patches, results_output):
+    merger = CheckerResultsMerger()
+    patched = patches(
+        ("CheckerResultsMerger.results",
+         dict(new_callable=PropertyMock)),
+        ("CheckerResultsMerger.results_output",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.merge")
+
+    with patched as (m_results, m_output):
+        if not results_output:
+            m_output.return_value = None
+        m_results.return_value.problems = [
+            dict(check="C1", level="error", message="E1"),
+            dict(check="C2", level="warning", message="W2", path="P2")]
+        m_results.return_value.checks = dict(
+            C2=dict(status="passed", successes=1),
+            C1=dict(status="failed", errors=1))
+        assert not merger.write_results()
+
+    if not results_output:
+        return
+    results_output = m_output.return_value
+    assert (
+        results_output.problem.call_args_list
+        == [[("C1", "error", "E1", None), {}],
+            [("C2", "warning", "W2", "P2"), {}]])
+    assert (
+        results_output.check.call_args_list
+        == [[("C1", "failed", dict(errors=1)), {}],
+            [("C2", "passed", dict(successes=1)), {}]])
+    assert (
+        results_output.close.call_args
+        == [(m_results.return_value.summary, ), {}])
+
+
+def test_merge_merger_write_results_sarif(tmp_path):
+    results_path = tmp_path.joinpath("results.sarif")
+    merger = CheckerResultsMerger(
+        "--results-file", str(results_path),
+        "--results-format", "sarif",
+        "PATH")
+    merger.results.problems.append(
+        dict(check="C1", level="error", message="E1"))
+    merger.results.problems.append(
+        dict(check="C1", level="error", message="a.py:3: E2", path="a.py"))
+    merger.results.checks["C1"] = dict(status="failed", errors=2)
+    merger.write_results()
+
+    sarif = json.loads(results_path.read_text())
+    assert sarif["$schema"] == output.SARIF_SCHEMA
+    assert (
+        sarif["runs"][0]["results"]
+        == [dict(ruleId="C1",
+                 level="error",
+                 message=dict(text="E1"),
+                 locations=[
+                     dict(physicalLocation=dict(
+                         artifactLocation=dict(
+                             uri=".",
+                             uriBaseId="%SRCROOT%")))]),
+            dict(ruleId="C1",
+                 level="error",
+                 message=dict(text="a.py:3: E2"),
+                 locations=[
+                     dict(physicalLocation=dict(
+                         artifactLocation=dict(
+                             uri="a.py",
+                             uriBaseId="%SRCROOT%"),
+                         region=dict(startLine=3)))])])
+
+
+@pytest.mark.parametrize(
+    "args",
+    [[], tuple(f"ARG{i}" for i in range(0, 5))])
+def test_merge_cmd_main(patches, args):
+    patched = patches(
+        "CheckerResultsMerger",
+        prefix="aio.run.checker.merge_cmd")
+
+    with patched as (m_merger, ):
+        assert main(*args) == m_merger.return_value.return_value
+
+    assert (
+        m_merger.call_args
+        == [tuple(args), {}])
+    assert (
+        m_merger.return_value.call_args
+        == [(), {}])
+
+
+def test_merge_cmd(iters, patches):
+    patched = patches(
+        "sys",
+        "main",
+        prefix="aio.run.checker.merge_cmd")
+    args = iters(tuple)
+
+    with patched as (m_sys, m_main):
+        m_sys.argv.__getitem__.return_value = args
+        assert not merge_cmd()
+
+    assert (
+        m_sys.exit.call_args
+        == [(m_main.return_value, ), {}])
+    assert (
+        m_main.call_args
+        == [args, {}])
+    assert (
+        m_sys.argv.__getitem__.call_args
+        == [(slice(1, None), ), {}])
@@ -0,0 +1,236 @@
+
+import json
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from aio.run.checker import (
+    CheckerOutput, JSONLOutput, output, SARIFOutput)
+
+
+def test_output_constructor():
+    results = CheckerOutput("PATH", "NAME")
+    assert results.path == "PATH"
+    assert results.name == "NAME"
+    assert results.closed is False
+    assert output.output_formats == dict(
+        jsonl=JSONLOutput,
+        sarif=SARIFOutput)
+
+
+def test_output_file(patches, tmp_path):
+    path = tmp_path.joinpath("some", "results.out")
+    results = CheckerOutput(path, "NAME")
+    patched = patches(
+        "CheckerOutput.start",
+        prefix="aio.run.checker.output")
+
+    with patched as (m_start, ):
+        file = results.file
+
+    assert "file" in results.__dict__
+    assert not file.closed
+    assert file.name == str(path)
+    assert file.mode == "w"
+    assert (
+        m_start.call_args
+        == [(file, ), {}])
+    file.close()
+
+
+@pytest.mark.parametrize("closed", [True, False])
+def test_output_close(patches, closed):
+    results = CheckerOutput("PATH", "NAME")
+    results.closed = closed
+    patched = patches(
+        "CheckerOutput.end",
+        ("CheckerOutput.file",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.output")
+
+    with patched as (m_end, m_file):
+        assert not results.close("STATUS")
+
+    assert results.closed is True
+    if closed:
+        assert not m_end.called
+        assert not m_file.called
+        return
+    assert (
+        m_end.call_args
+        == [("STATUS", ), {}])
+    assert (
+        m_file.return_value.close.call_args
+        == [(), {}])
+
+
+def test_output_noops():
+    results = CheckerOutput("PATH", "NAME")
+    assert not results.check("CHECK", "STATUS", {})
+    assert not results.end("STATUS")
+    assert not results.start("FILE")
+    with pytest.raises(NotImplementedError):
+        results.problem("CHECK", "LEVEL", "MESSAGE")
+
+
+def test_output_write(patches):
+    results = CheckerOutput("PATH", "NAME")
+    patched = patches(
+        ("CheckerOutput.file",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.output")
+
+    with patched as (m_file, ):
+        assert not results.write("TEXT")
+
+    assert (
+        m_file.return_value.write.call_args
+        == [("TEXT", ), {}])
+    assert (
+        m_file.return_value.flush.call_args
+        == [(), {}])
+
+
+def test_output_jsonl(tmp_path):
+    path = tmp_path.joinpath("results.jsonl")
+    results = JSONLOutput(path, "NAME")
+    results.problem("CHECK1", "error", "Something\nwent wrong")
+    assert (
+        json.loads(path.read_text())
+        == dict(
+            type="problem",
+            check="CHECK1",
+            level="error",
+            message="Something\nwent wrong"))
+    results.problem("CHECK1", "warning", "Something else")
+    results.problem("CHECK2", "error", "a.py:1: Bad", "a.py")
+    results.check(
+        "CHECK1",
+        "failed",
+        dict(errors=1, warnings=1, successes=0))
+    results.close(dict(errors=1, warnings=1))
+    results.close(dict(errors=23))
+
+    assert (
+        [json.loads(line)
+         for line
+         in path.read_text().splitlines()]
+        == [dict(type="problem",
+                 check="CHECK1",
+                 level="error",
+                 message="Something\nwent wrong"),
+            dict(type="problem",
+                 check="CHECK1",
+                 level="warning",
+                 message="Something else"),
+            dict(type="problem",
+                 check="CHECK2",
+                 level="error",
+                 message="a.py:1: Bad",
+                 path="a.py"),
+            dict(type="check",
+                 check="CHECK1",
+                 status="failed",
+                 errors=1,
+                 warnings=1,
+                 successes=0),
+            dict(type="summary",
+                 errors=1,
+                 warnings=1)])
+
+
+def test_output_jsonl_record(patches):
+    results = JSONLOutput("PATH", "NAME")
+    patched = patches(
+        "json",
+        "JSONLOutput.write",
+        prefix="aio.run.checker.output")
+
+    with patched as (m_json, m_write):
+        m_json.dumps.return_value = "RECORD"
+        assert not results.record("DATA")
+
+    assert (
+        m_json.dumps.call_args
+        == [("DATA", ), {}])
+    assert (
+        m_write.call_args
+        == [("RECORD\n", ), {}])
+
+
+@pytest.mark.parametrize("problems", [0, 1, 3])
+def test_output_sarif(tmp_path, problems):
+    path = tmp_path.joinpath("results.sarif")
+    results = SARIFOutput(path, "NAME")
+    assert results.results == 0
+    assert results.rules == set()
+    expected = []
+    for i in range(0, problems):
+        check = f"CHECK{i % 2}"
+        level = "error" if i % 2 else "warning"
+        problem_path = f"dir/file{i}.py" if i % 2 else None
+        results.problem(check, level, f"Problem {i}", problem_path)
+        expected.append(
+            dict(ruleId=check,
+                 level=level,
+                 message=dict(text=f"Problem {i}"),
+                 locations=[
+                     dict(physicalLocation=dict(
+                         artifactLocation=dict(
+                             uri=problem_path or ".",
+                             uriBaseId=output.SARIF_ROOT)))]))
+    results.check("CHECK1", "failed", dict(errors=1))
+    results.close(dict(errors=1))
+
+    assert (
+        json.loads(path.read_text())
+        == {"version": "2.1.0",
+            "$schema": output.SARIF_SCHEMA,
+            "runs": [
+                dict(results=expected,
+                     tool=dict(
+                         driver=dict(
+                             name="NAME",
+                             rules=[
+                                 dict(id=rule)
+                                 for rule
+                                 in sorted(
+                                     set(r["ruleId"]
+                                         for r
+                                         in expected))])))]})
+
+
+@pytest.mark.parametrize(
+    "problem",
+    [("Problem", None,
+      dict(artifactLocation=dict(uri="."))),
+     ("Problem", "a/b.py",
+      dict(artifactLocation=dict(uri="a/b.py"))),
+     ("a/b.py:23:4: E1 Problem", "a/b.py",
+      dict(artifactLocation=dict(uri="a/b.py"),
+           region=dict(startLine=23))),
+     ("a/b.py: Problem", "a/b.py",
+      dict(artifactLocation=dict(uri="a/b.py"))),
+     ("a/bxpy:23: Problem", "a/b.py",
+      dict(artifactLocation=dict(uri="a/b.py"))),
+     ("a b.py:7 Problem", "a b.py",
+      dict(artifactLocation=dict(uri="a%20b.py"),
+           region=dict(startLine=7)))])
+def test_output_sarif_location(problem):
+    message, path, expected = problem
+    expected["artifactLocation"]["uriBaseId"] = "%SRCROOT%"
+    results = SARIFOutput("PATH", "NAME")
+    assert (
+        results.location(message, path)
+        == dict(physicalLocation=expected))
+
+
+def test_output_sarif_start():
+    results = SARIFOutput("PATH", "NAME")
+    file = MagicMock()
+    assert not results.start(file)
+    assert (
+        file.write.call_args
+        == [("{\"version\": \"2.1.0\", "
+             f"\"$schema\": \"{output.SARIF_SCHEMA}\", "
+             "\"runs\": [{\"results\": [", ), {}])
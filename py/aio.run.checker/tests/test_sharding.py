@@ -0,0 +1,111 @@
+
+import argparse
+import collections
+
+import pytest
+
+from aio.run.checker import sharding
+
+
+@pytest.mark.parametrize(
+    "value",
+    [("1/1", (1, 1)),
+     ("1/4", (1, 4)),
+     ("4/4", (4, 4)),
+     ("0/4", None),
+     ("5/4", None),
+     ("-1/4", None),
+     ("1/0", None),
+     ("1", None),
+     ("1/2/3", None),
+     ("a/b", None),
+     ("", None)])
+def test_sharding_shard_arg(value):
+    value, expected = value
+    if expected:
+        assert sharding.shard_arg(value) == expected
+        return
+    with pytest.raises(argparse.ArgumentTypeError) as e:
+        sharding.shard_arg(value)
+    assert (
+        e.value.args[0]
+        == f"must be `i/N`, where `i` is from 1 to `N`: {value}")
+
+
+def test_sharding_shard_index():
+    paths = [f"path/to/file{i}.py" for i in range(0, 1000)]
+    counts = collections.Counter(
+        sharding.shard_index(path, 4)
+        for path
+        in paths)
+    assert sorted(counts) == [1, 2, 3, 4]
+    assert all(count > 200 for count in counts.values())
+    # Stable across processes and runs.
+    assert sharding.shard_index("path/to/file0.py", 4) == 3
+    assert sharding.shard_index("path/to/file1.py", 4) == 1
+    for path in paths:
+        assert sharding.shard_index(path, 1) == 1
+
+
+@pytest.mark.parametrize("shard", [(1, 2), (2, 2), (3, 7)])
+def test_sharding_in_shard(patches, shard):
+    patched = patches(
+        "shard_index",
+        prefix="aio.run.checker.sharding")
+
+    with patched as (m_index, ):
+        m_index.return_value = 2
+        assert (
+            sharding.in_shard("KEY", shard)
+            == (shard[0] == 2))
+
+    assert (
+        m_index.call_args
+        == [("KEY", shard[1]), {}])
+
+
+def test_sharding_in_shard_partitions():
+    paths = [f"file{i}" for i in range(0, 100)]
+    shards = [
+        set(path
+            for path
+            in paths
+            if sharding.in_shard(path, (i, 3)))
+        for i
+        in range(1, 4)]
+    assert set().union(*shards) == set(paths)
+    assert sum(len(shard) for shard in shards) == len(paths)
+
+
+@pytest.mark.parametrize(
+    "checks",
+    [(),
+     ("a", ),
+     ("a", "b", "c", "d", "e"),
+     ("a", "f1", "b", "f2", "c")])
+@pytest.mark.parametrize("count", [1, 2, 3, 7])
+@pytest.mark.parametrize("sharded", [(), ("f1", "f2")])
+def test_sharding_shard_checks(checks, count, sharded):
+    shards = [
+        sharding.shard_checks(checks, (i, count), sharded)
+        for i
+        in range(1, count + 1)]
+    whole = [check for check in checks if check not in sharded]
+
+    for i, shard in enumerate(shards):
+        assert (
+            shard
+            == [check
+                for check
+                in checks
+                if (check in sharded
+                    or check in whole[i::count])])
+    assert (
+        sorted(
+            check
+            for shard
+            in shards
+            for check
+            in shard
+            if check not in sharded)
+        == sorted(whole))
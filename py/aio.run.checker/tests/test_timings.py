@@ -0,0 +1,202 @@
+
+from unittest.mock import PropertyMock
+
+import pytest
+
+from aio.run.checker import CheckerTimings
+
+
+def _timings(times, blockers=None):
+    timings = CheckerTimings()
+    for (kind, name), (start, end) in times.items():
+        timings.started[(kind, name)] = start
+        if end is not None:
+            timings.ended[(kind, name)] = end
+    timings.blockers.update(blockers or {})
+    return timings
+
+
+def test_timings_constructor():
+    timings = CheckerTimings()
+    assert timings.blockers == {}
+    assert timings.started == {}
+    assert timings.ended == {}
+
+
+def test_timings_start_end(patches):
+    timings = CheckerTimings()
+    patched = patches(
+        "time",
+        prefix="aio.run.checker.timings")
+
+    with patched as (m_time, ):
+        m_time.monotonic.side_effect = [10, 13, 20, 30]
+        assert not timings.start("preload", "TASK")
+        assert not timings.end("preload", "TASK")
+        assert not timings.end("check", "NOT_STARTED")
+        assert not timings.start("check", "CHECK")
+        assert not timings.start("preload", "TASK")
+
+    assert (
+        timings.started
+        == {("preload", "TASK"): 30,
+            ("check", "CHECK"): 20})
+    assert timings.ended == {}
+
+
+def test_timings_blocked():
+    timings = CheckerTimings()
+    assert not timings.blocked("CHECK", "TASK")
+    assert timings.blockers == dict(CHECK="TASK")
+
+
+def test_timings_finished():
+    timings = _timings(
+        {("preload", "P1"): (1, 3),
+         ("check", "C1"): (3, None),
+         ("check", "C2"): (2, 7)})
+    assert (
+        timings.finished
+        == {("preload", "P1"): (1, 3),
+            ("check", "C2"): (2, 7)})
+    assert "finished" not in timings.__dict__
+
+
+def test_timings_origin():
+    assert CheckerTimings().origin == 0
+    timings = _timings(
+        {("preload", "P1"): (7, 9),
+         ("check", "C1"): (5, None)})
+    assert timings.origin == 5
+
+
+@pytest.mark.parametrize(
+    "times,blockers,expected",
+    [({}, {}, []),
+     # only preloads
+     ({("preload", "P1"): (0, 3),
+       ("preload", "P2"): (0, 1)},
+      {},
+      [("preload", "P1")]),
+     # unfinished tasks are ignored
+     ({("preload", "P1"): (0, None),
+       ("check", "C1"): (0, None)},
+      {},
+      []),
+     # waiting on a preload
+     ({("preload", "P1"): (0, 3),
+       ("preload", "P2"): (0, 1),
+       ("check", "C"): (0, 0.5),
+       ("check", "A"): (1, 2),
+       ("check", "B"): (3, 5)},
+      dict(A="P2", B="P1"),
+      [("preload", "P1"), ("check", "B")]),
+     # waiting on the previous check
+     ({("preload", "P1"): (0, 1),
+       ("check", "A"): (0, 4),
+       ("check", "B"): (4, 6)},
+      dict(B="P1"),
+      [("check", "A"), ("check", "B")]),
+     # preloads that did not block a check are not on its path
+     ({("preload", "P1"): (0, 2),
+       ("preload", "P2"): (0, 1),
+       ("check", "A"): (1, 1.5),
+       ("check", "B"): (2, 3)},
+      dict(A="P2"),
+      [("preload", "P2"), ("check", "A"), ("check", "B")])])
+def test_timings_critical_path(times, blockers, expected):
+    timings = _timings(times, blockers)
+    assert timings.critical_path == expected
+
+
+def test_timings_timing():
+    timings = _timings(
+        {("preload", "P1"): (10, 13.12345),
+         ("check", "C1"): (13.5, None),
+         ("check", "C2"): (14, 15)},
+        dict(C2="P1"))
+    assert (
+        timings.timing("preload", "P1")
+        == dict(
+            kind="preload",
+            name="P1",
+            start=0,
+            end=3.123,
+            duration=3.123))
+    assert (
+        timings.timing("check", "C1")
+        == dict(
+            kind="check",
+            name="C1",
+            start=3.5,
+            end=None,
+            duration=None,
+            blocked_by=None))
+    assert (
+        timings.timing("check", "C2")
+        == dict(
+            kind="check",
+            name="C2",
+            start=4,
+            end=5,
+            duration=1,
+            blocked_by="P1"))
+
+
+def test_timings_as_dict():
+    timings = _timings(
+        {("check", "C1"): (3, 4),
+         ("preload", "P1"): (0, 3),
+         ("check", "C2"): (4, None)},
+        dict(C1="P1"))
+
+    assert (
+        timings.as_dict()
+        == dict(
+            total=4,
+            timings=[
+                timings.timing("preload", "P1"),
+                timings.timing("check", "C1"),
+                timings.timing("check", "C2")],
+            critical_path=[
+                timings.timing("preload", "P1"),
+                timings.timing("check", "C1")]))
+    assert (
+        CheckerTimings().as_dict()
+        == dict(
+            total=0,
+            timings=[],
+            critical_path=[]))
+
+
+def test_timings_as_text():
+    timings = _timings(
+        {("check", "check1"): (3, 4),
+         ("preload", "preload_long"): (0, 3),
+         ("check", "check2"): (4, None)},
+        dict(check1="preload_long"))
+
+    assert (
+        timings.as_text()
+        == "\n".join([
+            "Timings (seconds from start):",
+            "  kind     name            start      end "
+            "duration  blocked by",
+            "  preload  preload_long    0.000    3.000    3.000",
+            "  check    check1          3.000    4.000    1.000  "
+            "preload_long",
+            "  check    check2          4.000        -        -",
+            "Critical path (4.000s): preload_long (3.000s) "
+            "-> check1 (1.000s)"]))
+
+
+def test_timings_as_text_empty(patches):
+    timings = CheckerTimings()
+    patched = patches(
+        ("CheckerTimings.critical_path",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.timings")
+
+    with patched as (m_path, ):
+        m_path.return_value = []
+        assert timings.as_text() == "No timings recorded"
@@ -4,6 +4,7 @@ from .decorators import (
     catches,
     cleansup)
 from .abstract import ACommand, ARunnerWithCommands, ICommand
+from .profiling import RunProfiler
 from .runner import Runner
 
 
@@ -13,5 +14,6 @@ __all__ = (
     "ICommand",
     "catches",
     "cleansup",
+    "RunProfiler",
     "Runner",
     "runner")
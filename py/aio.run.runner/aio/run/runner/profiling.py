@@ -0,0 +1,102 @@
+#
+# Profiling for runs, enabled with `--profile`
+
+import asyncio
+import cProfile
+import io
+import logging
+import pathlib
+import pstats
+import tracemalloc
+
+
+PROFILE_STATS = "profile.prof"
+PROFILE_REPORT = "profile.txt"
+PROFILE_REPORT_LIMIT = 50
+MEMORY_SNAPSHOT = "memory.snapshot"
+MEMORY_REPORT = "memory.txt"
+SLOW_CALLBACKS = "slow-callbacks.log"
+
+
+class RunProfiler:
+    """Profile a run, writing the artifacts to `path`.
+
+    - cProfile stats, which can be loaded with `pstats`/`snakeviz`, and
+      a text report of the most expensive calls by cumulative time.
+    - Optionally, a `tracemalloc` snapshot and a report of the `memory_top`
+      allocation sites.
+    - Optionally, a log of event loop callbacks that took longer than
+      `slow_callback_duration` seconds. This puts the loop in debug mode,
+      which works with both `asyncio` and `uvloop` loops.
+    """
+
+    def __init__(
+            self,
+            path: str | pathlib.Path,
+            memory_top: int = 0,
+            slow_callback_duration: float | None = None) -> None:
+        self.path = pathlib.Path(path)
+        self.memory_top = memory_top
+        self.slow_callback_duration = slow_callback_duration
+        self.profile = cProfile.Profile()
+        self._slow_callback_handler: logging.Handler | None = None
+
+    @property
+    def asyncio_logger(self) -> logging.Logger:
+        return logging.getLogger("asyncio")
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.slow_callback_duration:
+            self._log_slow_callbacks(loop, self.slow_callback_duration)
+        if self.memory_top:
+            tracemalloc.start()
+        self.profile.enable()
+
+    def stop(self) -> list[pathlib.Path]:
+        """Stop profiling, and return the paths of written artifacts."""
+        self.profile.disable()
+        artifacts = self._write_profile()
+        if tracemalloc.is_tracing():
+            artifacts.extend(self._write_memory())
+        if self._slow_callback_handler:
+            self.asyncio_logger.removeHandler(self._slow_callback_handler)
+            self._slow_callback_handler.close()
+            self._slow_callback_handler = None
+            artifacts.append(self.path.joinpath(SLOW_CALLBACKS))
+        return artifacts
+
+    def _log_slow_callbacks(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            duration: float) -> None:
+        loop.slow_callback_duration = duration
+        loop.set_debug(True)
+        handler = logging.FileHandler(self.path.joinpath(SLOW_CALLBACKS))
+        handler.setLevel(logging.WARNING)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(message)s"))
+        self.asyncio_logger.addHandler(handler)
+        self._slow_callback_handler = handler
+
+    def _write_memory(self) -> list[pathlib.Path]:
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        snapshot_path = self.path.joinpath(MEMORY_SNAPSHOT)
+        report_path = self.path.joinpath(MEMORY_REPORT)
+        snapshot.dump(str(snapshot_path))
+        top = snapshot.statistics("lineno")[:self.memory_top]
+        report_path.write_text(
+            "".join(f"{stat}\n" for stat in top))
+        return [snapshot_path, report_path]
+
+    def _write_profile(self) -> list[pathlib.Path]:
+        stats_path = self.path.joinpath(PROFILE_STATS)
+        report_path = self.path.joinpath(PROFILE_REPORT)
+        self.profile.dump_stats(stats_path)
+        report = io.StringIO()
+        (pstats.Stats(self.profile, stream=report)
+               .sort_stats(pstats.SortKey.CUMULATIVE)
+               .print_stats(PROFILE_REPORT_LIMIT))
+        report_path.write_text(report.getvalue())
+        return [stats_path, report_path]
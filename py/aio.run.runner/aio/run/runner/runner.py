@@ -28,9 +28,11 @@ import abstracts
 from aio.core import event, log as _log
 
 from .decorators import cleansup
+from .profiling import RunProfiler
 
 
 SUCCESS = 27
+LOG_BATCH_CAPACITY = 1000
 LOG_LEVELS = (
     ("debug", logging.DEBUG),
     ("info", logging.INFO),
@@ -57,6 +59,20 @@ class BazelRunError(Exception):
     pass
 
 
+def jobs_arg(value: str) -> int | None:
+    """Parse a `--jobs` arg, `auto` (`None`) or a positive integer."""
+    if value == "auto":
+        return None
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be `auto` or a positive integer: {value}")
+    return jobs
+
+
 class VerboseLogger(verboselogs.VerboseLogger):
 
     def success(self, msg, *args, **kw) -> None:
@@ -99,6 +115,10 @@ class Runner(event.AReactive):
             # interrupt. This means that a new loop has to be created to
             # cleanup.
             return self._on_runner_error(e)
+        finally:
+            self.shutdown_executors()
+            self.log_executor_profile()
+            self.stop_profiler()
 
     @cached_property
     def args(self) -> argparse.Namespace:
@@ -124,7 +144,9 @@ class Runner(event.AReactive):
         app_logger.setLevel(self.verbosity)
         return cast(
             VerboseLogger,
-            _log.QueueLogger(app_logger).start())
+            _log.QueueLogger(
+                app_logger,
+                batch_capacity=LOG_BATCH_CAPACITY).start())
 
     @property
     def log_field_styles(self):
@@ -163,6 +185,16 @@ class Runner(event.AReactive):
     def root_log_format(self) -> logging.Formatter:
         return logging.Formatter("%(name)s: %(levelname)s %(message)s")
 
+    @cached_property
+    def profiler(self) -> RunProfiler | None:
+        """Profiler for the run, if `--profile` was specified."""
+        if not self.args.profile:
+            return None
+        return RunProfiler(
+            self.args.profile,
+            memory_top=self.args.profile_memory,
+            slow_callback_duration=self.args.profile_slow_callback)
+
     @cached_property
     def root_log_handler(self) -> logging.Handler:
         """Instantiated logger."""
@@ -234,10 +266,47 @@ class Runner(event.AReactive):
             choices=[level[0] for level in LOG_LEVELS],
             default="warn",
             help="Log level for non-application logs")
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=jobs_arg,
+            default=None,
+            metavar="N",
+            help=(
+                "Maximum number of parallel jobs, defaults to (`auto`) the "
+                "number of CPUs available to the process, taking any "
+                "affinity mask or cgroup CPU quota into account"))
+        parser.add_argument(
+            "--profile",
+            metavar="DIR",
+            help=(
+                "Profile the run with cProfile, and write the profile "
+                "artifacts to this directory"))
+        parser.add_argument(
+            "--profile-memory",
+            metavar="N",
+            type=int,
+            default=0,
+            help=(
+                "When profiling, also trace memory allocations and report "
+                "the top N allocation sites"))
+        parser.add_argument(
+            "--profile-slow-callback",
+            metavar="SECONDS",
+            type=float,
+            default=0.1,
+            help=(
+                "When profiling, log event loop callbacks that take longer "
+                "than this, 0 disables"))
 
     async def cleanup(self) -> None:
         self._cleanup_tempdir()
 
+    def configure_jobs(self) -> None:
+        """Set the process-wide jobs budget from the `--jobs` arg."""
+        event.jobs.configure(self.args.jobs)
+        self.log.debug(f"Jobs budget: {event.jobs.limit}")
+
     def exit(self) -> int | None:
         self.root_logger.handlers[0].setLevel(logging.FATAL)
         self.stdout.handlers[0].setLevel(logging.FATAL)
@@ -247,6 +316,12 @@ class Runner(event.AReactive):
             uvloop.install()
         self.log.debug("Starting reactor...")
 
+    def log_executor_profile(self) -> None:
+        """Log the executor profile, if any calls were profiled."""
+        if event.profiler.calls:
+            self.log.info(
+                f"Executor profile:\n{event.profiler.report()}")
+
     def on_async_error(
             self,
             loop: asyncio.AbstractEventLoop,
@@ -265,7 +340,9 @@ class Runner(event.AReactive):
 
     def on_runner_start(self):
         self.setup_logging()
+        self.configure_jobs()
         self.start_reactor()
+        self.start_profiler()
 
     @cleansup
     async def run(self) -> int | None:
@@ -275,10 +352,27 @@ class Runner(event.AReactive):
         self.root_logger.debug("Start (async) root logger")
         self.log.debug("Start (async) app logger")
 
+    def shutdown_executors(self) -> None:
+        """Shutdown the shared executors, cancelling any pending work."""
+        event.executors.shutdown(cancel_futures=True)
+
+    def start_profiler(self) -> None:
+        if self.profiler:
+            self.profiler.start(self.loop)
+            self.log.debug(f"Profiling run to: {self.profiler.path}")
+
     def start_reactor(self):
         self.install_reactor()
         self.loop.set_exception_handler(self.on_async_error)
 
+    def stop_profiler(self) -> None:
+        if not self.profiler:
+            return
+        artifacts = self.profiler.stop()
+        self.log.info(
+            "Profile written to:\n"
+            + "\n".join(f"  {artifact}" for artifact in artifacts))
+
     @property
     def _missing_cleanup(self) -> bool:
         run_fun = getattr(self, "run", None)
@@ -0,0 +1,298 @@
+
+import asyncio
+import logging
+import pstats
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+from aio.run.runner import profiling
+
+
+@pytest.mark.parametrize("memory_top", [None, 0, 23])
+@pytest.mark.parametrize("slow", [None, 0, 0.5])
+def test_profiler_constructor(patches, memory_top, slow):
+    patched = patches(
+        "pathlib",
+        "cProfile",
+        prefix="aio.run.runner.profiling")
+    kwargs = {}
+    if memory_top is not None:
+        kwargs["memory_top"] = memory_top
+    if slow is not None:
+        kwargs["slow_callback_duration"] = slow
+
+    with patched as (m_plib, m_cprofile):
+        profiler = profiling.RunProfiler("PATH", **kwargs)
+
+    assert profiler.path == m_plib.Path.return_value
+    assert (
+        m_plib.Path.call_args
+        == [("PATH", ), {}])
+    assert profiler.memory_top == (memory_top or 0)
+    assert profiler.slow_callback_duration == slow
+    assert profiler.profile == m_cprofile.Profile.return_value
+    assert profiler._slow_callback_handler is None
+
+
+def test_profiler_asyncio_logger(patches):
+    profiler = profiling.RunProfiler("PATH")
+    patched = patches(
+        "logging",
+        prefix="aio.run.runner.profiling")
+
+    with patched as (m_logging, ):
+        assert (
+            profiler.asyncio_logger
+            == m_logging.getLogger.return_value)
+
+    assert (
+        m_logging.getLogger.call_args
+        == [("asyncio", ), {}])
+    assert "asyncio_logger" not in profiler.__dict__
+
+
+@pytest.mark.parametrize("memory_top", [0, 23])
+@pytest.mark.parametrize("slow", [None, 0, 0.5])
+def test_profiler_start(patches, memory_top, slow):
+    profiler = profiling.RunProfiler(
+        "PATH",
+        memory_top=memory_top,
+        slow_callback_duration=slow)
+    patched = patches(
+        "tracemalloc",
+        "RunProfiler._log_slow_callbacks",
+        prefix="aio.run.runner.profiling")
+    loop = MagicMock()
+
+    profiler.path = m_path = MagicMock()
+    profiler.profile = m_profile = MagicMock()
+
+    with patched as (m_trace, m_slow):
+        assert not profiler.start(loop)
+
+    assert (
+        m_path.mkdir.call_args
+        == [(), dict(parents=True, exist_ok=True)])
+    if slow:
+        assert (
+            m_slow.call_args
+            == [(loop, slow), {}])
+    else:
+        assert not m_slow.called
+    if memory_top:
+        assert (
+            m_trace.start.call_args
+            == [(), {}])
+    else:
+        assert not m_trace.start.called
+    assert (
+        m_profile.enable.call_args
+        == [(), {}])
+
+
+@pytest.mark.parametrize("tracing", [True, False])
+@pytest.mark.parametrize("slow", [True, False])
+def test_profiler_stop(patches, tracing, slow):
+    profiler = profiling.RunProfiler("PATH")
+    patched = patches(
+        "tracemalloc",
+        ("RunProfiler.asyncio_logger",
+         dict(new_callable=PropertyMock)),
+        "RunProfiler._write_memory",
+        "RunProfiler._write_profile",
+        prefix="aio.run.runner.profiling")
+    handler = MagicMock()
+    if slow:
+        profiler._slow_callback_handler = handler
+
+    profiler.path = m_path = MagicMock()
+    profiler.profile = m_profile = MagicMock()
+
+    with patched as patchy:
+        (m_trace, m_logger, m_memory, m_write) = patchy
+        m_trace.is_tracing.return_value = tracing
+        m_write.return_value = ["P1", "P2"]
+        m_memory.return_value = ["M1", "M2"]
+        artifacts = profiler.stop()
+
+    expected = ["P1", "P2"]
+    if tracing:
+        expected += ["M1", "M2"]
+    if slow:
+        expected.append(m_path.joinpath.return_value)
+    assert artifacts == expected
+    assert (
+        m_profile.disable.call_args
+        == [(), {}])
+    assert (
+        m_write.call_args
+        == [(), {}])
+    if tracing:
+        assert (
+            m_memory.call_args
+            == [(), {}])
+    else:
+        assert not m_memory.called
+    assert profiler._slow_callback_handler is None
+    if not slow:
+        assert not m_logger.called
+        return
+    assert (
+        m_logger.return_value.removeHandler.call_args
+        == [(handler, ), {}])
+    assert (
+        handler.close.call_args
+        == [(), {}])
+    assert (
+        m_path.joinpath.call_args
+        == [(profiling.SLOW_CALLBACKS, ), {}])
+
+
+def test_profiler__log_slow_callbacks(patches):
+    profiler = profiling.RunProfiler("PATH")
+    patched = patches(
+        "logging",
+        ("RunProfiler.asyncio_logger",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.runner.profiling")
+    loop = MagicMock()
+
+    profiler.path = m_path = MagicMock()
+
+    with patched as (m_logging, m_logger):
+        assert not profiler._log_slow_callbacks(loop, 0.5)
+
+    handler = m_logging.FileHandler.return_value
+    assert loop.slow_callback_duration == 0.5
+    assert (
+        loop.set_debug.call_args
+        == [(True, ), {}])
+    assert (
+        m_logging.FileHandler.call_args
+        == [(m_path.joinpath.return_value, ), {}])
+    assert (
+        m_path.joinpath.call_args
+        == [(profiling.SLOW_CALLBACKS, ), {}])
+    assert (
+        handler.setLevel.call_args
+        == [(m_logging.WARNING, ), {}])
+    assert (
+        handler.setFormatter.call_args
+        == [(m_logging.Formatter.return_value, ), {}])
+    assert (
+        m_logging.Formatter.call_args
+        == [("%(asctime)s %(message)s", ), {}])
+    assert (
+        m_logger.return_value.addHandler.call_args
+        == [(handler, ), {}])
+    assert profiler._slow_callback_handler == handler
+
+
+def test_profiler__write_memory(patches):
+    profiler = profiling.RunProfiler("PATH", memory_top=2)
+    patched = patches(
+        "tracemalloc",
+        prefix="aio.run.runner.profiling")
+    snapshot_path = MagicMock()
+    report_path = MagicMock()
+
+    profiler.path = m_path = MagicMock()
+
+    with patched as (m_trace, ):
+        m_path.joinpath.side_effect = [
+            snapshot_path, report_path]
+        snapshot = m_trace.take_snapshot.return_value
+        snapshot.statistics.return_value = ["S1", "S2", "S3"]
+        assert (
+            profiler._write_memory()
+            == [snapshot_path, report_path])
+
+    assert (
+        m_trace.stop.call_args
+        == [(), {}])
+    assert (
+        m_path.joinpath.call_args_list
+        == [[(profiling.MEMORY_SNAPSHOT, ), {}],
+            [(profiling.MEMORY_REPORT, ), {}]])
+    assert (
+        snapshot.dump.call_args
+        == [(str(snapshot_path), ), {}])
+    assert (
+        snapshot.statistics.call_args
+        == [("lineno", ), {}])
+    assert (
+        report_path.write_text.call_args
+        == [("S1\nS2\n", ), {}])
+
+
+def test_profiler__write_profile(patches):
+    profiler = profiling.RunProfiler("PATH")
+    patched = patches(
+        "io",
+        "pstats",
+        prefix="aio.run.runner.profiling")
+    stats_path = MagicMock()
+    report_path = MagicMock()
+
+    profiler.path = m_path = MagicMock()
+    profiler.profile = m_profile = MagicMock()
+
+    with patched as (m_io, m_pstats):
+        m_path.joinpath.side_effect = [
+            stats_path, report_path]
+        assert (
+            profiler._write_profile()
+            == [stats_path, report_path])
+
+    report = m_io.StringIO.return_value
+    stats = m_pstats.Stats.return_value
+    assert (
+        m_profile.dump_stats.call_args
+        == [(stats_path, ), {}])
+    assert (
+        m_pstats.Stats.call_args
+        == [(m_profile, ), dict(stream=report)])
+    assert (
+        stats.sort_stats.call_args
+        == [(m_pstats.SortKey.CUMULATIVE, ), {}])
+    assert (
+        stats.sort_stats.return_value.print_stats.call_args
+        == [(profiling.PROFILE_REPORT_LIMIT, ), {}])
+    assert (
+        report_path.write_text.call_args
+        == [(report.getvalue.return_value, ), {}])
+
+
+def test_profiler_artifacts(tmp_path):
+    profiler = profiling.RunProfiler(
+        tmp_path.joinpath("profile"),
+        memory_top=5,
+        slow_callback_duration=0.01)
+    loop = asyncio.new_event_loop()
+    logger = logging.getLogger("asyncio")
+    propagate = logger.propagate
+    logger.propagate = False
+
+    async def _slow():
+        sum(range(1000000))
+
+    try:
+        profiler.start(loop)
+        loop.run_until_complete(_slow())
+        artifacts = profiler.stop()
+    finally:
+        logger.propagate = propagate
+        loop.close()
+
+    assert (
+        [artifact.name for artifact in artifacts]
+        == [profiling.PROFILE_STATS,
+            profiling.PROFILE_REPORT,
+            profiling.MEMORY_SNAPSHOT,
+            profiling.MEMORY_REPORT,
+            profiling.SLOW_CALLBACKS])
+    assert all(artifact.exists() for artifact in artifacts)
+    assert pstats.Stats(str(artifacts[0])).total_calls
+    assert artifacts[3].read_text().count("\n") <= 5
+    assert "_slow" in artifacts[4].read_text()
@@ -1,4 +1,5 @@
 
+import argparse
 import logging
 import sys
 from unittest.mock import MagicMock, PropertyMock
@@ -17,6 +18,23 @@ class DummyRunner(runner.Runner):
         self.args = PropertyMock()
 
 
+@pytest.mark.parametrize(
+    "value",
+    ["auto", "1", "7", "0", "-3", "many", "1.5"])
+def test_runner_jobs_arg(value):
+    if value == "auto":
+        assert runner.runner.jobs_arg(value) is None
+        return
+    if value.isdigit() and int(value) > 0:
+        assert runner.runner.jobs_arg(value) == int(value)
+        return
+    with pytest.raises(argparse.ArgumentTypeError) as e:
+        runner.runner.jobs_arg(value)
+    assert (
+        e.value.args[0]
+        == f"must be `auto` or a positive integer: {value}")
+
+
 def test_verbose_logger():
     logger = runner.runner.VerboseLogger("LOGGER")
     assert isinstance(logger, verboselogs.VerboseLogger)
@@ -92,9 +110,14 @@ def test_runner_dunder_call(patches, raises):
         ("Runner._on_runner_error",
          dict(new_callable=MagicMock)),
         "Runner.on_runner_start",
+        "Runner.shutdown_executors",
+        "Runner.log_executor_profile",
+        "Runner.stop_profiler",
         prefix="aio.run.runner.runner")
 
-    with patched as (m_loop, m_run, m_error, m_start):
+    with patched as patchy:
+        (m_loop, m_run, m_error, m_start,
+         m_shutdown, m_profile, m_stop) = patchy
         if raises:
             error = raises("DIE")
             m_run.side_effect = error
@@ -120,6 +143,15 @@ def test_runner_dunder_call(patches, raises):
     assert (
         m_run.call_args
         == [(), {}])
+    assert (
+        m_shutdown.call_args
+        == [(), {}])
+    assert (
+        m_profile.call_args
+        == [(), {}])
+    assert (
+        m_stop.call_args
+        == [(), {}])
     if not raises:
         assert not m_error.called
         assert (
@@ -225,7 +257,8 @@ def test_runner_log(patches):
         == [(m_verbosity.return_value, ), {}])
     assert (
         m_log.QueueLogger.call_args
-        == [(m_verb.return_value, ), {}])
+        == [(m_verb.return_value, ),
+            dict(batch_capacity=runner.runner.LOG_BATCH_CAPACITY)])
     assert (
         m_log.QueueLogger.return_value.start.call_args
         == [(), {}])
@@ -288,6 +321,35 @@ def test_runner_path(patches):
         == [(".", ), {}])
 
 
+@pytest.mark.parametrize("profile", [None, "", "PROFILE_DIR"])
+def test_runner_profiler(patches, profile):
+    run = runner.Runner()
+    patched = patches(
+        ("Runner.args",
+         dict(new_callable=PropertyMock)),
+        "RunProfiler",
+        prefix="aio.run.runner.runner")
+
+    with patched as (m_args, m_profiler):
+        m_args.return_value.profile = profile
+        assert (
+            run.profiler
+            == (m_profiler.return_value
+                if profile
+                else None))
+
+    assert "profiler" in run.__dict__
+    if not profile:
+        assert not m_profiler.called
+        return
+    assert (
+        m_profiler.call_args
+        == [("PROFILE_DIR", ),
+            dict(memory_top=m_args.return_value.profile_memory,
+                 slow_callback_duration=(
+                     m_args.return_value.profile_slow_callback))])
+
+
 def test_runner_root_log_format(patches):
     run = DummyRunner()
     patched = patches(
@@ -488,7 +550,34 @@ def test_runner_add_arguments():
             [('--log-level', '-l'),
              {'choices': ['debug', 'info', "success", 'warn', 'error'],
               'default': 'warn',
-              'help': 'Log level for non-application logs'}]])
+              'help': 'Log level for non-application logs'}],
+            [('--jobs', '-j'),
+             {'type': runner.runner.jobs_arg,
+              'default': None,
+              'metavar': 'N',
+              'help': (
+                  "Maximum number of parallel jobs, defaults to (`auto`) the "
+                  "number of CPUs available to the process, taking any "
+                  "affinity mask or cgroup CPU quota into account")}],
+            [('--profile', ),
+             {'metavar': 'DIR',
+              'help': (
+                  "Profile the run with cProfile, and write the profile "
+                  "artifacts to this directory")}],
+            [('--profile-memory', ),
+             {'metavar': 'N',
+              'type': int,
+              'default': 0,
+              'help': (
+                  "When profiling, also trace memory allocations and report "
+                  "the top N allocation sites")}],
+            [('--profile-slow-callback', ),
+             {'metavar': 'SECONDS',
+              'type': float,
+              'default': 0.1,
+              'help': (
+                  "When profiling, log event loop callbacks that take longer "
+                  "than this, 0 disables")}]])
 
 
 async def test_runner_cleanup(patches):
@@ -505,6 +594,65 @@ async def test_runner_cleanup(patches):
         == [(), {}])
 
 
+def test_runner_configure_jobs(patches):
+    run = DummyRunner()
+    patched = patches(
+        "event",
+        ("Runner.log",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.runner.runner")
+
+    with patched as (m_event, m_log):
+        assert not run.configure_jobs()
+
+    assert (
+        m_event.jobs.configure.call_args
+        == [(run.args.jobs, ), {}])
+    assert (
+        m_log.return_value.debug.call_args
+        == [(f"Jobs budget: {m_event.jobs.limit}", ), {}])
+
+
+@pytest.mark.parametrize("calls", [True, False])
+def test_runner_log_executor_profile(patches, calls):
+    run = runner.Runner()
+    patched = patches(
+        "event",
+        ("Runner.log",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.runner.runner")
+
+    with patched as (m_event, m_log):
+        m_event.profiler.calls = (
+            dict(NAME=["CALL"])
+            if calls
+            else {})
+        m_event.profiler.report.return_value = "REPORT"
+        assert not run.log_executor_profile()
+
+    if not calls:
+        assert not m_log.called
+        assert not m_event.profiler.report.called
+        return
+    assert (
+        m_log.return_value.info.call_args
+        == [("Executor profile:\nREPORT", ), {}])
+
+
+def test_runner_shutdown_executors(patches):
+    run = runner.Runner()
+    patched = patches(
+        "event",
+        prefix="aio.run.runner.runner")
+
+    with patched as (m_event, ):
+        assert not run.shutdown_executors()
+
+    assert (
+        m_event.executors.shutdown.call_args
+        == [(), dict(cancel_futures=True)])
+
+
 def test_runner_exit(patches):
     run = DummyRunner()
     patched = patches(
@@ -582,18 +730,26 @@ def test_runner_on_runner_start(patches):
     run = DummyRunner()
     patched = patches(
         "Runner.setup_logging",
+        "Runner.configure_jobs",
         "Runner.start_reactor",
+        "Runner.start_profiler",
         prefix="aio.run.runner.runner")
 
-    with patched as (m_logging, m_reactor):
+    with patched as (m_logging, m_jobs, m_reactor, m_profiler):
         assert not run.on_runner_start()
 
     assert (
         m_logging.call_args
         == [(), {}])
+    assert (
+        m_jobs.call_args
+        == [(), {}])
     assert (
         m_reactor.call_args
         == [(), {}])
+    assert (
+        m_profiler.call_args
+        == [(), {}])
 
 
 def test_runner_setup_logging(patches):
@@ -616,6 +772,35 @@ def test_runner_setup_logging(patches):
         == [("Start (async) app logger", ), {}])
 
 
+@pytest.mark.parametrize("profiler", [True, False])
+def test_runner_start_profiler(patches, profiler):
+    run = DummyRunner()
+    patched = patches(
+        ("Runner.log",
+         dict(new_callable=PropertyMock)),
+        ("Runner.loop",
+         dict(new_callable=PropertyMock)),
+        ("Runner.profiler",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.runner.runner")
+
+    with patched as (m_log, m_loop, m_profiler):
+        if not profiler:
+            m_profiler.return_value = None
+        assert not run.start_profiler()
+
+    if not profiler:
+        assert not m_loop.called
+        assert not m_log.called
+        return
+    assert (
+        m_profiler.return_value.start.call_args
+        == [(m_loop.return_value, ), {}])
+    assert (
+        m_log.return_value.debug.call_args
+        == [(f"Profiling run to: {m_profiler.return_value.path}", ), {}])
+
+
 def test_runner_start_reactor(patches):
     runner = DummyRunner()
     patched = patches(
@@ -639,6 +824,34 @@ def test_runner_start_reactor(patches):
         == [(m_onerror, ), {}])
 
 
+@pytest.mark.parametrize("profiler", [True, False])
+def test_runner_stop_profiler(patches, profiler):
+    run = DummyRunner()
+    patched = patches(
+        ("Runner.log",
+         dict(new_callable=PropertyMock)),
+        ("Runner.profiler",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.runner.runner")
+
+    with patched as (m_log, m_profiler):
+        if profiler:
+            m_profiler.return_value.stop.return_value = ["A1", "A2"]
+        else:
+            m_profiler.return_value = None
+        assert not run.stop_profiler()
+
+    if not profiler:
+        assert not m_log.called
+        return
+    assert (
+        m_profiler.return_value.stop.call_args
+        == [(), {}])
+    assert (
+        m_log.return_value.info.call_args
+        == [("Profile written to:\n  A1\n  A2", ), {}])
+
+
 @pytest.mark.parametrize("has_fun", [True, False])
 @pytest.mark.parametrize("is_wrapped", [True, False])
 @pytest.mark.parametrize("cleansup", [True, False])
@@ -1,3 +1,4 @@
+from __future__ import annotations
 
 import asyncio
 import json
@@ -5,19 +6,28 @@ import pathlib
 from collections.abc import AsyncGenerator, AsyncIterator, Mapping
 from concurrent import futures
 from functools import cached_property
+from typing import TYPE_CHECKING
 
-import aiohttp
 from packaging import version as _version
 
 import abstracts
 
-from aio.api import github as _github
-from aio.core import directory as _directory, event
+from aio.core import directory as _directory, event, utils as _utils
 from aio.core.functional import async_property
 
 from envoy.base import utils
 from envoy.base.utils import exceptions, interface, typing
 
+if TYPE_CHECKING:
+    import aiohttp
+
+    from aio.api import github as _github
+else:
+    # Only needed for github/http operations, which most project
+    # checks do not use.
+    aiohttp = _utils.lazy_import("aiohttp")
+    _github = _utils.lazy_import("aio.api.github")
+
 
 ENVOY_REPO = "envoyproxy/envoy"
 MAIN_BRANCH = "main"
@@ -1,23 +1,36 @@
+from __future__ import annotations
 
 import json
 import pathlib
 from collections.abc import Callable
 from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
 
 import yaml as _yaml
 
-from google.protobuf import descriptor, descriptor_pb2
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import json_format
-from google.protobuf import (
-    message_factory,
-    message as _message)
-
 import abstracts
 
+from aio.core import utils
+
 from envoy.base.utils import interface
 from envoy.base.utils.yaml import EnvoyLoader
 
+if TYPE_CHECKING:
+    from google.protobuf import descriptor, descriptor_pb2
+    from google.protobuf import descriptor_pool as _descriptor_pool
+    from google.protobuf import json_format
+    from google.protobuf import (
+        message_factory,
+        message as _message)
+else:
+    # Protobuf is only needed to validate data, so is loaded on first use.
+    descriptor = utils.lazy_import("google.protobuf.descriptor")
+    descriptor_pb2 = utils.lazy_import("google.protobuf.descriptor_pb2")
+    _descriptor_pool = utils.lazy_import("google.protobuf.descriptor_pool")
+    json_format = utils.lazy_import("google.protobuf.json_format")
+    message_factory = utils.lazy_import("google.protobuf.message_factory")
+    _message = utils.lazy_import("google.protobuf.message")
+
 
 BOOTSTRAP_PROTO = "envoy.config.bootstrap.v3.Bootstrap"
 
@@ -1,3 +1,4 @@
+from __future__ import annotations
 
 import asyncio
 import json
@@ -7,17 +8,23 @@ import os
 import pathlib
 import time
 from functools import cached_property
-from typing import IO
+from typing import IO, TYPE_CHECKING
 from urllib.parse import urlsplit
 
-import aiohttp
-
-import gnupg  # type:ignore
-
+from aio.core import utils as _utils
 from aio.core.tasks import concurrent, ConcurrentExecutionError
 from aio.run import runner
 from envoy.base import utils
 
+if TYPE_CHECKING:
+    import aiohttp
+    import gnupg  # type:ignore
+else:
+    # Loaded when a fetch is run, rather than when `envoy.base.utils`
+    # is imported.
+    aiohttp = _utils.lazy_import("aiohttp")
+    gnupg = _utils.lazy_import("gnupg")
+
 
 DEFAULT_CHUNK_SIZE = 32768
 DEFAULT_MAX_CONCURRENCY = 3
@@ -5,18 +5,24 @@ import pathlib
 from collections.abc import (
     AsyncGenerator, ItemsView, Iterator, KeysView,
     ValuesView)
+from typing import TYPE_CHECKING
 
-import aiohttp
-from google.protobuf import descriptor_pool as _descriptor_pool
 from packaging import version as _version
 
 import abstracts
 
-from aio.api import github as _github
 from aio.core import directory as _directory, event
 
 from envoy.base.utils import typing
 
+if TYPE_CHECKING:
+    # These are only used for type annotations, and are relatively
+    # expensive to import.
+    import aiohttp
+    from google.protobuf import descriptor_pool as _descriptor_pool
+
+    from aio.api import github as _github
+
 
 class IProtobufSet(metaclass=abstracts.Interface):
 
@@ -1,13 +1,20 @@
+from __future__ import annotations
 
 import argparse
 import importlib
 import pathlib
 from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
 
-import jinja2
+from aio.core import utils
 
 from .descriptors import classproperty
 
+if TYPE_CHECKING:
+    import jinja2
+else:
+    jinja2 = utils.lazy_import("jinja2")
+
 
 class JinjaEnvironment:
 
@@ -2,12 +2,12 @@
 import asyncio
 import argparse
 import math
-import os
 import shlex
 from collections.abc import Iterable, Iterator
 from functools import cached_property
 from itertools import batched
 
+from aio.core import event
 from aio.run import runner
 
 
@@ -23,7 +23,7 @@ class ParallelRunner(runner.Runner):
 
     @cached_property
     def cpu_count(self) -> int:
-        return os.cpu_count() or 1
+        return event.jobs.limit
 
     @property
     def items(self) -> list[str]:
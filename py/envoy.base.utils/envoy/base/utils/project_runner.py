@@ -1,20 +1,27 @@
+from __future__ import annotations
 
 import json
 import os
 import pathlib
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from packaging import version as _version
 
-import aiohttp
 from frozendict import frozendict
 
 from aio.api.github import exceptions as github_exceptions
+from aio.core import utils as _utils
 from aio.run import runner
 
 from envoy.base import utils
 from envoy.base.utils import exceptions, interface, typing
 
+if TYPE_CHECKING:
+    import aiohttp
+else:
+    aiohttp = _utils.lazy_import("aiohttp")
+
 
 ENV_GITHUB_TOKEN = "GITHUB_TOKEN"
 # TODO: move these to config
@@ -0,0 +1,37 @@
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+LOADED = """
+import importlib, json, sys, types
+importlib.import_module(sys.argv[1])
+print(json.dumps([
+    name
+    for name
+    in sys.argv[2:]
+    if type(sys.modules.get(name)) is types.ModuleType]))
+"""
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["aiohttp",
+     "gidgethub.aiohttp",
+     "gidgethub.apps",
+     "gnupg",
+     "google.protobuf.descriptor_pb2",
+     "google.protobuf.json_format",
+     "google.protobuf.message_factory",
+     "jinja2"])
+def test_import_is_lazy(module):
+    response = subprocess.run(
+        [sys.executable, "-c", LOADED, "envoy.base.utils", module],
+        capture_output=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    assert json.loads(response.stdout) == []
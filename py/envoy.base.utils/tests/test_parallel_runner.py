@@ -93,16 +93,14 @@ def test_parallelrunner_batches(iters, patches):
     assert "batches" not in runner.__dict__
 
 
-@pytest.mark.parametrize("count", [None, "", 23, "COUNT"])
-def test_parallelrunner_cpu_count(patches, count):
+def test_parallelrunner_cpu_count(patches):
     runner = utils.ParallelRunner()
     patched = patches(
-        "os",
+        "event",
         prefix="envoy.base.utils.parallel_runner")
 
-    with patched as (m_os, ):
-        m_os.cpu_count.return_value = count
-        assert runner.cpu_count == (count or 1)
+    with patched as (m_event, ):
+        assert runner.cpu_count == m_event.jobs.limit
 
     assert "cpu_count" in runner.__dict__
 
@@ -0,0 +1,153 @@
+"""Time of matching extension directories against CODEOWNERS, before and
+after compiling it into a trie.
+
+A synthetic CODEOWNERS file is generated, with `--lines` lines. Most
+lines own an extension, and the remainder own other paths or are comments.
+The extension directories to check include the owned directories, some
+directories below them, and some that have no owners.
+
+`linear` compares each directory against every owned path, as the check
+did previously.
+
+`trie` uses the check's `_owners_error_matches`, with a new trie for each
+run, so its time includes compiling it.
+
+Names in the generated file are padded, so that no path is a string prefix
+of another path that it is not also a component prefix of. Both modes must
+then find the same errors. The modes are run in turn, and the best of
+`--runs` is reported.
+
+Run with:
+
+    python benchmarks/bench_codeowners.py [--runs N] [--lines N]
+"""
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+from functools import cached_property
+
+from envoy.code.check import AExtensionsCheck
+
+
+CATEGORIES = (
+    "filters/http",
+    "filters/network",
+    "filters/listener",
+    "tracers",
+    "transport_sockets")
+
+
+class ExtensionsCheck(AExtensionsCheck):
+
+    @cached_property
+    def maintainers(self) -> set[str]:
+        return {"@maintainer0"}
+
+
+def generate(lines: int) -> tuple[str, list[str]]:
+    """Generate CODEOWNERS content, and the directories to check."""
+    content = []
+    directories = []
+    for i in range(0, lines):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        if i % 10 == 0:
+            content.append(f"# Extension group {i:05}")
+            continue
+        if i % 10 == 1:
+            content.append(f"/source/common/module_{i:05}/ @owner{i % 97}")
+            continue
+        if i % 10 == 2:
+            content.append(
+                f"/contrib/{category}/source/extension_{i:05}/ "
+                f"@owner{i % 89} @maintainer0")
+            directories.append(f"contrib/{category}/source/extension_{i:05}")
+            continue
+        extension = f"source/extensions/{category}/extension_{i:05}"
+        content.append(f"/{extension}/ @owner{i % 97} @maintainer0")
+        directories.append(extension)
+        if i % 10 == 3:
+            directories.append(f"{extension}/common")
+        if i % 10 == 4:
+            directories.append(
+                f"source/extensions/{category}/unowned_{i:05}")
+    return "\n".join(content) + "\n", directories
+
+
+def run_linear(checker, directories) -> dict[str, tuple[str, ...]]:
+    tracked = checker.tracked_ownership
+
+    def matches(path) -> tuple[str, ...]:
+        _skip = (
+            not checker._owners_expected(path)
+            or path.startswith(tracked))
+        if _skip:
+            return ()
+        for owned in tracked:
+            if owned.startswith(path):
+                return ()
+        return (f"Directory ({path}) has no owners in CODEOWNERS", )
+
+    return {path: matches(path) for path in directories}
+
+
+def run_trie(checker, directories) -> dict[str, tuple[str, ...]]:
+    checker.__dict__.pop("tracked_ownership_trie", None)
+    return {
+        path: checker._owners_error_matches(path)
+        for path
+        in directories}
+
+
+def bench(modes, checker, directories, runs) -> dict[str, dict]:
+    # Modes are run in turn, so that neither gains from running later.
+    times: dict[str, list[float]] = {name: [] for name in modes}
+    errors: dict[str, dict] = {}
+    for _ in range(runs):
+        for name, fun in modes.items():
+            start = time.perf_counter()
+            errors[name] = fun(checker, directories)
+            times[name].append(time.perf_counter() - start)
+    for name, timed in times.items():
+        print(
+            f"{name:<8} best {min(timed) * 1000:.1f}ms "
+            f"(mean {sum(timed) / len(timed) * 1000:.1f}ms, "
+            f"{len([e for e in errors[name].values() if e])} errors)")
+    return errors
+
+
+def main(*args: str) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--lines", type=int, default=10000)
+    parsed = parser.parse_args(args)
+    content, directories = generate(parsed.lines)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        codeowners = pathlib.Path(tmpdir).joinpath("CODEOWNERS")
+        codeowners.write_text(content)
+        checker = ExtensionsCheck(
+            tmpdir,
+            extensions_build_config="BUILD",
+            owners="OWNERS",
+            codeowners=str(codeowners))
+        # Parsing CODEOWNERS is the same for both modes.
+        checker.tracked_ownership
+    print(
+        f"{parsed.lines} CODEOWNERS lines, "
+        f"{len(checker.tracked_ownership)} owned paths, "
+        f"{len(directories)} directories")
+    errors = bench(
+        dict(linear=run_linear, trie=run_trie),
+        checker,
+        directories,
+        parsed.runs)
+    if errors["linear"] != errors["trie"]:
+        print("Errors differ between modes")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:]))
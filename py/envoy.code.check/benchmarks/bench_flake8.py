@@ -0,0 +1,128 @@
+"""Time of the flake8 check over a repository, before and after sharding.
+
+`single` runs all files in one pool call, with a newly built flake8 app
+that uses its own multiprocessing, as the check did previously.
+
+`sharded` runs the files in batches of similar size across the pool, with
+an app built once in each worker (when it is initialized), as the check
+does now.
+
+Both modes must find the same errors. The modes are run in turn, and the
+best of `--runs` is reported. Each run uses a new pool, and includes the
+time to start it.
+
+Run with:
+
+    python benchmarks/bench_flake8.py [--runs N] [--jobs N] [PATH]
+"""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from concurrent import futures
+
+from aio.core import event, functional
+
+from envoy.code.check import AFlake8Check
+from envoy.code.check.abstract import flake8
+
+
+def check_single(path: str, files: set[str]) -> list[str]:
+    args = (
+        "--color=never",
+        "--config",
+        str(pathlib.Path(path).joinpath(flake8.FLAKE8_CONFIG)),
+        path)
+    return flake8.Flake8App(path, args).run_checks(files)
+
+
+def files_for(path: str) -> set[str]:
+    """Python files tracked by git in `path`, that flake8 would check."""
+    response = subprocess.run(
+        ["git", "ls-files", "--", "*.py"],
+        cwd=path,
+        capture_output=True,
+        text=True,
+        check=True)
+    return AFlake8Check.filter_flake8_files(
+        path,
+        AFlake8Check.flake8_args_for(path),
+        set(response.stdout.splitlines()))
+
+
+def run_single(path: str, files: set[str], jobs: int) -> list[str]:
+    with futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        return pool.submit(check_single, path, files).result()
+
+
+def run_sharded(path: str, files: set[str], jobs: int) -> list[str]:
+    args = AFlake8Check.flake8_args_for(path)
+    batches = functional.balanced_batches(
+        AFlake8Check.file_costs(path, files, flake8.FLAKE8_FILE_COST),
+        jobs * flake8.FLAKE8_BATCHES_PER_JOB)
+    with futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=AFlake8Check.initialize_worker,
+            initargs=(path, )) as pool:
+        return [
+            error
+            for result
+            in [pool.submit(
+                    AFlake8Check.check_flake8_files,
+                    path,
+                    args,
+                    *batch)
+                for batch
+                in batches]
+            for error
+            in result.result()]
+
+
+def bench(modes, path, files, jobs, runs) -> dict[str, list[str]]:
+    # Modes are run in turn, so that neither gains from running later,
+    # eg with a warmer page cache.
+    times: dict[str, list[float]] = {name: [] for name in modes}
+    errors: dict[str, list[str]] = {}
+    for _ in range(runs):
+        for name, fun in modes.items():
+            start = time.perf_counter()
+            errors[name] = fun(path, files, jobs)
+            times[name].append(time.perf_counter() - start)
+    for name, timed in times.items():
+        print(
+            f"{name:<8} best {min(timed):.2f}s "
+            f"(mean {sum(timed) / len(timed):.2f}s, "
+            f"{len(errors[name])} errors)")
+    return errors
+
+
+def main(*args: str) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", nargs="?", default=os.getcwd())
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=event.jobs.limit,
+        help="Number of pool workers")
+    parsed = parser.parse_args(args)
+    path = str(pathlib.Path(parsed.path).resolve())
+    files = files_for(path)
+    print(f"{len(files)} files, {parsed.jobs} jobs")
+    errors = bench(
+        dict(single=run_single, sharded=run_sharded),
+        path,
+        files,
+        parsed.jobs,
+        parsed.runs)
+    if sorted(errors["single"]) != sorted(errors["sharded"]):
+        print("Errors differ between modes")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:]))
@@ -20,7 +20,9 @@ from .yapf import AYapfCheck
 from . import (
     base,
     checker,
+    codeowners,
     extensions,
+    files,
     flake8,
     glint,
     gofmt,
@@ -51,7 +53,9 @@ __all__ = (
     "AYapfCheck",
     "base",
     "checker",
+    "codeowners",
     "extensions",
+    "files",
     "flake8",
     "glint",
     "gofmt",
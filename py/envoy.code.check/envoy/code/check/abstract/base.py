@@ -1,15 +1,27 @@
 
 import asyncio
+import logging
+from collections.abc import Iterable
 from concurrent import futures
+from functools import cached_property
+from importlib import metadata
 
 import abstracts
 
-from aio.core import event
+from aio.core import event, functional
 from aio.core.directory import ADirectory
 from aio.core.functional import async_property
+from aio.run import checker
 
 from envoy.base import utils
 from envoy.code.check import interface, typing
+from envoy.code.check.abstract.files import FileIndex
+
+
+# Packages whose version can change the outcome of a check, eg with new rules.
+FINGERPRINT_PACKAGES = ("aio.run.checker", "envoy.code.check")
+
+logger = logging.getLogger(__name__)
 
 
 @abstracts.implementer(event.IExecutive)
@@ -22,34 +34,143 @@ class ACodeCheck(event.AExecutive, metaclass=abstracts.Abstraction):
             binaries: dict[str, str] | None = None,
             config: typing.YAMLConfigDict | None = None,
             loop: asyncio.AbstractEventLoop | None = None,
-            pool: futures.Executor | None = None) -> None:
+            pool: futures.Executor | None = None,
+            shard: checker.sharding.Shard | None = None,
+            file_index: interface.IFileIndex | None = None) -> None:
         self.directory = directory
         self.config = config
         self._fix = fix
         self._loop = loop
         self._pool = pool
         self._binaries = binaries
+        self.shard = shard
+        self._file_index = file_index
+
+    @classmethod
+    def initialize_worker(cls, path: str) -> None:
+        """Prepare a pool worker process to run this check in the directory
+        at `path`.
+
+        This is called once in each worker of the checker's pool, so that
+        tools can be imported, and their config built, once per process
+        rather than for every batch.
+
+        The pool is shared with other checks, so this should not raise.
+        """
+        pass
 
     @property
     def binaries(self) -> dict[str, str]:
         return self._binaries or {}
 
+    @cached_property
+    def file_index(self) -> interface.IFileIndex:
+        """Classification of the directory's files, shared with other checks
+        if it was passed in."""
+        return self._file_index or FileIndex(
+            self.directory,
+            loop=self._loop,
+            pool=self._pool)
+
+    @async_property
+    async def fingerprint(self) -> str | None:
+        """Fingerprint of the check's inputs, or `None` if the check does
+        not support caching.
+
+        Checks are not cached if the versions of the packages that implement
+        them are not known.
+        """
+        if (paths := await self.fingerprint_paths) is None:
+            return None
+        if (versions := self.package_versions) is None:
+            return None
+        return await asyncio.to_thread(
+            checker.fingerprint,
+            type(self).__name__,
+            *versions,
+            *await self.fingerprint_parts,
+            root=self.directory.path,
+            paths=paths)
+
+    @cached_property
+    def package_versions(self) -> tuple[str, ...] | None:
+        """Versions of the packages that implement the check, or `None` if
+        any of them is not installed (eg when run from source)."""
+        try:
+            return tuple(
+                f"{package}=={metadata.version(package)}"
+                for package
+                in FINGERPRINT_PACKAGES)
+        except metadata.PackageNotFoundError as e:
+            logger.warning(
+                f"Not caching {type(self).__name__}, "
+                f"version of {e.name} is unknown as it is not installed")
+            return None
+
+    @async_property
+    async def fingerprint_parts(self) -> tuple[str, ...]:
+        """Anything other than input files that affects the outcome of the
+        check, eg tool versions."""
+        return ()
+
+    @async_property
+    async def fingerprint_paths(self) -> Iterable[str] | None:
+        """Input files of the check, relative to its directory.
+
+        Checks that do not provide these are not cached.
+        """
+        return None
+
 
 @abstracts.implementer(interface.IFileCodeCheck)
 class AFileCodeCheck(ACodeCheck, metaclass=abstracts.Abstraction):
 
+    async def file_costs(
+            self,
+            files: Iterable[str],
+            file_cost: int = 0) -> dict[str, int]:
+        """Estimated cost of checking each file, its size in bytes plus
+        `file_cost`."""
+        return {
+            file: size + file_cost
+            for file, size
+            in (await self.file_index.sizes(*files)).items()}
+
     @async_property
     @abstracts.interfacemethod
     async def checker_files(self) -> set[str]:
         raise NotImplementedError
 
+    async def file_batches(
+            self,
+            batches_per_job: int,
+            file_cost: int = 0) -> list[list[str]]:
+        """Files to check, split into batches of similar cost to run across
+        the pool.
+
+        Files are split into `batches_per_job` batches for each job in the
+        jobs budget, so that work is spread across the pool if some batches
+        take longer than estimated.
+        """
+        if not (files := await self.files):
+            return []
+        return functional.balanced_batches(
+            await self.file_costs(files, file_cost),
+            event.jobs.limit * batches_per_job)
+
     @async_property(cache=True)
     async def files(self) -> set[str]:
+        """Files to check, only those assigned to the shard if set."""
         files = await self.directory.files
-        return (
-            files & await self.checker_files
-            if files
-            else files)
+        if files:
+            files = files & await self.checker_files
+        if not self.shard:
+            return files
+        return set(
+            path
+            for path
+            in files
+            if checker.sharding.in_shard(path, self.shard))
 
     @property
     def fix(self) -> bool:
@@ -72,3 +193,22 @@ class AProjectCodeCheck(ACodeCheck, metaclass=abstracts.Abstraction):
             **kwargs) -> None:
         self.project = project
         super().__init__(project.directory, *args, **kwargs)
+
+    @property
+    def changelog_paths(self) -> tuple[str, ...]:
+        """The project's version file and changelog files, relative to the
+        project."""
+        # Changelogs (and their config) are found from the directories of
+        # the project's changelogs.
+        changelog_dirs = set(
+            path.parent
+            for path
+            in self.project.changelogs.changelog_paths.values())
+        return (
+            str(self.project.rel_version_path),
+            *(str(path.relative_to(self.project.path))
+              for changelogs
+              in sorted(changelog_dirs)
+              for path
+              in changelogs.rglob("*")
+              if path.is_file()))
@@ -396,3 +396,7 @@ class AChangelogCheck(
             self.changelog_status_class(self, changelog)
             for changelog
             in self.project.changelogs.values())
+
+    @async_property
+    async def fingerprint_paths(self) -> tuple[str, ...]:
+        return self.changelog_paths
@@ -4,7 +4,7 @@ import abc
 import argparse
 import pathlib
 import re
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from functools import cached_property
 
 import yaml
@@ -20,6 +20,7 @@ from aio.run import checker
 from envoy.base import utils
 from envoy.base.utils import IProject
 from envoy.code.check import exceptions, interface, typing
+from envoy.code.check.abstract import files
 
 
 # TODO: Add a README in envoy repo with info on how to fix and maybe use
@@ -69,6 +70,13 @@ class ACodeChecker(
         "runtime_guards",
         "shellcheck",
         "yamllint")
+    sharded_checks = (
+        "glint",
+        "gofmt",
+        "python_yapf",
+        "python_flake8",
+        "shellcheck",
+        "yamllint")
 
     @property
     def all_files(self) -> bool:
@@ -114,7 +122,9 @@ class ACodeChecker(
             fix=self.fix,
             binaries=self.binaries,
             loop=self.loop,
-            pool=self.pool)
+            pool=self.pool,
+            shard=self.shard,
+            file_index=self.file_index)
 
     @cached_property
     def config(self) -> typing.YAMLConfigDict:
@@ -166,6 +176,14 @@ class ACodeChecker(
     def extensions_class(self) -> type["interface.IExtensionsCheck"]:
         raise NotImplementedError
 
+    @cached_property
+    def file_index(self) -> "interface.IFileIndex":
+        """Classification of the files to check, shared by the checks."""
+        return files.FileIndex(
+            self.directory,
+            loop=self.loop,
+            pool=self.pool)
+
     @cached_property
     def flake8(self) -> "interface.IFlake8Check":
         """Flake8 checker."""
@@ -219,6 +237,20 @@ class ACodeChecker(
     def path(self) -> pathlib.Path:
         return super().path
 
+    @property
+    def pool_initializers(self) -> tuple[tuple[Callable, tuple], ...]:
+        """Prepare pool workers for the checks that will run in them."""
+        path = str(self.directory.path)
+        worker_checks: dict[str, type[interface.ICodeCheck]] = dict(
+            python_flake8=self.flake8_class,
+            python_yapf=self.yapf_class,
+            yamllint=self.yamllint_class)
+        return tuple(
+            (check_class.initialize_worker, (path, ))  # type:ignore
+            for check, check_class
+            in worker_checks.items()
+            if check in self.checks_to_run)
+
     @cached_property
     def project(self) -> IProject:
         return self.project_class(self.path)
@@ -233,6 +265,7 @@ class ACodeChecker(
         """Runtime guards checker."""
         return self.runtime_guards_class(
             self.project,
+            mentions_cache=self.args.runtime_guards_cache,
             **self.check_kwargs)
 
     @property  # type:ignore
@@ -291,6 +324,12 @@ class ACodeChecker(
         parser.add_argument("--owners")
         parser.add_argument("--extensions_build_config")
         parser.add_argument("--extensions_fuzzed_count")
+        parser.add_argument(
+            "--runtime_guards_cache",
+            metavar="FILE",
+            help=("Store the runtime guards mentioned in released "
+                  "changelogs in this file, so that unchanged changelogs "
+                  "are not parsed again"))
 
     async def check_changelog(self):
         for changelog in self.changelog:
@@ -381,6 +420,30 @@ class ACodeChecker(
         """Check for yamllint issues."""
         await self._code_check(self.yamllint)
 
+    async def fingerprint_changelog(self) -> str | None:
+        return await self.changelog.fingerprint
+
+    async def fingerprint_extensions_fuzzed(self) -> str | None:
+        return await self.extensions.fingerprint
+
+    async def fingerprint_extensions_metadata(self) -> str | None:
+        return await self.extensions.fingerprint
+
+    async def fingerprint_extensions_owners(self) -> str | None:
+        return await self.extensions.fingerprint
+
+    async def fingerprint_extensions_registered(self) -> str | None:
+        return await self.extensions.fingerprint
+
+    async def fingerprint_runtime_guards(self) -> str | None:
+        return await self.runtime_guards.fingerprint
+
+    async def fingerprint_shellcheck(self) -> str | None:
+        return await self.shellcheck.fingerprint
+
+    async def fingerprint_yamllint(self) -> str | None:
+        return await self.yamllint.fingerprint
+
     @checker.preload(
         when=["changelog"],
         catches=[utils.exceptions.ChangelogParseError])
@@ -456,20 +519,25 @@ class ACodeChecker(
             problem_files: typing.ProblemDict) -> None:
         # This can be slow/blocking for large result sets, run
         # in a separate thread
+        successes = []
         for path in sorted(check_files):
             if path not in problem_files:
-                self.succeed(
-                    self.active_check,
-                    [path])
+                successes.append(path)
                 continue
             if problem_files[path].errors:
                 self.error(
                     self.active_check,
-                    problem_files[path].errors)
+                    problem_files[path].errors,
+                    path=path)
             if problem_files[path].warnings:
                 self.warn(
                     self.active_check,
-                    problem_files[path].warnings)
+                    problem_files[path].warnings,
+                    path=path)
+        if successes:
+            # Record all successes at once, rather than one call (and
+            # potentially one log line) per file.
+            self.succeed(self.active_check, successes)
 
     async def _code_check(self, check: "interface.IFileCodeCheck") -> None:
         await self.loop.run_in_executor(
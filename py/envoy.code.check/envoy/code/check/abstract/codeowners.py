@@ -0,0 +1,67 @@
+
+from collections.abc import Iterable
+
+
+class _Node:
+    __slots__ = ("children", "match")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_Node"] = {}
+        self.match: tuple[int, str] | None = None
+
+
+class CodeOwnersTrie:
+    """Paths from CODEOWNERS, compiled into a trie of path components.
+
+    Paths match by whole component, so `foo/bar` matches `foo/bar/baz` but
+    not `foo/barbaz`. Where more than one path matches, the one added last
+    wins, as it does for CODEOWNERS.
+
+    Lookups take time in proportion to the depth of the path, rather than
+    the number of paths, and are memoized.
+    """
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        self.root = _Node()
+        self._matches: dict[str, str | None] = {}
+        self._within: dict[str, bool] = {}
+        for index, path in enumerate(paths):
+            node = self.root
+            for part in self.parts(path):
+                node = node.children.setdefault(part, _Node())
+            node.match = (index, path)
+
+    @staticmethod
+    def parts(path: str) -> list[str]:
+        return [part for part in path.split("/") if part]
+
+    def match(self, path: str) -> str | None:
+        """The last added path that `path` is at, or below."""
+        if path not in self._matches:
+            self._matches[path] = self._match(path)
+        return self._matches[path]
+
+    def within(self, path: str) -> bool:
+        """Whether any path was added at, or below, `path`."""
+        if path not in self._within:
+            self._within[path] = self._is_within(path)
+        return self._within[path]
+
+    def _match(self, path: str) -> str | None:
+        node = self.root
+        match = node.match
+        for part in self.parts(path):
+            if (child := node.children.get(part)) is None:
+                break
+            node = child
+            if node.match and (not match or node.match[0] > match[0]):
+                match = node.match
+        return match[1] if match else None
+
+    def _is_within(self, path: str) -> bool:
+        node = self.root
+        for part in self.parts(path):
+            if (child := node.children.get(part)) is None:
+                return False
+            node = child
+        return bool(node.children or node.match)
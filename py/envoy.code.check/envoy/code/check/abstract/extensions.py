@@ -16,6 +16,7 @@ from aio.core import functional, utils
 from aio.core.functional import async_property
 
 from envoy.code.check import abstract, exceptions, interface, typing
+from envoy.code.check.abstract.codeowners import CodeOwnersTrie
 
 
 logger = logging.getLogger(__name__)
@@ -137,6 +138,26 @@ class AExtensionsCheck(abstract.ACodeCheck, metaclass=abstracts.Abstraction):
             for posture
             in self.extensions_schema["status_values"]]
 
+    @async_property
+    async def fingerprint_parts(self) -> tuple[str, ...]:
+        return (
+            str(self._fuzzed_count),
+            *sorted(await self.tracked_directories))
+
+    @async_property
+    async def fingerprint_paths(self) -> tuple[str, ...]:
+        return tuple(
+            str(path)
+            for path
+            in (self.extensions_build_config,
+                self._owners,
+                self._codeowners,
+                self.metadata_core_path,
+                self.metadata_contrib_path,
+                self.extensions_schema_path,
+                self.fuzz_test_path)
+            if path)
+
     @property
     def fuzz_test_path(self) -> pathlib.Path:
         return self.directory.path.joinpath(FUZZ_TEST_PATH)
@@ -280,6 +301,10 @@ class AExtensionsCheck(abstract.ACodeCheck, metaclass=abstracts.Abstraction):
     def tracked_ownership_re(self) -> re.Pattern[str]:
         return re.compile(TRACKED_OWNERSHIP_RE)
 
+    @cached_property
+    def tracked_ownership_trie(self) -> CodeOwnersTrie:
+        return CodeOwnersTrie(self.tracked_ownership)
+
     async def check_metadata(self, extension: str) -> tuple[str, ...]:
         return tuple(
             itertools.chain.from_iterable(
@@ -423,12 +448,10 @@ class AExtensionsCheck(abstract.ACodeCheck, metaclass=abstracts.Abstraction):
     def _owners_error_matches(self, path) -> tuple[str, ...]:
         _skip = (
             not self._owners_expected(path)
-            or path.startswith(self.tracked_ownership))
+            or self.tracked_ownership_trie.match(path)
+            or self.tracked_ownership_trie.within(path))
         if _skip:
             return ()
-        for tracked in self.tracked_ownership:
-            if tracked.startswith(path):
-                return ()
         return (f"Directory ({path}) has no owners in CODEOWNERS", )
 
     def _owners_error_tracked(
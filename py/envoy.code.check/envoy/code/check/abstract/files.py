@@ -0,0 +1,140 @@
+
+import asyncio
+import os
+from collections.abc import Iterable
+from concurrent import futures
+from functools import cached_property, partial
+
+import abstracts
+
+from aio.core import directory as _directory, event
+from aio.core.functional import async_property
+
+from envoy.code.check import interface
+
+
+# Bytes read from the start of a file, to find its shebang.
+FILE_HEAD_SIZE = 512
+
+
+@abstracts.implementer((event.IExecutive, interface.IFileIndex))
+class FileIndex(event.AExecutive):
+    """Classification of a directory's files.
+
+    Files' extensions, shebang interpreters and sizes are looked up once
+    and shared, so that checks can find the files they own, and estimate
+    the cost of checking them, without each matching and reading the files.
+
+    Interpreters and sizes are only found for the files that are asked
+    about.
+    """
+
+    def __init__(
+            self,
+            directory: _directory.ADirectory,
+            loop: asyncio.AbstractEventLoop | None = None,
+            pool: futures.Executor | None = None) -> None:
+        self.directory = directory
+        self._loop = loop
+        self._pool = pool
+        self._interpreters: dict[str, str | None] = {}
+        self._sizes: dict[str, int] = {}
+
+    @classmethod
+    def file_interpreters(
+            cls,
+            path: str,
+            *files: str) -> dict[str, str | None]:
+        """Shebang interpreters of `files` in the directory at `path`."""
+        interpreters: dict[str, str | None] = {}
+        for file in files:
+            try:
+                with open(os.path.join(path, file), "rb") as f:
+                    head = f.read(FILE_HEAD_SIZE)
+            except OSError:
+                head = b""
+            interpreters[file] = cls.interpreter(head)
+        return interpreters
+
+    @classmethod
+    def file_sizes(cls, path: str, *files: str) -> dict[str, int]:
+        """Sizes in bytes of `files` in the directory at `path`."""
+        sizes = {}
+        for file in files:
+            try:
+                sizes[file] = os.path.getsize(os.path.join(path, file))
+            except OSError:
+                sizes[file] = 0
+        return sizes
+
+    @classmethod
+    def interpreter(cls, head: bytes) -> str | None:
+        """Interpreter named by a file's shebang, if it has one, eg `bash`
+        for `#!/bin/bash` or `#!/usr/bin/env bash`."""
+        if not head.startswith(b"#!"):
+            return None
+        args = head[2:].split(b"\n", 1)[0].decode(errors="replace").split()
+        if args and os.path.basename(args[0]) == "env":
+            # Skip `env` and its flags, eg `#!/usr/bin/env -S bash -e`.
+            args = [arg for arg in args[1:] if not arg.startswith("-")]
+        return (
+            os.path.basename(args[0])
+            if args
+            else None)
+
+    @async_property(cache=True)
+    async def extensions(self) -> dict[str, set[str]]:
+        """Files by extension.
+
+        Extensions only need the file paths, so the files are not read.
+        """
+        extensions: dict[str, set[str]] = {}
+        for path in await self.directory.files:
+            extensions.setdefault(os.path.splitext(path)[1], set()).add(path)
+        return extensions
+
+    async def interpreters(self, *files: str) -> dict[str, str | None]:
+        # The heads of the files are read in the pool, in batches.
+        async with self._lock:
+            if missing := set(files) - self._interpreters.keys():
+                batches = self.execute_in_batches(
+                    partial(
+                        self.file_interpreters,
+                        str(self.directory.path)),
+                    *missing)
+                async for batch in batches:
+                    self._interpreters.update(batch)
+        return {file: self._interpreters[file] for file in files}
+
+    async def sizes(self, *files: str) -> dict[str, int]:
+        async with self._lock:
+            if missing := set(files) - self._sizes.keys():
+                self._sizes.update(
+                    await asyncio.to_thread(
+                        self.file_sizes,
+                        str(self.directory.path),
+                        *missing))
+        return {file: self._sizes[file] for file in files}
+
+    async def with_extension(self, *extensions: str) -> set[str]:
+        files = await self.extensions
+        return set().union(
+            *(files.get(extension, ())
+              for extension
+              in extensions))
+
+    async def with_interpreter(
+            self,
+            files: Iterable[str],
+            *interpreters: str) -> set[str]:
+        return set(
+            path
+            for path, interpreter
+            in (await self.interpreters(*files)).items()
+            if interpreter in interpreters)
+
+    @cached_property
+    def _lock(self) -> asyncio.Lock:
+        # Lookups wait for any in progress, so that files are only read
+        # once if checks ask for the same files at the same time.
+        return asyncio.Lock()
@@ -12,6 +12,7 @@ from flake8 import (  # type:ignore
 
 import abstracts
 
+from aio.core import event, tasks
 from aio.core.functional import async_property
 from aio.core.directory.utils import directory_context
 from aio.run import checker
@@ -20,6 +21,11 @@ from envoy.code.check import abstract, interface, typing
 
 
 FLAKE8_CONFIG = '.flake8'
+# Files are split into this many batches per job, so that work is spread
+# across the pool if some batches take longer than estimated.
+FLAKE8_BATCHES_PER_JOB = 4
+# Estimated cost of checking a file, in addition to its size in bytes.
+FLAKE8_FILE_COST = 1024
 
 
 # Workaround for https://github.com/PyCQA/flake8/issues/1390
@@ -28,7 +34,11 @@ logger = logging.getLogger(__name__)
 
 
 class Flake8Application(Application):
-    """Subclassed flake8.Application to capture output."""
+    """Subclassed flake8.Application to capture output.
+
+    Output is captured separately for each run, so that the application can
+    be reused to check many sets of files.
+    """
 
     @cached_property
     def output_fd(self) -> io.StringIO:
@@ -38,9 +48,18 @@ class Flake8Application(Application):
         # ~Hacky workaround to capture flake8 output
         super().make_formatter()
         self.formatter.output_fd = self.output_fd
+        self._formatter_start = self.formatter.start
         self._formatter_stop = self.formatter.stop
+        self.formatter.start = self._start
         self.formatter.stop = self._stop
 
+    def _start(self) -> None:
+        # The formatter closes its output when it stops, so a new one is
+        # needed for each run.
+        self.__dict__.pop("output_fd", None)
+        self._formatter_start()
+        self.formatter.output_fd = self.output_fd
+
     def _stop(self) -> None:
         self.output_fd.seek(0)
         self._results: list[str] = [
@@ -153,11 +172,11 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             cls,
             path: str,
             args: tuple[str, ...],
-            files: set[str]) -> list[str]:
-        """Flake8 checker."""
-        return Flake8App(
+            *files: str) -> list[str]:
+        """Flake8 checker, using the app built once per process."""
+        return cls.flake8_app(
             path,
-            args).run_checks(files)
+            args).run_checks(set(files))
 
     @classmethod
     def filter_flake8_files(
@@ -166,10 +185,41 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             args: tuple[str, ...],
             files: set[str]) -> set[str]:
         """Flake8 file discovery."""
-        return Flake8App(
+        return cls.flake8_app(
             path,
             args).include_files(files)
 
+    @classmethod
+    def flake8_args_for(cls, path: str) -> tuple[str, ...]:
+        """Flake configuration args for the directory at `path`."""
+        # Files are sharded across the pool, so flake8 should not start
+        # its own.
+        return (
+            "--color=never",
+            "--jobs=1",
+            "--config",
+            str(pathlib.Path(path).joinpath(FLAKE8_CONFIG)),
+            path)
+
+    @classmethod
+    @lru_cache
+    def flake8_app(cls, path: str, args: tuple[str, ...]) -> Flake8App:
+        """Flake8 app for file discovery and checks, built once per process
+        and reused across calls."""
+        return Flake8App(path, args)
+
+    @classmethod
+    def initialize_worker(cls, path: str) -> None:
+        # Parse options, load config and plugins. Errors are left for
+        # flake8's own run to report, as the pool is shared with other
+        # checks.
+        try:
+            cls.flake8_app(
+                str(pathlib.Path(path).resolve()),
+                cls.flake8_args_for(path)).app
+        except Exception:
+            pass
+
     @async_property
     async def checker_files(self) -> set[str]:
         return await self.execute(
@@ -178,14 +228,24 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             self.flake8_args,
             await self.directory.files)
 
+    @async_property
+    async def flake8_batches(self) -> list[list[str]]:
+        """Batches of files to check.
+
+        Files are only split up if there are other jobs to share them with,
+        as each batch is a separate flake8 run.
+        """
+        if event.jobs.limit > 1:
+            return await self.file_batches(
+                FLAKE8_BATCHES_PER_JOB,
+                FLAKE8_FILE_COST)
+        files = await self.files
+        return [list(files)] if files else []
+
     @property
     def flake8_args(self) -> tuple[str, ...]:
         """Flake configuration args."""
-        return (
-            "--color=never",
-            "--config",
-            str(self.flake8_config_path),
-            str(self.directory.path))
+        return self.flake8_args_for(str(self.directory.path))
 
     @property
     def flake8_config_path(self) -> pathlib.Path:
@@ -197,14 +257,18 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
         """Flake8 error list for check files."""
         # Important dont send an empty set to the flake8 checker,
         # as flake8 will check every file in path.
-        return (
-            await self.execute(
+        errors: list[str] = []
+        batches = tasks.concurrent(
+            self.execute(
                 self.check_flake8_files,
                 self.directory.absolute_path,
                 self.flake8_args,
-                await self.files)
-            if await self.files
-            else [])
+                *batch)
+            for batch
+            in await self.flake8_batches)
+        async for batch_errors in batches:
+            errors.extend(batch_errors)
+        return errors
 
     @async_property(cache=True)
     async def problem_files(self) -> typing.ProblemDict:
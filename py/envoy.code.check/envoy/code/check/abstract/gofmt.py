@@ -29,14 +29,13 @@ class Gofmt(_subprocess.ASubprocessHandler):
             self,
             response: subprocess.CompletedProcess) -> typing.ProblemDict:
         """Handle response for `gofmt`."""
-        if response.args[1] == "-d":
-            return self.handle_diff(response)
-        return self.handle_problems(response)
+        return self.handle_diff(response)
 
     def handle_diff(
             self,
             response: subprocess.CompletedProcess) -> typing.ProblemDict:
-        """Handle response for `gofmt -d`.
+        """Handle response for `gofmt -d`, which may also have written
+        the files (`-w`).
 
         As `gofmt` is called with multiple files, we need to parse the
         diff line-by-line to match the diff content with the file that
@@ -49,7 +48,11 @@ class Gofmt(_subprocess.ASubprocessHandler):
         result: typing.ProblemDict = dict()
         if not response.stdout:
             return result
-        files = response.args[2:]
+        files = [
+            arg
+            for arg
+            in response.args[1:]
+            if not arg.startswith("-")]
         filename = ""
         for line in response.stdout.splitlines():
             filename = self._diff_line(filename, result, line)
@@ -68,20 +71,14 @@ class Gofmt(_subprocess.ASubprocessHandler):
         """Handle error response for `gofmt`."""
         raise GofmtError(response)
 
-    def handle_problems(
-            self,
-            response: subprocess.CompletedProcess) -> typing.ProblemDict:
-        """Handle response for `gofmt -l/w`."""
-        return dict(
-            reformat=checker.Problems(
-                errors=response.stdout.splitlines()))
-
     def _diff_line(
             self,
             filename: str,
             result: typing.ProblemDict,
             line: str) -> str:
-        if not line.startswith("diff -u"):
+        # Diff headers are `diff -u a.go.orig a.go`, or without `-u` for
+        # newer versions.
+        if not line.startswith("diff "):
             # Append diff line
             result[filename].errors[0] += f"{line}\n"
             return filename
@@ -123,41 +120,20 @@ class AGofmtCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             await self.go_files,
             self.nogofmt_re)
 
-    @async_property(cache=True)
-    async def fixable_files(self) -> set[str]:
-        """Files that can be fixed by Gofmt."""
-        jobs = self.execute_in_batches(
-            self.gofmt_problems,
-            *await self.files)
-        problem_files = set()
-        async for result in jobs:
-            problem_files |= set(result["reformat"].errors)
-        return problem_files
-
     @async_property
     async def fixed_files(self) -> "typing.ProblemDict":
         """Files that have been fixed by Gofmt."""
-        # Gofmt doesnt give any feedback about changes - so we have
-        # to first get the set of fixable files, then run the fixes
-        # and then return the original files.
-        jobs = self.execute_in_batches(
-            self.gofmt_fix,
-            *await self.fixable_files)
-        async for result in jobs:
-            pass
+        # Files are diffed and fixed in the same pass, so files that have
+        # been fixed are those with a diff.
         return {
             f: checker.Problems(errors=[f"Reformatted: {f}"])
             for f
-            in await self.fixable_files}
+            in await self.gofmt_results(self.gofmt_fix)}
 
     @async_property(cache=True)
     async def go_files(self) -> set[str]:
         """Files with a `.go` suffix."""
-        return set(
-            path
-            for path
-            in await self.directory.files
-            if path.endswith(".go"))
+        return await self.file_index.with_extension(".go")
 
     @cached_property
     def gofmt_command(self) -> str | os.PathLike:
@@ -176,13 +152,22 @@ class AGofmtCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
 
     @cached_property
     def gofmt_fix(self) -> partial:
-        """Partial with gofmt command and write arg."""
-        return self._gofmt("-w")
+        """Partial with gofmt command and diff and write args."""
+        return self._gofmt("-d", "-w")
 
-    @cached_property
-    def gofmt_problems(self) -> partial:
-        """Partial with gofmt command and list arg."""
-        return self._gofmt("-l")
+    async def gofmt_results(
+            self,
+            executable: partial) -> "typing.ProblemDict":
+        """Diffs of files that require reformatting, from running
+        `executable` on the files in batches."""
+        errors: typing.ProblemDict = dict()
+        jobs = self.execute_in_batches(
+            executable,
+            *await self.files)
+        async for result in jobs:
+            if result:
+                errors.update(result)
+        return errors
 
     @cached_property
     def nogofmt_re(self) -> re.Pattern[str] | None:
@@ -195,16 +180,9 @@ class AGofmtCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
     @async_property(cache=True)
     async def problem_files(self) -> "typing.ProblemDict":
         """Problematic Go files detected by Gofmt."""
-        errors: typing.ProblemDict = dict()
         if self.fix:
             return await self.fixed_files
-        jobs = self.execute_in_batches(
-            self.gofmt_diff,
-            *await self.files)
-        async for result in jobs:
-            if result:
-                errors.update(result)
-        return errors
+        return await self.gofmt_results(self.gofmt_diff)
 
     def _gofmt(self, *args: str) -> partial:
         """Partial with gofmt command and args."""
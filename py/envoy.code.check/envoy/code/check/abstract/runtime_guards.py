@@ -1,11 +1,18 @@
 #
+import asyncio
+import json
+import pathlib
 import re
-from collections.abc import AsyncIterator, Awaitable, Iterable
+from collections.abc import AsyncIterator, Awaitable, Iterable, Mapping
 from functools import cached_property
+from typing import cast
 
 import abstracts
 
 from aio.core.functional import async_property
+from aio.run import checker
+
+from envoy.base import utils
 
 from envoy.code.check import abstract, interface
 
@@ -27,7 +34,40 @@ RUNTIME_GUARDS_CONFIG_PATH = "source/common/runtime/runtime_features.cc"
 class ARuntimeGuardsCheck(
         abstract.AProjectCodeCheck,
         metaclass=abstracts.Abstraction):
-    """Runtime guards check."""
+    """Runtime guards check.
+
+    If `mentions_cache` is set, the guards mentioned in each released
+    changelog are stored in that file, keyed by a fingerprint of the
+    changelog, so that unchanged changelogs are not parsed again.
+    """
+
+    def __init__(
+            self,
+            *args,
+            mentions_cache: str | None = None,
+            **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._mentions_cache = mentions_cache
+
+    @async_property(cache=True)
+    async def changelog_mentions(self) -> dict[str, set[str]]:
+        """Guards mentioned in each changelog, by version.
+
+        Released changelogs found in the mentions cache are not parsed.
+        """
+        cached = await self._mentions_cached
+        parse = {
+            str(version): changelog
+            for version, changelog
+            in self.project.changelogs.items()
+            if str(version) not in cached}
+        parsed = await asyncio.gather(
+            *(self._changelog_mention(changelog)
+              for changelog
+              in parse.values()))
+        mentions = {**cached, **dict(zip(parse, parsed))}
+        await self._mentions_cache_update(mentions)
+        return mentions
 
     @async_property(cache=True)
     async def configured(self) -> set[str]:
@@ -40,12 +80,57 @@ class ARuntimeGuardsCheck(
     def expected_missing(self) -> set[str]:
         return set(EXPECTED_MISSING_GUARDS)
 
+    @async_property
+    async def fingerprint_parts(self) -> tuple[str, ...]:
+        return tuple(sorted(self.expected_missing))
+
+    @async_property
+    async def fingerprint_paths(self) -> tuple[str, ...]:
+        return (RUNTIME_GUARDS_CONFIG_PATH, *self.changelog_paths)
+
     @async_property
     async def mentioned(self) -> set[str]:
-        mentioned = set()
-        async for change in self._changes:
-            mentioned |= self._find_mention(change)
-        return mentioned
+        return set(await self.mentions)
+
+    @async_property(cache=True)
+    async def mentions(self) -> dict[str, set[str]]:
+        """Versions of the changelogs that mention each guard."""
+        mentions: dict[str, set[str]] = {}
+        for version, found in (await self.changelog_mentions).items():
+            for guard in found:
+                mentions.setdefault(guard, set()).add(version)
+        return mentions
+
+    @async_property(cache=True)
+    async def mentions_cache(self) -> dict[str, list[str]]:
+        """Guards mentioned in released changelogs, by cache key, loaded
+        from the mentions cache file."""
+        return (
+            await asyncio.to_thread(self._mentions_cache_load)
+            if self.mentions_cache_path
+            else {})
+
+    @async_property(cache=True)
+    async def mentions_cache_keys(self) -> dict[str, str]:
+        """Cache keys of released changelogs, by version.
+
+        Keys are fingerprints of the changelog file, and of the pattern used
+        to find mentions in it.
+        """
+        if not self.mentions_cache_path:
+            return {}
+        return await asyncio.to_thread(
+            self._mentions_cache_keys,
+            {version: changelog.path
+             for version, changelog
+             in self.released_changelogs.items()})
+
+    @cached_property
+    def mentions_cache_path(self) -> pathlib.Path | None:
+        return (
+            pathlib.Path(self._mentions_cache)
+            if self._mentions_cache
+            else None)
 
     @async_property(cache=True)
     async def missing(self) -> set[str]:
@@ -58,6 +143,17 @@ class ARuntimeGuardsCheck(
     def reloadable_match_re(self) -> re.Pattern:
         return re.compile(RELOADABLE_MATCH_RE)
 
+    @property
+    def released_changelogs(self) -> dict[str, utils.interface.IChangelog]:
+        """Changelogs other than the current one, which are not expected to
+        change."""
+        current = self.project.changelogs.current
+        return {
+            str(version): changelog
+            for version, changelog
+            in self.project.changelogs.items()
+            if version != current}
+
     @async_property
     async def status(self) -> AsyncIterator[tuple[str, bool | None]]:
         for guard in sorted(await self.configured):
@@ -68,14 +164,25 @@ class ARuntimeGuardsCheck(
             else:
                 yield guard, True
 
+    async def _changelog_mention(
+            self,
+            changelog: utils.interface.IChangelog) -> set[str]:
+        mentioned = set()
+        for section, data in (await changelog.data).items():
+            if section == "date":
+                continue
+            for change in data:
+                mentioned |= self._find_mention(change["change"])
+        return mentioned
+
     @async_property
-    async def _changes(self) -> AsyncIterator[str]:
-        for changelog in self.project.changelogs.values():
-            for section, data in (await changelog.data).items():
-                if section == "date":
-                    continue
-                for change in data:
-                    yield change["change"]
+    async def _mentions_cached(self) -> dict[str, set[str]]:
+        cache = await self.mentions_cache
+        return {
+            version: set(cache[key])
+            for version, key
+            in (await self.mentions_cache_keys).items()
+            if key in cache}
 
     @property
     def _grepped(self) -> Awaitable[Iterable[str]]:
@@ -88,3 +195,46 @@ class ARuntimeGuardsCheck(
             m.strip("`").replace(".", "_")
             for m
             in self.reloadable_match_re.findall(change))
+
+    def _mentions_cache_keys(
+            self,
+            paths: Mapping[str, pathlib.Path]) -> dict[str, str]:
+        return {
+            version: checker.fingerprint(RELOADABLE_MATCH_RE, paths=[path])
+            for version, path
+            in paths.items()}
+
+    def _mentions_cache_load(self) -> dict[str, list[str]]:
+        path = cast(pathlib.Path, self.mentions_cache_path)
+        if not path.exists():
+            return {}
+        try:
+            cache = json.loads(path.read_text())
+        except ValueError:
+            cache = None
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            key: mentioned
+            for key, mentioned
+            in cache.items()
+            if isinstance(mentioned, list)}
+
+    def _mentions_cache_save(self, cache: dict[str, list[str]]) -> None:
+        path = cast(pathlib.Path, self.mentions_cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+
+    async def _mentions_cache_update(
+            self,
+            mentions: dict[str, set[str]]) -> None:
+        """Store the mentions of released changelogs in the mentions cache
+        file, if they have changed."""
+        if not self.mentions_cache_path:
+            return
+        cache = {
+            key: sorted(mentions[version])
+            for version, key
+            in (await self.mentions_cache_keys).items()}
+        if cache != await self.mentions_cache:
+            await asyncio.to_thread(self._mentions_cache_save, cache)
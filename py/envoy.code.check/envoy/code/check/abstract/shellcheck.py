@@ -1,51 +1,47 @@
 
+import asyncio
+import json
 import os
 import pathlib
-import re
 import shutil
 import subprocess
-from collections.abc import Iterator
 from functools import cached_property, partial
 from typing import TypedDict
 
 import abstracts
 
-from aio.core import subprocess as _subprocess
+from aio.core import subprocess as _subprocess, tasks
 from aio.core.functional import async_property
 from aio.run import checker
 
 from envoy.code.check import abstract, interface, typing
 
 
-SHELLCHECK_ERROR_LINE_RE = r"In ([\w\-\_\./]+) line ([0-9]+):"
-SHEBANG_RE = (
-    r"^#!/bin/bash",
-    r"^#!/bin/sh",
-    r"^#!/usr/bin/env bash",
-    r"^#!/usr/bin/env sh")
-SHELLCHECK_MATCH_RE = (
-    r"[\w/]*\.sh$", )
-SHELLCHECK_NOMATCH_RE = (
-    r"[\w/]*\.rst$",
-    r"[\w/]*\.md$",
-    r"[\w/]*\.genrule_cmd$")
+SHELLCHECK_CONFIG = ".shellcheckrc"
+# Files are split into this many batches per job, so that work is spread
+# across the pool if some batches take longer than estimated.
+SHELLCHECK_BATCHES_PER_JOB = 4
+# Estimated cost of checking a file, in addition to its size in bytes.
+SHELLCHECK_FILE_COST = 1024
+SHELLCHECK_EXTENSIONS = (".sh", )
+# Files are also checked if they have a shebang for these interpreters.
+SHELLCHECK_INTERPRETERS = ("bash", "sh")
+# Files that may have shebang lines for other reasons, eg docs.
+SHELLCHECK_SHEBANG_EXCLUDE_EXTENSIONS = (".rst", ".md", ".genrule_cmd")
 
 
-class ShellcheckErrorDict(TypedDict):
-    lines: list[str]
-    line_numbers: list[int]
+class ShellcheckCommentDict(TypedDict):
+    file: str
+    line: int
+    column: int
+    level: str
+    code: int
+    message: str
 
 
 @abstracts.implementer(_subprocess.ISubprocessHandler)
 class Shellcheck(_subprocess.ASubprocessHandler):
-
-    @cached_property
-    def error_line_re(self) -> re.Pattern[str]:
-        """Regex for matching a shellcheck error line.
-
-        This demarcates the beginning of a specific error for a file.
-        """
-        return re.compile(SHELLCHECK_ERROR_LINE_RE)
+    """Shellcheck handler, for its `json1` output format (`-f json1`)."""
 
     def handle(
             self,
@@ -57,74 +53,59 @@ class Shellcheck(_subprocess.ASubprocessHandler):
             response: subprocess.CompletedProcess) -> typing.ProblemDict:
         """Turn the response from a call to shellcheck (for multiple files)
         into an `typing.ProblemDict`."""
-        return self._render_errors(self._shellcheck_errors(response))
+        return self._render_errors(self.parse_comments(response))
+
+    def parse_comments(
+            self,
+            response: subprocess.CompletedProcess) -> dict[
+                str, list[ShellcheckCommentDict]]:
+        """Parse shellcheck comments from the response, grouped by file.
 
-    def parse_error_line(self, line: str) -> tuple[str, int | None]:
-        """Parse `filename`, `line_number` from a shellcheck error line."""
-        matched = self.error_line_re.search(line)
+        Shellcheck only writes `json1` output if it was able to check the
+        files, otherwise the error it gives is raised.
+        """
+        try:
+            comments = json.loads(response.stdout)["comments"]
+        except (TypeError, KeyError, ValueError):
+            raise _subprocess.exceptions.RunError(
+                f"Shellcheck failed ({response.returncode}): "
+                f"{response.stderr}")
+        files: dict[str, list[ShellcheckCommentDict]] = {}
+        for comment in comments:
+            files.setdefault(comment["file"], []).append(comment)
+        return files
+
+    def _render_comment(self, comment: ShellcheckCommentDict) -> str:
         return (
-            (matched.groups()[0],
-             int(matched.groups()[1]))
-            if matched
-            else ("", None))
+            f"  {comment['line']}:{comment['column']}: "
+            f"[SC{comment['code']}] ({comment['level']}) "
+            f"{comment['message']}")
 
     def _render_errors(
             self,
-            errors: Iterator[
-                tuple[
-                    str,
-                    ShellcheckErrorDict]]) -> typing.ProblemDict:
+            errors: dict[str, list[ShellcheckCommentDict]]) -> (
+                typing.ProblemDict):
         return {
             k: checker.Problems(errors=self._render_file_errors(k, v))
             for k, v
-            in errors}
+            in errors.items()}
 
     def _render_file_errors(
             self,
             path: str,
-            errors: ShellcheckErrorDict) -> list[str]:
+            comments: list[ShellcheckCommentDict]) -> list[str]:
         # This does v basic en pluralization
-        line_numbers = ", ".join(str(n) for n in errors["line_numbers"])
+        line_numbers = sorted(set(c["line"] for c in comments))
         lines = (
             "lines"
-            if len(errors["line_numbers"]) > 1
+            if len(line_numbers) > 1
             else "line")
         return [
             "\n".join([
-                f"{path} ({lines}: {line_numbers})",
-                *errors["lines"]])]
-
-    def _shellcheck_error_info(
-            self,
-            filename: str | None = None) -> tuple[
-                str | None, ShellcheckErrorDict]:
-        return (
-            filename,
-            dict(line_numbers=[], lines=[]))
-
-    def _shellcheck_errors(
-            self,
-            response: subprocess.CompletedProcess) -> Iterator[
-                tuple[str, ShellcheckErrorDict]]:
-        filename, info = self._shellcheck_error_info()
-        for line in response.stdout.split("\n"):
-            _filename, line_number = self.parse_error_line(line)
-            if _filename and line_number:
-                # matches as error line - may/not be a new error for this file
-                if filename and (_filename != filename):
-                    # filename boundary - yield, and reset
-                    yield filename, info
-                    filename, info = self._shellcheck_error_info(_filename)
-                # add line number to error line_numbers
-                info["line_numbers"].append(line_number)
-                filename = _filename
-            if filename is None:
-                # preceeding whitespace
-                continue
-            info["lines"].append(line)
-        if filename:
-            # flush the buffer
-            yield filename, info
+                f"{path} ({lines}: {', '.join(str(n) for n in line_numbers)})",
+                *(self._render_comment(comment)
+                  for comment
+                  in comments)])]
 
 
 @abstracts.implementer(interface.IShellcheckCheck)
@@ -139,57 +120,54 @@ class AShellcheckCheck(
         """Run shellcheck on files."""
         return Shellcheck(path)(*args)
 
-    @async_property
+    @async_property(cache=True)
     async def checker_files(self) -> set[str]:
         return (
             await self.sh_files
             | await self.shebang_files)
 
-    @cached_property
-    def path_match_exclude_re(self) -> re.Pattern[str]:
-        """Regex to match files not to check."""
-        return re.compile("|".join(SHELLCHECK_NOMATCH_RE))
+    @async_property
+    async def fingerprint_parts(self) -> tuple[str, ...]:
+        return (await self.shellcheck_version, )
 
-    @cached_property
-    def path_match_re(self) -> re.Pattern[str]:
-        """Regex to match files to check."""
-        return re.compile("|".join(SHELLCHECK_MATCH_RE))
+    @async_property
+    async def fingerprint_paths(self) -> tuple[str, ...]:
+        # Files are checked with the files they source (`-x`), which may
+        # not be in this shard.
+        return (*await self.checker_files, SHELLCHECK_CONFIG)
 
     @async_property(cache=True)
     async def problem_files(self) -> typing.ProblemDict:
         """Discovered shellcheck errors."""
-        if not await self.files:
-            return {}
         errors: typing.ProblemDict = {}
-        jobs = self.execute_in_batches(
-            self.shellcheck_executable,
-            *await self.files)
+        jobs = tasks.concurrent(
+            self.execute(self.shellcheck_executable, *batch)
+            for batch
+            in await self.file_batches(
+                SHELLCHECK_BATCHES_PER_JOB,
+                SHELLCHECK_FILE_COST))
         async for result in jobs:
             errors.update(result)
         return errors
 
     @async_property
     async def sh_files(self) -> set[str]:
-        """Files with a `.sh` suffix, but that are not excluded."""
-        return set(
-            path
-            for path
-            in await self.directory.files
-            if (self.path_match_re.match(path)
-                and not self.path_match_exclude_re.match(path)))
+        """Files with a `.sh` suffix."""
+        return await self.file_index.with_extension(*SHELLCHECK_EXTENSIONS)
 
     @async_property
     async def shebang_files(self) -> set[str]:
-        """Files that contain shebang lines, excluding actual .sh files and
-        others, eg md/rst, that may have such lines for other reasons."""
-        return await self.directory.grep(
-            ["-lE", self.shebang_re_expr],
-            target=await self._possible_shebang_files)
+        """Files with shell shebang lines, excluding `.sh` files and others,
+        eg md/rst, that may have such lines for other reasons.
 
-    @property
-    def shebang_re_expr(self) -> str:
-        """Regex for matching shebang lines _in_ a file."""
-        return "|".join(SHEBANG_RE)
+        Only the heads of the remaining files are read.
+        """
+        excluded = await self.file_index.with_extension(
+            *SHELLCHECK_EXTENSIONS,
+            *SHELLCHECK_SHEBANG_EXCLUDE_EXTENSIONS)
+        return await self.file_index.with_interpreter(
+            await self.directory.files - excluded,
+            *SHELLCHECK_INTERPRETERS)
 
     @cached_property
     def shellcheck_command(self) -> str | pathlib.Path:
@@ -208,13 +186,16 @@ class AShellcheckCheck(
             self.run_shellcheck,
             self.directory.path,
             self.shellcheck_command,
-            "-x")
+            "-x",
+            "-f",
+            "json1")
 
-    @async_property
-    async def _possible_shebang_files(self) -> set[str]:
-        return set(
-            path
-            for path
-            in await self.directory.files
-            if (not self.path_match_re.match(path)
-                and not self.path_match_exclude_re.match(path)))
+    @async_property(cache=True)
+    async def shellcheck_version(self) -> str:
+        """Version of the shellcheck command."""
+        response = await asyncio.to_thread(
+            subprocess.run,
+            [self.shellcheck_command, "--version"],
+            capture_output=True,
+            encoding="utf-8")
+        return response.stdout
@@ -2,9 +2,10 @@
 import io
 import pathlib
 from collections.abc import AsyncIterator, Generator, Iterator
-from functools import cached_property, partial
+from functools import cached_property, lru_cache, partial
 
 import yaml
+import yamllint  # type:ignore
 from yamllint import linter  # type:ignore
 from yamllint.config import YamlLintConfig  # type:ignore
 
@@ -86,13 +87,33 @@ class YamllintFilesCheck(directory.ADirectoryContext):
 
 class AYamllintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
 
+    @classmethod
+    def initialize_worker(cls, path: str) -> None:
+        # Errors, eg from an invalid config, are left for yamllint's own run
+        # to report, as the pool is shared with other checks.
+        try:
+            cls.worker_config(
+                str(pathlib.Path(path).joinpath(YAMLLINT_CONFIG)))
+        except Exception:
+            pass
+
+    @classmethod
+    @lru_cache
+    def worker_config(cls, config_path: str) -> YamlLintConfig:
+        """Yamllint config, built once per process and reused across
+        batches."""
+        return YamlLintConfig(file=config_path)
+
     @classmethod
     def yamllint(
             cls,
             root_path: str,
-            config: YamlLintConfig,
+            config_path: str,
             *args) -> tuple["typing.YamllintProblemTuple", ...]:
-        return YamllintFilesCheck(root_path, config, *args).run_checks()
+        return YamllintFilesCheck(
+            root_path,
+            cls.worker_config(config_path),
+            *args).run_checks()
 
     @async_property
     async def checker_files(self) -> set[str]:
@@ -102,6 +123,14 @@ class AYamllintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             if (self.yamllint_config.is_yaml_file(path)
                 and not self.yamllint_config.is_file_ignored(path)))
 
+    @async_property
+    async def fingerprint_parts(self) -> tuple[str, ...]:
+        return (yamllint.__version__, )
+
+    @async_property
+    async def fingerprint_paths(self) -> tuple[str, ...]:
+        return (*await self.files, YAMLLINT_CONFIG)
+
     @cached_property
     def yamllint_config(self) -> YamlLintConfig:
         return YamlLintConfig(file=self.config_path)
@@ -124,7 +153,7 @@ class AYamllintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             partial(
                 self.yamllint,
                 str(self.directory.path),
-                self.yamllint_config),
+                str(self.config_path)),
             *await self.files)
 
         async for batch in batches:
@@ -98,6 +98,19 @@ class YapfFiles(directory.ADirectoryContext):
 @abstracts.implementer(interface.IYapfCheck)
 class AYapfCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
 
+    @classmethod
+    def initialize_worker(cls, path: str) -> None:
+        # Formatting an empty string loads the parser and validates the
+        # style config. The pool is shared with other checks, so errors,
+        # eg from a missing or invalid config, are left for yapf's own run
+        # to report.
+        try:
+            yapf.yapf_api.FormatCode(
+                "",
+                style_config=str(pathlib.Path(path).joinpath(YAPF_CONFIG)))
+        except Exception:
+            pass
+
     @classmethod
     def yapf_files(
             cls,
@@ -143,11 +156,7 @@ class AYapfCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
     @async_property(cache=True)
     async def py_files(self) -> set[str]:
         """Files with a `.py` suffix."""
-        return set(
-            path
-            for path
-            in await self.directory.files
-            if path.endswith(".py"))
+        return await self.file_index.with_extension(".py")
 
     @async_property
     async def _problem_files(self) -> AsyncIterator["typing.YapfProblemTuple"]:
@@ -2,7 +2,7 @@
 import asyncio
 import pathlib
 from concurrent import futures
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterable, Iterator
 
 from packaging import version as _version
 
@@ -14,6 +14,41 @@ from envoy.base import utils
 from envoy.code.check import typing
 
 
+class IFileIndex(metaclass=abstracts.Interface):
+    """Classification of a directory's files, shared by checks."""
+
+    def __init__(
+            self,
+            directory: _directory.ADirectory,
+            loop: asyncio.AbstractEventLoop | None = None,
+            pool: futures.Executor | None = None) -> None:
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    async def interpreters(self, *files: str) -> dict[str, str | None]:
+        """Shebang interpreter of each of `files`, if it has one."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    async def sizes(self, *files: str) -> dict[str, int]:
+        """Size in bytes of each of `files`."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    async def with_extension(self, *extensions: str) -> set[str]:
+        """Files with any of the `extensions`, eg `.py`."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    async def with_interpreter(
+            self,
+            files: Iterable[str],
+            *interpreters: str) -> set[str]:
+        """Those of `files` with a shebang for any of the `interpreters`,
+        eg `bash`."""
+        raise NotImplementedError
+
+
 class ICodeCheck(metaclass=abstracts.Interface):
 
     def __init__(
@@ -23,7 +58,16 @@ class ICodeCheck(metaclass=abstracts.Interface):
             binaries: dict[str, str] | None = None,
             config: typing.YAMLConfigDict | None = None,
             loop: asyncio.AbstractEventLoop | None = None,
-            pool: futures.Executor | None = None) -> None:
+            pool: futures.Executor | None = None,
+            shard: tuple[int, int] | None = None,
+            file_index: IFileIndex | None = None) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstracts.interfacemethod
+    async def fingerprint(self) -> str | None:
+        """Fingerprint of the check's inputs, or `None` if the check does
+        not support caching."""
         raise NotImplementedError
 
 
@@ -60,6 +104,11 @@ class IExtensionsCheck(metaclass=abstracts.Interface):
     async def all_fuzzed(self) -> bool:
         raise NotImplementedError
 
+    @property
+    @abstracts.interfacemethod
+    async def fingerprint(self) -> str | None:
+        raise NotImplementedError
+
     @property
     @abstracts.interfacemethod
     def extensions_schema(self) -> "typing.ExtensionsSchemaDict":
@@ -1,4 +1,6 @@
 
+import pathlib
+from importlib import metadata
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -20,13 +22,24 @@ class DummyCodeCheck:
         return super().problem_files
 
 
+def test_code_check_initialize_worker():
+    assert not DummyCodeCheck.initialize_worker("PATH")
+
+
 @pytest.mark.parametrize("fix", [None, True, False])
 @pytest.mark.parametrize("binaries", [None, "BINARIES"])
 @pytest.mark.parametrize("config", [None, "CONFIG"])
 @pytest.mark.parametrize("pool", [None, "POOL"])
 @pytest.mark.parametrize("loop", [None, "LOOP"])
-async def test_code_check_constructor(fix, binaries, pool, loop, config):
+@pytest.mark.parametrize("shard", [None, "SHARD"])
+@pytest.mark.parametrize("file_index", [None, "FILE_INDEX"])
+async def test_code_check_constructor(
+        fix, binaries, pool, loop, config, shard, file_index):
     kwargs = {}
+    if file_index is not None:
+        kwargs["file_index"] = file_index
+    if shard is not None:
+        kwargs["shard"] = shard
     if fix is not None:
         kwargs["fix"] = fix
     if binaries is not None:
@@ -52,12 +65,123 @@ async def test_code_check_constructor(fix, binaries, pool, loop, config):
     assert code_check.config == config
     assert code_check._loop == loop
     assert code_check._pool == pool
+    assert code_check.shard == shard
+    assert code_check._file_index == file_index
 
     for iface_prop in ["checker_files", "problem_files"]:
         with pytest.raises(NotImplementedError):
             await getattr(code_check, iface_prop)
 
 
+@pytest.mark.parametrize("file_index", [None, "FILE_INDEX"])
+def test_code_check_file_index(patches, file_index):
+    directory = MagicMock()
+    code_check = DummyCodeCheck(
+        directory,
+        loop="LOOP",
+        pool="POOL",
+        file_index=file_index)
+    patched = patches(
+        "FileIndex",
+        prefix="envoy.code.check.abstract.base")
+
+    with patched as (m_index, ):
+        assert (
+            code_check.file_index
+            == (file_index or m_index.return_value))
+
+    assert "file_index" in code_check.__dict__
+    if file_index:
+        assert not m_index.called
+        return
+    assert (
+        m_index.call_args
+        == [(directory, ), dict(loop="LOOP", pool="POOL")])
+
+
+@pytest.mark.parametrize("paths", [None, (), ("P1", "P2")])
+@pytest.mark.parametrize("versions", [None, ("V1", "V2")])
+async def test_code_check_fingerprint(patches, paths, versions):
+    directory = MagicMock()
+    code_check = DummyCodeCheck(directory)
+    patched = patches(
+        "asyncio",
+        "checker",
+        ("ACodeCheck.fingerprint_parts",
+         dict(new_callable=PropertyMock)),
+        ("ACodeCheck.fingerprint_paths",
+         dict(new_callable=PropertyMock)),
+        ("ACodeCheck.package_versions",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.base")
+
+    with patched as (m_asyncio, m_checker, m_parts, m_paths, m_versions):
+        m_asyncio.to_thread = AsyncMock()
+        m_parts.side_effect = AsyncMock(return_value=("PART1", "PART2"))
+        m_paths.side_effect = AsyncMock(return_value=paths)
+        m_versions.return_value = versions
+        result = await code_check.fingerprint
+
+    if paths is None or versions is None:
+        assert result is None
+        assert not m_asyncio.to_thread.called
+        assert not m_parts.called
+        return
+    assert result == m_asyncio.to_thread.return_value
+    assert (
+        m_asyncio.to_thread.call_args
+        == [(m_checker.fingerprint,
+             "DummyCodeCheck",
+             "V1",
+             "V2",
+             "PART1",
+             "PART2"),
+            dict(root=directory.path,
+                 paths=paths)])
+
+
+async def test_code_check_fingerprint_defaults():
+    code_check = DummyCodeCheck("DIRECTORY")
+    assert await code_check.fingerprint_parts == ()
+    assert await code_check.fingerprint_paths is None
+    assert await code_check.fingerprint is None
+
+
+@pytest.mark.parametrize(
+    "missing",
+    [None, "aio.run.checker", "envoy.code.check"])
+def test_code_check_package_versions(patches, missing):
+    code_check = DummyCodeCheck("DIRECTORY")
+    patched = patches(
+        "logger",
+        "metadata.version",
+        prefix="envoy.code.check.abstract.base")
+
+    def version(package):
+        if package == missing:
+            raise metadata.PackageNotFoundError(package)
+        return f"VERSION:{package}"
+
+    with patched as (m_logger, m_version):
+        m_version.side_effect = version
+        assert (
+            code_check.package_versions
+            == (None
+                if missing
+                else ("aio.run.checker==VERSION:aio.run.checker",
+                      "envoy.code.check==VERSION:envoy.code.check")))
+
+    assert "package_versions" in code_check.__dict__
+    if not missing:
+        assert not m_logger.warning.called
+        return
+    assert (
+        m_logger.warning.call_args
+        == [("Not caching DummyCodeCheck, "
+             f"version of {missing} is unknown as it is not installed", ),
+            {}])
+
+
 @pytest.mark.parametrize(
     "files",
     [set(),
@@ -68,24 +192,38 @@ async def test_code_check_constructor(fix, binaries, pool, loop, config):
     [set(),
      set(f"F{i}" for i in range(0, 5)),
      set(f"F{i}" for i in range(0, 10))])
-async def test_code_check_files(patches, files, dir_files):
+@pytest.mark.parametrize("shard", [None, (1, 2), (2, 2)])
+async def test_code_check_files(patches, files, dir_files, shard):
     directory = MagicMock()
-    code_check = DummyCodeCheck(directory)
+    code_check = DummyCodeCheck(directory, shard=shard)
     patched = patches(
         ("AFileCodeCheck.checker_files",
          dict(new_callable=PropertyMock)),
+        "checker.sharding.in_shard",
         prefix="envoy.code.check.abstract.base")
     directory_files = AsyncMock(return_value=dir_files)
     directory.files = directory_files()
 
-    with patched as (m_files, ):
+    def in_shard(path, _shard):
+        assert _shard == shard
+        return int(path[1:]) % 2 == _shard[0] - 1
+
+    with patched as (m_files, m_in_shard):
         checker_files = AsyncMock(return_value=files)
         m_files.side_effect = checker_files
+        m_in_shard.side_effect = in_shard
         result = await code_check.files
 
-    assert (
-        result
-        == dir_files & files)
+    expected = dir_files & files
+    if shard:
+        expected = set(
+            path
+            for path
+            in expected
+            if in_shard(path, shard))
+    else:
+        assert not m_in_shard.called
+    assert result == expected
     if not dir_files:
         assert not checker_files.called
     assert (
@@ -96,6 +234,72 @@ async def test_code_check_files(patches, files, dir_files):
         == result)
 
 
+@pytest.mark.parametrize("file_cost", [None, 23])
+async def test_code_check_file_costs(patches, file_cost):
+    code_check = DummyCodeCheck("DIRECTORY")
+    patched = patches(
+        ("AFileCodeCheck.file_index",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.base")
+    files = MagicMock()
+    sizes = dict(A=0, B=7, C=400)
+    args = (
+        (file_cost, )
+        if file_cost is not None
+        else ())
+
+    with patched as (m_index, ):
+        m_index.return_value.sizes = AsyncMock(return_value=sizes)
+        assert (
+            await code_check.file_costs(files, *args)
+            == {file: size + (file_cost or 0)
+                for file, size
+                in sizes.items()})
+
+    assert (
+        m_index.return_value.sizes.call_args
+        == [tuple(files), {}])
+
+
+@pytest.mark.parametrize("files", [set(), {"F1"}, {"F1", "F2", "F3"}])
+@pytest.mark.parametrize("file_cost", [None, 23])
+async def test_code_check_file_batches(patches, files, file_cost):
+    directory = MagicMock()
+    code_check = DummyCodeCheck(directory)
+    patched = patches(
+        "event",
+        "functional",
+        ("AFileCodeCheck.files",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.file_costs",
+         dict(new_callable=AsyncMock)),
+        prefix="envoy.code.check.abstract.base")
+    args = (
+        (file_cost, )
+        if file_cost is not None
+        else ())
+
+    with patched as (m_event, m_func, m_files, m_costs):
+        m_files.side_effect = AsyncMock(return_value=files)
+        m_event.jobs.limit = 7
+        assert (
+            await code_check.file_batches(3, *args)
+            == (m_func.balanced_batches.return_value
+                if files
+                else []))
+
+    if not files:
+        assert not m_costs.called
+        assert not m_func.balanced_batches.called
+        return
+    assert (
+        m_costs.call_args
+        == [(files, file_cost or 0), {}])
+    assert (
+        m_func.balanced_batches.call_args
+        == [(m_costs.return_value, 21), {}])
+
+
 @abstracts.implementer(check.AProjectCodeCheck)
 class DummyProjectCodeCheck:
     pass
@@ -117,3 +321,29 @@ async def test_project_code_check_constructor(iters, patches):
     assert (
         m_super.call_args
         == [(project.directory, *args), kwargs])
+
+
+def test_project_code_check_changelog_paths(tmp_path):
+    project = MagicMock()
+    project.path = tmp_path
+    project.rel_version_path = pathlib.Path("VERSION.txt")
+    checker = DummyProjectCodeCheck(project)
+    changelogs = tmp_path.joinpath("changelogs")
+    project.changelogs.changelog_paths = dict(
+        V1=changelogs.joinpath("1.2.3.yaml"),
+        V2=changelogs.joinpath("current"))
+    changelogs.joinpath("current", "bug_fixes").mkdir(parents=True)
+    changelogs.joinpath("changelogs.yaml").write_text("")
+    changelogs.joinpath("1.2.3.yaml").write_text("")
+    changelogs.joinpath("current", "bug_fixes", "a__b.rst").write_text("")
+    tmp_path.joinpath("other.txt").write_text("")
+
+    assert (
+        checker.changelog_paths[0]
+        == "VERSION.txt")
+    assert (
+        sorted(checker.changelog_paths[1:])
+        == ["changelogs/1.2.3.yaml",
+            "changelogs/changelogs.yaml",
+            "changelogs/current/bug_fixes/a__b.rst"])
+    assert "changelog_paths" not in checker.__dict__
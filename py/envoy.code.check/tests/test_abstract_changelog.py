@@ -117,6 +117,19 @@ def test_changelogcheck_changelogs(iters, patches):
             for c in clogs.values()])
 
 
+async def test_changelogcheck_fingerprint_paths(patches):
+    changelog = DummyChangelogCheck()
+    patched = patches(
+        ("AChangelogCheck.changelog_paths",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.changelog")
+
+    with patched as (m_paths, ):
+        assert (
+            await changelog.fingerprint_paths
+            == m_paths.return_value)
+
+
 def test_changelogstatus_constructor():
     _check = MagicMock()
     changelog = MagicMock()
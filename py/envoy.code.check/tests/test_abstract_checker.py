@@ -143,6 +143,10 @@ def test_abstract_checker_constructor(patches, args, kwargs):
             "extensions_registered",
             "glint", "gofmt", "python_yapf", "python_flake8",
             "runtime_guards", "shellcheck", "yamllint"))
+    assert (
+        checker.sharded_checks
+        == ("glint", "gofmt", "python_yapf", "python_flake8",
+            "shellcheck", "yamllint"))
     for prop in iface_props:
         with pytest.raises(NotImplementedError):
             getattr(checker, prop)
@@ -241,6 +245,71 @@ def test_abstract_checker_tools(iters, patches, tool):
     assert tool in checker.__dict__
 
 
+@pytest.mark.parametrize(
+    "check_name,prop",
+    [("changelog", "changelog"),
+     ("extensions_fuzzed", "extensions"),
+     ("extensions_metadata", "extensions"),
+     ("extensions_owners", "extensions"),
+     ("extensions_registered", "extensions"),
+     ("runtime_guards", "runtime_guards"),
+     ("shellcheck", "shellcheck"),
+     ("yamllint", "yamllint")])
+async def test_abstract_checker_fingerprints(patches, check_name, prop):
+    checker = DummyCodeChecker()
+    patched = patches(
+        (f"ACodeChecker.{prop}",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+
+    fingerprint = AsyncMock()
+
+    with patched as (m_check, ):
+        m_check.return_value.fingerprint = fingerprint()
+        assert (
+            await getattr(checker, f"fingerprint_{check_name}")()
+            == fingerprint.return_value)
+
+
+@pytest.mark.parametrize("cached", [True, False])
+async def test_abstract_checker_shellcheck_cached(patches, cached):
+    checker = DummyCodeChecker()
+    patched = patches(
+        ("ACodeChecker.args",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.log",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.shellcheck",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+    checker.checks_to_run = ["glint", "shellcheck"]
+
+    with patched as (m_args, m_log, m_shellcheck):
+        m_args.return_value.check_cache = "CACHE"
+        m_args.return_value.shard = None
+        m_args.return_value.config_shellcheck = "CONFIG"
+        m_shellcheck.return_value.fingerprint = AsyncMock(
+            return_value="FINGERPRINT")()
+        fingerprint = run.checker.fingerprint(
+            "shellcheck",
+            "CONFIG",
+            "FINGERPRINT")
+        checker.check_cache = dict(
+            shellcheck=(
+                fingerprint
+                if cached
+                else "OTHER"))
+        assert not await checker.skip_cached_checks()
+
+    assert checker.fingerprints == dict(shellcheck=fingerprint)
+    if cached:
+        assert checker.cached_checks == {"shellcheck"}
+        assert checker.checks_to_run == ["glint"]
+        return
+    assert not checker.cached_checks
+    assert checker.checks_to_run == ["glint", "shellcheck"]
+
+
 async def test_abstract_checker_preload_changelog(patches):
     checker = DummyCodeChecker()
     patched = patches(
@@ -502,9 +571,14 @@ def test_abstract_checker_check_kwargs(patches):
          dict(new_callable=PropertyMock)),
         ("ACodeChecker.pool",
          dict(new_callable=PropertyMock)),
+        ("ACodeChecker.shard",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.file_index",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.checker")
 
-    with patched as (m_dict, m_bin, m_fix, m_loop, m_pool):
+    with patched as patchy:
+        (m_dict, m_bin, m_fix, m_loop, m_pool, m_shard, m_index) = patchy
         assert (
             checker.check_kwargs
             == m_dict.return_value)
@@ -515,7 +589,9 @@ def test_abstract_checker_check_kwargs(patches):
             dict(binaries=m_bin.return_value,
                  fix=m_fix.return_value,
                  loop=m_loop.return_value,
-                 pool=m_pool.return_value)])
+                 pool=m_pool.return_value,
+                 shard=m_shard.return_value,
+                 file_index=m_index.return_value)])
     assert "check_kwargs" in checker.__dict__
 
 
@@ -616,6 +692,31 @@ def test_abstract_checker_directory(patches):
     assert "directory" in checker.__dict__
 
 
+def test_abstract_checker_file_index(patches):
+    checker = DummyCodeChecker()
+    patched = patches(
+        "files",
+        ("ACodeChecker.directory",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.loop",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.pool",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+
+    with patched as (m_files, m_dir, m_loop, m_pool):
+        assert (
+            checker.file_index
+            == m_files.FileIndex.return_value)
+
+    assert (
+        m_files.FileIndex.call_args
+        == [(m_dir.return_value, ),
+            dict(loop=m_loop.return_value,
+                 pool=m_pool.return_value)])
+    assert "file_index" in checker.__dict__
+
+
 @pytest.mark.parametrize("all_files", [True, False])
 def test_abstract_checker_directory_kwargs(patches, all_files):
     checker = DummyCodeChecker()
@@ -708,6 +809,45 @@ def test_abstract_checker_path(patches):
     assert "path" not in checker.__dict__
 
 
+@pytest.mark.parametrize(
+    "checks",
+    [[],
+     ["glint", "gofmt"],
+     ["python_flake8", "yamllint", "glint"],
+     ["python_flake8", "python_yapf", "yamllint"]])
+def test_abstract_checker_pool_initializers(patches, checks):
+    checker = DummyCodeChecker()
+    patched = patches(
+        ("ACodeChecker.checks_to_run",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.directory",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.flake8_class",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.yamllint_class",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.yapf_class",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+
+    with patched as (m_checks, m_dir, m_flake8, m_yamllint, m_yapf):
+        m_checks.return_value = checks
+        path = str(m_dir.return_value.path)
+        classes = dict(
+            python_flake8=m_flake8.return_value,
+            python_yapf=m_yapf.return_value,
+            yamllint=m_yamllint.return_value)
+        assert (
+            checker.pool_initializers
+            == tuple(
+                (check_class.initialize_worker, (path, ))
+                for check, check_class
+                in classes.items()
+                if check in checks))
+
+    assert "pool_initializers" not in checker.__dict__
+
+
 def test_abstract_checker_project(patches):
     checker = DummyCodeChecker()
     patched = patches(
@@ -731,6 +871,8 @@ def test_abstract_checker_project(patches):
 def test_abstract_checker_runtime_guards(iters, patches):
     checker = DummyCodeChecker()
     patched = patches(
+        ("ACodeChecker.args",
+         dict(new_callable=PropertyMock)),
         ("ACodeChecker.check_kwargs",
          dict(new_callable=PropertyMock)),
         ("ACodeChecker.project",
@@ -740,7 +882,7 @@ def test_abstract_checker_runtime_guards(iters, patches):
         prefix="envoy.code.check.abstract.checker")
     kwargs = iters(dict)
 
-    with patched as (m_kwargs, m_project, m_class):
+    with patched as (m_args, m_kwargs, m_project, m_class):
         m_kwargs.return_value = kwargs
         assert (
             checker.runtime_guards
@@ -748,7 +890,10 @@ def test_abstract_checker_runtime_guards(iters, patches):
 
     assert (
         m_class.return_value.call_args
-        == [(m_project.return_value, ), kwargs])
+        == [(m_project.return_value, ),
+            dict(
+                mentions_cache=m_args.return_value.runtime_guards_cache,
+                **kwargs)])
     assert "runtime_guards" in checker.__dict__
 
 
@@ -780,7 +925,13 @@ def test_checker_add_arguments(patches):
             [("--codeowners", ), {}],
             [("--owners", ), {}],
             [("--extensions_build_config", ), {}],
-            [("--extensions_fuzzed_count", ), {}]])
+            [("--extensions_fuzzed_count", ), {}],
+            [("--runtime_guards_cache", ),
+             dict(
+                 metavar="FILE",
+                 help=("Store the runtime guards mentioned in released "
+                       "changelogs in this file, so that unchanged "
+                       "changelogs are not parsed again"))]])
 
 
 async def test_abstract_checker_check_changelogs(patches):
@@ -1060,16 +1211,19 @@ def test_abstract_checker__check_output(
         == [(check_files, ), {}])
     assert (
         m_error.call_args_list
-        == [[(m_active.return_value, [error_files[error]]), {}]
+        == [[(m_active.return_value, [error_files[error]]),
+             dict(path=error)]
             for error in errors])
     assert (
         m_warning.call_args_list
-        == [[(m_active.return_value, [warning_files[warning]]), {}]
+        == [[(m_active.return_value, [warning_files[warning]]),
+             dict(path=warning)]
             for warning in warnings])
     assert (
         m_succeed.call_args_list
-        == [[(m_active.return_value, [succeed]), {}]
-            for succeed in success])
+        == ([[(m_active.return_value, success), {}]]
+            if success
+            else []))
 
 
 async def test_abstract_checker__code_check(patches):
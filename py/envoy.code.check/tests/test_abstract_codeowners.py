@@ -0,0 +1,83 @@
+
+import pytest
+
+from envoy.code import check
+
+
+def test_codeowners_trie_constructor():
+    trie = check.abstract.codeowners.CodeOwnersTrie(
+        ["foo/bar/", "/foo/baz", "foo/bar"])
+    assert trie.root.match is None
+    assert trie._matches == {}
+    assert trie._within == {}
+    assert list(trie.root.children) == ["foo"]
+    foo = trie.root.children["foo"]
+    assert foo.match is None
+    assert list(foo.children) == ["bar", "baz"]
+    assert foo.children["bar"].match == (2, "foo/bar")
+    assert foo.children["bar"].children == {}
+    assert foo.children["baz"].match == (1, "/foo/baz")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [("", []),
+     ("/", []),
+     ("foo", ["foo"]),
+     ("/foo/bar/", ["foo", "bar"]),
+     ("foo//bar", ["foo", "bar"])])
+def test_codeowners_trie_parts(path):
+    path, expected = path
+    assert (
+        check.abstract.codeowners.CodeOwnersTrie.parts(path)
+        == expected)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [("foo", None),
+     ("foo/bar", "foo/bar/"),
+     ("foo/bar/", "foo/bar/"),
+     ("foo/bar/baz", "foo/bar/"),
+     ("foo/barbaz", None),
+     ("foo/bar/other/baz", "foo/bar/other"),
+     ("foo/bar/other/baz/deeper", "foo/bar/other"),
+     ("foo/bar/last", "foo/bar/"),
+     ("foo/bar/last/baz", "foo/bar/"),
+     ("other", None)])
+def test_codeowners_trie_match(path):
+    path, expected = path
+    trie = check.abstract.codeowners.CodeOwnersTrie(
+        ["foo/bar/last",
+         "foo/bar/",
+         "foo/bar/other"])
+    assert trie.match(path) == expected
+    assert trie._matches == {path: expected}
+    trie.root = None
+    assert trie.match(path) == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [("", True),
+     ("foo", True),
+     ("foo/", True),
+     ("foo/bar", True),
+     ("foo/bar/baz", True),
+     ("foo/bar/baz/qux", False),
+     ("foo/ba", False),
+     ("foo/other", False),
+     ("other", False)])
+def test_codeowners_trie_within(path):
+    path, expected = path
+    trie = check.abstract.codeowners.CodeOwnersTrie(["foo/bar/baz"])
+    assert trie.within(path) == expected
+    assert trie._within == {path: expected}
+    trie.root = None
+    assert trie.within(path) == expected
+
+
+def test_codeowners_trie_within_empty():
+    trie = check.abstract.codeowners.CodeOwnersTrie([])
+    assert not trie.within("")
+    assert trie.match("") is None
@@ -331,6 +331,62 @@ def test_extensions_extensions_status_values(iters, patches):
             == [("name", ), {}])
 
 
+@pytest.mark.parametrize("fuzzed_count", [None, "23"])
+async def test_extensions_fingerprint_parts(patches, fuzzed_count):
+    checker = check.AExtensionsCheck(
+        "DIRECTORY",
+        extensions_build_config="BUILD",
+        owners="OWNERS",
+        codeowners="CODEOWNERS",
+        extensions_fuzzed_count=fuzzed_count)
+    patched = patches(
+        ("AExtensionsCheck.tracked_directories",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.extensions")
+
+    with patched as (m_tracked, ):
+        m_tracked.side_effect = AsyncMock(return_value={"D2", "D1"})
+        assert (
+            await checker.fingerprint_parts
+            == (str(fuzzed_count), "D1", "D2"))
+
+
+@pytest.mark.parametrize("build_config", [None, "BUILD"])
+@pytest.mark.parametrize("owners", [None, "OWNERS"])
+async def test_extensions_fingerprint_paths(patches, build_config, owners):
+    checker = check.AExtensionsCheck(
+        "DIRECTORY",
+        extensions_build_config=build_config,
+        owners=owners,
+        codeowners="CODEOWNERS")
+    patched = patches(
+        ("AExtensionsCheck.metadata_core_path",
+         dict(new_callable=PropertyMock)),
+        ("AExtensionsCheck.metadata_contrib_path",
+         dict(new_callable=PropertyMock)),
+        ("AExtensionsCheck.extensions_schema_path",
+         dict(new_callable=PropertyMock)),
+        ("AExtensionsCheck.fuzz_test_path",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.extensions")
+
+    with patched as (m_core, m_contrib, m_schema, m_fuzz):
+        m_core.return_value = "CORE"
+        m_contrib.return_value = "CONTRIB"
+        m_schema.return_value = "SCHEMA"
+        m_fuzz.return_value = "FUZZ"
+        result = await checker.fingerprint_paths
+
+    assert (
+        result
+        == tuple(
+            path
+            for path
+            in (build_config, owners, "CODEOWNERS",
+                "CORE", "CONTRIB", "SCHEMA", "FUZZ")
+            if path))
+
+
 def test_extensions_fuzz_test_path():
     directory = MagicMock()
     checker = check.AExtensionsCheck(
@@ -865,6 +921,29 @@ async def test_extensions_tracked_ownership(iters, patches):
     assert "tracked_ownership" in checker.__dict__
 
 
+def test_extensions_tracked_ownership_trie(patches):
+    checker = check.AExtensionsCheck(
+        "DIRECTORY",
+        extensions_build_config="BUILD",
+        owners="OWNERS",
+        codeowners="CODEOWNERS")
+    patched = patches(
+        "CodeOwnersTrie",
+        ("AExtensionsCheck.tracked_ownership",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.extensions")
+
+    with patched as (m_trie, m_tracked):
+        assert (
+            checker.tracked_ownership_trie
+            == m_trie.return_value)
+
+    assert (
+        m_trie.call_args
+        == [(m_tracked.return_value, ), {}])
+    assert "tracked_ownership_trie" in checker.__dict__
+
+
 async def test_extensions_check_metadata(iters, patches):
     checker = check.AExtensionsCheck(
         "DIRECTORY",
@@ -1462,53 +1541,47 @@ async def test_extensions__metadata(patches, raises):
 
 
 @pytest.mark.parametrize("expected", [True, False])
-@pytest.mark.parametrize("startswith", [True, False])
-@pytest.mark.parametrize("matches", [True, False])
+@pytest.mark.parametrize("match", [None, "MATCH"])
+@pytest.mark.parametrize("within", [True, False])
 def test_extensions__owners_error_matches(
-        iters, patches, expected, startswith, matches):
+        patches, expected, match, within):
     checker = check.AExtensionsCheck(
         "DIRECTORY",
         extensions_build_config="BUILD",
         owners="OWNERS",
         codeowners="CODEOWNERS")
     patched = patches(
-        ("AExtensionsCheck.tracked_ownership",
+        ("AExtensionsCheck.tracked_ownership_trie",
          dict(new_callable=PropertyMock)),
         "AExtensionsCheck._owners_expected",
         prefix="envoy.code.check.abstract.extensions")
     path = MagicMock()
-    path.startswith.return_value = startswith
-
-    def cb_tracked(i):
-        _tracked = MagicMock()
-        _tracked.startswith.return_value = matches and i == 3
-        return _tracked
 
-    tracked = iters(cb=cb_tracked)
-
-    with patched as (m_tracked, m_expected):
+    with patched as (m_trie, m_expected):
         m_expected.return_value = expected
-        m_tracked.return_value = tracked
+        m_trie.return_value.match.return_value = match
+        m_trie.return_value.within.return_value = within
         assert (
             checker._owners_error_matches(path)
             == (()
-                if (not expected or startswith or matches)
+                if (not expected or match or within)
                 else (f"Directory ({path}) has no owners in CODEOWNERS",)))
 
-        assert (
-            m_expected.call_args
-            == [(path, ), {}])
-        if not expected:
-            assert not path.startswith.called
-            assert not m_tracked.called
-            return
-        assert (
-            path.startswith.call_args
-            == [(m_tracked.return_value, ), {}])
-        if startswith:
-            len(m_tracked.call_args_list) == 1
-            return
-        len(m_tracked.call_args_list) == 2
+    assert (
+        m_expected.call_args
+        == [(path, ), {}])
+    if not expected:
+        assert not m_trie.called
+        return
+    assert (
+        m_trie.return_value.match.call_args
+        == [(path, ), {}])
+    if match:
+        assert not m_trie.return_value.within.called
+        return
+    assert (
+        m_trie.return_value.within.call_args
+        == [(path, ), {}])
 
 
 @pytest.mark.parametrize("enough_maintainers", [True, False])
@@ -0,0 +1,318 @@
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+
+from aio.core import event
+
+from envoy.code import check
+
+
+def test_file_index_constructor():
+    index = check.abstract.files.FileIndex("DIRECTORY")
+    assert isinstance(index, event.IExecutive)
+    assert isinstance(index, check.interface.IFileIndex)
+    assert index.directory == "DIRECTORY"
+    assert index._loop is None
+    assert index._pool is None
+    assert index._interpreters == {}
+    assert index._sizes == {}
+
+    index = check.abstract.files.FileIndex(
+        "DIRECTORY",
+        loop="LOOP",
+        pool="POOL")
+    assert index._loop == "LOOP"
+    assert index._pool == "POOL"
+
+
+def test_file_index_file_interpreters(patches, tmp_path):
+    index = check.abstract.files.FileIndex
+    tmp_path.joinpath("script").write_text("#!/usr/bin/env bash\n\necho FOO\n")
+    tmp_path.joinpath("image.png").write_bytes(b"\x89PNG\r\n\x00\x00")
+    patched = patches(
+        "FileIndex.interpreter",
+        prefix="envoy.code.check.abstract.files")
+
+    with patched as (m_interpreter, ):
+        assert (
+            index.file_interpreters(
+                str(tmp_path),
+                "script", "image.png", "missing.sh")
+            == {"script": m_interpreter.return_value,
+                "image.png": m_interpreter.return_value,
+                "missing.sh": m_interpreter.return_value})
+
+    assert (
+        m_interpreter.call_args_list
+        == [[(b"#!/usr/bin/env bash\n\necho FOO\n", ), {}],
+            [(b"\x89PNG\r\n\x00\x00", ), {}],
+            [(b"", ), {}]])
+
+
+def test_file_index_file_interpreters_head(patches, tmp_path):
+    index = check.abstract.files.FileIndex
+    tmp_path.joinpath("big").write_bytes(b"#!/bin/sh\n" + b"X" * 1000)
+    patched = patches(
+        "FileIndex.interpreter",
+        prefix="envoy.code.check.abstract.files")
+
+    with patched as (m_interpreter, ):
+        index.file_interpreters(str(tmp_path), "big")
+
+    assert (
+        len(m_interpreter.call_args[0][0])
+        == check.abstract.files.FILE_HEAD_SIZE)
+
+
+def test_file_index_file_sizes(tmp_path):
+    index = check.abstract.files.FileIndex
+    tmp_path.joinpath("small.sh").write_text("x=1\n")
+    tmp_path.joinpath("large.sh").write_text("x=1\n" * 100)
+    assert (
+        index.file_sizes(
+            str(tmp_path),
+            "small.sh", "large.sh", "missing.sh")
+        == {"small.sh": 4,
+            "large.sh": 400,
+            "missing.sh": 0})
+
+
+@pytest.mark.parametrize(
+    "head",
+    [(b"", None),
+     (b"echo FOO\n", None),
+     (b"# !/bin/bash\n", None),
+     (b"#!\n", None),
+     (b"#!/bin/bash", "bash"),
+     (b"#!/bin/bash\necho FOO\n", "bash"),
+     (b"#!/bin/sh -e\n", "sh"),
+     (b"#! /usr/bin/python3\n", "python3"),
+     (b"#!/usr/bin/env bash\n", "bash"),
+     (b"#!/usr/bin/env -S bash -e\n", "bash"),
+     (b"#!/usr/bin/env\n", None)])
+def test_file_index_interpreter(head):
+    head, expected = head
+    assert (
+        check.abstract.files.FileIndex.interpreter(head)
+        == expected)
+
+
+@pytest.mark.parametrize(
+    "files",
+    [(),
+     ("F1", "F2"),
+     ("F1", "K1"),
+     ("K1", "K2")])
+async def test_file_index_interpreters(patches, files):
+    directory = MagicMock()
+    index = check.abstract.files.FileIndex(directory)
+    patched = patches(
+        "partial",
+        "str",
+        "FileIndex.execute_in_batches",
+        prefix="envoy.code.check.abstract.files")
+    index._interpreters.update(dict(K1="bash", K2=None))
+    missing = set(files) - {"K1", "K2"}
+    batched = [
+        {file: f"I:{file}"}
+        for file
+        in sorted(missing)]
+
+    async def iter_batched(*args):
+        for batch in batched:
+            yield batch
+
+    with patched as (m_partial, m_str, m_exec):
+        m_exec.side_effect = iter_batched
+        assert (
+            await index.interpreters(*files)
+            == {file: index._interpreters[file]
+                for file
+                in files})
+
+    assert (
+        index._interpreters
+        == dict(
+            K1="bash",
+            K2=None,
+            **{file: f"I:{file}"
+               for file
+               in missing}))
+    assert not index._lock.locked()
+    if not missing:
+        assert not m_exec.called
+        return
+    assert (
+        m_exec.call_args
+        == [(m_partial.return_value, *missing), {}])
+    assert (
+        m_partial.call_args
+        == [(index.file_interpreters, m_str.return_value), {}])
+    assert (
+        m_str.call_args
+        == [(directory.path, ), {}])
+
+
+@pytest.mark.parametrize(
+    "files",
+    [(),
+     ("F1", "F2"),
+     ("F1", "K1"),
+     ("K1", "K2")])
+async def test_file_index_sizes(patches, files):
+    directory = MagicMock()
+    index = check.abstract.files.FileIndex(directory)
+    patched = patches(
+        "asyncio.to_thread",
+        "str",
+        prefix="envoy.code.check.abstract.files")
+    index._sizes.update(dict(K1=23, K2=0))
+    missing = set(files) - {"K1", "K2"}
+
+    async def to_thread(fun, path, *files):
+        return {file: len(file) for file in files}
+
+    with patched as (m_thread, m_str):
+        m_thread.side_effect = to_thread
+        assert (
+            await index.sizes(*files)
+            == {file: index._sizes[file]
+                for file
+                in files})
+
+    assert (
+        index._sizes
+        == dict(
+            K1=23,
+            K2=0,
+            **{file: len(file)
+               for file
+               in missing}))
+    assert not index._lock.locked()
+    if not missing:
+        assert not m_thread.called
+        return
+    assert (
+        m_thread.call_args
+        == [(index.file_sizes, m_str.return_value, *missing), {}])
+    assert (
+        m_str.call_args
+        == [(directory.path, ), {}])
+
+
+async def test_file_index_lookups_shared(tmp_path):
+    directory = MagicMock()
+    directory.path = tmp_path
+    tmp_path.joinpath("A").write_text("#!/bin/bash\n")
+    index = check.abstract.files.FileIndex(directory)
+    index.execute_in_batches = MagicMock(
+        wraps=index.execute_in_batches)
+    index.execute = AsyncMock(
+        side_effect=lambda fun, *args: fun(*args))
+
+    results = await asyncio.gather(
+        index.interpreters("A"),
+        index.interpreters("A"))
+
+    assert results == [dict(A="bash"), dict(A="bash")]
+    assert index.execute_in_batches.call_count == 1
+
+
+async def test_file_index_extensions():
+    directory = MagicMock()
+    index = check.abstract.files.FileIndex(directory)
+    directory.files = AsyncMock(
+        return_value={
+            "a.py",
+            "b/c.py",
+            "b/d.sh",
+            "e",
+            "f.tar.gz"})()
+    assert (
+        await index.extensions
+        == {".py": {"a.py", "b/c.py"},
+            ".sh": {"b/d.sh"},
+            "": {"e"},
+            ".gz": {"f.tar.gz"}}
+        == getattr(
+            index,
+            check.abstract.files.FileIndex.extensions.cache_name)[
+                "extensions"])
+
+
+@pytest.mark.parametrize(
+    "extensions",
+    [(),
+     (".py", ),
+     (".py", ".sh"),
+     (".py", ".go")])
+async def test_file_index_with_extension(patches, extensions):
+    index = check.abstract.files.FileIndex("DIRECTORY")
+    patched = patches(
+        ("FileIndex.extensions",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.files")
+    files = {
+        ".py": {"a.py", "b.py"},
+        ".sh": {"c.sh"}}
+
+    with patched as (m_extensions, ):
+        m_extensions.side_effect = AsyncMock(return_value=files)
+        assert (
+            await index.with_extension(*extensions)
+            == set(
+                path
+                for extension
+                in extensions
+                for path
+                in files.get(extension, ())))
+
+
+@pytest.mark.parametrize(
+    "interpreters",
+    [(),
+     ("bash", ),
+     ("bash", "sh"),
+     ("python3", )])
+async def test_file_index_with_interpreter(patches, interpreters):
+    index = check.abstract.files.FileIndex("DIRECTORY")
+    patched = patches(
+        "FileIndex.interpreters",
+        prefix="envoy.code.check.abstract.files")
+    files = MagicMock()
+    found = dict(
+        A="bash",
+        B=None,
+        C="sh",
+        D="bash")
+
+    with patched as (m_interpreters, ):
+        m_interpreters.side_effect = AsyncMock(return_value=found)
+        assert (
+            await index.with_interpreter(files, *interpreters)
+            == set(
+                path
+                for path, interpreter
+                in found.items()
+                if interpreter in interpreters))
+
+    assert (
+        m_interpreters.call_args
+        == [tuple(files), {}])
+
+
+def test_file_index__lock(patches):
+    index = check.abstract.files.FileIndex("DIRECTORY")
+    patched = patches(
+        "asyncio",
+        prefix="envoy.code.check.abstract.files")
+
+    with patched as (m_aio, ):
+        assert index._lock == m_aio.Lock.return_value
+
+    assert (
+        m_aio.Lock.call_args
+        == [(), {}])
+    assert "_lock" in index.__dict__
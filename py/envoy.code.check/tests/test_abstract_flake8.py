@@ -10,15 +10,14 @@ from envoy.code import check
 
 def test_check_flake8_files(patches):
     patched = patches(
-        "Flake8App",
+        "AFlake8Check.flake8_app",
         prefix="envoy.code.check.abstract.flake8")
     path = MagicMock()
-    files = MagicMock()
     args = MagicMock()
 
     with patched as (m_app, ):
         assert (
-            check.AFlake8Check.check_flake8_files(path, args, files)
+            check.AFlake8Check.check_flake8_files(path, args, "F1", "F2")
             == m_app.return_value.run_checks.return_value)
 
     assert (
@@ -26,12 +25,12 @@ def test_check_flake8_files(patches):
         == [(path, args), {}])
     assert (
         m_app.return_value.run_checks.call_args
-        == [(files, ), {}])
+        == [({"F1", "F2"}, ), {}])
 
 
 def test_filter_flake8_files(patches):
     patched = patches(
-        "Flake8App",
+        "AFlake8Check.flake8_app",
         prefix="envoy.code.check.abstract.flake8")
     path = MagicMock()
     files = MagicMock()
@@ -50,6 +49,61 @@ def test_filter_flake8_files(patches):
         == [(files, ), {}])
 
 
+def test_flake8_args_for():
+    assert (
+        check.AFlake8Check.flake8_args_for("/PATH")
+        == ("--color=never",
+            "--jobs=1",
+            "--config",
+            f"/PATH/{check.abstract.flake8.FLAKE8_CONFIG}",
+            "/PATH"))
+
+
+def test_flake8_app(patches):
+    patched = patches(
+        "Flake8App",
+        prefix="envoy.code.check.abstract.flake8")
+    check.AFlake8Check.flake8_app.cache_clear()
+
+    with patched as (m_app, ):
+        assert (
+            check.AFlake8Check.flake8_app("PATH", ("ARGS", ))
+            == m_app.return_value)
+        assert (
+            check.AFlake8Check.flake8_app("PATH", ("ARGS", ))
+            == m_app.return_value)
+
+    check.AFlake8Check.flake8_app.cache_clear()
+    assert (
+        m_app.call_args_list
+        == [[("PATH", ("ARGS", )), {}]])
+
+
+@pytest.mark.parametrize("raises", [None, Exception, ValueError])
+def test_flake8_initialize_worker(patches, raises):
+    patched = patches(
+        "pathlib",
+        "AFlake8Check.flake8_app",
+        "AFlake8Check.flake8_args_for",
+        prefix="envoy.code.check.abstract.flake8")
+
+    with patched as (m_plib, m_app, m_args):
+        if raises:
+            m_app.side_effect = raises("BAD CONFIG")
+        assert not check.AFlake8Check.initialize_worker("PATH")
+
+    assert (
+        m_plib.Path.call_args
+        == [("PATH", ), {}])
+    assert (
+        m_app.call_args
+        == [(str(m_plib.Path.return_value.resolve.return_value),
+             m_args.return_value), {}])
+    assert (
+        m_args.call_args
+        == [("PATH", ), {}])
+
+
 def test_flake8_constructor():
     flake8 = check.AFlake8Check("DIRECTORY")
     assert flake8.directory == "DIRECTORY"
@@ -114,18 +168,17 @@ def test_flake8_flake8_args(patches):
     directory = MagicMock()
     flake8 = check.AFlake8Check(directory)
     patched = patches(
-        ("AFlake8Check.flake8_config_path",
-         dict(new_callable=PropertyMock)),
+        "AFlake8Check.flake8_args_for",
         prefix="envoy.code.check.abstract.flake8")
 
-    with patched as (m_config, ):
+    with patched as (m_args, ):
         assert (
             flake8.flake8_args
-            == ("--color=never",
-                "--config",
-                str(m_config.return_value),
-                str(directory.path)))
+            == m_args.return_value)
 
+    assert (
+        m_args.call_args
+        == [(str(directory.path), ), {}])
     assert "flake8_args" not in flake8.__dict__
 
 
@@ -141,32 +194,87 @@ def test_flake8_flake8_config_path():
     assert "flake8_config_path" not in flake8.__dict__
 
 
-async def test_flake8_flake8_errors(patches):
+@pytest.mark.parametrize("limit", [1, 2, 5])
+@pytest.mark.parametrize("files", [set(), set(["F1", "F2"])])
+async def test_flake8_flake8_batches(patches, limit, files):
     directory = MagicMock()
     flake8 = check.AFlake8Check(directory)
     patched = patches(
+        "event",
+        ("AFlake8Check.file_batches",
+         dict(new_callable=AsyncMock)),
         ("AFlake8Check.files",
          dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.flake8")
+
+    with patched as (m_event, m_batches, m_files):
+        m_event.jobs.limit = limit
+        m_files.side_effect = AsyncMock(return_value=files)
+        result = await flake8.flake8_batches
+
+    if limit > 1:
+        assert result == m_batches.return_value
+        assert (
+            m_batches.call_args
+            == [(check.abstract.flake8.FLAKE8_BATCHES_PER_JOB,
+                 check.abstract.flake8.FLAKE8_FILE_COST), {}])
+        assert not m_files.called
+        return
+    assert not m_batches.called
+    assert (
+        result
+        == ([list(files)]
+            if files
+            else []))
+    assert not (
+        hasattr(
+            flake8,
+            check.AFlake8Check.flake8_batches.cache_name))
+
+
+@pytest.mark.parametrize("batches", [0, 1, 3])
+async def test_flake8_flake8_errors(patches, batches):
+    directory = MagicMock()
+    flake8 = check.AFlake8Check(directory)
+    patched = patches(
+        ("AFlake8Check.flake8_batches",
+         dict(new_callable=PropertyMock)),
         ("AFlake8Check.flake8_args",
          dict(new_callable=PropertyMock)),
         "AFlake8Check.check_flake8_files",
         ("AFlake8Check.execute",
          dict(new_callable=AsyncMock)),
         prefix="envoy.code.check.abstract.flake8")
-
-    with patched as (m_files, m_args, m_checks, m_execute):
-        files = AsyncMock()
-        m_files.side_effect = files
-        assert (
-            await flake8.flake8_errors
-            == m_execute.return_value)
-
-    assert (
-        m_execute.call_args
-        == [(m_checks,
-             directory.absolute_path,
-             m_args.return_value,
-             files.return_value), {}])
+    batched = [
+        [f"B{i}F{j}" for j in range(0, i + 1)]
+        for i
+        in range(0, batches)]
+
+    async def execute(fun, path, args, *files):
+        return [f"{file}: ERROR" for file in files]
+
+    with patched as (m_batches, m_args, m_checks, m_execute):
+        m_batches.side_effect = AsyncMock(return_value=batched)
+        m_execute.side_effect = execute
+        errors = await flake8.flake8_errors
+
+    assert (
+        sorted(errors)
+        == sorted(
+            f"{file}: ERROR"
+            for batch
+            in batched
+            for file
+            in batch))
+    assert (
+        sorted(m_execute.call_args_list)
+        == sorted(
+            [(m_checks,
+              directory.absolute_path,
+              m_args.return_value,
+              *batch), {}]
+            for batch
+            in batched))
     assert not (
         hasattr(
             flake8,
@@ -645,17 +753,53 @@ def test_flake8application_make_formatter(patches):
          dict(new_callable=PropertyMock)),
         ("Flake8Application.output_fd",
          dict(new_callable=PropertyMock)),
+        "Flake8Application._start",
         "Flake8Application._stop",
         prefix="envoy.code.check.abstract.flake8")
     app.formatter = MagicMock()
+    start = app.formatter.start
     stop = app.formatter.stop
 
-    with patched as (m_super, m_out, m_stop):
+    with patched as (m_super, m_out, m_start, m_stop):
         assert not app.make_formatter()
 
     assert (
         m_super.call_args
         == [(), {}])
     assert app.formatter.output_fd == m_out.return_value
+    assert app._formatter_start == start
     assert app._formatter_stop == stop
+    assert app.formatter.start == m_start
     assert app.formatter.stop == m_stop
+
+
+@pytest.mark.parametrize("started", [True, False])
+def test_flake8application__start(started):
+    app = check.abstract.flake8.Flake8Application()
+    app.formatter = MagicMock()
+    app._formatter_start = MagicMock()
+    output_fd = app.output_fd if started else None
+
+    assert not app._start()
+
+    assert (
+        app._formatter_start.call_args
+        == [(), {}])
+    assert app.formatter.output_fd is app.output_fd
+    assert app.output_fd is not output_fd
+
+
+def test_flake8application_runs(tmp_path):
+    tmp_path.joinpath("bad.py").write_text("import os\n")
+    tmp_path.joinpath("good.py").write_text("x = 1\n")
+    app = check.abstract.flake8.Flake8App(
+        str(tmp_path),
+        ("--color=never", "--jobs=1", str(tmp_path)))
+
+    assert (
+        app.run_checks({"bad.py"})
+        == ["bad.py:1:1: F401 'os' imported but unused"])
+    assert app.run_checks({"good.py"}) == []
+    assert (
+        app.run_checks({"bad.py", "good.py"})
+        == ["bad.py:1:1: F401 'os' imported but unused"])
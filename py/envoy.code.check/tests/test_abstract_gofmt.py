@@ -15,49 +15,33 @@ def test_gofmt_constructor():
     assert isinstance(gofmt, subprocess.ASubprocessHandler)
 
 
-@pytest.mark.parametrize("diff", [True, False])
-def test_gofmt_handle(patches, diff):
+def test_gofmt_handle(patches):
     gofmt = check.abstract.gofmt.Gofmt("PATH")
     response = MagicMock()
-    if diff:
-        response.args.__getitem__.return_value = "-d"
     patched = patches(
         "Gofmt.handle_diff",
-        "Gofmt.handle_problems",
         prefix="envoy.code.check.abstract.gofmt")
 
-    with patched as (m_diff, m_probs):
+    with patched as (m_diff, ):
         assert (
             gofmt.handle(response)
-            == (m_diff.return_value
-                if diff
-                else m_probs.return_value))
+            == m_diff.return_value)
 
     assert (
-        response.args.__getitem__.call_args
-        == [(1, ), {}])
-    if diff:
-        assert not m_probs.called
-        assert (
-            m_diff.call_args
-            == [(response, ), {}])
-    else:
-        assert not m_diff.called
-        assert (
-            m_probs.call_args
-            == [(response, ), {}])
+        m_diff.call_args
+        == [(response, ), {}])
 
 
 @pytest.mark.parametrize("stdout", [True, False])
-@pytest.mark.parametrize("failure", [None, "extra", "missing"])
+@pytest.mark.parametrize("failure", [None, "extra", "flag", "missing"])
 def test_gofmt_handle_diff(patches, iters, stdout, failure):
     gofmt = check.abstract.gofmt.Gofmt("PATH")
     response = MagicMock()
     response.stdout.__bool__.return_value = stdout
     lines = iters()
-    files = iters(cb=MagicMock)
+    files = iters(cb=lambda i: f"F{i}.go")
     response.stdout.splitlines.return_value = lines
-    response.args.__getitem__.return_value = files
+    response.args = ["CMD", "-d", "-w", *files]
     patched = patches(
         "dict",
         "Gofmt._diff_line",
@@ -69,6 +53,8 @@ def test_gofmt_handle_diff(patches, iters, stdout, failure):
             m_diff.return_value = None
         elif failure == "extra":
             m_diff.return_value = "EXTRA"
+        elif failure == "flag":
+            m_diff.return_value = "-w"
         else:
             m_diff.return_value = files[0]
         if not stdout or not failure:
@@ -84,7 +70,6 @@ def test_gofmt_handle_diff(patches, iters, stdout, failure):
         == [(), {}])
     if not stdout:
         assert not e
-        assert not response.args.__getitem__.called
         assert not response.stdout.splitlines.called
         assert not m_diff.called
         return
@@ -96,10 +81,11 @@ def test_gofmt_handle_diff(patches, iters, stdout, failure):
         == [("", m_dict.return_value, lines[0]), {}])
     if failure == "missing":
         assert e.value.args[0] == f"Unable to parse: {response}"
-    if failure == "extra":
+    if failure in ["extra", "flag"]:
         assert (
             e.value.args[0]
-            == f"Unable to parse filename (EXTRA): {response}")
+            == ("Unable to parse filename "
+                f"({m_diff.return_value}): {response}"))
     if failure:
         assert len(m_diff.call_args_list) == 1
         return
@@ -121,30 +107,6 @@ def test_gofmt_handle_error():
     assert e.value.args[0] == response
 
 
-def test_gofmt_handle_problems(patches):
-    gofmt = check.abstract.gofmt.Gofmt("PATH")
-    response = MagicMock()
-    patched = patches(
-        "dict",
-        "checker",
-        prefix="envoy.code.check.abstract.gofmt")
-
-    with patched as (m_dict, m_checker):
-        assert (
-            gofmt.handle_problems(response)
-            == m_dict.return_value)
-
-    assert (
-        m_dict.call_args
-        == [(), dict(reformat=m_checker.Problems.return_value)])
-    assert (
-        m_checker.Problems.call_args
-        == [(), dict(errors=response.stdout.splitlines.return_value)])
-    assert (
-        response.stdout.splitlines.call_args
-        == [(), {}])
-
-
 @pytest.mark.parametrize("starts", [True, False])
 def test_gofmt__diff_line(patches, starts):
     gofmt = check.abstract.gofmt.Gofmt("PATH")
@@ -165,7 +127,7 @@ def test_gofmt__diff_line(patches, starts):
 
     assert (
         line.startswith.call_args
-        == [("diff -u", ), {}])
+        == [("diff ", ), {}])
     if not starts:
         assert not line.split.called
         assert (
@@ -267,9 +229,8 @@ def test_gofmt_check_gofmt(patches, iters):
 
 @pytest.mark.parametrize(
     "cmd",
-    [["diff", "-d"],
-     ["fix", "-w"],
-     ["problems", "-l"]])
+    [["diff", ("-d", )],
+     ["fix", ("-d", "-w")]])
 def test_gofmt_check_gofmt_cmds(patches, cmd):
     cmd, expected = cmd
     directory = MagicMock()
@@ -284,7 +245,7 @@ def test_gofmt_check_gofmt_cmds(patches, cmd):
 
     assert (
         m_gofmt.call_args
-        == [(expected, ), {}])
+        == [expected, {}])
     assert f"gofmt_{cmd}" in gofmt.__dict__
 
 
@@ -315,128 +276,57 @@ async def test_gofmt_checker_files(patches, iters):
             check.AGofmtCheck.checker_files.cache_name))
 
 
-async def test_gofmt_fixable_files(patches, iters):
-    directory = MagicMock()
-    gofmt = check.AGofmtCheck(directory)
-    patched = patches(
-        "set",
-        "AGofmtCheck.execute_in_batches",
-        ("AGofmtCheck.gofmt_problems",
-         dict(new_callable=PropertyMock)),
-        ("AGofmtCheck.files",
-         dict(new_callable=PropertyMock)),
-        prefix="envoy.code.check.abstract.gofmt")
-    files = iters()
-    jobs = iters(cb=lambda x: MagicMock(dict(errors=["I{x}"])))
-
-    async def iter_jobs(x, y, *z):
-        for job in jobs:
-            yield job
-
-    with patched as (m_set, m_exec, m_probs, m_files):
-        m_exec.side_effect = iter_jobs
-        m_files.side_effect = AsyncMock(return_value=files)
-        assert (
-            await gofmt.fixable_files
-            == (m_set.return_value
-                .__ior__.return_value
-                .__ior__.return_value
-                .__ior__.return_value
-                .__ior__.return_value
-                .__ior__.return_value)
-            == getattr(
-                gofmt,
-                check.AGofmtCheck.fixable_files.cache_name)[
-                    "fixable_files"])
-
-    assert (
-        m_exec.call_args
-        == [(m_probs.return_value,) + tuple(files), {}])
-    assert (
-        m_set.call_args_list
-        == ([[(), {}]]
-            + [[(j.__getitem__.return_value.errors, ), {}]
-               for j
-               in jobs]))
-    tset = m_set.return_value
-    for i, j in enumerate(jobs):
-        assert (
-            tset.__ior__.call_args
-            == [(m_set.return_value, ), {}])
-        assert (
-            j.__getitem__.call_args
-            == [("reformat", ), {}])
-        tset = tset.__ior__.return_value
-
-
 async def test_gofmt_fixed_files(patches, iters):
     directory = MagicMock()
     gofmt = check.AGofmtCheck(directory)
     patched = patches(
         "checker",
-        "AGofmtCheck.execute_in_batches",
+        ("AGofmtCheck.gofmt_results",
+         dict(new_callable=AsyncMock)),
         ("AGofmtCheck.gofmt_fix",
          dict(new_callable=PropertyMock)),
-        ("AGofmtCheck.fixable_files",
-         dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.gofmt")
-    files = iters()
-    jobs = iters(cb=lambda x: MagicMock(dict(errors=["I{x}"])))
-
-    async def iter_jobs(x, y, *z):
-        for job in jobs:
-            yield job
+    diffs = iters(dict)
 
-    with patched as (m_checker, m_exec, m_fix, m_files):
-        m_exec.side_effect = iter_jobs
-        m_files.side_effect = AsyncMock(return_value=files)
+    with patched as (m_checker, m_results, m_fix):
+        m_results.return_value = diffs
         assert (
             await gofmt.fixed_files
             == {f: m_checker.Problems.return_value
-                for f in files})
+                for f in diffs})
 
     assert (
-        m_exec.call_args
-        == [(m_fix.return_value, ) + tuple(files), {}])
+        m_results.call_args
+        == [(m_fix.return_value, ), {}])
     assert (
         m_checker.Problems.call_args_list
         == [[(), dict(errors=[f"Reformatted: {f}"])]
-            for f in files])
+            for f in diffs])
     assert not (
         hasattr(
             gofmt,
             check.AGofmtCheck.fixed_files.cache_name))
 
 
-async def test_gofmt_check_go_files(patches, iters):
-    directory = MagicMock()
-    gofmt = check.AGofmtCheck(directory)
+async def test_gofmt_check_go_files(patches):
+    gofmt = check.AGofmtCheck("DIRECTORY")
     patched = patches(
-        "set",
+        ("AGofmtCheck.file_index",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.gofmt")
 
-    def filemock(x):
-        mock = MagicMock()
-        mock.x = x
-        mock.endswith.side_effect = lambda y: bool(x % 2)
-        return mock
-
-    files = iters(cb=filemock)
-    directory.files = AsyncMock(return_value=files)()
-
-    with patched as (m_set, ):
+    with patched as (m_index, ):
+        m_index.return_value.with_extension = AsyncMock()
         assert (
             await gofmt.go_files
-            == m_set.return_value)
-        resultiter = m_set.call_args[0][0]
-        result = list(resultiter)
+            == m_index.return_value.with_extension.return_value
+            == getattr(
+                gofmt,
+                check.AGofmtCheck.go_files.cache_name)["go_files"])
 
-    assert isinstance(resultiter, types.GeneratorType)
-    assert result == [x for x in files if x.x % 2]
-    for file in files:
-        assert (
-            file.endswith.call_args
-            == [(".go", ), {}])
+    assert (
+        m_index.return_value.with_extension.call_args
+        == [(".go", ), {}])
 
 
 @pytest.mark.parametrize("binfile", [True, False])
@@ -515,49 +405,68 @@ def test_gofmt_nogofmt_re(patches, nogo_re):
 
 
 @pytest.mark.parametrize("fix", [True, False])
-async def test_gofmt_problem_files(patches, iters, fix):
+async def test_gofmt_problem_files(patches, fix):
     directory = MagicMock()
     gofmt = check.AGofmtCheck(directory)
     patched = patches(
-        "dict",
-        "AGofmtCheck.execute_in_batches",
-        "AGofmtCheck.gofmt_diff",
-        ("AGofmtCheck.files",
+        ("AGofmtCheck.gofmt_results",
+         dict(new_callable=AsyncMock)),
+        ("AGofmtCheck.gofmt_diff",
          dict(new_callable=PropertyMock)),
         ("AGofmtCheck.fix",
          dict(new_callable=PropertyMock)),
         ("AGofmtCheck.fixed_files",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.gofmt")
-    files = iters()
-    jobs = iters(cb=MagicMock)
-    fixed = iters(cb=MagicMock)
+    fixed = MagicMock()
 
-    async def iter_jobs(x, y, *z):
-        for i, job in enumerate(jobs):
-            job.__bool__.return_value = bool(i % 2)
-            yield job
-
-    with patched as (m_dict, m_exec, m_diff, m_files, m_fix, m_fixed):
+    with patched as (m_results, m_diff, m_fix, m_fixed):
         m_fix.return_value = fix
-        m_exec.side_effect = iter_jobs
-        m_files.side_effect = AsyncMock(return_value=files)
         m_fixed.side_effect = AsyncMock(return_value=fixed)
         assert (
             await gofmt.problem_files
             == (fixed
                 if fix
-                else m_dict.return_value)
+                else m_results.return_value)
             == getattr(
                 gofmt,
                 check.AGofmtCheck.problem_files.cache_name)[
                     "problem_files"])
 
     if fix:
-        assert not m_dict.return_value.update.called
-        assert not m_exec.called
+        assert not m_results.called
         return
     assert not m_fixed.called
+    assert (
+        m_results.call_args
+        == [(m_diff.return_value, ), {}])
+
+
+async def test_gofmt_gofmt_results(patches, iters):
+    directory = MagicMock()
+    gofmt = check.AGofmtCheck(directory)
+    patched = patches(
+        "dict",
+        "AGofmtCheck.execute_in_batches",
+        ("AGofmtCheck.files",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.gofmt")
+    files = iters()
+    jobs = iters(cb=MagicMock)
+    executable = MagicMock()
+
+    async def iter_jobs(x, *y):
+        for i, job in enumerate(jobs):
+            job.__bool__.return_value = bool(i % 2)
+            yield job
+
+    with patched as (m_dict, m_exec, m_files):
+        m_exec.side_effect = iter_jobs
+        m_files.side_effect = AsyncMock(return_value=files)
+        assert (
+            await gofmt.gofmt_results(executable)
+            == m_dict.return_value)
+
     assert (
         m_dict.return_value.update.call_args_list
         == [[(j, ), {}]
@@ -566,7 +475,7 @@ async def test_gofmt_problem_files(patches, iters, fix):
             if i % 2])
     assert (
         m_exec.call_args
-        == [(m_diff, ) + tuple(files), {}])
+        == [(executable, ) + tuple(files), {}])
 
 
 def test_gofmt__gofmt(patches, iters):
@@ -1,7 +1,10 @@
 
+import json
 import types
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
+import pytest
+
 from envoy.code import check
 
 
@@ -22,12 +25,72 @@ def test_runtimeguardscheck_constructor(patches):
 
     with patched as (m_super, ):
         m_super.return_value = None
-        guards = _DummyRuntimeGuardsCheck("PROJECT")
+        guards = _DummyRuntimeGuardsCheck("PROJECT", foo="FOO")
 
     assert isinstance(guards, check.AProjectCodeCheck)
+    assert (
+        m_super.call_args
+        == [("PROJECT", ), dict(foo="FOO")])
+    assert guards._mentions_cache is None
+
+    patched = patches(
+        "abstract.AProjectCodeCheck.__init__",
+        prefix="envoy.code.check.abstract.runtime_guards")
+
+    with patched as (m_super, ):
+        m_super.return_value = None
+        guards = _DummyRuntimeGuardsCheck(
+            "PROJECT",
+            mentions_cache="CACHE")
+
     assert (
         m_super.call_args
         == [("PROJECT", ), {}])
+    assert guards._mentions_cache == "CACHE"
+
+
+async def test_runtimeguardscheck_changelog_mentions(patches):
+    guards = DummyRuntimeGuardsCheck()
+    guards.project = MagicMock()
+    patched = patches(
+        ("ARuntimeGuardsCheck._mentions_cached",
+         dict(new_callable=PropertyMock)),
+        "ARuntimeGuardsCheck._changelog_mention",
+        "ARuntimeGuardsCheck._mentions_cache_update",
+        prefix="envoy.code.check.abstract.runtime_guards")
+    changelogs = {f"V{i}": MagicMock() for i in range(0, 5)}
+    cached = dict(V1={"G1"}, V3={"G3"})
+    guards.project.changelogs.items.return_value = changelogs.items()
+
+    async def mention(changelog):
+        for version, _changelog in changelogs.items():
+            if changelog is _changelog:
+                return {f"FOUND{version}"}
+
+    with patched as (m_cached, m_mention, m_update):
+        m_cached.side_effect = AsyncMock(return_value=cached)
+        m_mention.side_effect = mention
+        assert (
+            await guards.changelog_mentions
+            == dict(
+                V0={"FOUNDV0"},
+                V1={"G1"},
+                V2={"FOUNDV2"},
+                V3={"G3"},
+                V4={"FOUNDV4"})
+            == getattr(
+                guards,
+                check.ARuntimeGuardsCheck.changelog_mentions.cache_name)[
+                    "changelog_mentions"])
+
+    assert (
+        m_mention.call_args_list
+        == [[(changelogs[version], ), {}]
+            for version
+            in ["V0", "V2", "V4"]])
+    assert (
+        m_update.call_args
+        == [(await guards.changelog_mentions, ), {}])
 
 
 async def test_runtimeguardscheck_configured(iters, patches):
@@ -72,6 +135,36 @@ async def test_runtimeguardscheck_configured(iters, patches):
             == [(slice(14, -2), ), {}])
 
 
+async def test_runtimeguardscheck_fingerprint_parts(patches):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        ("ARuntimeGuardsCheck.expected_missing",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.runtime_guards")
+
+    with patched as (m_missing, ):
+        m_missing.return_value = {"C", "A", "B"}
+        assert (
+            await guards.fingerprint_parts
+            == ("A", "B", "C"))
+
+
+async def test_runtimeguardscheck_fingerprint_paths(patches):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        ("ARuntimeGuardsCheck.changelog_paths",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.runtime_guards")
+
+    with patched as (m_paths, ):
+        m_paths.return_value = ("P1", "P2")
+        assert (
+            await guards.fingerprint_paths
+            == (check.abstract.runtime_guards.RUNTIME_GUARDS_CONFIG_PATH,
+                "P1",
+                "P2"))
+
+
 def test_runtimeguardscheck_expected_missing(patches):
     guards = DummyRuntimeGuardsCheck()
     patched = patches(
@@ -90,33 +183,142 @@ def test_runtimeguardscheck_expected_missing(patches):
     assert "expected_missing" in guards.__dict__
 
 
-async def test_runtimeguardscheck_mentioned(iters, patches):
+async def test_runtimeguardscheck_mentioned(patches):
     guards = DummyRuntimeGuardsCheck()
     patched = patches(
-        ("ARuntimeGuardsCheck._changes",
+        ("ARuntimeGuardsCheck.mentions",
          dict(new_callable=PropertyMock)),
-        "ARuntimeGuardsCheck._find_mention",
         prefix="envoy.code.check.abstract.runtime_guards")
+    mentions = dict(G1={"V1"}, G2={"V1", "V2"})
 
-    def find_mention(x):
-        return iters(set, cb=lambda i: f"X{i}", start=x, count=3)
-
-    async def changes():
-        for x in range(0, 10):
-            yield x
-
-    with patched as (m_changes, m_mention):
-        m_changes.side_effect = changes
-        m_mention.side_effect = find_mention
-        assert (
-            await guards.mentioned
-            == set(f"X{i}" for i in range(0, 12)))
+    with patched as (m_mentions, ):
+        m_mentions.side_effect = AsyncMock(return_value=mentions)
+        assert await guards.mentioned == {"G1", "G2"}
 
     assert not hasattr(
         guards,
         check.ARuntimeGuardsCheck.mentioned.cache_name)
 
 
+async def test_runtimeguardscheck_mentions(patches):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        ("ARuntimeGuardsCheck.changelog_mentions",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.runtime_guards")
+    mentions = dict(
+        V1={"G1", "G2"},
+        V2=set(),
+        V3={"G2", "G3"})
+
+    with patched as (m_mentions, ):
+        m_mentions.side_effect = AsyncMock(return_value=mentions)
+        assert (
+            await guards.mentions
+            == dict(
+                G1={"V1"},
+                G2={"V1", "V3"},
+                G3={"V3"})
+            == getattr(
+                guards,
+                check.ARuntimeGuardsCheck.mentions.cache_name)["mentions"])
+
+
+@pytest.mark.parametrize("path", [None, "PATH"])
+async def test_runtimeguardscheck_mentions_cache(patches, path):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        "asyncio",
+        ("ARuntimeGuardsCheck.mentions_cache_path",
+         dict(new_callable=PropertyMock)),
+        "ARuntimeGuardsCheck._mentions_cache_load",
+        prefix="envoy.code.check.abstract.runtime_guards")
+
+    with patched as (m_aio, m_path, m_load):
+        m_path.return_value = path
+        m_aio.to_thread = AsyncMock()
+        assert (
+            await guards.mentions_cache
+            == (m_aio.to_thread.return_value
+                if path
+                else {})
+            == getattr(
+                guards,
+                check.ARuntimeGuardsCheck.mentions_cache.cache_name)[
+                    "mentions_cache"])
+
+    if not path:
+        assert not m_aio.to_thread.called
+        return
+    assert (
+        m_aio.to_thread.call_args
+        == [(m_load, ), {}])
+
+
+@pytest.mark.parametrize("path", [None, "PATH"])
+async def test_runtimeguardscheck_mentions_cache_keys(patches, path):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        "asyncio",
+        ("ARuntimeGuardsCheck.mentions_cache_path",
+         dict(new_callable=PropertyMock)),
+        ("ARuntimeGuardsCheck.released_changelogs",
+         dict(new_callable=PropertyMock)),
+        "ARuntimeGuardsCheck._mentions_cache_keys",
+        prefix="envoy.code.check.abstract.runtime_guards")
+    changelogs = {f"V{i}": MagicMock() for i in range(0, 5)}
+
+    with patched as (m_aio, m_path, m_released, m_keys):
+        m_path.return_value = path
+        m_released.return_value = changelogs
+        m_aio.to_thread = AsyncMock()
+        assert (
+            await guards.mentions_cache_keys
+            == (m_aio.to_thread.return_value
+                if path
+                else {})
+            == getattr(
+                guards,
+                check.ARuntimeGuardsCheck.mentions_cache_keys.cache_name)[
+                    "mentions_cache_keys"])
+
+    if not path:
+        assert not m_aio.to_thread.called
+        assert not m_released.called
+        return
+    assert (
+        m_aio.to_thread.call_args
+        == [(m_keys,
+             {version: changelog.path
+              for version, changelog
+              in changelogs.items()}),
+            {}])
+
+
+@pytest.mark.parametrize("cache", [None, "", "CACHE"])
+def test_runtimeguardscheck_mentions_cache_path(patches, cache):
+    guards = DummyRuntimeGuardsCheck()
+    guards._mentions_cache = cache
+    patched = patches(
+        "pathlib",
+        prefix="envoy.code.check.abstract.runtime_guards")
+
+    with patched as (m_plib, ):
+        assert (
+            guards.mentions_cache_path
+            == (m_plib.Path.return_value
+                if cache
+                else None))
+
+    assert "mentions_cache_path" in guards.__dict__
+    if not cache:
+        assert not m_plib.Path.called
+        return
+    assert (
+        m_plib.Path.call_args
+        == [(cache, ), {}])
+
+
 async def test_runtimeguardscheck_missing(patches):
     guards = DummyRuntimeGuardsCheck()
     patched = patches(
@@ -163,6 +365,25 @@ def test_runtimeguardscheck_reloadable_match_re(patches):
     assert "reloadable_match_re" in guards.__dict__
 
 
+def test_runtimeguardscheck_released_changelogs():
+    guards = DummyRuntimeGuardsCheck()
+    guards.project = MagicMock()
+    changelogs = {
+        MagicMock(): MagicMock()
+        for i
+        in range(0, 5)}
+    current = list(changelogs)[2]
+    guards.project.changelogs.items.return_value = changelogs.items()
+    guards.project.changelogs.current = current
+    assert (
+        guards.released_changelogs
+        == {str(version): changelog
+            for version, changelog
+            in changelogs.items()
+            if version is not current})
+    assert "released_changelogs" not in guards.__dict__
+
+
 async def test_runtimeguardscheck_status(iters, patches):
     guards = DummyRuntimeGuardsCheck()
     patched = patches(
@@ -208,39 +429,68 @@ async def test_runtimeguardscheck_status(iters, patches):
         check.ARuntimeGuardsCheck.status.cache_name)
 
 
-async def test_runtimeguardscheck__changes(iters):
+async def test_runtimeguardscheck__changelog_mention(iters, patches):
     guards = DummyRuntimeGuardsCheck()
-    guards.project = MagicMock()
-    changelogs = []
-    all_items = []
-    for i in range(0, 5):
-        changelog = MagicMock()
-        data = MagicMock()
-        changelog.data = AsyncMock(return_value=data)()
-        items = {
-            f"K{i}_{x}": iters(cb=lambda i: MagicMock())
-            for x in range(0, 5)}
-        for v in items.values():
-            all_items.extend(v)
-        items["date"] = "DATE"
-        data.items.return_value = items.items()
-        changelogs.append(changelog)
-    guards.project.changelogs.values.return_value = changelogs
-    results = []
-
-    async for result in guards._changes:
-        results.append(result)
+    patched = patches(
+        "ARuntimeGuardsCheck._find_mention",
+        prefix="envoy.code.check.abstract.runtime_guards")
+    changelog = MagicMock()
+    data = {
+        f"K{i}": iters(
+            cb=lambda x: dict(change=f"C{i}_{x}"),
+            count=3)
+        for i
+        in range(0, 3)}
+    data["date"] = "DATE"
+    changelog.data = AsyncMock(return_value=data)()
+
+    with patched as (m_mention, ):
+        m_mention.side_effect = lambda change: {change[:2], change}
+        assert (
+            await guards._changelog_mention(changelog)
+            == set(
+                found
+                for section, changes
+                in data.items()
+                if section != "date"
+                for change
+                in changes
+                for found
+                in (change["change"][:2], change["change"])))
 
     assert (
-        results
-        == [i.__getitem__.return_value for i in all_items])
-    for i in all_items:
+        m_mention.call_args_list
+        == [[(f"C{i}_{x}", ), {}]
+            for i
+            in range(0, 3)
+            for x
+            in range(0, 3)])
+
+
+async def test_runtimeguardscheck__mentions_cached(patches):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        ("ARuntimeGuardsCheck.mentions_cache",
+         dict(new_callable=PropertyMock)),
+        ("ARuntimeGuardsCheck.mentions_cache_keys",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.runtime_guards")
+    cache = dict(
+        KEY1=["G1", "G2"],
+        KEY3=[],
+        OTHER=["G3"])
+    keys = dict(V1="KEY1", V2="KEY2", V3="KEY3")
+
+    with patched as (m_cache, m_keys):
+        m_cache.side_effect = AsyncMock(return_value=cache)
+        m_keys.side_effect = AsyncMock(return_value=keys)
         assert (
-            i.__getitem__.call_args
-            == [("change", ), {}])
+            await guards._mentions_cached
+            == dict(V1={"G1", "G2"}, V3=set()))
+
     assert not hasattr(
         guards,
-        check.ARuntimeGuardsCheck._changes.cache_name)
+        check.ARuntimeGuardsCheck._mentions_cached.cache_name)
 
 
 def test_runtimeguardscheck__grepped(patches):
@@ -299,3 +549,106 @@ def test_runtimeguardscheck__find_mention(iters, patches):
     assert (
         m_re.return_value.findall.call_args
         == [(change, ), {}])
+
+
+def test_runtimeguardscheck__mentions_cache_keys(patches):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        "checker",
+        "RELOADABLE_MATCH_RE",
+        prefix="envoy.code.check.abstract.runtime_guards")
+    paths = {f"V{i}": f"PATH{i}" for i in range(0, 5)}
+
+    with patched as (m_checker, m_re):
+        m_checker.fingerprint.side_effect = (
+            lambda *args, paths: f"KEY{paths[0]}")
+        assert (
+            guards._mentions_cache_keys(paths)
+            == {version: f"KEY{path}"
+                for version, path
+                in paths.items()})
+
+    assert (
+        m_checker.fingerprint.call_args_list
+        == [[(m_re, ), dict(paths=[path])]
+            for path
+            in paths.values()])
+
+
+@pytest.mark.parametrize(
+    "content",
+    [None,
+     "",
+     "NOT JSON",
+     "[]",
+     "{}",
+     '{"KEY1": ["G1"], "KEY2": "G2", "KEY3": []}'])
+def test_runtimeguardscheck__mentions_cache_load(tmp_path, content):
+    guards = DummyRuntimeGuardsCheck()
+    path = tmp_path.joinpath("cache.json")
+    guards.mentions_cache_path = path
+    if content is not None:
+        path.write_text(content)
+    assert (
+        guards._mentions_cache_load()
+        == (dict(KEY1=["G1"], KEY3=[])
+            if content and content.startswith("{\"")
+            else {}))
+
+
+def test_runtimeguardscheck__mentions_cache_save(tmp_path):
+    guards = DummyRuntimeGuardsCheck()
+    path = tmp_path.joinpath("cache", "mentions.json")
+    guards.mentions_cache_path = path
+    cache = dict(KEY2=["G2", "G3"], KEY1=[])
+    assert not guards._mentions_cache_save(cache)
+    assert json.loads(path.read_text()) == cache
+    assert (
+        path.read_text()
+        == json.dumps(cache, indent=2, sort_keys=True))
+
+
+@pytest.mark.parametrize("path", [None, "PATH"])
+@pytest.mark.parametrize("changed", [True, False])
+async def test_runtimeguardscheck__mentions_cache_update(
+        patches, path, changed):
+    guards = DummyRuntimeGuardsCheck()
+    patched = patches(
+        "asyncio",
+        ("ARuntimeGuardsCheck.mentions_cache",
+         dict(new_callable=PropertyMock)),
+        ("ARuntimeGuardsCheck.mentions_cache_keys",
+         dict(new_callable=PropertyMock)),
+        ("ARuntimeGuardsCheck.mentions_cache_path",
+         dict(new_callable=PropertyMock)),
+        "ARuntimeGuardsCheck._mentions_cache_save",
+        prefix="envoy.code.check.abstract.runtime_guards")
+    mentions = dict(
+        V1={"G2", "G1"},
+        V2={"G3"},
+        CURRENT={"G4"})
+    keys = dict(V1="KEY1", V2="KEY2")
+    expected = dict(KEY1=["G1", "G2"], KEY2=["G3"])
+    cache = (
+        dict(KEY1=["G1", "G2"], OTHER=["G3"])
+        if changed
+        else expected)
+
+    with patched as patchy:
+        (m_aio, m_cache, m_keys, m_path, m_save) = patchy
+        m_aio.to_thread = AsyncMock()
+        m_path.return_value = path
+        m_cache.side_effect = AsyncMock(return_value=cache)
+        m_keys.side_effect = AsyncMock(return_value=keys)
+        assert not await guards._mentions_cache_update(mentions)
+
+    if not path:
+        assert not m_keys.called
+        assert not m_aio.to_thread.called
+        return
+    if not changed:
+        assert not m_aio.to_thread.called
+        return
+    assert (
+        m_aio.to_thread.call_args
+        == [(m_save, expected), {}])
@@ -1,5 +1,5 @@
 
-import types
+import json
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -15,24 +15,6 @@ def test_shellcheck_constructor():
     assert isinstance(shellcheck, subprocess.ASubprocessHandler)
 
 
-def test_shellcheck_error_line_re(patches):
-    shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
-    patched = patches(
-        "re",
-        prefix="envoy.code.check.abstract.shellcheck")
-
-    with patched as (m_re, ):
-        assert (
-            shellcheck.error_line_re
-            == m_re.compile.return_value)
-
-    assert (
-        m_re.compile.call_args
-        == [(check.abstract.shellcheck.SHELLCHECK_ERROR_LINE_RE, ),
-            {}])
-    assert "error_line_re" in shellcheck.__dict__
-
-
 def test_shellcheck_handle():
     shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
     assert shellcheck.handle("RESPONSE") == {}
@@ -42,60 +24,70 @@ def test_shellcheck_handle_error(patches):
     shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
     patched = patches(
         "Shellcheck._render_errors",
-        "Shellcheck._shellcheck_errors",
+        "Shellcheck.parse_comments",
         prefix="envoy.code.check.abstract.shellcheck")
     response = MagicMock()
 
-    with patched as (m_render, m_errors):
+    with patched as (m_render, m_parse):
         assert (
             shellcheck.handle_error(response)
             == m_render.return_value)
 
     assert (
         m_render.call_args
-        == [(m_errors.return_value, ), {}])
+        == [(m_parse.return_value, ), {}])
     assert (
-        m_errors.call_args
+        m_parse.call_args
         == [(response, ), {}])
 
 
-@pytest.mark.parametrize("matched", [True, False])
-def test_shellcheck_parse_error_line(patches, matched):
+@pytest.mark.parametrize(
+    "stdout",
+    [None,
+     "",
+     "NOT JSON",
+     "{}",
+     json.dumps(dict(comments=[])),
+     json.dumps(
+         dict(comments=[
+             dict(file="FILE1", line=23),
+             dict(file="FILE2", line=7),
+             dict(file="FILE1", line=73)]))])
+def test_shellcheck_parse_comments(stdout):
     shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
-    patched = patches(
-        "int",
-        ("Shellcheck.error_line_re",
-         dict(new_callable=PropertyMock)),
-        prefix="envoy.code.check.abstract.shellcheck")
-    matched_re = (
-        MagicMock()
-        if matched
-        else None)
-    line = MagicMock()
-
-    with patched as (m_int, m_re):
-        m_re.return_value.search.return_value = matched_re
+    response = MagicMock()
+    response.stdout = stdout
+
+    if stdout is None or "comments" not in stdout:
+        with pytest.raises(subprocess.exceptions.RunError) as e:
+            shellcheck.parse_comments(response)
         assert (
-            shellcheck.parse_error_line(line)
-            == ((matched_re.groups.return_value.__getitem__.return_value,
-                 m_int.return_value)
-                if matched
-                else ("", None)))
+            e.value.args[0]
+            == (f"Shellcheck failed ({response.returncode}): "
+                f"{response.stderr}"))
+        return
 
+    comments = json.loads(stdout)["comments"]
     assert (
-        m_re.return_value.search.call_args
-        == [(line, ), {}])
-    if matched:
-        assert (
-            m_int.call_args
-            == [(matched_re.groups.return_value.__getitem__.return_value, ),
-                {}])
-        assert (
-            matched_re.groups.call_args_list
-            == [[(), {}]] * 2)
-        assert (
-            matched_re.groups.return_value.__getitem__.call_args_list
-            == [[(0, ), {}], [(1, ), {}]])
+        shellcheck.parse_comments(response)
+        == ({"FILE1": [comments[0], comments[2]],
+             "FILE2": [comments[1]]}
+            if comments
+            else {}))
+
+
+def test_shellcheck__render_comment():
+    shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
+    comment = dict(
+        file="FILE",
+        line=23,
+        column=7,
+        level="warning",
+        code=2086,
+        message="MESSAGE")
+    assert (
+        shellcheck._render_comment(comment)
+        == "  23:7: [SC2086] (warning) MESSAGE")
 
 
 def test_shellcheck__render_errors(iters, patches):
@@ -104,169 +96,58 @@ def test_shellcheck__render_errors(iters, patches):
         "checker",
         "Shellcheck._render_file_errors",
         prefix="envoy.code.check.abstract.shellcheck")
-    errors = iters(cb=lambda i: (MagicMock(), MagicMock()))
+    errors = iters(dict, cb=lambda i: (f"K{i}", MagicMock()))
 
     with patched as (m_checker, m_render):
         assert (
             shellcheck._render_errors(errors)
-            == {e: m_checker.Problems.return_value
-                for e, info
+            == {k: m_checker.Problems.return_value
+                for k
                 in errors})
 
     assert (
         m_checker.Problems.call_args_list
         == [[(), dict(errors=m_render.return_value)]
-            for e in errors])
+            for k in errors])
     assert (
         m_render.call_args_list
-        == [[(e, info), {}]
-            for e, info
-            in errors])
+        == [[(k, v), {}]
+            for k, v
+            in errors.items()])
 
 
-@pytest.mark.parametrize("line_nums", range(0, 5))
-def test_shellcheck__render_file_errors(iters, patches, line_nums):
+@pytest.mark.parametrize(
+    "line_numbers",
+    [[23], [23, 23], [73, 23], [23, 73, 23, 5]])
+def test_shellcheck__render_file_errors(patches, line_numbers):
     shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
     patched = patches(
-        "str",
+        "Shellcheck._render_comment",
         prefix="envoy.code.check.abstract.shellcheck")
-    path = MagicMock()
-    errors = MagicMock()
-    line_numbers = iters(cb=lambda i: MagicMock(), count=line_nums)
-    lines = iters(count=3)
+    comments = [
+        dict(line=line_number)
+        for line_number
+        in line_numbers]
+    unique_lines = sorted(set(line_numbers))
     line_or_lines = (
         "lines"
-        if line_nums > 1
+        if len(unique_lines) > 1
         else "line")
 
-    def getitem(k):
-        if k == "line_numbers":
-            return line_numbers
-        return lines
-
-    errors.__getitem__.side_effect = getitem
-    joined_line_numbers = ", ".join(str(line) for line in line_numbers)
-
-    with patched as (m_str, ):
-        m_str.side_effect = lambda x: str(x)
+    with patched as (m_comment, ):
+        m_comment.side_effect = lambda c: f"COMMENT {c['line']}"
         assert (
-            shellcheck._render_file_errors(path, errors)
+            shellcheck._render_file_errors("PATH", comments)
             == ["\n".join(
-                [f"{path} ({line_or_lines}: {joined_line_numbers})",
-                 *lines])])
-
-
-@pytest.mark.parametrize("filename", [None, "FILENAME"])
-def test_shellcheck__shellcheck_error_info(patches, filename):
-    shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
-    patched = patches(
-        "dict",
-        prefix="envoy.code.check.abstract.shellcheck")
-    args = (
-        (filename, )
-        if filename is not None
-        else ())
-
-    with patched as (m_dict, ):
-        assert (
-            shellcheck._shellcheck_error_info(*args)
-            == (filename, m_dict.return_value))
-
-    assert (
-        m_dict.call_args
-        == [(), dict(line_numbers=[], lines=[])])
-
-
-SHELLCHECK_INPUTS = (
-    (),
-    ("", ),
-    ("MATCH FNAME1 23",
-     "DATA 0",
-     "DATA 1",
-     "DATA 2",
-     "",
-     "MATCH FNAME1 73",
-     "MORE DATA 0",
-     "MORE DATA 1",
-     "MORE DATA 2",
-     "",
-     "MATCH FNAME2 23",
-     "MORE DATA 0",
-     "MORE DATA 1",
-     "MORE DATA 2",
-     ""),
-    ("",
-     "MATCH FNAME1 23",
-     "DATA 0",
-     "DATA 1",
-     "DATA 2",
-     "",
-     "MATCH FNAME1 73",
-     "MORE DATA 0",
-     "MORE DATA 1",
-     "MORE DATA 2",
-     "",
-     "MATCH FNAME2 23",
-     "MORE DATA 0",
-     "MORE DATA 1",
-     "MORE DATA 2",
-     ""))
-
-
-@pytest.mark.parametrize("input", SHELLCHECK_INPUTS)
-def test_shellcheck__shellcheck_errors(patches, input):
-    shellcheck = check.abstract.shellcheck.Shellcheck("PATH")
-    patched = patches(
-        "Shellcheck.parse_error_line",
-        "Shellcheck._shellcheck_error_info",
-        prefix="envoy.code.check.abstract.shellcheck")
-    response = MagicMock()
-    response.stdout.split.return_value = input
-
-    def parse(line):
-        if line.startswith("MATCH"):
-            return line.split(" ")[1:]
-        return "", None
-
-    def info(fname=None):
-        return fname, dict(lines=[], line_numbers=[])
-
-    with patched as (m_parse, m_info):
-        m_parse.side_effect = parse
-        m_info.side_effect = info
-        resultgen = shellcheck._shellcheck_errors(response)
-        assert isinstance(resultgen, types.GeneratorType)
-        result = list(resultgen)
-
-    if not input or not any(input):
-        assert not result
-        return
+                [f"PATH ({line_or_lines}: "
+                 f"{', '.join(str(n) for n in unique_lines)})",
+                 *(f"COMMENT {n}" for n in line_numbers)])])
 
     assert (
-        result
-        == [('FNAME1',
-             {'lines': [
-                 'MATCH FNAME1 23',
-                 'DATA 0',
-                 'DATA 1',
-                 'DATA 2',
-                 "",
-                 'MATCH FNAME1 73',
-                 'MORE DATA 0',
-                 'MORE DATA 1',
-                 'MORE DATA 2',
-                 ""],
-              'line_numbers': [
-                  '23',
-                  '73']}),
-            ('FNAME2',
-             {'lines': [
-                 'MATCH FNAME2 23',
-                 'MORE DATA 0',
-                 'MORE DATA 1',
-                 'MORE DATA 2',
-                 ""],
-              'line_numbers': ['23']})])
+        m_comment.call_args_list
+        == [[(comment, ), {}]
+            for comment
+            in comments])
 
 
 def test_shellcheck_checker_run_shellcheck(iters, patches):
@@ -292,10 +173,6 @@ def test_shellcheck_checker_run_shellcheck(iters, patches):
 def test_shellcheck_checker_constructor():
     shellcheck = check.AShellcheckCheck("DIRECTORY")
     assert shellcheck.directory == "DIRECTORY"
-    assert (
-        shellcheck.shebang_re_expr
-        == "|".join(check.abstract.shellcheck.SHEBANG_RE))
-    assert "shebang_re_expr" not in shellcheck.__dict__
 
 
 @pytest.mark.parametrize(
@@ -322,132 +199,113 @@ async def test_shellcheck_checker_files(patches, sh_files, shebang_files):
         m_shebang.side_effect = AsyncMock(return_value=shebang_files)
         assert (
             await shellcheck.checker_files
-            == (sh_files | shebang_files))
-
-    assert not (
-        hasattr(
-            shellcheck,
-            check.AShellcheckCheck.checker_files.cache_name))
+            == (sh_files | shebang_files)
+            == getattr(
+                shellcheck,
+                check.AShellcheckCheck.checker_files.cache_name)[
+                    "checker_files"])
 
 
-def test_shellcheck_checker_path_match_exclude_re(patches):
+async def test_shellcheck_fingerprint_parts(patches):
     shellcheck = check.AShellcheckCheck("DIRECTORY")
     patched = patches(
-        "re",
+        ("AShellcheckCheck.shellcheck_version",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.shellcheck")
 
-    with patched as (m_re, ):
+    with patched as (m_version, ):
+        m_version.side_effect = AsyncMock(return_value="VERSION")
         assert (
-            shellcheck.path_match_exclude_re
-            == m_re.compile.return_value)
+            await shellcheck.fingerprint_parts
+            == ("VERSION", ))
 
-    assert (
-        m_re.compile.call_args
-        == [("|".join(check.abstract.shellcheck.SHELLCHECK_NOMATCH_RE), ),
-            {}])
-    assert "path_match_exclude_re" in shellcheck.__dict__
+    assert not (
+        hasattr(
+            shellcheck,
+            check.AShellcheckCheck.fingerprint_parts.cache_name))
 
 
-def test_shellcheck_checker_path_match_re(patches):
+async def test_shellcheck_fingerprint_paths(patches):
     shellcheck = check.AShellcheckCheck("DIRECTORY")
     patched = patches(
-        "re",
+        ("AShellcheckCheck.checker_files",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.shellcheck")
 
-    with patched as (m_re, ):
+    with patched as (m_files, ):
+        m_files.side_effect = AsyncMock(return_value=["F1", "F2"])
         assert (
-            shellcheck.path_match_re
-            == m_re.compile.return_value)
+            await shellcheck.fingerprint_paths
+            == ("F1", "F2", check.abstract.shellcheck.SHELLCHECK_CONFIG))
 
-    assert (
-        m_re.compile.call_args
-        == [("|".join(check.abstract.shellcheck.SHELLCHECK_MATCH_RE), ),
-            {}])
-    assert "path_match_re" in shellcheck.__dict__
+    assert not (
+        hasattr(
+            shellcheck,
+            check.AShellcheckCheck.fingerprint_paths.cache_name))
 
 
-@pytest.mark.parametrize("files", [True, False])
-async def test_shellcheck_problem_files(patches, files):
+@pytest.mark.parametrize("batches", [0, 1, 3])
+async def test_shellcheck_problem_files(patches, batches):
     shellcheck = check.AShellcheckCheck("DIRECTORY")
     patched = patches(
-        ("AShellcheckCheck.files",
-         dict(new_callable=PropertyMock)),
+        ("AShellcheckCheck.file_batches",
+         dict(new_callable=AsyncMock)),
         ("AShellcheckCheck.shellcheck_executable",
          dict(new_callable=PropertyMock)),
-        "AShellcheckCheck.execute_in_batches",
+        ("AShellcheckCheck.execute",
+         dict(new_callable=AsyncMock)),
         prefix="envoy.code.check.abstract.shellcheck")
     batched = [
-        {f"K{x}": "V1{x}" for x in range(0, 10)},
-        {f"K{x}": "V2{x}" for x in range(1, 7)},
-        {f"K{x}": "V3{x}" for x in range(5, 13)}]
-    if files:
-        files = [f"F{i}" for i in range(0, 5)]
-    expected = {}
-    for d in batched:
-        expected.update(d)
-
-    async def iter_batched(*args):
-        for batch in batched:
-            yield batch
-
-    with patched as (m_files, m_exec, m_batches):
-        m_files.side_effect = AsyncMock(return_value=files)
-        m_batches.side_effect = iter_batched
+        [f"B{i}F{j}" for j in range(0, i + 1)]
+        for i
+        in range(0, batches)]
+
+    async def execute(fun, *files):
+        return {file: f"ERRORS {file}" for file in files}
+
+    with patched as (m_batches, m_exec, m_execute):
+        m_batches.return_value = batched
+        m_execute.side_effect = execute
         assert (
             await shellcheck.problem_files
-            == (expected
-                if files
-                else {})
+            == {file: f"ERRORS {file}"
+                for batch
+                in batched
+                for file
+                in batch}
             == getattr(
                 shellcheck,
                 check.AFileCodeCheck.problem_files.cache_name)[
                     "problem_files"])
 
-    if not files:
-        assert not m_exec.called
-        return
     assert (
         m_batches.call_args
-        == [(m_exec.return_value, *files), {}])
+        == [(check.abstract.shellcheck.SHELLCHECK_BATCHES_PER_JOB,
+             check.abstract.shellcheck.SHELLCHECK_FILE_COST), {}])
+    assert (
+        sorted(m_execute.call_args_list)
+        == sorted(
+            [(m_exec.return_value, *batch), {}]
+            for batch
+            in batched))
 
 
-@pytest.mark.parametrize("files", [True, False])
-async def test_shellcheck_sh_files(patches, files):
-    directory = MagicMock()
-    shellcheck = check.AShellcheckCheck(directory)
+async def test_shellcheck_sh_files(patches):
+    shellcheck = check.AShellcheckCheck("DIRECTORY")
     patched = patches(
-        "set",
-        ("AShellcheckCheck.path_match_exclude_re",
-         dict(new_callable=PropertyMock)),
-        ("AShellcheckCheck.path_match_re",
+        ("AShellcheckCheck.file_index",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.shellcheck")
-    files = AsyncMock(return_value=range(0, 20))
-    directory.files = files()
 
-    with patched as (m_set, m_exc_re, m_re):
-        m_exc_re.return_value.match.side_effect = lambda x: x % 3
-        m_re.return_value.match.side_effect = lambda x: x % 2
+    with patched as (m_index, ):
+        m_index.return_value.with_extension = AsyncMock()
         assert (
             await shellcheck.sh_files
-            == m_set.return_value)
-        iterator = m_set.call_args[0][0]
-        called = list(iterator)
+            == m_index.return_value.with_extension.return_value)
 
     assert (
-        called
-        == [x for x in range(0, 20)
-            if not x % 3
-            and x % 2])
-    assert (
-        m_re.return_value.match.call_args_list
-        == [[(x, ), {}] for x in range(0, 20)])
-    assert (
-        m_exc_re.return_value.match.call_args_list
-        == [[(x, ), {}]
-            for x
-            in range(0, 20)
-            if x % 2])
+        m_index.return_value.with_extension.call_args
+        == [check.abstract.shellcheck.SHELLCHECK_EXTENSIONS, {}])
     assert not (
         hasattr(
             shellcheck,
@@ -458,24 +316,30 @@ async def test_shellcheck_shebang_files(patches):
     directory = MagicMock()
     shellcheck = check.AShellcheckCheck(directory)
     patched = patches(
-        ("AShellcheckCheck.shebang_re_expr",
-         dict(new_callable=PropertyMock)),
-        ("AShellcheckCheck._possible_shebang_files",
+        ("AShellcheckCheck.file_index",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.shellcheck")
-    directory.grep = AsyncMock()
+    directory.files = AsyncMock(
+        return_value={"A", "B.md", "C.rst", "D", "F.sh"})()
 
-    with patched as (m_re, m_files):
-        files = AsyncMock()
-        m_files.side_effect = files
+    with patched as (m_index, ):
+        m_index.return_value.with_interpreter = AsyncMock()
+        m_index.return_value.with_extension = AsyncMock(
+            return_value={"B.md", "C.rst", "E.md", "F.sh"})
         assert (
             await shellcheck.shebang_files
-            == directory.grep.return_value)
+            == m_index.return_value.with_interpreter.return_value)
 
     assert (
-        directory.grep.call_args
-        == [(['-lE', m_re.return_value], ),
-            dict(target=files.return_value)])
+        m_index.return_value.with_interpreter.call_args
+        == [({"A", "D"},
+             *check.abstract.shellcheck.SHELLCHECK_INTERPRETERS),
+            {}])
+    assert (
+        m_index.return_value.with_extension.call_args
+        == [(*check.abstract.shellcheck.SHELLCHECK_EXTENSIONS,
+             *check.abstract.shellcheck.SHELLCHECK_SHEBANG_EXCLUDE_EXTENSIONS),
+            {}])
     assert not (
         hasattr(
             shellcheck,
@@ -551,47 +415,33 @@ def test_shellcheck_shellcheck_executable(patches):
         == [(m_run,
              directory.path,
              m_command.return_value,
-             "-x"), {}])
+             "-x",
+             "-f",
+             "json1"), {}])
 
 
-@pytest.mark.parametrize("files", [True, False])
-async def test_shellcheck__possible_shebang_files(patches, files):
-    directory = MagicMock()
-    shellcheck = check.AShellcheckCheck(directory)
+async def test_shellcheck_shellcheck_version(patches):
+    shellcheck = check.AShellcheckCheck("DIRECTORY")
     patched = patches(
-        "set",
-        ("AShellcheckCheck.path_match_exclude_re",
-         dict(new_callable=PropertyMock)),
-        ("AShellcheckCheck.path_match_re",
+        "asyncio",
+        "subprocess",
+        ("AShellcheckCheck.shellcheck_command",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.shellcheck")
-    files = AsyncMock(return_value=range(0, 20))
-    directory.files = files()
 
-    with patched as (m_set, m_exc_re, m_re):
-        m_re.return_value.match.side_effect = lambda x: not (x % 2)
-        m_exc_re.return_value.match.side_effect = lambda x: x % 3
+    with patched as (m_aio, m_subproc, m_command):
+        m_aio.to_thread = AsyncMock()
         assert (
-            await shellcheck._possible_shebang_files
-            == m_set.return_value)
-        iterator = m_set.call_args[0][0]
-        called = list(iterator)
+            await shellcheck.shellcheck_version
+            == m_aio.to_thread.return_value.stdout
+            == getattr(
+                shellcheck,
+                check.AShellcheckCheck.shellcheck_version.cache_name)[
+                    "shellcheck_version"])
 
     assert (
-        called
-        == [x for x in range(0, 20)
-            if not (x % 3)
-            and x % 2])
-    assert (
-        m_re.return_value.match.call_args_list
-        == [[(x, ), {}] for x in range(0, 20)])
-    assert (
-        m_exc_re.return_value.match.call_args_list
-        == [[(x, ), {}]
-            for x
-            in range(0, 20)
-            if x % 2])
-    assert not (
-        hasattr(
-            shellcheck,
-            check.AShellcheckCheck.sh_files.cache_name))
+        m_aio.to_thread.call_args
+        == [(m_subproc.run,
+             [m_command.return_value, "--version"]),
+            dict(capture_output=True,
+                 encoding="utf-8")])
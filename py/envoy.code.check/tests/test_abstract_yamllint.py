@@ -184,29 +184,69 @@ def test_yamllint_yamllintfilescheck__parse_problems(iters):
 def test_yamllint_yamllint(iters, patches, fix):
     patched = patches(
         "YamllintFilesCheck",
+        "AYamllintCheck.worker_config",
         prefix="envoy.code.check.abstract.yamllint")
     root_path = MagicMock()
-    config = MagicMock()
+    config_path = MagicMock()
     args = iters(cb=lambda i: MagicMock())
 
-    with patched as (m_yamllint, ):
+    with patched as (m_yamllint, m_config):
         assert (
             check.AYamllintCheck.yamllint(
                 root_path,
-                config,
+                config_path,
                 *args)
             == m_yamllint.return_value.run_checks.return_value)
 
+    assert (
+        m_config.call_args
+        == [(config_path, ), {}])
     assert (
         m_yamllint.call_args
         == [(root_path,
-             config,
+             m_config.return_value,
              *args), {}])
     assert (
         m_yamllint.return_value.run_checks.call_args
         == [(), {}])
 
 
+@pytest.mark.parametrize("raises", [None, Exception, ValueError])
+def test_yamllint_initialize_worker(patches, raises):
+    patched = patches(
+        "AYamllintCheck.worker_config",
+        prefix="envoy.code.check.abstract.yamllint")
+
+    with patched as (m_config, ):
+        if raises:
+            m_config.side_effect = raises("BAD CONFIG")
+        assert not check.AYamllintCheck.initialize_worker("/PATH")
+
+    assert (
+        m_config.call_args
+        == [(f"/PATH/{check.abstract.yamllint.YAMLLINT_CONFIG}", ), {}])
+
+
+def test_yamllint_worker_config(patches):
+    patched = patches(
+        "YamlLintConfig",
+        prefix="envoy.code.check.abstract.yamllint")
+    check.AYamllintCheck.worker_config.cache_clear()
+
+    with patched as (m_config, ):
+        assert (
+            check.AYamllintCheck.worker_config("CONFIG_PATH")
+            == m_config.return_value)
+        assert (
+            check.AYamllintCheck.worker_config("CONFIG_PATH")
+            == m_config.return_value)
+
+    check.AYamllintCheck.worker_config.cache_clear()
+    assert (
+        m_config.call_args_list
+        == [[(), dict(file="CONFIG_PATH")]])
+
+
 def test_yamllint_constructor():
     yamllint = check.AYamllintCheck("DIRECTORY")
     assert yamllint.directory == "DIRECTORY"
@@ -252,6 +292,33 @@ async def test_yamllint_checker_files(patches):
             check.AYamllintCheck.checker_files.cache_name))
 
 
+async def test_yamllint_fingerprint_parts(patches):
+    yamllint = check.AYamllintCheck("DIRECTORY")
+    patched = patches(
+        "yamllint",
+        prefix="envoy.code.check.abstract.yamllint")
+
+    with patched as (m_yamllint, ):
+        m_yamllint.__version__ = "VERSION"
+        assert (
+            await yamllint.fingerprint_parts
+            == ("VERSION", ))
+
+
+async def test_yamllint_fingerprint_paths(patches):
+    yamllint = check.AYamllintCheck("DIRECTORY")
+    patched = patches(
+        ("AYamllintCheck.files",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.yamllint")
+
+    with patched as (m_files, ):
+        m_files.side_effect = AsyncMock(return_value=["F1", "F2"])
+        assert (
+            await yamllint.fingerprint_paths
+            == ("F1", "F2", check.abstract.yamllint.YAMLLINT_CONFIG))
+
+
 def test_yamllint_yamllint_config(patches):
     yamllint = check.AYamllintCheck("DIRECTORY")
     patched = patches(
@@ -319,7 +386,7 @@ async def test_yamllint__problem_files(patches, files):
         "partial",
         "str",
         "AYamllintCheck.yamllint",
-        ("AYamllintCheck.yamllint_config",
+        ("AYamllintCheck.config_path",
          dict(new_callable=PropertyMock)),
         ("AYamllintCheck.files",
          dict(new_callable=PropertyMock)),
@@ -369,7 +436,8 @@ async def test_yamllint__problem_files(patches, files):
         m_partial.call_args
         == [(m_lint,
              m_str.return_value,
-             m_conf.return_value), {}])
+             m_str.return_value), {}])
     assert (
-        m_str.call_args
-        == [(directory.path, ), {}])
+        m_str.call_args_list
+        == [[(directory.path, ), {}],
+            [(m_conf.return_value, ), {}]])
@@ -298,6 +298,24 @@ async def test_yapf_checker_files(patches, files):
         == [(directory.path, ), {}])
 
 
+@pytest.mark.parametrize("raises", [None, Exception, ValueError])
+def test_yapf_initialize_worker(patches, raises):
+    patched = patches(
+        "yapf",
+        prefix="envoy.code.check.abstract.yapf")
+
+    with patched as (m_yapf, ):
+        if raises:
+            m_yapf.yapf_api.FormatCode.side_effect = raises("BAD CONFIG")
+        assert not check.AYapfCheck.initialize_worker("/PATH")
+
+    assert (
+        m_yapf.yapf_api.FormatCode.call_args
+        == [("", ),
+            dict(style_config=(
+                f"/PATH/{check.abstract.yapf.YAPF_CONFIG}"))])
+
+
 def test_yapf_config_path():
     directory = MagicMock()
     yapf = check.AYapfCheck(directory)
@@ -339,42 +357,25 @@ async def test_yapf_problem_files(patches, files):
         == [(m_problems.return_value, ), {}])
 
 
-@pytest.mark.parametrize("notpy", range(0, 10))
-async def test_yapf_py_files(patches, notpy):
-    directory = MagicMock()
-    yapf = check.AYapfCheck(directory)
-    dir_files = []
+async def test_yapf_py_files(patches):
+    yapf = check.AYapfCheck("DIRECTORY")
     patched = patches(
-        "set",
+        ("AYapfCheck.file_index",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.yapf")
 
-    def path_endswith(x, ext):
-        return x != notpy
-
-    for x in range(0, 5):
-        f = MagicMock()
-        f.endswith.side_effect = partial(path_endswith, x)
-        dir_files.append(f)
-    files = AsyncMock(return_value=dir_files)
-    directory.files = files()
-
-    with patched as (m_set, ):
+    with patched as (m_index, ):
+        m_index.return_value.with_extension = AsyncMock()
         assert (
             await yapf.py_files
-            == m_set.return_value
+            == m_index.return_value.with_extension.return_value
             == getattr(
                 yapf,
                 check.AYapfCheck.py_files.cache_name)["py_files"])
-        iterator = m_set.call_args[0][0]
-        called = list(iterator)
 
     assert (
-        called
-        == [f for i, f in enumerate(dir_files) if i != notpy])
-    for f in dir_files:
-        assert (
-            f.endswith.call_args
-            == [(".py", ), {}])
+        m_index.return_value.with_extension.call_args
+        == [(".py", ), {}])
 
 
 @pytest.mark.parametrize("files", [True, False])
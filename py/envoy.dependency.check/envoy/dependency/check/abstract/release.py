@@ -35,7 +35,7 @@ class ADependencyGithubRelease(
     """Github release associated with a dependency."""
 
     @classmethod
-    def hash_file_data(cls, data: bytes) -> str:
+    def hash_file_data(cls, data: bytes | memoryview) -> str:
         file_hash = hashlib.sha256()
         file_hash.update(data)
         return str(file_hash.hexdigest())
@@ -178,7 +178,9 @@ class ADependencyGithubRelease(
         hash_in_proc = self.should_hash_in_proc(data)
         start = time.perf_counter()
         sha = (
-            await self.execute(self.hash_file_data, data)
+            # As a `memoryview`, large data is hashed directly from shared
+            # memory, rather than being copied in the worker.
+            await self.execute(self.hash_file_data, memoryview(data))
             if hash_in_proc
             else self.hash_file_data(data))
         logger.debug(
@@ -519,7 +519,7 @@ async def test_release__hash_file_data(patches, in_proc):
         "ADependencyGithubRelease.hash_file_data",
         "ADependencyGithubRelease.should_hash_in_proc",
         prefix="envoy.dependency.check.abstract.release")
-    data = MagicMock()
+    data = b"DATA"
 
     class Time:
         called = False
@@ -550,9 +550,11 @@ async def test_release__hash_file_data(patches, in_proc):
     if in_proc:
         fork = " (fork: True)"
         assert not m_hash.called
-        assert (
-            m_execute.call_args
-            == [(m_hash, data), {}])
+        (hasher, view), kwargs = m_execute.call_args
+        assert hasher == m_hash
+        assert isinstance(view, memoryview)
+        assert view == data
+        assert kwargs == {}
     else:
         fork = ""
         assert not m_execute.called
@@ -4,7 +4,8 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 
-from aio.run.checker import Checker
+from aio.run import runner
+from aio.run.checker import Checker, sharding
 
 from envoy.distribution import distrotest, verify
 
@@ -290,6 +291,33 @@ def test_checker_add_arguments():
              {'choices': ['debug', 'info', "success", 'warn', 'error'],
               'default': 'warn',
               'help': 'Log level for non-application logs'}],
+            [('--jobs', '-j'),
+             {'type': runner.runner.jobs_arg,
+              'default': None,
+              'metavar': 'N',
+              'help': (
+                  'Maximum number of parallel jobs, defaults to (`auto`) the '
+                  'number of CPUs available to the process, taking any '
+                  'affinity mask or cgroup CPU quota into account')}],
+            [('--profile',),
+             {'metavar': 'DIR',
+              'help': (
+                  'Profile the run with cProfile, and write the profile '
+                  'artifacts to this directory')}],
+            [('--profile-memory',),
+             {'metavar': 'N',
+              'type': int,
+              'default': 0,
+              'help': (
+                  'When profiling, also trace memory allocations and report '
+                  'the top N allocation sites')}],
+            [('--profile-slow-callback',),
+             {'metavar': 'SECONDS',
+              'type': float,
+              'default': 0.1,
+              'help': (
+                  'When profiling, log event loop callbacks that take longer '
+                  'than this, 0 disables')}],
             [('--fix',),
              {'action': 'store_true',
               'default': False,
@@ -316,12 +344,66 @@ def test_checker_add_arguments():
               'default': 5,
               'help': (
                   'Number of warnings to show in the summary, -1 shows all')}],
+            [('--timings',),
+             {'action': 'store_true',
+              'default': False,
+              'help': (
+                  'Show the timings of preload tasks and checks, and the '
+                  'critical path through them')}],
+            [('--timings-json',),
+             {'metavar': 'FILE',
+              'default': None,
+              'help': (
+                  'Write the timings of preload tasks and checks, and the '
+                  'critical path through them, as JSON to this file. '
+                  'Timings from a previous run in this file are used to '
+                  'prioritize preload tasks')}],
+            [('--results-file',),
+             {'metavar': 'FILE',
+              'default': None,
+              'help': (
+                  'Stream errors and warnings, the outcome of each check, '
+                  'and a final summary to this file while checks run')}],
+            [('--results-format',),
+             {'choices': ['jsonl', 'sarif'],
+              'default': 'jsonl',
+              'help': 'Format of the results file, JSON lines or SARIF'}],
+            [('--log-success',),
+             {'choices': ['each', 'summary'],
+              'default': 'each',
+              'help': (
+                  'Log each success, or only a count of successes for each '
+                  'check. Errors and warnings are always logged')}],
+            [('--fail-fast',),
+             {'action': 'store_true',
+              'default': False,
+              'help': (
+                  'Stop after the first check fails, cancelling any '
+                  'remaining checks, preload tasks and running tools')}],
+            [('--shard',),
+             {'metavar': 'I/N',
+              'type': sharding.shard_arg,
+              'default': None,
+              'help': (
+                  'Run the `I`th of `N` shards of the checks, eg to split a '
+                  'run across CI machines. Files are partitioned between '
+                  'shards for checks that support it, other checks are '
+                  'assigned whole to a shard. Results can be combined with '
+                  '`aio.run.checker.merge`')}],
             [('--check', '-c'),
              {'choices': ('distros',),
               'nargs': '*',
               'help': (
                   'Specify which checks to run, '
                   'can be specified for multiple checks')}],
+            [('--check-cache',),
+             {'metavar': 'FILE',
+              'default': None,
+              'help': (
+                  'Skip checks with inputs that are unchanged since they last '
+                  'succeeded, storing the fingerprints of their inputs in '
+                  'this file. Only checks that provide a fingerprint are '
+                  'cached')}],
             [('--config-distros',),
              {'default': '',
               'help': 'Custom configuration for the distros check'}],
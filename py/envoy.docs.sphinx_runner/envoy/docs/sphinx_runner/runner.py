@@ -17,6 +17,7 @@ from sphinx.cmd.build import (  # type:ignore[import-untyped]
     main as sphinx_build,
 )
 
+from aio.core import event
 from aio.run import runner
 
 from envoy.base import utils
@@ -191,8 +192,9 @@ class SphinxRunner(runner.Runner):
 
     @property
     def jobs(self) -> str:
-        """Number of parallel jobs to run with Sphinx, defaults to `auto`."""
-        return self.args.jobs
+        """Number of parallel jobs to run with Sphinx, from the jobs
+        budget."""
+        return str(event.jobs.limit)
 
     @property
     def warnings_file(self) -> pathlib.Path:
@@ -301,7 +303,6 @@ class SphinxRunner(runner.Runner):
         parser.add_argument("--build_sha")
         parser.add_argument("--build_target", default="html")
         parser.add_argument("--docs_tag")
-        parser.add_argument("-j", "--jobs", default="auto")
         parser.add_argument("--version_file")
         parser.add_argument("--validator_path")
         parser.add_argument("--descriptor_path")
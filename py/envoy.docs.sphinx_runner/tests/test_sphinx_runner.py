@@ -323,11 +323,16 @@ def test_sphinx_runner_intersphinx_mapping(patches, versions_exists):
 def test_sphinx_runner_jobs(patches):
     runner = DummySphinxRunner()
     patched = patches(
-        ("SphinxRunner.args", dict(new_callable=PropertyMock)),
+        "str",
+        "event",
         prefix="envoy.docs.sphinx_runner.runner")
 
-    with patched as (m_args, ):
-        assert runner.jobs == m_args.return_value.jobs
+    with patched as (m_str, m_event):
+        assert runner.jobs == m_str.return_value
+
+    assert (
+        m_str.call_args
+        == [(m_event.jobs.limit, ), {}])
 
     assert "jobs" not in runner.__dict__
 
@@ -612,7 +617,6 @@ def test_sphinx_runner_add_arguments(patches):
         == [[('--build_sha',), {}],
             [("--build_target", ), dict(default="html")],
             [('--docs_tag',), {}],
-            [("-j", "--jobs", ), dict(default="auto")],
             [('--version_file',), {}],
             [('--validator_path',), {}],
             [('--descriptor_path',), {}],
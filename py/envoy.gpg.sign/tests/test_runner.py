@@ -278,6 +278,33 @@ def test_packager_add_arguments():
              {'choices': ['debug', 'info', "success", 'warn', 'error'],
               'default': 'warn',
               'help': 'Log level for non-application logs'}],
+            [('--jobs', '-j'),
+             {'type': runner.runner.jobs_arg,
+              'default': None,
+              'metavar': 'N',
+              'help': (
+                  'Maximum number of parallel jobs, defaults to (`auto`) the '
+                  'number of CPUs available to the process, taking any '
+                  'affinity mask or cgroup CPU quota into account')}],
+            [('--profile',),
+             {'metavar': 'DIR',
+              'help': (
+                  'Profile the run with cProfile, and write the profile '
+                  'artifacts to this directory')}],
+            [('--profile-memory',),
+             {'metavar': 'N',
+              'type': int,
+              'default': 0,
+              'help': (
+                  'When profiling, also trace memory allocations and report '
+                  'the top N allocation sites')}],
+            [('--profile-slow-callback',),
+             {'metavar': 'SECONDS',
+              'type': float,
+              'default': 0.1,
+              'help': (
+                  'When profiling, log event loop callbacks that take longer '
+                  'than this, 0 disables')}],
             [('infiles',),
              {'nargs': '+',
               'help': 'Paths to the tarballs containing packages to sign'}],
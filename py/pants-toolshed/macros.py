@@ -62,12 +62,33 @@ def _publish_req_target_name(req_str: str) -> str:
 
 
 def _req_bare_name(req_str: str) -> str:
+    return _canonical_name(_req_raw_name(req_str))
+
+
+def _req_raw_name(req_str: str) -> str:
     chars = []
     for ch in req_str.strip():
         if ch in " <>=!~[;":
             break
         chars.append(ch)
-    return _canonical_name("".join(chars))
+    return "".join(chars)
+
+
+def _in_repo_source_targets(namespace: str) -> list:
+    """Source targets of in-repo packages named in ``install_requires``.
+
+    Libraries can depend on a sibling's in-repo sources (rather than its
+    pinned release) while it is unreleased.
+    """
+    targets = []
+    for req_str in _setup_cfg_install_requires(namespace):
+        name = _req_raw_name(req_str)
+        try:
+            open(f"py/{name}/setup.cfg", encoding="utf-8").close()
+        except OSError:
+            continue
+        targets.append(f"//{_dep_on_myself(name)[0]}")
+    return targets
 
 
 def _setup_cfg_extras_require(namespace: str) -> list:
@@ -206,6 +227,10 @@ def toolshed_package(
         f"!!//py/deps:reqs#{name}"
         for name in {_req_bare_name(r) for r in all_reqs}
         if name in pinned]
+    # Sibling sources are replaced by their setup.cfg range in the wheel.
+    excluded_reqs += [
+        f"!!{target}"
+        for target in _in_repo_source_targets(namespace)]
 
     publish_req_deps = _publish_req_dependencies(namespace)
     toolshed_distribution(